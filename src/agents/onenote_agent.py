@@ -20,11 +20,13 @@ from typing_extensions import TypedDict
 from ..auth.microsoft_auth import AuthenticationError, MicrosoftAuthenticator
 from ..config.logging import log_api_call, log_performance, logged
 from ..config.settings import get_settings
-from ..models.onenote import OneNotePage, SearchResult
+from ..models.onenote import OneNotePage, SearchResult, SemanticSearchResult
 from ..models.responses import (AgentState, OneNoteSearchResponse,
                                 StreamingChunk)
 from ..storage.cache_manager import OneNoteCacheManager
 from ..storage.local_search import LocalOneNoteSearch, LocalSearchError
+from ..storage.search_maintenance import SearchIndexMaintainer
+from ..tools.graph_client import close_graph_client
 from ..tools.onenote_content import (OneNoteContentProcessor,
                                      create_ai_context_from_pages)
 from ..tools.onenote_search import OneNoteSearchError, OneNoteSearchTool
@@ -65,6 +67,7 @@ class OneNoteAgent:
         self._cache_manager = None
         self._local_search = None
         self._local_search_available = False
+        self._search_maintainer: Optional[SearchIndexMaintainer] = None
 
         # Initialize semantic search components
         self._semantic_search_engine = None
@@ -150,7 +153,7 @@ class OneNoteAgent:
                 return False
 
             # Check if there are any cached pages
-            cached_pages = await self.cache_manager.get_all_cached_pages()
+            cached_pages = await self.cache_manager.get_all_cached_pages(fields=("metadata",))
             if not cached_pages:
                 logger.debug("No cached pages found - local search unavailable")
                 return False
@@ -787,7 +790,9 @@ class OneNoteAgent:
             # Try local search first if available
             if self._local_search_available and self.local_search:
                 try:
-                    local_results = await self.local_search.search(query, limit=max_results)
+                    local_results = [
+                        result async for result in self.iter_local_search(query, max_results)
+                    ]
                     if local_results:
                         search_method = "local_cache"
                         logger.info(f"Local search found {len(local_results)} results in {time.time() - start_time:.2f}s")
@@ -815,6 +820,29 @@ class OneNoteAgent:
                 metadata={"error": str(e), "search_method": search_method}
             )
 
+    async def iter_local_search(
+        self,
+        query: str,
+        max_results: int = 10
+    ) -> AsyncGenerator[SemanticSearchResult, None]:
+        """
+        Stream local search results as they are read from the index.
+
+        Only as many rows as needed for max_results are fetched, so callers
+        can display the first results immediately.
+
+        Args:
+            query: Search query string
+            max_results: Maximum number of results
+
+        Yields:
+            Local search results in relevance order
+        """
+        if not self._local_search_available or not self.local_search:
+            return
+        async for result in self.local_search.iter_search(query, max_results=max_results):
+            yield result
+
     async def _create_response_from_local_results(
         self,
         local_results: list,
@@ -965,6 +993,10 @@ class OneNoteAgent:
                 if self.local_search:
                     await self.local_search.initialize()
                     self._local_search_available = True
+
+                    # Keep the index compact while the agent is idle
+                    self._search_maintainer = SearchIndexMaintainer(self.local_search)
+                    self._search_maintainer.start_background()
                     logger.info("Local search engine initialized and ready")
                 else:
                     logger.warning("Local search not available despite cache check")
@@ -999,7 +1031,7 @@ class OneNoteAgent:
                 if cache_root.exists():
                     # Get cached pages count
                     try:
-                        cached_pages = await self.cache_manager.get_all_cached_pages()
+                        cached_pages = await self.cache_manager.get_all_cached_pages(fields=("metadata",))
                         status["cached_pages_count"] = len(cached_pages)
 
                         if cached_pages:
@@ -1029,6 +1061,11 @@ class OneNoteAgent:
     async def cleanup(self) -> None:
         """Cleanup resources used by the agent."""
         try:
+            # Stop idle-time index maintenance before closing its database
+            if self._search_maintainer:
+                await self._search_maintainer.stop_background()
+                self._search_maintainer = None
+
             # Close local search database connection
             if self._local_search:
                 await self._local_search.close()
@@ -1038,6 +1075,9 @@ class OneNoteAgent:
             if hasattr(self._semantic_search_engine, 'close'):
                 await self._semantic_search_engine.close()
 
+            # Close pooled Graph API connections
+            await close_graph_client()
+
         except Exception as e:
             logger.warning(f"Error during agent cleanup: {e}")
 
@@ -17,12 +17,11 @@ from threading import Thread
 from typing import Any, Dict, Optional
 from urllib.parse import parse_qs, urlparse
 
-import httpx
 from msal import PublicClientApplication
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from ..config.logging import log_api_call, log_performance
 from ..config.settings import get_settings
+from ..tools.graph_client import graph_request
 
 logger = logging.getLogger(__name__)
 
@@ -416,10 +415,6 @@ class MicrosoftAuthenticator:
         logger.debug("Token expired or missing, re-authenticating")
         return await self.authenticate()
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10)
-    )
     async def validate_token(self, token: str) -> bool:
         """
         Validate access token by making a test API call.
@@ -437,22 +432,22 @@ class MicrosoftAuthenticator:
             }
 
             # Make a simple API call to validate token
-            async with httpx.AsyncClient(timeout=self.settings.request_timeout) as client:
-                response = await client.get(
-                    self.settings.get_graph_endpoint("/me"),
-                    headers=headers
-                )
+            response = await graph_request(
+                "GET",
+                self.settings.get_graph_endpoint("/me"),
+                headers=headers
+            )
 
-                if response.status_code == 200:
-                    user_info = response.json()
-                    logger.debug(f"Token validated for user: {user_info.get('displayName', 'unknown')}")
-                    return True
-                elif response.status_code == 401:
-                    logger.debug("Token validation failed: unauthorized")
-                    return False
-                else:
-                    logger.warning(f"Token validation returned status {response.status_code}")
-                    return False
+            if response.status_code == 200:
+                user_info = response.json()
+                logger.debug(f"Token validated for user: {user_info.get('displayName', 'unknown')}")
+                return True
+            elif response.status_code == 401:
+                logger.debug("Token validation failed: unauthorized")
+                return False
+            else:
+                logger.warning(f"Token validation returned status {response.status_code}")
+                return False
 
         except Exception as e:
             logger.error(f"Token validation failed: {e}")
@@ -655,19 +650,19 @@ class MicrosoftAuthenticator:
                 "Content-Type": "application/json"
             }
 
-            async with httpx.AsyncClient(timeout=self.settings.request_timeout) as client:
-                response = await client.get(
-                    self.settings.get_graph_endpoint("/me"),
-                    headers=headers
-                )
+            response = await graph_request(
+                "GET",
+                self.settings.get_graph_endpoint("/me"),
+                headers=headers
+            )
 
-                if response.status_code == 200:
-                    user_profile = response.json()
-                    logger.debug(f"Retrieved user profile for: {user_profile.get('displayName', 'unknown')}")
-                    return user_profile
-                else:
-                    logger.warning(f"Failed to get user profile: HTTP {response.status_code}")
-                    return None
+            if response.status_code == 200:
+                user_profile = response.json()
+                logger.debug(f"Retrieved user profile for: {user_profile.get('displayName', 'unknown')}")
+                return user_profile
+            else:
+                logger.warning(f"Failed to get user profile: HTTP {response.status_code}")
+                return None
 
         except Exception as e:
             logger.error(f"Error getting user profile: {e}")
@@ -68,6 +68,7 @@ class OneNoteCLI:
             '/content': self._show_page_content,
             '/index': self._index_content,
             '/semantic': self._semantic_search,
+            '/local': self._local_search,
             '/stats': self._show_semantic_stats,
             '/reset-index': self._reset_semantic_index,
             '/status': self._show_rate_limit_status,
@@ -253,6 +254,8 @@ class OneNoteCLI:
             return await self._index_content(command_args)
         elif command_name == '/semantic':
             return await self._semantic_search(command_args)
+        elif command_name == '/local':
+            return await self._local_search(command_args)
         elif command_name in self.commands:
             return await self.commands[command_name]()
         else:
@@ -591,6 +594,42 @@ Stay organized! 📚✨
             self.console.print(f"[red]❌ Error performing semantic search: {e}[/red]")
             return True
 
+    @logged
+    async def _local_search(self, query: str = "") -> bool:
+        """
+        Search the local cache, printing each result as soon as it is read.
+
+        Args:
+            query: Search query
+
+        Returns:
+            True to continue chat loop
+        """
+        try:
+            if not query.strip():
+                self.console.print("[yellow]🔍 Usage: /local <search_query>[/yellow]")
+                self.console.print("[dim]Example: /local meeting notes[/dim]")
+                return True
+
+            found = 0
+            async for result in self.agent.iter_local_search(query, max_results=10):
+                found += 1
+                self.console.print(f"[bold]{found}. {result.chunk.page_title}[/bold]")
+                self.console.print(f"   [dim]Score: {result.similarity_score:.3f}[/dim]")
+
+                content_preview = result.chunk.content[:200] + "..." if len(result.chunk.content) > 200 else result.chunk.content
+                self.console.print(f"   {content_preview}\n")
+
+            if not found:
+                self.console.print(f"[yellow]🔍 No local search results found for '{query}'[/yellow]")
+                self.console.print("[dim]💡 Local search needs a synced cache; try /semantic or a regular question[/dim]")
+
+            return True
+
+        except Exception as e:
+            self.console.print(f"[red]❌ Error performing local search: {e}[/red]")
+            return True
+
     async def _show_semantic_stats(self) -> bool:
         """Show semantic search statistics."""
         try:
@@ -6,10 +6,10 @@ for semantic search capabilities. It handles:
 - Initial content indexing from all accessible OneNote pages
 - Incremental updates for new/modified content
 - Progress tracking and error handling
+- Resuming interrupted runs from a checkpoint
 - Content validation and statistics
 """
 
-import asyncio
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -26,14 +26,24 @@ from rich.text import Text
 from ..auth.microsoft_auth import MicrosoftAuthenticator
 from ..config.logging import get_logger
 from ..config.settings import get_settings
+from ..models.cache import SyncCheckpoint
 from ..models.onenote import OneNotePage
 from ..search.embeddings import EmbeddingGenerator
 from ..storage.content_indexer import ContentIndexer
+from ..storage.sync_checkpoint import SyncCheckpointStore
 from ..storage.vector_store import VectorStore
+from ..tools.graph_client import ContentValidators
+from ..tools.graph_scheduler import background_priority
 from ..tools.onenote_search import OneNoteSearchTool
 
 console = Console()
 
+# Checkpoint of an interrupted `index --initial` run, kept with the vector database
+INDEX_CHECKPOINT_FILE = "index_checkpoint.json"
+INDEX_CHECKPOINT_OPERATION = "index"
+# Indexed pages between checkpoint saves
+INDEX_CHECKPOINT_INTERVAL = 25
+
 
 def _get_logger():
     """Get logger with safe initialization."""
@@ -51,6 +61,7 @@ class IndexingStats:
         self.total_pages = 0
         self.processed_pages = 0
         self.failed_pages = 0
+        self.unchanged_pages = 0
         self.total_chunks = 0
         self.start_time = datetime.now()
         self.end_time: Optional[datetime] = None
@@ -125,8 +136,10 @@ class ContentIndexingService:
         try:
             self.logger.info("Fetching all OneNote pages...")
 
-            # Use OneNote search tool to get all pages
-            pages = await self.onenote_search.get_all_pages(limit)
+            # Use OneNote search tool to list all pages (a metadata-only
+            # manifest, newest first); content is fetched per page,
+            # conditionally, while indexing
+            pages = await self.onenote_search.get_all_pages(limit, include_content=False)
 
             self.stats.total_pages = len(pages)
             console.print(f"[blue]Pages Found {len(pages)} pages to index[/blue]")
@@ -143,10 +156,18 @@ class ContentIndexingService:
         try:
             self.logger.debug(f"Indexing page: {page.title} ({page.id})")
 
-            # Get page content using OneNote search tool
+            # Get page content unless it is unchanged since it was embedded
             token = await self.authenticator.get_access_token()
-            content_result, status_code = await self.onenote_search._fetch_page_content(page.id, token)
+            validators = await self._get_indexed_validators(page.id)
+            response = await self.onenote_search._fetch_page_content_if_modified(page.id, token, validators)
+
+            if response.not_modified:
+                self.logger.debug(f"Content unchanged, skipping re-embedding: {page.id}")
+                self.stats.processed_pages += 1
+                self.stats.unchanged_pages += 1
+                return True
 
+            content_result = response.text
             if not content_result or not content_result.strip():
                 self.logger.warning(f"Empty content for page {page.id}")
                 return False
@@ -157,6 +178,13 @@ class ContentIndexingService:
                 self.logger.warning(f"No embeddings generated for page {page.id}")
                 return False
 
+            # Keep the content validators with the embeddings, so the next run
+            # can skip the page if it is unchanged
+            if response.validators:
+                for embedded_chunk in embeddings:
+                    embedded_chunk.chunk.metadata["content_etag"] = response.validators.etag or ""
+                    embedded_chunk.chunk.metadata["content_last_modified"] = response.validators.last_modified or ""
+
             # Store embeddings in vector database
             await self.content_indexer.store_page_embeddings(page.id, embeddings)
 
@@ -171,8 +199,34 @@ class ContentIndexingService:
             self.stats.add_error(error_msg)
             return False
 
-    async def index_all_content(self, limit: Optional[int] = None) -> IndexingStats:
-        """Index all OneNote content."""
+    async def _get_indexed_validators(self, page_id: str) -> Optional[ContentValidators]:
+        """Get the content validators stored with a page's embeddings."""
+        metadata = await self.vector_store.get_page_chunk_metadata(page_id)
+        if not metadata:
+            return None
+        validators = ContentValidators(
+            etag=metadata.get("chunk_content_etag") or None,
+            last_modified=metadata.get("chunk_content_last_modified") or None
+        )
+        return validators or None
+
+    @staticmethod
+    def _checkpoint_key(page: OneNotePage) -> str:
+        """Get the checkpoint section key of a page."""
+        return (page.parent_section or {}).get("id", "")
+
+    @background_priority
+    async def index_all_content(self, limit: Optional[int] = None, resume: bool = True) -> IndexingStats:
+        """
+        Index all OneNote content.
+
+        Pages indexed by an earlier run that failed or was interrupted are
+        skipped; the checkpoint is removed once a run indexes every page.
+
+        Args:
+            limit: Maximum number of pages to index
+            resume: Resume from the checkpoint of an interrupted run
+        """
         console.print(Panel.fit("🚀 Starting OneNote Content Indexing", style="bold blue"))
 
         # Initialize service
@@ -185,33 +239,76 @@ class ContentIndexingService:
             console.print("[yellow]! No pages found to index[/yellow]")
             return self.stats
 
-        # Index pages with progress tracking
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeElapsedColumn(),
-            console=console
-        ) as progress:
-
-            task = progress.add_task("Indexing pages...", total=len(pages))
+        checkpoint_store = SyncCheckpointStore(self.settings.vector_db_full_path / INDEX_CHECKPOINT_FILE)
+        checkpoint = await checkpoint_store.load(INDEX_CHECKPOINT_OPERATION) if resume else None
+        if checkpoint:
+            resumed = sum(len(page_ids) for page_ids in checkpoint.stored_pages.values())
+            console.print(f"[blue]Resuming interrupted indexing, {resumed} pages already indexed[/blue]")
+        else:
+            checkpoint = SyncCheckpoint(operation=INDEX_CHECKPOINT_OPERATION)
 
-            for page in pages:
-                progress.update(task, description=f"Indexing: {page.title[:30]}...")
-
-                success = await self.index_page(page)
-                if success:
-                    progress.update(task, advance=1, description=f"OK {page.title[:30]}...")
-                else:
-                    progress.update(task, advance=1, description=f"X {page.title[:30]}...")
-
-                # Small delay to avoid rate limiting
-                await asyncio.sleep(0.1)
+        # Index pages with progress tracking
+        indexed_all = False
+        try:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                # Share of found pages that are searchable
+                TextColumn("coverage {task.fields[coverage]:>5.1f}%"),
+                TimeElapsedColumn(),
+                console=console
+            ) as progress:
+
+                # Pages come newest first, so recently edited pages are
+                # searchable early in a long run
+                task = progress.add_task("Indexing pages...", total=len(pages), coverage=0.0)
+                unsaved_pages = 0
+
+                for page in pages:
+                    section_key = self._checkpoint_key(page)
+                    if checkpoint.is_page_stored(section_key, page.id):
+                        # Indexed by the interrupted run
+                        self.stats.processed_pages += 1
+                        self.stats.unchanged_pages += 1
+                        progress.update(task, advance=1, coverage=self.stats.success_rate)
+                        continue
+
+                    progress.update(task, description=f"Indexing: {page.title[:30]}...")
+
+                    success = await self.index_page(page)
+                    if success:
+                        checkpoint.mark_page_stored(section_key, page.id)
+                        progress.update(task, advance=1, description=f"OK {page.title[:30]}...",
+                                        coverage=self.stats.success_rate)
+                    else:
+                        progress.update(task, advance=1, description=f"X {page.title[:30]}...")
+
+                    unsaved_pages += 1
+                    if unsaved_pages >= INDEX_CHECKPOINT_INTERVAL:
+                        await self._save_checkpoint(checkpoint_store, checkpoint)
+                        unsaved_pages = 0
+
+            indexed_all = self.stats.processed_pages == len(pages)
+        finally:
+            # Also runs on cancellation (Ctrl-C), so the next run resumes
+            if indexed_all:
+                await checkpoint_store.clear()
+            else:
+                await self._save_checkpoint(checkpoint_store, checkpoint)
 
         self.stats.end_time = datetime.now()
         return self.stats
 
+    async def _save_checkpoint(self, store: SyncCheckpointStore, checkpoint: SyncCheckpoint) -> None:
+        """Save the indexing checkpoint, logging (not raising) failures."""
+        try:
+            await store.save(checkpoint)
+        except Exception as e:
+            self.logger.warning(f"Failed to save indexing checkpoint: {e}")
+
+    @background_priority
     async def index_recent_content(self, days: int = 30) -> IndexingStats:
         """Index recent OneNote content."""
         console.print(Panel.fit(f"Indexing Recent Content ({days} days)", style="bold blue"))
@@ -266,6 +363,7 @@ def show_indexing_results(stats: IndexingStats) -> None:
 
     table.add_row("Total Pages Found", str(stats.total_pages))
     table.add_row("Successfully Processed", str(stats.processed_pages))
+    table.add_row("Unchanged (Skipped)", str(stats.unchanged_pages))
     table.add_row("Failed", str(stats.failed_pages))
     table.add_row("Success Rate", f"{stats.success_rate:.1f}%")
     table.add_row("Total Chunks Created", str(stats.total_chunks))
@@ -301,3 +399,92 @@ async def cmd_show_status() -> None:
     """Command to show indexing status."""
     service = ContentIndexingService()
     await service.show_indexing_status()
+
+
+async def cmd_optimize_search_index() -> None:
+    """Command to compact and optimize the local full-text search index."""
+    from ..storage.local_search import LocalOneNoteSearch
+    from ..storage.search_maintenance import SearchIndexMaintainer
+
+    local_search = LocalOneNoteSearch()
+    try:
+        await local_search.initialize()
+        maintainer = SearchIndexMaintainer(local_search)
+        report = await maintainer.run_maintenance(force=True)
+    finally:
+        await local_search.close()
+
+    table = Table(title="Search Index Maintenance", show_header=True, header_style="bold magenta")
+    table.add_column("Metric", style="cyan", no_wrap=True)
+    table.add_column("Before", style="white")
+    table.add_column("After", style="white")
+
+    table.add_row("FTS Segments", str(report.before.segment_count), str(report.after.segment_count))
+    table.add_row(
+        "Database Size (MB)",
+        f"{report.before.database_size_bytes / (1024 * 1024):.2f}",
+        f"{report.after.database_size_bytes / (1024 * 1024):.2f}"
+    )
+    table.add_row(
+        "WAL Size (MB)",
+        f"{report.before.wal_size_bytes / (1024 * 1024):.2f}",
+        f"{report.after.wal_size_bytes / (1024 * 1024):.2f}"
+    )
+    table.add_row(
+        "Fragmentation",
+        f"{report.before.fragmentation:.1%}",
+        f"{report.after.fragmentation:.1%}"
+    )
+    table.add_row(
+        "Query Latency (ms)",
+        f"{report.latency_before_ms:.2f}",
+        f"{report.latency_after_ms:.2f}"
+    )
+
+    console.print(table)
+    console.print(f"[green]OK Ran {', '.join(report.actions)} in {report.duration_seconds:.2f}s[/green]")
+
+
+async def cmd_rebuild_page_index() -> None:
+    """Command to repair the page location index of every cached user."""
+    from ..storage.cache_manager import OneNoteCacheManager
+
+    cache_manager = OneNoteCacheManager()
+    users_dir = cache_manager.cache_root / "users"
+    user_dirs = sorted(d for d in users_dir.glob("*") if d.is_dir()) if users_dir.exists() else []
+
+    if not user_dirs:
+        console.print("[yellow]No cached users found[/yellow]")
+        return
+
+    table = Table(title="Page Location Index", show_header=True, header_style="bold magenta")
+    table.add_column("User", style="cyan", no_wrap=True)
+    table.add_column("Indexed Pages", style="white")
+
+    for user_dir in user_dirs:
+        count = await cache_manager.rebuild_page_index(user_dir.name)
+        table.add_row(user_dir.name, str(count))
+
+    console.print(table)
+    console.print(f"[green]OK Rebuilt page location index for {len(user_dirs)} user(s)[/green]")
+
+
+async def cmd_migrate_cache_compression() -> None:
+    """Command to rewrite cached pages with the configured compression."""
+    from ..storage.cache_manager import OneNoteCacheManager
+
+    cache_manager = OneNoteCacheManager()
+    stats = await cache_manager.migrate_page_compression()
+
+    table = Table(title="Cache Compression Migration", show_header=True, header_style="bold magenta")
+    table.add_column("Metric", style="cyan", no_wrap=True)
+    table.add_column("Value", style="white")
+
+    table.add_row("Target Format", cache_manager.compression or "uncompressed")
+    table.add_row("Files Migrated", str(stats["files_migrated"]))
+    table.add_row("Files Already Current", str(stats["files_skipped"]))
+    table.add_row("Size Before (MB)", f"{stats['bytes_before'] / (1024 * 1024):.2f}")
+    table.add_row("Size After (MB)", f"{stats['bytes_after'] / (1024 * 1024):.2f}")
+
+    console.print(table)
+    console.print("[green]OK Cache compression migration complete[/green]")
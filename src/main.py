@@ -422,6 +422,21 @@ def index(
         False,
         "--status",
         help="📊 Show current indexing status and statistics"
+    ),
+    optimize: bool = typer.Option(
+        False,
+        "--optimize",
+        help="🧹 Merge, optimize and checkpoint the local search index"
+    ),
+    rebuild_page_index: bool = typer.Option(
+        False,
+        "--rebuild-page-index",
+        help="🗂️ Repair the cached page location index from the cache tree"
+    ),
+    migrate_compression: bool = typer.Option(
+        False,
+        "--migrate-compression",
+        help="🗜️ Rewrite cached pages using the configured compression setting"
     )
 ) -> None:
     """
@@ -440,20 +455,48 @@ def index(
     **Status Check** (--status):
     Display current indexing statistics without processing content.
 
+    **Index Maintenance** (--optimize):
+    Merge full-text index segments, checkpoint the WAL and report
+    query latency before and after.
+
+    **Page Index Repair** (--rebuild-page-index):
+    Rescan the local cache and rebuild the page_id -> location index.
+
+    **Compression Migration** (--migrate-compression):
+    Rewrite existing cached pages to match ONENOTE_ENABLE_COMPRESSION.
+
     **Examples:**
     - First-time setup: `onenote-copilot index --initial`
     - Regular updates: `onenote-copilot index --sync`
     - Custom timeframe: `onenote-copilot index --sync --recent-days 7`
     - Check status: `onenote-copilot index --status`
+    - Compact search index: `onenote-copilot index --optimize`
+    - Repair page index: `onenote-copilot index --rebuild-page-index`
+    - Compress existing cache: `onenote-copilot index --migrate-compression`
     - Test with limit: `onenote-copilot index --initial --limit 10`
     """
     try:
         # Lazy import of indexing commands to avoid heavy dependencies during startup
         from .commands.index_content import (cmd_index_all_content,
                                              cmd_index_recent_content,
+                                             cmd_migrate_cache_compression,
+                                             cmd_optimize_search_index,
+                                             cmd_rebuild_page_index,
                                              cmd_show_status)
 
-        if status:
+        if migrate_compression:
+            # Rewrite cached pages with the configured compression
+            console.print("[yellow]🗜️ Migrating cache compression...[/yellow]")
+            asyncio.run(cmd_migrate_cache_compression())
+        elif rebuild_page_index:
+            # Repair the cached page location index
+            console.print("[yellow]🗂️ Rebuilding page location index...[/yellow]")
+            asyncio.run(cmd_rebuild_page_index())
+        elif optimize:
+            # Maintain the local full-text search index
+            console.print("[yellow]🧹 Optimizing local search index...[/yellow]")
+            asyncio.run(cmd_optimize_search_index())
+        elif status:
             # Show indexing status
             asyncio.run(cmd_show_status())
         elif initial:
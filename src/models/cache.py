@@ -8,9 +8,11 @@ and content management. Extends existing OneNote models for local storage.
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Union
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import (BaseModel, ConfigDict, Field, PrivateAttr,
+                      SerializerFunctionWrapHandler, field_validator,
+                      model_serializer)
 
 from .onenote import OneNotePage
 
@@ -181,6 +183,11 @@ class CachedPageMetadata(BaseModel):
     local_content_path: str = Field(..., description="Local markdown file path")
     local_html_path: str = Field(..., description="Local HTML file path")
 
+    # HTTP validators of the downloaded content, sent on re-fetch so unchanged
+    # content is not downloaded again
+    content_etag: Optional[str] = Field(None, description="ETag of the downloaded content")
+    content_last_modified: Optional[str] = Field(None, description="Last-Modified of the downloaded content")
+
     # Assets and links
     attachments: List[AssetInfo] = Field(default_factory=list)
     internal_links: List[InternalLink] = Field(default_factory=list)
@@ -204,14 +211,105 @@ class CachedPageMetadata(BaseModel):
     )
 
 
+# CachedPage fields that can be loaded lazily from the cache
+LAZY_CONTENT_FIELDS = ("content", "markdown_content", "text_content")
+
+
 class CachedPage(BaseModel):
-    """A cached OneNote page with content and metadata."""
+    """
+    A cached OneNote page with content and metadata.
+
+    Pages loaded from the cache may defer their content fields; deferred
+    fields hold None until they are read through the content loader on first
+    access. Serializing, iterating or comparing a page loads them first, also
+    when the page is nested in another model.
+    """
 
     metadata: CachedPageMetadata = Field(..., description="Page metadata")
     content: Optional[str] = Field(None, description="Original HTML content")
     markdown_content: Optional[str] = Field(None, description="Converted markdown content")
     text_content: Optional[str] = Field(None, description="Extracted text content")
 
+    _content_loader: Optional[Callable[[str], Optional[str]]] = PrivateAttr(default=None)
+    _pending_fields: FrozenSet[str] = PrivateAttr(default=frozenset())
+
+    @classmethod
+    def with_lazy_content(
+        cls,
+        metadata: CachedPageMetadata,
+        loader: Callable[[str], Optional[str]],
+        loaded: Optional[Dict[str, Optional[str]]] = None
+    ) -> "CachedPage":
+        """
+        Create a page whose content fields not in ``loaded`` load on first access.
+
+        Args:
+            metadata: Page metadata
+            loader: Callable returning the value of a content field by name
+            loaded: Content fields that are already loaded
+
+        Returns:
+            Cached page with deferred content fields
+        """
+        loaded = loaded or {}
+        page = cls(metadata=metadata, **loaded)
+        pending = frozenset(name for name in LAZY_CONTENT_FIELDS if name not in loaded)
+        if pending:
+            page._pending_fields = pending
+            page._content_loader = loader
+        return page
+
+    def __getattribute__(self, name: str) -> Any:
+        """Load deferred content fields on first access."""
+        if name in LAZY_CONTENT_FIELDS:
+            private = object.__getattribute__(self, "__pydantic_private__")
+            if private and name in private["_pending_fields"]:
+                value = private["_content_loader"](name)
+                setattr(self, name, value)
+                return value
+        return super().__getattribute__(name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Assigning a deferred content field cancels its lazy load."""
+        super().__setattr__(name, value)
+        if name in LAZY_CONTENT_FIELDS and self.__pydantic_private__:
+            # Replace rather than mutate: model copies share the set
+            self._pending_fields = self._pending_fields - {name}
+
+    @model_serializer(mode="wrap")
+    def _serialize_loaded(self, handler: SerializerFunctionWrapHandler) -> Dict[str, Any]:
+        """Load deferred content before serializing (also when nested)."""
+        return handler(self.load_content())
+
+    def __iter__(self):
+        """Iterate over fields, loading deferred content first."""
+        return super(CachedPage, self.load_content()).__iter__()
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare pages by their (loaded) field values."""
+        if not isinstance(other, CachedPage):
+            return NotImplemented
+        return (
+            type(self) is type(other)
+            and self.load_content().__dict__ == other.load_content().__dict__
+        )
+
+    @property
+    def is_content_loaded(self) -> bool:
+        """Whether all content fields are loaded."""
+        return not self._pending_fields
+
+    def load_content(self) -> "CachedPage":
+        """
+        Load all deferred content fields.
+
+        Returns:
+            This page, fully loaded
+        """
+        for name in self._pending_fields:
+            getattr(self, name)
+        return self
+
     @property
     def id(self) -> str:
         """Get page ID."""
@@ -286,6 +384,22 @@ class SyncStatistics(BaseModel):
     total_time_seconds: float = Field(default=0.0)
 
 
+class CacheCounters(BaseModel):
+    """Incrementally maintained cache content counters."""
+
+    notebooks: int = Field(default=0, ge=0)
+    sections: int = Field(default=0, ge=0)
+    pages: int = Field(default=0, ge=0)
+    images: int = Field(default=0, ge=0)
+    files: int = Field(default=0, ge=0)
+    size_bytes: int = Field(default=0, ge=0)
+    markdown_bytes: int = Field(default=0, ge=0)
+    asset_bytes: int = Field(default=0, ge=0)
+
+    # Last full rescan; None means the counters have never been verified
+    verified_at: Optional[datetime] = Field(None, description="Last full rescan timestamp")
+
+
 class CacheMetadata(BaseModel):
     """Metadata for the entire cache for a user."""
 
@@ -306,6 +420,9 @@ class CacheMetadata(BaseModel):
     # Sync statistics from last sync
     sync_statistics: SyncStatistics = Field(default_factory=SyncStatistics)
 
+    # Content counters maintained on every page store and delete
+    counters: CacheCounters = Field(default_factory=CacheCounters)
+
     # Cache configuration
     cache_root_path: str = Field(..., description="Root path of the cache")
     sync_enabled: bool = Field(default=True)
@@ -383,6 +500,55 @@ class SyncResult(BaseModel):
         return self.status in [SyncStatus.COMPLETED, SyncStatus.PARTIAL]
 
 
+class SyncCheckpoint(BaseModel):
+    """Durable progress of a running sync, used to resume it after an interruption."""
+
+    operation: str = Field(..., description="Operation that wrote the checkpoint, e.g. 'fetch' or 'index'")
+    sync_type: Optional[SyncType] = Field(None, description="Type of the interrupted sync")
+    started_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+    # Sections whose pages are all stored
+    completed_sections: Set[str] = Field(default_factory=set)
+    # Number of stored pages per complete section
+    completed_section_pages: Dict[str, int] = Field(default_factory=dict)
+    # Listing cursor (@odata.nextLink) of the next unprocessed listing page per section
+    section_cursors: Dict[str, str] = Field(default_factory=dict)
+    # Pages already stored, per section that is not complete yet
+    stored_pages: Dict[str, Set[str]] = Field(default_factory=dict)
+
+    def is_page_stored(self, section_id: str, page_id: str) -> bool:
+        """Check whether a page was stored before the interruption."""
+        return section_id in self.completed_sections or page_id in self.stored_pages.get(section_id, ())
+
+    def mark_page_stored(self, section_id: str, page_id: str) -> None:
+        """Record a stored page."""
+        self.stored_pages.setdefault(section_id, set()).add(page_id)
+
+    def stored_page_count(self) -> int:
+        """Number of pages stored by the sync, including runs before an interruption."""
+        return (
+            sum(self.completed_section_pages.values())
+            + sum(len(page_ids) for page_ids in self.stored_pages.values())
+        )
+
+    def advance_section(self, section_id: str, next_url: Optional[str]) -> None:
+        """
+        Record that a listing page of a section is done.
+
+        Args:
+            section_id: Section ID
+            next_url: Cursor of the next listing page, or None if the
+                section is complete
+        """
+        if next_url:
+            self.section_cursors[section_id] = next_url
+            return
+        self.completed_sections.add(section_id)
+        self.section_cursors.pop(section_id, None)
+        self.completed_section_pages[section_id] = len(self.stored_pages.pop(section_id, ()))
+
+
 class DownloadResult(BaseModel):
     """Result of downloading an asset or content."""
 
@@ -14,8 +14,9 @@ from dataclasses import dataclass, field
 from enum import Enum
 
 from ..models.cache import CachedPage
-from ..models.onenote import OneNoteNotebook, OneNoteSection
-from ..storage.local_search import LocalOneNoteSearch
+from ..models.onenote import (OneNoteNotebook, OneNoteSection,
+                              SemanticSearchResult)
+from ..storage.local_search import LocalOneNoteSearch, LocalSearchFilter
 
 logger = logging.getLogger(__name__)
 
@@ -244,6 +245,69 @@ class SearchFilterManager:
             logger.error(f"Filter application failed: {e}")
             return pages  # Return unfiltered on error
 
+    def to_local_search_filter(self, search_filter: SearchFilter) -> LocalSearchFilter:
+        """
+        Compile the SQL-compatible parts of a filter for LocalOneNoteSearch.
+
+        Date, location and size constraints are pushed down into the search
+        index query. Content type, quality, condition and custom filters need
+        page content and are not included.
+
+        Args:
+            search_filter: Filter configuration to compile
+
+        Returns:
+            Structured filter for local search
+        """
+        local_filter = LocalSearchFilter(
+            notebook_ids=search_filter.notebook_ids,
+            section_ids=search_filter.section_ids,
+            notebook_names=search_filter.notebook_names,
+            section_names=search_filter.section_names,
+            min_content_length=search_filter.min_content_length,
+            max_content_length=search_filter.max_content_length
+        )
+
+        if search_filter.created_date:
+            start, end = search_filter.created_date.get_date_range()
+            local_filter.created_after = start
+            local_filter.created_before = end
+
+        if search_filter.modified_date:
+            start, end = search_filter.modified_date.get_date_range()
+            local_filter.modified_after = start
+            local_filter.modified_before = end
+
+        return local_filter
+
+    async def search(self,
+                     query: str,
+                     search_filter: SearchFilter,
+                     limit: Optional[int] = None) -> List[SemanticSearchResult]:
+        """
+        Search the local index with date, location and size filters applied in SQL.
+
+        Args:
+            query: Search query
+            search_filter: Filter configuration to apply
+            limit: Maximum number of results
+
+        Returns:
+            List of filtered search results
+
+        Raises:
+            ValueError: If no local search engine is configured
+        """
+        if not self.local_search:
+            raise ValueError("Local search engine is required for filtered search")
+
+        local_filter = self.to_local_search_filter(search_filter)
+        return await self.local_search.search(
+            query,
+            limit=limit,
+            search_filter=local_filter
+        )
+
     async def _evaluate_page(self, 
                             page: CachedPage, 
                             search_filter: SearchFilter) -> bool:
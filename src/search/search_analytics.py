@@ -7,7 +7,6 @@ and search optimization insights for the OneNote local cache search system.
 
 import asyncio
 import logging
-import json
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple, Any, Union, NamedTuple
@@ -19,6 +18,8 @@ import uuid
 
 from ..models.cache import CachedPage
 from ..config.settings import Settings
+from ..storage import serialization
+from ..storage.async_io import atomic_write_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -539,23 +540,15 @@ class SearchAnalytics:
             
             # Save events
             events_data = [asdict(event) for event in self.events[-10000:]]  # Keep last 10k
-            with open(self.events_file, 'w', encoding='utf-8') as f:
-                json.dump(events_data, f, indent=2, default=str)
+            atomic_write_bytes(self.events_file, serialization.dumps(events_data))
             
             # Save patterns
             patterns_data = {k: asdict(p) for k, p in self.patterns.items()}
-            # Convert sets to lists for JSON serialization
-            for pattern_data in patterns_data.values():
-                if 'unique_users' in pattern_data and isinstance(pattern_data['unique_users'], set):
-                    pattern_data['unique_users'] = list(pattern_data['unique_users'])
-            
-            with open(self.patterns_file, 'w', encoding='utf-8') as f:
-                json.dump(patterns_data, f, indent=2, default=str)
+            atomic_write_bytes(self.patterns_file, serialization.dumps(patterns_data))
             
             # Save performance snapshots
             snapshots_data = [asdict(snapshot) for snapshot in self.performance_snapshots]
-            with open(self.performance_file, 'w', encoding='utf-8') as f:
-                json.dump(snapshots_data, f, indent=2, default=str)
+            atomic_write_bytes(self.performance_file, serialization.dumps(snapshots_data))
             
             logger.debug("Analytics data saved to disk")
             
@@ -569,9 +562,7 @@ class SearchAnalytics:
         try:
             # Load events
             if self.events_file.exists():
-                with open(self.events_file, 'r', encoding='utf-8') as f:
-                    events_data = json.load(f)
-                    
+                events_data = serialization.loads(self.events_file.read_bytes())
                 for event_data in events_data:
                     # Convert timestamp back to datetime
                     event_data['timestamp'] = datetime.fromisoformat(event_data['timestamp'])
@@ -580,9 +571,7 @@ class SearchAnalytics:
             
             # Load patterns
             if self.patterns_file.exists():
-                with open(self.patterns_file, 'r', encoding='utf-8') as f:
-                    patterns_data = json.load(f)
-                    
+                patterns_data = serialization.loads(self.patterns_file.read_bytes())
                 for pattern_id, pattern_data in patterns_data.items():
                     # Convert datetime strings back
                     pattern_data['first_seen'] = datetime.fromisoformat(pattern_data['first_seen'])
@@ -596,9 +585,7 @@ class SearchAnalytics:
             
             # Load performance snapshots
             if self.performance_file.exists():
-                with open(self.performance_file, 'r', encoding='utf-8') as f:
-                    snapshots_data = json.load(f)
-                    
+                snapshots_data = serialization.loads(self.performance_file.read_bytes())
                 for snapshot_data in snapshots_data:
                     snapshot_data['timestamp'] = datetime.fromisoformat(snapshot_data['timestamp'])
                     snapshot = PerformanceSnapshot(**snapshot_data)
@@ -7,7 +7,6 @@ and auto-completion features for improved search experience.
 
 import asyncio
 import logging
-import json
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple, Any, Union
@@ -17,6 +16,8 @@ from collections import Counter
 import re
 
 from ..models.cache import CachedPage
+from ..storage import serialization
+from ..storage.async_io import atomic_write_bytes
 from ..storage.local_search import LocalOneNoteSearch
 from ..config.settings import Settings
 
@@ -624,21 +625,19 @@ class SearchSuggestions:
         """Load search history from disk."""
         try:
             if self.history_file.exists():
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                    for entry_data in data:
-                        history_entry = SearchHistory(
-                            query=entry_data['query'],
-                            timestamp=datetime.fromisoformat(entry_data['timestamp']),
-                            result_count=entry_data['result_count'],
-                            success=entry_data['success'],
-                            execution_time=entry_data.get('execution_time', 0.0),
-                            clicked_results=entry_data.get('clicked_results', 0),
-                            session_id=entry_data.get('session_id')
-                        )
-                        self.search_history.append(history_entry)
-                
+                data = serialization.loads(self.history_file.read_bytes())
+                for entry_data in data:
+                    history_entry = SearchHistory(
+                        query=entry_data['query'],
+                        timestamp=datetime.fromisoformat(entry_data['timestamp']),
+                        result_count=entry_data['result_count'],
+                        success=entry_data['success'],
+                        execution_time=entry_data.get('execution_time', 0.0),
+                        clicked_results=entry_data.get('clicked_results', 0),
+                        session_id=entry_data.get('session_id')
+                    )
+                    self.search_history.append(history_entry)
+            
                 # Rebuild frequency data
                 self._rebuild_frequency_data()
                 
@@ -665,8 +664,7 @@ class SearchSuggestions:
                 }
                 data.append(entry_data)
             
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            atomic_write_bytes(self.history_file, serialization.dumps(data))
                 
         except Exception as e:
             logger.error(f"Failed to save search history: {e}")
@@ -675,27 +673,26 @@ class SearchSuggestions:
         """Load suggestions cache from disk."""
         try:
             if self.suggestions_file.exists():
-                with open(self.suggestions_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
-                    
-                    for key, suggestions_data in cache_data.items():
-                        suggestions = []
-                        for suggestion_data in suggestions_data:
-                            suggestion = SearchSuggestion(
-                                query=suggestion_data['query'],
-                                suggestion_type=SuggestionType(suggestion_data['suggestion_type']),
-                                score=suggestion_data['score'],
-                                frequency=suggestion_data['frequency'],
-                                last_used=datetime.fromisoformat(suggestion_data['last_used']) if suggestion_data.get('last_used') else None,
-                                result_count=suggestion_data.get('result_count', 0),
-                                success_rate=suggestion_data.get('success_rate', 0.0),
-                                related_notebooks=set(suggestion_data.get('related_notebooks', [])),
-                                related_sections=set(suggestion_data.get('related_sections', [])),
-                                common_terms=set(suggestion_data.get('common_terms', []))
-                            )
-                            suggestions.append(suggestion)
-                        self.suggestion_cache[key] = suggestions
-                
+                cache_data = serialization.loads(self.suggestions_file.read_bytes())
+
+                for key, suggestions_data in cache_data.items():
+                    suggestions = []
+                    for suggestion_data in suggestions_data:
+                        suggestion = SearchSuggestion(
+                            query=suggestion_data['query'],
+                            suggestion_type=SuggestionType(suggestion_data['suggestion_type']),
+                            score=suggestion_data['score'],
+                            frequency=suggestion_data['frequency'],
+                            last_used=datetime.fromisoformat(suggestion_data['last_used']) if suggestion_data.get('last_used') else None,
+                            result_count=suggestion_data.get('result_count', 0),
+                            success_rate=suggestion_data.get('success_rate', 0.0),
+                            related_notebooks=set(suggestion_data.get('related_notebooks', [])),
+                            related_sections=set(suggestion_data.get('related_sections', [])),
+                            common_terms=set(suggestion_data.get('common_terms', []))
+                        )
+                        suggestions.append(suggestion)
+                    self.suggestion_cache[key] = suggestions
+            
                 logger.debug(f"Loaded {len(self.suggestion_cache)} cache entries")
         
         except Exception as e:
@@ -725,8 +722,7 @@ class SearchSuggestions:
                     suggestions_data.append(suggestion_data)
                 cache_data[key] = suggestions_data
             
-            with open(self.suggestions_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
+            atomic_write_bytes(self.suggestions_file, serialization.dumps(cache_data))
                 
         except Exception as e:
             logger.error(f"Failed to save suggestions cache: {e}")
@@ -6,16 +6,22 @@ with proper rate limiting, retry logic, and progress tracking.
 """
 
 import asyncio
+import hashlib
 import logging
 import mimetypes
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlparse
 
-import aiohttp
+import httpx
 
 from ..config.settings import get_settings
 from ..models.cache import AssetInfo, AssetDownloadResult, DownloadStatus
+from ..tools.graph_client import get_graph_client
+from ..tools.graph_scheduler import (THROTTLE_STATUSES, background_priority,
+                                     get_graph_scheduler, retry_after_seconds)
+from .asset_store import AssetBlobStore, StoredBlob
+from .async_io import get_file_io
 from .directory_utils import get_asset_storage_path, sanitize_filename
 
 logger = logging.getLogger(__name__)
@@ -30,7 +36,8 @@ class AssetDownloadManager:
     """
 
     def __init__(self, max_concurrent_downloads: int = 3, 
-                 max_retries: int = 3, timeout_seconds: int = 30):
+                 max_retries: int = 3, timeout_seconds: int = 30,
+                 asset_store: Optional[AssetBlobStore] = None):
         """
         Initialize the asset download manager.
 
@@ -38,12 +45,18 @@ class AssetDownloadManager:
             max_concurrent_downloads: Maximum concurrent download operations
             max_retries: Maximum retry attempts per download
             timeout_seconds: Timeout for individual download operations
+            asset_store: Content-addressed store to deduplicate downloads into;
+                attachment paths become links into the store
         """
         self.settings = get_settings()
         self.max_concurrent_downloads = max_concurrent_downloads
         self.max_retries = max_retries
         self.timeout_seconds = timeout_seconds
-        self.session: Optional[aiohttp.ClientSession] = None
+        self.asset_store = asset_store
+        self.session: Optional[httpx.AsyncClient] = None
+        
+        # Shared thread pool for blocking cache file writes
+        self.file_io = get_file_io()
         
         # Progress tracking
         self.download_stats = {
@@ -51,26 +64,25 @@ class AssetDownloadManager:
             'successful_downloads': 0,
             'failed_downloads': 0,
             'bytes_downloaded': 0,
-            'current_downloads': 0
+            'current_downloads': 0,
+            'deduplicated_downloads': 0
         }
         
         logger.debug(f"Initialized asset download manager (max concurrent: {max_concurrent_downloads})")
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
-            headers={
-                'User-Agent': 'OneNote-Copilot/1.0'
-            }
-        )
+        # Downloads reuse the pooled connections of the shared Graph client
+        self.session = await get_graph_client()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+        # The shared client stays open for other callers
+        self.session = None
+        await self.file_io.flush()
 
+    @background_priority
     async def download_assets(self, assets: List[AssetInfo], 
                             attachments_dir: Path) -> AssetDownloadResult:
         """
@@ -99,7 +111,8 @@ class AssetDownloadManager:
                 'successful_downloads': 0,
                 'failed_downloads': 0,
                 'bytes_downloaded': 0,
-                'current_downloads': 0
+                'current_downloads': 0,
+                'deduplicated_downloads': 0
             }
 
             # Create semaphore for concurrent downloads
@@ -190,6 +203,12 @@ class AssetDownloadManager:
                     attachments_dir, asset.type, asset.filename
                 )
 
+                # Link assets the store already has instead of downloading them
+                if self.asset_store:
+                    blob = await self.file_io.run(self.asset_store.find_source, asset.original_url)
+                    if blob:
+                        return await self._link_stored_asset(blob, asset, storage_path)
+
                 # Check if file already exists and is current
                 if await self._is_asset_current(storage_path, asset):
                     logger.debug(f"Asset already current: {asset.filename}")
@@ -262,12 +281,21 @@ class AssetDownloadManager:
             if not self.session:
                 raise Exception("HTTP session not initialized")
 
-            # Make HTTP request
-            async with self.session.get(asset.original_url) as response:
-                if response.status != 200:
+            # Make HTTP request; downloads take a Graph request scheduler slot
+            scheduler = get_graph_scheduler()
+            async with scheduler.slot(), self.session.stream(
+                "GET", asset.original_url, timeout=self.timeout_seconds
+            ) as response:
+                if response.status_code in THROTTLE_STATUSES:
+                    # Pause all Graph requests; the retry waits for the pause
+                    scheduler.on_throttled(retry_after_seconds(response.headers))
+                else:
+                    scheduler.on_success()
+
+                if response.status_code != 200:
                     return {
                         'success': False,
-                        'error': f"HTTP {response.status}: {response.reason}"
+                        'error': f"HTTP {response.status_code}: {response.reason_phrase}"
                     }
 
                 # Get content type and size
@@ -281,18 +309,16 @@ class AssetDownloadManager:
                         logger.warning(f"MIME type mismatch for {asset.filename}: "
                                      f"expected {asset.mime_type}, got {content_type}")
 
-                # Ensure storage directory exists
-                storage_path.parent.mkdir(parents=True, exist_ok=True)
+                if self.asset_store:
+                    return await self._download_into_store(asset, storage_path, response, content_type)
 
-                # Download content
-                with open(storage_path, 'wb') as f:
-                    downloaded_bytes = 0
-                    async for chunk in response.content.iter_chunked(8192):
-                        f.write(chunk)
-                        downloaded_bytes += len(chunk)
+                # Download content; the file only replaces storage_path once complete
+                async with self.file_io.open_stream(storage_path) as stream:
+                    async for chunk in response.aiter_bytes(8192):
+                        await stream.write(chunk)
 
                 # Verify download
-                actual_size = storage_path.stat().st_size
+                actual_size = stream.bytes_written
                 if size_bytes > 0 and actual_size != size_bytes:
                     logger.warning(f"Size mismatch for {asset.filename}: "
                                  f"expected {size_bytes}, got {actual_size}")
@@ -310,15 +336,81 @@ class AssetDownloadManager:
                 }
 
         except Exception as e:
-            # Clean up partial download
-            if storage_path.exists():
-                try:
-                    storage_path.unlink()
-                except Exception as cleanup_error:
-                    logger.warning(f"Failed to cleanup partial download: {cleanup_error}")
-
+            # Partial downloads are discarded by the atomic stream
             return {'success': False, 'error': str(e)}
 
+    async def _download_into_store(self, asset: AssetInfo, storage_path: Path,
+                                   response: httpx.Response,
+                                   content_type: str) -> Dict[str, any]:
+        """
+        Download an asset into the content-addressed store and link it.
+
+        Content the store already has (e.g. the same image under another
+        URL) is recognized by the SHA-256 of the downloaded body and stored
+        once.
+
+        Args:
+            asset: Asset information
+            storage_path: Attachment path to link the blob at
+            response: Open HTTP response
+            content_type: Response content type
+
+        Returns:
+            Dictionary with download result
+        """
+        etag = response.headers.get('etag')
+        digest = hashlib.sha256()
+        temp_path = await self.file_io.run(self.asset_store.temp_path)
+        async with self.file_io.open_stream(temp_path) as stream:
+            async for chunk in response.aiter_bytes(8192):
+                digest.update(chunk)
+                await stream.write(chunk)
+
+        blob = await self.file_io.run(
+            self.asset_store.add_file, temp_path, digest.hexdigest(), asset.original_url, etag
+        )
+        await self.file_io.run(self.asset_store.link, blob.sha256, storage_path)
+
+        if not asset.mime_type:
+            asset.mime_type = content_type
+        asset.size_bytes = blob.size_bytes
+
+        return {
+            'success': True,
+            'local_path': str(storage_path),
+            'size_bytes': blob.size_bytes,
+            'mime_type': content_type,
+            'sha256': blob.sha256
+        }
+
+    async def _link_stored_asset(self, blob: StoredBlob, asset: AssetInfo, storage_path: Path) -> Dict[str, any]:
+        """
+        Link an already stored blob at an attachment path.
+
+        Args:
+            blob: Stored blob
+            asset: Asset information
+            storage_path: Attachment path
+
+        Returns:
+            Dictionary with download result
+        """
+        await self.file_io.run(self.asset_store.link, blob.sha256, storage_path)
+        self.download_stats['deduplicated_downloads'] += 1
+
+        asset.local_path = str(storage_path)
+        asset.size_bytes = blob.size_bytes
+        asset.download_status = "completed"
+
+        logger.debug(f"Linked stored asset: {asset.filename} ({blob.sha256[:12]})")
+        return {
+            'success': True,
+            'local_path': str(storage_path),
+            'size_bytes': blob.size_bytes,
+            'cached': True,
+            'sha256': blob.sha256
+        }
+
     async def _is_asset_current(self, storage_path: Path, asset: AssetInfo) -> bool:
         """
         Check if a locally stored asset is current.
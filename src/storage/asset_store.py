@@ -0,0 +1,386 @@
+"""
+Content-addressed asset store for the local OneNote cache.
+
+Downloaded images and files are stored once per user, keyed by the SHA-256 of
+their content. Page attachment paths are hard links into the store (copies
+where the filesystem does not support links), and every link is recorded so
+blobs can be reference counted and reclaimed once no page uses them. Source
+URLs and their ETags are remembered so known assets are not downloaded again;
+an ETag only identifies content together with the URL that sent it.
+"""
+
+import hashlib
+import logging
+import os
+import shutil
+import sqlite3
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Name of the store directory inside each user's global cache directory
+ASSET_STORE_DIRNAME = "assets"
+
+HASH_CHUNK_BYTES = 1024 * 1024
+
+# Temporary files younger than this may belong to a download still in progress
+TEMP_FILE_MAX_AGE_SECONDS = 60 * 60
+
+
+def hash_file(path: Path) -> str:
+    """
+    Compute the SHA-256 digest of a file.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class StoredBlob:
+    """A blob in the asset store."""
+    sha256: str
+    path: Path
+    size_bytes: int
+
+
+class AssetBlobStore:
+    """
+    SHA-256 keyed blob store with reference-counted page links.
+
+    Layout::
+
+        <root>/blobs/<sha[:2]>/<sha>   blob content
+        <root>/tmp/                    in-flight downloads
+        <root>/assets.db               blobs, sources and links
+    """
+
+    def __init__(self, root: Path):
+        """
+        Initialize the asset store.
+
+        Args:
+            root: Store root directory
+        """
+        self.root = root
+        self.blobs_dir = root / "blobs"
+        self.tmp_dir = root / "tmp"
+        self.db_path = root / "assets.db"
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get (or open and initialize) the store database connection."""
+        if self._connection is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30.0)
+            connection.row_factory = sqlite3.Row
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS blobs (
+                    sha256 TEXT PRIMARY KEY,
+                    size_bytes INTEGER NOT NULL,
+                    created TEXT NOT NULL
+                )
+            """)
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS sources (
+                    url TEXT PRIMARY KEY,
+                    sha256 TEXT NOT NULL,
+                    etag TEXT
+                )
+            """)
+            connection.execute("""
+                CREATE TABLE IF NOT EXISTS links (
+                    path TEXT PRIMARY KEY,
+                    sha256 TEXT NOT NULL
+                )
+            """)
+            # ETags are looked up together with their URL (the primary key)
+            connection.execute("DROP INDEX IF EXISTS idx_sources_etag")
+            connection.execute("CREATE INDEX IF NOT EXISTS idx_links_sha256 ON links(sha256)")
+            connection.commit()
+            self._connection = connection
+        return self._connection
+
+    def blob_path(self, sha256: str) -> Path:
+        """Get the storage path of a blob."""
+        return self.blobs_dir / sha256[:2] / sha256
+
+    def temp_path(self) -> Path:
+        """Get a unique path for an in-flight download inside the store."""
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        return self.tmp_dir / uuid.uuid4().hex
+
+    def get_blob(self, sha256: str) -> Optional[StoredBlob]:
+        """
+        Look up a stored blob.
+
+        Args:
+            sha256: Content digest
+
+        Returns:
+            Stored blob, or None if it is not in the store
+        """
+        row = self._get_connection().execute(
+            "SELECT size_bytes FROM blobs WHERE sha256 = ?", (sha256,)
+        ).fetchone()
+        path = self.blob_path(sha256)
+        if row is None or not path.exists():
+            return None
+        return StoredBlob(sha256=sha256, path=path, size_bytes=row["size_bytes"])
+
+    def find_source(self, url: str, etag: Optional[str] = None) -> Optional[StoredBlob]:
+        """
+        Find a stored blob previously downloaded from a URL.
+
+        ETags are opaque values that only identify content of the resource
+        that sent them, so they are never matched across URLs.
+
+        Args:
+            url: Source URL
+            etag: Entity tag reported by the server now; if given, the blob
+                is only returned if the URL sent the same ETag before
+
+        Returns:
+            Stored blob, or None if the asset is unknown or changed
+        """
+        connection = self._get_connection()
+        if etag:
+            row = connection.execute(
+                "SELECT sha256 FROM sources WHERE url = ? AND etag = ?", (url, etag)
+            ).fetchone()
+        else:
+            row = connection.execute("SELECT sha256 FROM sources WHERE url = ?", (url,)).fetchone()
+        return self.get_blob(row["sha256"]) if row else None
+
+    def add_file(
+        self,
+        source_path: Path,
+        sha256: Optional[str] = None,
+        url: Optional[str] = None,
+        etag: Optional[str] = None
+    ) -> StoredBlob:
+        """
+        Move a file into the store.
+
+        If a blob with the same content already exists, the file is discarded.
+
+        Args:
+            source_path: File to add (moved into the store)
+            sha256: Content digest, computed if not given
+            url: Source URL to remember
+            etag: Entity tag to remember
+
+        Returns:
+            Stored blob
+        """
+        sha256 = sha256 or hash_file(source_path)
+        target = self.blob_path(sha256)
+        size_bytes = source_path.stat().st_size
+
+        if target.exists():
+            source_path.unlink()
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(source_path, target)
+
+        connection = self._get_connection()
+        with connection:
+            connection.execute(
+                "INSERT OR IGNORE INTO blobs (sha256, size_bytes, created) VALUES (?, ?, ?)",
+                (sha256, size_bytes, datetime.utcnow().isoformat())
+            )
+            if url:
+                connection.execute(
+                    "INSERT OR REPLACE INTO sources (url, sha256, etag) VALUES (?, ?, ?)",
+                    (url, sha256, etag)
+                )
+        return StoredBlob(sha256=sha256, path=target, size_bytes=size_bytes)
+
+    def remember_source(self, url: str, sha256: str, etag: Optional[str] = None) -> None:
+        """
+        Record that a URL serves a stored blob.
+
+        Args:
+            url: Source URL
+            sha256: Content digest
+            etag: Entity tag reported by the server
+        """
+        connection = self._get_connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO sources (url, sha256, etag) VALUES (?, ?, ?)",
+            (url, sha256, etag)
+        )
+        connection.commit()
+
+    def link(self, sha256: str, path: Path) -> Path:
+        """
+        Expose a blob at a page attachment path.
+
+        Args:
+            sha256: Content digest of a stored blob
+            path: Attachment path to create
+
+        Returns:
+            The attachment path
+
+        Raises:
+            FileNotFoundError: If the blob is not stored
+        """
+        blob_path = self.blob_path(sha256)
+        if not blob_path.exists():
+            raise FileNotFoundError(f"Asset blob not found: {sha256}")
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        linked = path.exists() and os.path.samefile(path, blob_path)
+        if not linked:
+            temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+            try:
+                os.link(blob_path, temp_path)
+            except OSError:
+                # Filesystem without hard links (or a different device)
+                shutil.copyfile(blob_path, temp_path)
+            os.replace(temp_path, path)
+
+        connection = self._get_connection()
+        connection.execute(
+            "INSERT OR REPLACE INTO links (path, sha256) VALUES (?, ?)", (str(path), sha256)
+        )
+        connection.commit()
+        return path
+
+    def release(self, path: Path, delete_unreferenced: bool = True) -> bool:
+        """
+        Remove an attachment link and drop its blob if no other page uses it.
+
+        Args:
+            path: Attachment path
+            delete_unreferenced: Delete the blob when its last link is released
+
+        Returns:
+            True if the path was a tracked link
+        """
+        connection = self._get_connection()
+        row = connection.execute("SELECT sha256 FROM links WHERE path = ?", (str(path),)).fetchone()
+        path.unlink(missing_ok=True)
+        if row is None:
+            return False
+
+        connection.execute("DELETE FROM links WHERE path = ?", (str(path),))
+        connection.commit()
+        if delete_unreferenced and self.reference_count(row["sha256"]) == 0:
+            self._delete_blob(row["sha256"])
+        return True
+
+    def release_under(self, directory: Path) -> int:
+        """
+        Release every tracked link below a directory (e.g. a deleted page).
+
+        Args:
+            directory: Directory whose links are released
+
+        Returns:
+            Number of released links
+        """
+        prefix = str(directory).rstrip(os.sep) + os.sep
+        rows = self._get_connection().execute(
+            "SELECT path FROM links WHERE substr(path, 1, ?) = ?", (len(prefix), prefix)
+        ).fetchall()
+        return sum(self.release(Path(row["path"])) for row in rows)
+
+    def reference_count(self, sha256: str) -> int:
+        """Get the number of attachment paths linking to a blob."""
+        return self._get_connection().execute(
+            "SELECT COUNT(*) FROM links WHERE sha256 = ?", (sha256,)
+        ).fetchone()[0]
+
+    def _delete_blob(self, sha256: str) -> None:
+        """Delete a blob and every record of it."""
+        connection = self._get_connection()
+        with connection:
+            connection.execute("DELETE FROM blobs WHERE sha256 = ?", (sha256,))
+            connection.execute("DELETE FROM sources WHERE sha256 = ?", (sha256,))
+        self.blob_path(sha256).unlink(missing_ok=True)
+
+    def garbage_collect(self, temp_max_age: float = TEMP_FILE_MAX_AGE_SECONDS) -> Dict[str, int]:
+        """
+        Drop links whose attachment file is gone and delete unreferenced blobs.
+
+        Args:
+            temp_max_age: Seconds since their last write after which temporary
+                files are treated as leftovers of interrupted downloads
+
+        Returns:
+            Dictionary with stale_links, blobs_removed and bytes_freed
+        """
+        connection = self._get_connection()
+        result = {"stale_links": 0, "blobs_removed": 0, "bytes_freed": 0}
+
+        stale = [
+            row["path"] for row in connection.execute("SELECT path FROM links")
+            if not Path(row["path"]).exists()
+        ]
+        with connection:
+            connection.executemany("DELETE FROM links WHERE path = ?", [(path,) for path in stale])
+        result["stale_links"] = len(stale)
+
+        unreferenced = connection.execute("""
+            SELECT sha256, size_bytes FROM blobs
+            WHERE sha256 NOT IN (SELECT DISTINCT sha256 FROM links)
+        """).fetchall()
+        for row in unreferenced:
+            self._delete_blob(row["sha256"])
+            result["blobs_removed"] += 1
+            result["bytes_freed"] += row["size_bytes"]
+
+        # Leftovers of interrupted downloads; downloads still streaming keep
+        # their temporary file fresh
+        if self.tmp_dir.exists():
+            cutoff = time.time() - temp_max_age
+            for leftover in self.tmp_dir.iterdir():
+                try:
+                    if leftover.stat().st_mtime < cutoff:
+                        leftover.unlink(missing_ok=True)
+                except FileNotFoundError:
+                    pass  # Moved into the store meanwhile
+
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get store statistics.
+
+        Returns:
+            Dictionary with blob and link counts, stored bytes and the bytes
+            saved by deduplication
+        """
+        row = self._get_connection().execute("""
+            SELECT (SELECT COUNT(*) FROM blobs) AS blobs,
+                   (SELECT COALESCE(SUM(size_bytes), 0) FROM blobs) AS stored_bytes,
+                   (SELECT COUNT(*) FROM links) AS links,
+                   (SELECT COALESCE(SUM(b.size_bytes), 0)
+                    FROM links l JOIN blobs b ON b.sha256 = l.sha256) AS linked_bytes
+        """).fetchone()
+        stats = dict(row)
+        stats["bytes_saved"] = max(0, stats.pop("linked_bytes") - stats["stored_bytes"])
+        return stats
+
+    def close(self) -> None:
+        """Close the store database connection."""
+        if self._connection:
+            self._connection.close()
+            self._connection = None
@@ -0,0 +1,286 @@
+"""
+Asynchronous file I/O for cache writers.
+
+Blocking file writes run on a bounded thread pool so that disk I/O overlaps
+with network I/O on the event loop. Files are written to a temporary sibling
+and atomically renamed into place, so readers never observe a partially
+written file. Durability is batched: written files (and their directories)
+are fsynced once per batch instead of once per file.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional, Set, TypeVar
+
+from . import serialization
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_IO_WORKERS = 4
+DEFAULT_FSYNC_BATCH_SIZE = 64
+
+# Buffer size for streamed writes before a chunk is handed to the thread pool
+STREAM_BUFFER_BYTES = 256 * 1024
+
+
+def _temp_path(path: Path) -> Path:
+    """Get a unique temporary sibling path for an atomic write."""
+    return path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+
+
+def _fsync_path(path: Path) -> None:
+    """Flush a file or directory to stable storage."""
+    flags = os.O_RDONLY
+    if path.is_dir() and hasattr(os, "O_DIRECTORY"):
+        flags |= os.O_DIRECTORY
+    try:
+        fd = os.open(str(path), flags)
+    except OSError:
+        # Already removed, or directories cannot be opened on this platform
+        return
+    try:
+        os.fsync(fd)
+    except OSError as e:
+        logger.debug(f"fsync failed for {path}: {e}")
+    finally:
+        os.close(fd)
+
+
+def atomic_write_bytes(path: Path, data: bytes, fsync: bool = False) -> Path:
+    """
+    Write a file atomically via a temporary file and rename.
+
+    Args:
+        path: Target file path
+        data: File content
+        fsync: Flush the file to stable storage before the rename
+
+    Returns:
+        The target path
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = _temp_path(path)
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return path
+
+
+class AtomicFileStream:
+    """
+    Streamed atomic file write, used for chunked downloads.
+
+    Chunks are buffered and written on the I/O thread pool. The target file
+    is only replaced when the stream exits without an error; otherwise the
+    temporary file is discarded and any existing file is left untouched.
+    """
+
+    def __init__(self, file_io: "AsyncFileIO", path: Path):
+        self.file_io = file_io
+        self.path = path
+        self.temp_path = _temp_path(path)
+        self.bytes_written = 0
+        self._file = None
+        self._buffer = bytearray()
+
+    async def __aenter__(self) -> "AtomicFileStream":
+        def open_temp():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            return open(self.temp_path, "wb")
+
+        self._file = await self.file_io.run(open_temp)
+        return self
+
+    async def write(self, chunk: bytes) -> None:
+        """Append a chunk to the file."""
+        self._buffer.extend(chunk)
+        self.bytes_written += len(chunk)
+        if len(self._buffer) >= STREAM_BUFFER_BYTES:
+            await self._drain()
+
+    async def _drain(self) -> None:
+        """Hand buffered data to the thread pool."""
+        if self._buffer:
+            data = bytes(self._buffer)
+            self._buffer.clear()
+            await self.file_io.run(self._file.write, data)
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc_type is None:
+                await self._drain()
+        finally:
+            await self.file_io.run(self._file.close)
+
+        if exc_type is not None:
+            await self.file_io.run(self.temp_path.unlink, True)
+            return
+
+        try:
+            await self.file_io.run(os.replace, self.temp_path, self.path)
+        except BaseException:
+            await self.file_io.run(self.temp_path.unlink, True)
+            raise
+        await self.file_io.mark_written([self.path])
+
+
+class AsyncFileIO:
+    """
+    Bounded thread pool for blocking cache file operations.
+
+    All cache writers share one instance (see ``get_file_io``) so the number
+    of threads doing disk I/O stays bounded regardless of how many writers
+    run concurrently.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_IO_WORKERS,
+        fsync_batch_size: int = DEFAULT_FSYNC_BATCH_SIZE
+    ):
+        """
+        Initialize the file I/O layer.
+
+        Args:
+            max_workers: Maximum number of I/O threads
+            fsync_batch_size: Number of written files after which they are
+                fsynced together (0 disables fsync)
+        """
+        self.max_workers = max_workers
+        self.fsync_batch_size = fsync_batch_size
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cache-io")
+        self._unsynced: Set[Path] = set()
+        self._lock = threading.Lock()
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run a blocking callable on the I/O thread pool.
+
+        Args:
+            func: Callable to run
+            *args: Positional arguments
+
+        Returns:
+            The callable's result
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def write_bytes(self, path: Path, data: bytes) -> Path:
+        """
+        Atomically write a binary file.
+
+        Args:
+            path: Target file path
+            data: File content
+
+        Returns:
+            The target path
+        """
+        await self.run(atomic_write_bytes, path, data)
+        await self.mark_written([path])
+        return path
+
+    async def write_text(self, path: Path, text: str, encoding: str = "utf-8") -> Path:
+        """Atomically write a text file."""
+        return await self.write_bytes(path, text.encode(encoding))
+
+    async def write_json(self, path: Path, data: Any) -> Path:
+        """
+        Atomically write a JSON file.
+
+        Serialization runs on the thread pool together with the write.
+
+        Args:
+            path: Target file path
+            data: Data to encode (see ``serialization.dumps``)
+
+        Returns:
+            The target path
+        """
+        def write():
+            return atomic_write_bytes(path, serialization.dumps(data))
+
+        await self.run(write)
+        await self.mark_written([path])
+        return path
+
+    def open_stream(self, path: Path) -> AtomicFileStream:
+        """
+        Open a streamed atomic write.
+
+        Usage::
+
+            async with file_io.open_stream(path) as stream:
+                async for chunk in response.aiter_bytes(8192):
+                    await stream.write(chunk)
+        """
+        return AtomicFileStream(self, path)
+
+    async def mark_written(self, paths: Iterable[Path]) -> None:
+        """
+        Record files written outside ``write_*`` for batched fsync.
+
+        Args:
+            paths: Written file paths
+        """
+        if self.fsync_batch_size <= 0:
+            return
+        with self._lock:
+            for path in paths:
+                self._unsynced.add(Path(path))
+            due = len(self._unsynced) >= self.fsync_batch_size
+        if due:
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Fsync every file written since the last flush, and their directories.
+
+        Returns:
+            Number of files flushed
+        """
+        with self._lock:
+            batch, self._unsynced = self._unsynced, set()
+        if batch:
+            await self.run(self._fsync_batch, batch)
+        return len(batch)
+
+    @staticmethod
+    def _fsync_batch(paths: Set[Path]) -> None:
+        """Fsync a batch of files followed by their parent directories."""
+        for path in paths:
+            _fsync_path(path)
+        for directory in {path.parent for path in paths}:
+            _fsync_path(directory)
+
+    def shutdown(self) -> None:
+        """Stop the thread pool after pending operations finish."""
+        self._executor.shutdown(wait=True)
+
+
+_file_io: Optional[AsyncFileIO] = None
+_file_io_lock = threading.Lock()
+
+
+def get_file_io() -> AsyncFileIO:
+    """Get the shared file I/O layer used by all cache writers."""
+    global _file_io
+    with _file_io_lock:
+        if _file_io is None:
+            _file_io = AsyncFileIO()
+        return _file_io
@@ -3,6 +3,12 @@ Bulk content indexing manager for OneNote cache system.
 
 Provides comprehensive batch processing capabilities with progress tracking,
 resume functionality, and efficient content synchronization.
+
+All pages are listed into a manifest first and then processed most recently
+modified first, so recently edited pages are searchable early in a long run.
+Progress is persisted as a sync checkpoint in the cache root: completed
+sections and indexed pages are skipped when an interrupted operation is
+resumed.
 """
 
 import asyncio
@@ -14,16 +20,23 @@ from typing import Dict, List, Optional, Tuple, Any, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 
-from ..models.cache import CachedPage, SyncResult
+from ..models.cache import CachedPage, SyncCheckpoint, SyncResult
 from ..models.onenote import OneNotePage, OneNoteSection, OneNoteNotebook
+from ..tools.graph_scheduler import background_priority
 from .onenote_fetcher import OneNoteContentFetcher
 from .asset_downloader import AssetDownloadManager
 from .markdown_converter import MarkdownConverter
 from .local_search import LocalOneNoteSearch
+from .page_manifest import parse_modified
 from .directory_utils import get_content_path_for_page
+from .sync_checkpoint import SyncCheckpointStore
 
 logger = logging.getLogger(__name__)
 
+# Checkpoint file of an interrupted bulk indexing operation, in the cache root
+BULK_CHECKPOINT_FILE = "indexing_checkpoint.json"
+BULK_CHECKPOINT_OPERATION = "bulk_index"
+
 
 class IndexingStatus(Enum):
     """Status of indexing operation."""
@@ -73,6 +86,12 @@ class IndexingProgress:
             return 0.0
         return (self.processed_pages / self.total_pages) * 100.0
     
+    def get_coverage_percentage(self) -> float:
+        """Get the percentage of pages that are indexed (0.0 to 100.0)."""
+        if self.total_pages == 0:
+            return 0.0
+        return ((self.successful_pages + self.skipped_pages) / self.total_pages) * 100.0
+    
     def get_success_rate(self) -> float:
         """Get success rate percentage (0.0 to 100.0)."""
         if self.processed_pages == 0:
@@ -168,6 +187,10 @@ class BulkContentIndexer:
         self.status = IndexingStatus.PENDING
         self.progress = IndexingProgress()
         self.checkpoint: Optional[IndexingCheckpoint] = None
+
+        # Durable record of completed sections and indexed pages
+        self.checkpoint_store = SyncCheckpointStore(self.cache_root / BULK_CHECKPOINT_FILE)
+        self.sync_checkpoint = SyncCheckpoint(operation=BULK_CHECKPOINT_OPERATION)
         
         # Callbacks
         self.progress_callback: Optional[Callable[[IndexingProgress], None]] = None
@@ -186,6 +209,7 @@ class BulkContentIndexer:
         """Set callback for checkpoint saves."""
         self.checkpoint_callback = callback
 
+    @background_priority
     async def index_all_content(self, 
                                notebooks: Optional[List[OneNoteNotebook]] = None,
                                resume_from_checkpoint: bool = True,
@@ -205,154 +229,181 @@ class BulkContentIndexer:
             # Generate operation ID
             self.current_operation_id = f"bulk_index_{int(time.time())}"
             
-            # Try to load checkpoint if resuming
+            # Initialize new operation
+            self.progress = IndexingProgress()
+            self.progress.start_time = datetime.utcnow()
+            self.status = IndexingStatus.RUNNING
+
+            # Try to load checkpoint if resuming; completed sections and
+            # indexed pages are then skipped
             if resume_from_checkpoint and await self._load_checkpoint():
                 logger.info(f"Resuming indexing from checkpoint: {self.checkpoint.timestamp}")
-                notebooks = None  # Use checkpoint state
             else:
-                # Initialize new operation
-                self.progress = IndexingProgress()
-                self.progress.start_time = datetime.utcnow()
-                self.status = IndexingStatus.RUNNING
-                
-                # Get notebooks to process
-                if not notebooks and self.content_fetcher:
-                    notebooks = await self.content_fetcher.get_all_notebooks()
-                elif not notebooks:
-                    raise ValueError("No notebooks provided and no content fetcher available")
-
-            # Count total items for progress tracking
-            await self._calculate_totals(notebooks or [])
+                self.sync_checkpoint = SyncCheckpoint(operation=BULK_CHECKPOINT_OPERATION)
+
+            # Get notebooks to process
+            if not notebooks and self.content_fetcher:
+                notebooks = await self.content_fetcher.get_all_notebooks()
+            elif not notebooks:
+                raise ValueError("No notebooks provided and no content fetcher available")
+
+            # List all pages first; this also sets the totals for progress tracking
+            manifest = await self._build_manifest(notebooks or [])
             
             logger.info(f"Starting bulk indexing: {self.progress.total_notebooks} notebooks, "
                        f"{self.progress.total_sections} sections, {self.progress.total_pages} pages")
 
-            # Process notebooks
-            for notebook in notebooks or []:
-                if self.status != IndexingStatus.RUNNING:
-                    break
-                    
-                await self._process_notebook(notebook, force_reindex)
-                self.progress.processed_notebooks += 1
-                await self._update_progress()
+            # Process pages, most recently modified first
+            await self._process_manifest(manifest, force_reindex)
 
             # Finalize
             self.progress.end_time = datetime.utcnow()
+            if self.status != IndexingStatus.RUNNING:
+                # Paused or cancelled: keep the checkpoint to resume from
+                await self._save_checkpoint()
+                return self.progress
+
             self.status = IndexingStatus.COMPLETED
+            if self.progress.failed_pages:
+                await self._save_checkpoint()
+            else:
+                await self.checkpoint_store.clear()
             
             logger.info(f"Bulk indexing completed: {self.progress.successful_pages}/{self.progress.total_pages} "
                        f"pages processed successfully ({self.progress.get_success_rate():.1f}%)")
             
             return self.progress
 
+        except asyncio.CancelledError:
+            # Interrupted (e.g. Ctrl-C): the next run resumes from here
+            self.status = IndexingStatus.CANCELLED
+            await self._save_checkpoint()
+            raise
+
         except Exception as e:
             logger.error(f"Bulk indexing failed: {e}")
             self.progress.errors.append(f"Indexing failed: {str(e)}")
             self.status = IndexingStatus.FAILED
+            await self._save_checkpoint()
             raise
 
-    async def _calculate_totals(self, notebooks: List[OneNoteNotebook]) -> None:
-        """Calculate total items for progress tracking."""
-        try:
-            self.progress.total_notebooks = len(notebooks)
-            
-            for notebook in notebooks:
-                if not self.content_fetcher:
-                    continue
-                    
+    async def _build_manifest(
+        self, notebooks: List[OneNoteNotebook]
+    ) -> List[Tuple[OneNoteNotebook, OneNoteSection, List[OneNotePage]]]:
+        """
+        List the sections and pages of all notebooks.
+
+        Sections completed before an interruption are left out. The listing
+        sets the totals for progress tracking.
+
+        Args:
+            notebooks: Notebooks to index
+
+        Returns:
+            List of (notebook, section, pages) tuples
+        """
+        manifest = []
+        self.progress.total_notebooks = len(notebooks)
+        if not self.content_fetcher:
+            return manifest
+
+        for notebook in notebooks:
+            try:
                 sections = await self.content_fetcher.get_all_sections(notebook_id=notebook.id)
-                self.progress.total_sections += len(sections)
-                
-                for section in sections:
-                    pages = await self.content_fetcher.get_pages_from_section(section.id)
-                    self.progress.total_pages += len(pages)
-                    
-        except Exception as e:
-            logger.warning(f"Failed to calculate totals: {e}")
-            # Set conservative estimates
-            self.progress.total_notebooks = len(notebooks)
-            self.progress.total_sections = len(notebooks) * 3  # Estimate
-            self.progress.total_pages = len(notebooks) * 10   # Estimate
-
-    async def _process_notebook(self, notebook: OneNoteNotebook, force_reindex: bool) -> None:
-        """Process a single notebook with all sections and pages."""
-        try:
-            logger.info(f"Processing notebook: {notebook.display_name}")
-            
-            if not self.content_fetcher:
-                return
-                
-            sections = await self.content_fetcher.get_all_sections(notebook_id=notebook.id)
-            
+            except Exception as e:
+                error_msg = f"Failed to process notebook {notebook.display_name}: {e}"
+                logger.error(error_msg)
+                self.progress.errors.append(error_msg)
+                continue
+
+            self.progress.total_sections += len(sections)
             for section in sections:
-                if self.status != IndexingStatus.RUNNING:
-                    break
-                    
-                await self._process_section(notebook, section, force_reindex)
-                self.progress.processed_sections += 1
-                
-        except Exception as e:
-            error_msg = f"Failed to process notebook {notebook.display_name}: {e}"
-            logger.error(error_msg)
-            self.progress.errors.append(error_msg)
+                if section.id in self.sync_checkpoint.completed_sections:
+                    logger.debug(f"Section {section.display_name} completed before, skipping")
+                    self.progress.processed_sections += 1
+                    continue
 
-    async def _process_section(self, 
-                             notebook: OneNoteNotebook, 
-                             section: OneNoteSection, 
-                             force_reindex: bool) -> None:
-        """Process a single section with all pages."""
-        try:
-            logger.debug(f"Processing section: {section.display_name}")
-            
-            if not self.content_fetcher:
-                return
-                
-            pages = await self.content_fetcher.get_pages_from_section(section.id)
-            
-            # Process pages with concurrency control
-            semaphore_tasks = []
-            for page in pages:
+                try:
+                    pages = await self.content_fetcher.get_pages_from_section(section.id)
+                except Exception as e:
+                    error_msg = f"Failed to process section {section.display_name}: {e}"
+                    logger.error(error_msg)
+                    self.progress.errors.append(error_msg)
+                    continue
+
+                self.progress.total_pages += len(pages)
+                manifest.append((notebook, section, pages))
+
+        return manifest
+
+    async def _process_manifest(
+        self,
+        manifest: List[Tuple[OneNoteNotebook, OneNoteSection, List[OneNotePage]]],
+        force_reindex: bool
+    ) -> None:
+        """
+        Process all listed pages, most recently modified first.
+
+        Args:
+            manifest: Listed (notebook, section, pages) tuples
+            force_reindex: Whether to force reindex existing content
+        """
+        queue = [(notebook, section, page) for notebook, section, pages in manifest for page in pages]
+        queue.sort(key=lambda item: parse_modified(item[2].last_modified_date_time), reverse=True)
+        pending = iter(queue)
+        failed_sections = set()
+
+        async def worker() -> None:
+            """Process pages from the shared queue until it is empty or the operation stops."""
+            for notebook, section, page in pending:
                 if self.status != IndexingStatus.RUNNING:
-                    break
-                    
-                task = self._process_page_with_semaphore(notebook, section, page, force_reindex)
-                semaphore_tasks.append(task)
-                
-                # Process in batches to avoid memory issues
-                if len(semaphore_tasks) >= self.max_concurrent_pages * 2:
-                    await asyncio.gather(*semaphore_tasks)
-                    semaphore_tasks = []
-            
-            # Process remaining tasks
-            if semaphore_tasks:
-                await asyncio.gather(*semaphore_tasks)
-                
-        except Exception as e:
-            error_msg = f"Failed to process section {section.display_name}: {e}"
-            logger.error(error_msg)
-            self.progress.errors.append(error_msg)
+                    return
+                if not await self._process_page_with_semaphore(notebook, section, page, force_reindex):
+                    failed_sections.add(section.id)
+
+        await asyncio.gather(*(worker() for _ in range(self.max_concurrent_pages)))
+        if self.status != IndexingStatus.RUNNING:
+            return
+
+        # Sections whose pages were all processed are complete
+        for notebook, section, pages in manifest:
+            if section.id not in failed_sections:
+                self.sync_checkpoint.advance_section(section.id, None)
+            self.progress.processed_sections += 1
+        self.progress.processed_notebooks = self.progress.total_notebooks
+        await self._update_progress()
 
     async def _process_page_with_semaphore(self, 
                                          notebook: OneNoteNotebook,
                                          section: OneNoteSection, 
                                          page: OneNotePage, 
-                                         force_reindex: bool) -> None:
+                                         force_reindex: bool) -> bool:
         """Process a single page with semaphore control."""
         async with self.processing_semaphore:
-            await self._process_page(notebook, section, page, force_reindex)
+            return await self._process_page(notebook, section, page, force_reindex)
 
     async def _process_page(self, 
                           notebook: OneNoteNotebook,
                           section: OneNoteSection, 
                           page: OneNotePage, 
-                          force_reindex: bool) -> None:
-        """Process a single page through the complete pipeline."""
+                          force_reindex: bool) -> bool:
+        """
+        Process a single page through the complete pipeline.
+
+        Returns:
+            True if the page is indexed (or already was), False if it failed
+        """
         try:
+            # Skip pages indexed before an interruption
+            if self.sync_checkpoint.is_page_stored(section.id, page.id):
+                self.progress.skipped_pages += 1
+                return True
+
             # Check if already processed (unless force reindex)
             if not force_reindex and self._is_page_current(page):
                 self.progress.skipped_pages += 1
-                self.progress.processed_pages += 1
-                return
+                self.sync_checkpoint.mark_page_stored(section.id, page.id)
+                return True
             
             logger.debug(f"Processing page: {page.title}")
             
@@ -402,15 +453,18 @@ class BulkContentIndexer:
             
             # Save to cache storage
             await self._save_cached_page(cached_page)
+            self.sync_checkpoint.mark_page_stored(section.id, page.id)
             
             self.progress.successful_pages += 1
             self.progress.processed_content_size += len(page.html_content or "")
+            return True
             
         except Exception as e:
             error_msg = f"Failed to process page {page.title}: {e}"
             logger.error(error_msg)
             self.progress.errors.append(error_msg)
             self.progress.failed_pages += 1
+            return False
             
         finally:
             self.progress.processed_pages += 1
@@ -421,6 +475,27 @@ class BulkContentIndexer:
             
             await self._update_progress()
 
+    async def index_cached_pages(self, cached_pages: List[CachedPage]) -> Tuple[int, int]:
+        """
+        Index pages that are already cached, e.g. pages stored by an incremental sync.
+
+        The pages are written to the search index in one batched pass.
+
+        Args:
+            cached_pages: Cached pages to index
+
+        Returns:
+            Tuple of (indexed_count, failed_count)
+        """
+        if not self.local_search or not cached_pages:
+            return 0, 0
+
+        indexed_count, failed_count = await self.local_search.index_pages(cached_pages)
+        if failed_count:
+            self.progress.warnings.append(f"Failed to index {failed_count} synced pages")
+        logger.info(f"Indexed {indexed_count} synced pages ({failed_count} failed)")
+        return indexed_count, failed_count
+
     def _is_page_current(self, page: OneNotePage) -> bool:
         """Check if page is already current in cache."""
         try:
@@ -480,12 +555,9 @@ class BulkContentIndexer:
             if not self.current_operation_id:
                 return
                 
-            self.checkpoint = IndexingCheckpoint(
-                operation_id=self.current_operation_id,
-                timestamp=datetime.utcnow(),
-                progress=self.progress,
-                settings={}
-            )
+            await self.checkpoint_store.save(self.sync_checkpoint)
+
+            self.checkpoint = self._indexing_checkpoint()
             
             if self.checkpoint_callback:
                 self.checkpoint_callback(self.checkpoint)
@@ -496,10 +568,32 @@ class BulkContentIndexer:
             logger.error(f"Failed to save checkpoint: {e}")
 
     async def _load_checkpoint(self) -> bool:
-        """Load operation checkpoint."""
-        # Implementation would load from storage
-        # For now, return False (no checkpoint found)
-        return False
+        """Load the checkpoint of an interrupted operation, if there is one."""
+        try:
+            sync_checkpoint = await self.checkpoint_store.load(BULK_CHECKPOINT_OPERATION)
+        except Exception as e:
+            logger.error(f"Failed to load checkpoint: {e}")
+            return False
+        if sync_checkpoint is None:
+            return False
+
+        self.sync_checkpoint = sync_checkpoint
+        self.checkpoint = self._indexing_checkpoint()
+        return True
+
+    def _indexing_checkpoint(self) -> IndexingCheckpoint:
+        """Describe the persisted checkpoint for checkpoint callbacks."""
+        return IndexingCheckpoint(
+            operation_id=self.current_operation_id,
+            timestamp=self.sync_checkpoint.updated_at,
+            progress=self.progress,
+            completed_page_ids=[
+                page_id
+                for page_ids in self.sync_checkpoint.stored_pages.values()
+                for page_id in page_ids
+            ],
+            settings={}
+        )
 
     def pause_indexing(self) -> None:
         """Pause the current indexing operation."""
@@ -526,6 +620,7 @@ class BulkContentIndexer:
             "status": self.status.value,
             "progress": {
                 "completion_percentage": self.progress.get_completion_percentage(),
+                "coverage_percentage": self.progress.get_coverage_percentage(),
                 "success_rate": self.progress.get_success_rate(),
                 "processing_rate": self.progress.get_processing_rate(),
                 "elapsed_time": str(self.progress.get_elapsed_time()),
@@ -5,15 +5,20 @@ Manages the local caching system for OneNote content including directory structu
 metadata storage, and basic cache operations.
 """
 
-import json
+import asyncio
+import functools
 import logging
+import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import (Any, AsyncGenerator, Callable, Dict, Iterable, Iterator,
+                    List, Optional, Set, Tuple)
 
 from ..config.settings import Settings, get_settings
 from ..models.cache import (
+    CacheCounters,
     CacheMetadata,
     CacheStatistics,
     CachedPage,
@@ -22,28 +27,110 @@ from ..models.cache import (
     PageMatch,
     CacheSearchResult,
 )
+from . import compression, serialization
+from .asset_store import ASSET_STORE_DIRNAME, AssetBlobStore
+from .async_io import get_file_io
+from .page_index import (PAGE_INDEX_FILENAME, PageChange, PageLocation,
+                         PageLocationIndex, compute_content_hash)
+from .page_pack import PAGE_PACK_FILENAME, PagePackStore
+from .sync_checkpoint import CHECKPOINT_FILE, SyncCheckpointStore
 
 logger = logging.getLogger(__name__)
 
+# Page parts that can be loaded when iterating over cached pages
+PAGE_FIELDS = ("metadata", "content", "markdown_content", "text_content")
+DEFAULT_PAGE_READ_WORKERS = 8
+
+# Page files that are stored with the configured compression codec
+PAGE_FILES = ("metadata.json", "content.md", "original.html")
+
+# Page storage backends
+DIRECTORY_BACKEND = "directory"
+PACK_BACKEND = "pack"
+
+# Cache counters fed by per-page footprint columns
+FOOTPRINT_COUNTERS = {
+    "images": "image_count",
+    "files": "file_count",
+    "size_bytes": "size_bytes",
+    "markdown_bytes": "markdown_bytes",
+    "asset_bytes": "asset_bytes",
+}
+
+# Number of page changes between writes of the cache counters to disk
+STATISTICS_FLUSH_INTERVAL = 50
+
+
+class _PageContentLoader:
+    """Reads content fields of a lazily loaded cached page on demand."""
+
+    def __init__(self, reader: Callable[..., Optional[str]], *args: Any):
+        self.reader = reader
+        self.args = args
+
+    def __call__(self, field: str) -> Optional[str]:
+        return self.reader(*self.args, field)
+
+    def __deepcopy__(self, memo: Dict) -> "_PageContentLoader":
+        # Loaders are immutable; deep-copied pages keep reading from the cache
+        return self
+
 
 class OneNoteCacheManager:
     """
     Manages the local OneNote content cache.
     
     Provides functionality for storing, retrieving, and managing cached OneNote
-    content in a hierarchical directory structure that mirrors OneNote organization.
+    content in a hierarchical directory structure that mirrors OneNote organization,
+    or in a single pack database per user with the ``pack`` storage backend.
     """
 
-    def __init__(self, settings: Optional[Settings] = None, cache_root: Optional[Path] = None):
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        cache_root: Optional[Path] = None,
+        storage_backend: str = DIRECTORY_BACKEND,
+        export_markdown: bool = False
+    ):
         """
         Initialize the cache manager.
 
         Args:
             settings: Optional settings instance (uses global if None)
             cache_root: Optional custom cache root directory
+            storage_backend: "directory" stores one directory per page;
+                "pack" stores all pages of a user in a single database file
+            export_markdown: With the pack backend, also write each page's
+                markdown to the directory tree as a browsable export
+
+        Raises:
+            ValueError: If the storage backend is unknown
         """
+        if storage_backend not in (DIRECTORY_BACKEND, PACK_BACKEND):
+            raise ValueError(f"Unknown cache storage backend: {storage_backend}")
+
         self.settings = settings or get_settings()
         self.cache_root = cache_root or self.settings.onenote_cache_full_path
+        self.storage_backend = storage_backend
+        self.export_markdown = export_markdown
+        
+        # Codec for page files (None stores them uncompressed)
+        self.compression = compression.resolve_codec(self.settings)
+        
+        # Shared thread pool for blocking cache file writes
+        self.file_io = get_file_io()
+        
+        # Per-user page location indexes and pack stores, opened lazily
+        self._page_indexes: Dict[str, PageLocationIndex] = {}
+        self._page_packs: Dict[str, PagePackStore] = {}
+        self._asset_stores: Dict[str, AssetBlobStore] = {}
+        self._checkpoint_stores: Dict[str, SyncCheckpointStore] = {}
+        
+        # Counter changes not yet written to cache metadata, per user
+        self._counter_deltas: Dict[str, Dict[str, int]] = {}
+        self._counter_changes: Dict[str, int] = {}
+        # Verification times withheld from cache metadata while changes are unflushed
+        self._unflushed_verified_at: Dict[str, datetime] = {}
         
         logger.debug(f"Initializing OneNote cache manager with root: {self.cache_root}")
 
@@ -103,6 +190,84 @@ class OneNoteCacheManager:
         """
         return self._get_section_dir(user_id, notebook_id, section_id) / "pages" / page_id
 
+    @property
+    def uses_pack_store(self) -> bool:
+        """Whether pages are stored in a per-user pack database."""
+        return self.storage_backend == PACK_BACKEND
+
+    def _get_page_pack(self, user_id: str) -> PagePackStore:
+        """
+        Get the page pack store for a user.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Page pack store
+        """
+        user_cache_dir = self._get_user_cache_dir(user_id)
+        pack = self._page_packs.get(str(user_cache_dir))
+        if pack is None:
+            pack = PagePackStore(user_cache_dir / PAGE_PACK_FILENAME, self.compression)
+            self._page_packs[str(user_cache_dir)] = pack
+        return pack
+
+    def get_asset_store(self, user_id: str) -> AssetBlobStore:
+        """
+        Get the content-addressed asset store for a user.
+
+        Pass it to ``AssetDownloadManager`` so identical attachments are
+        downloaded and stored once per user.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Asset blob store
+        """
+        user_cache_dir = self._get_user_cache_dir(user_id)
+        store = self._asset_stores.get(str(user_cache_dir))
+        if store is None:
+            store = AssetBlobStore(user_cache_dir / "global" / ASSET_STORE_DIRNAME)
+            self._asset_stores[str(user_cache_dir)] = store
+        return store
+
+    def get_sync_checkpoint_store(self, user_id: str) -> SyncCheckpointStore:
+        """
+        Get the store of a user's sync checkpoint.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Sync checkpoint store
+        """
+        user_cache_dir = self._get_user_cache_dir(user_id)
+        store = self._checkpoint_stores.get(str(user_cache_dir))
+        if store is None:
+            store = SyncCheckpointStore(user_cache_dir / CHECKPOINT_FILE, self.file_io)
+            self._checkpoint_stores[str(user_cache_dir)] = store
+        return store
+
+    def _get_page_index(self, user_id: str) -> PageLocationIndex:
+        """
+        Get the page location index for a user.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Page location index (built from the cache tree on first use)
+        """
+        user_cache_dir = self._get_user_cache_dir(user_id)
+        index = self._page_indexes.get(str(user_cache_dir))
+        if index is None:
+            index = PageLocationIndex(user_cache_dir / PAGE_INDEX_FILENAME)
+            self._page_indexes[str(user_cache_dir)] = index
+            if user_cache_dir.exists() and not index.is_built:
+                self._build_page_index(user_id, index)
+        return index
+
     async def initialize_user_cache(self, user_id: str) -> None:
         """
         Set up cache directory structure for a user.
@@ -136,6 +301,8 @@ class OneNoteCacheManager:
                     user_id=user_id,
                     cache_root_path=str(self.cache_root)
                 )
+                # A new cache is empty, so its counters are exact
+                cache_metadata.counters.verified_at = datetime.utcnow()
                 await self._save_cache_metadata(user_id, cache_metadata)
                 logger.info(f"Created initial cache metadata for user: {user_id}")
 
@@ -148,8 +315,7 @@ class OneNoteCacheManager:
                     "sync_pid": None,
                     "created_at": datetime.utcnow().isoformat()
                 }
-                with open(sync_status_file, 'w', encoding='utf-8') as f:
-                    json.dump(sync_status, f, indent=2)
+                await self.file_io.write_json(sync_status_file, sync_status)
                 logger.debug(f"Created sync status file: {sync_status_file}")
 
             logger.info(f"Cache initialization completed for user: {user_id}")
@@ -177,71 +343,208 @@ class OneNoteCacheManager:
             if not notebook_id or not section_id:
                 raise ValueError(f"Missing parent IDs for page {page.metadata.id}")
 
-            # Create page directory
             page_dir = self._get_page_dir(user_id, notebook_id, section_id, page.metadata.id)
-            page_dir.mkdir(parents=True, exist_ok=True)
 
-            # Create attachments directory
-            attachments_dir = page_dir / "attachments"
-            attachments_dir.mkdir(exist_ok=True)
-            (attachments_dir / "images").mkdir(exist_ok=True)
-            (attachments_dir / "files").mkdir(exist_ok=True)
+            if self.uses_pack_store:
+                await self._store_packed_page(user_id, page, notebook_id, section_id, page_dir)
+                logger.debug(f"Stored page content: {page.metadata.title} ({page.metadata.id})")
+                return
 
-            # Save metadata
-            metadata_file = page_dir / "metadata.json"
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(page.metadata.model_dump(), f, indent=2, default=str)
+            index = self._get_page_index(user_id)
 
-            # Save markdown content
+            # Metadata, markdown content and (if requested) original HTML
+            files = {"metadata.json": serialization.dumps(page.metadata)}
             if page.markdown_content:
-                markdown_file = page_dir / "content.md"
-                with open(markdown_file, 'w', encoding='utf-8') as f:
-                    f.write(page.markdown_content)
-
-            # Save original HTML content if requested
+                files["content.md"] = page.markdown_content.encode("utf-8")
             if page.content and self.settings.onenote_preserve_html:
-                html_file = page_dir / "original.html"
-                with open(html_file, 'w', encoding='utf-8') as f:
-                    f.write(page.content)
+                files["original.html"] = page.content.encode("utf-8")
+
+            # Write the page files off the event loop
+            written, footprint = await self.file_io.run(self._write_page_files, page_dir, files)
+            await self.file_io.mark_written(written)
 
             # Update page paths in metadata
             page.metadata.local_content_path = str(page_dir / "content.md")
             page.metadata.local_html_path = str(page_dir / "original.html")
             page.metadata.last_synced = datetime.utcnow()
 
+            # Record the page location for keyed lookups
+            location = PageLocation(
+                page_id=page.metadata.id,
+                notebook_id=notebook_id,
+                section_id=section_id,
+                path=str(page_dir),
+                modified=page.metadata.last_modified_date_time.isoformat(),
+                content_hash=compute_content_hash(page.markdown_content),
+                **footprint
+            )
+            await self._record_page_change(user_id, index.upsert(location))
+
             logger.debug(f"Stored page content: {page.metadata.title} ({page.metadata.id})")
 
         except Exception as e:
             logger.error(f"Failed to store page {page.metadata.id}: {e}")
             raise
 
-    async def get_cached_page(self, user_id: str, page_id: str) -> Optional[CachedPage]:
+    def _write_page_files(self, page_dir: Path, files: Dict[str, bytes]) -> Tuple[List[Path], Dict[str, int]]:
+        """
+        Write page files into a page directory (runs on the file I/O pool).
+
+        Args:
+            page_dir: Path to page directory
+            files: Mapping of logical file name to content
+
+        Returns:
+            Written file paths and the resulting page footprint
+        """
+        # Create page and attachments directories
+        attachments_dir = page_dir / "attachments"
+        (attachments_dir / "images").mkdir(parents=True, exist_ok=True)
+        (attachments_dir / "files").mkdir(exist_ok=True)
+
+        written = [
+            compression.write_bytes(page_dir / name, data, self.compression)
+            for name, data in files.items()
+        ]
+        return written, self._measure_page_dir(page_dir)
+
+    async def _store_packed_page(
+        self,
+        user_id: str,
+        page: CachedPage,
+        notebook_id: str,
+        section_id: str,
+        page_dir: Path
+    ) -> None:
+        """
+        Store a page in the user's pack database.
+
+        Args:
+            user_id: User identifier
+            page: Cached page to store
+            notebook_id: Parent notebook identifier
+            section_id: Parent section identifier
+            page_dir: Logical page directory (used for the markdown export)
+        """
+        page.metadata.local_content_path = str(page_dir / "content.md")
+        page.metadata.local_html_path = str(page_dir / "original.html")
+        page.metadata.last_synced = datetime.utcnow()
+
+        html = page.content if self.settings.onenote_preserve_html else None
+        pack = self._get_page_pack(user_id)
+        change = await self.file_io.run(functools.partial(
+            pack.put,
+            page_id=page.metadata.id,
+            notebook_id=notebook_id,
+            section_id=section_id,
+            modified=page.metadata.last_modified_date_time.isoformat(),
+            metadata_json=serialization.dumps(page.metadata).decode("utf-8"),
+            markdown=page.markdown_content,
+            html=html,
+            footprint=self._measure_assets(page_dir)
+        ))
+        await self._record_page_change(user_id, change)
+
+        if self.export_markdown and page.markdown_content:
+            await self.file_io.write_text(page_dir / "content.md", page.markdown_content)
+
+    async def export_markdown_tree(self, user_id: str) -> int:
+        """
+        Write the markdown of every packed page to the directory tree.
+
+        The export is a derived, browsable view; the pack store stays the
+        source of truth.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Number of exported pages
+        """
+        if not self.uses_pack_store:
+            return 0
+
+        exported = 0
+        for batch in self._get_page_pack(user_id).iter_pages(("metadata", "markdown_content")):
+            for values in batch:
+                if not values["markdown_content"]:
+                    continue
+                metadata = serialization.load_model(CachedPageMetadata, values["metadata"])
+                page_dir = self._get_page_dir(
+                    user_id,
+                    metadata.parent_notebook.get("id", ""),
+                    metadata.parent_section.get("id", ""),
+                    metadata.id
+                )
+                page_dir.mkdir(parents=True, exist_ok=True)
+                compression.write_text(page_dir / "content.md", values["markdown_content"], None)
+                exported += 1
+
+        logger.info(f"Exported {exported} packed pages as markdown for user {user_id}")
+        return exported
+
+    async def import_directory_pages(self, user_id: str, remove_directories: bool = False) -> int:
+        """
+        Move pages from the per-page directory layout into the pack store.
+
+        Args:
+            user_id: User identifier
+            remove_directories: Delete page directories once packed
+
+        Returns:
+            Number of imported pages
+        """
+        if not self.uses_pack_store:
+            raise ValueError("Importing into the pack store requires the pack storage backend")
+
+        imported = 0
+        for page_dir in list(self._iter_page_dirs(user_id)):
+            try:
+                page = self._read_page(page_dir, set(PAGE_FIELDS))
+                section_dir = page_dir.parent.parent
+                await self._store_packed_page(
+                    user_id, page, section_dir.parent.parent.name, section_dir.name, page_dir
+                )
+            except Exception as e:
+                logger.warning(f"Failed to import page from {page_dir}: {e}")
+                continue
+
+            if remove_directories:
+                shutil.rmtree(page_dir, ignore_errors=True)
+            imported += 1
+
+        logger.info(f"Imported {imported} pages into the pack store for user {user_id}")
+        return imported
+
+    async def get_cached_page(
+        self,
+        user_id: str,
+        page_id: str,
+        load_content: bool = True
+    ) -> Optional[CachedPage]:
         """
         Retrieve a page from local cache.
 
         Args:
             user_id: User identifier
             page_id: Page identifier
+            load_content: Read HTML and markdown now; when False only
+                metadata is read and content loads on first access
 
         Returns:
             Cached page if found, None otherwise
         """
         try:
-            # Find page by searching through cache structure
-            user_cache_dir = self._get_user_cache_dir(user_id)
-            
-            # Search for the page in all notebooks/sections
-            for notebook_dir in (user_cache_dir / "notebooks").glob("*"):
-                if not notebook_dir.is_dir():
-                    continue
-                    
-                for section_dir in (notebook_dir / "sections").glob("*"):
-                    if not section_dir.is_dir():
-                        continue
-                    
-                    page_dir = section_dir / "pages" / page_id
-                    if page_dir.exists():
-                        return await self._load_page_from_directory(page_dir)
+            if self.uses_pack_store:
+                fields = set(PAGE_FIELDS) if load_content else {"metadata"}
+                page = self._read_packed_page(user_id, page_id, fields)
+                if page:
+                    return page
+
+            else:
+                location = await self.get_page_location(user_id, page_id)
+                if location:
+                    return await self._load_page_from_directory(Path(location.path), load_content)
 
             logger.debug(f"Page not found in cache: {page_id}")
             return None
@@ -250,12 +553,367 @@ class OneNoteCacheManager:
             logger.error(f"Failed to retrieve page {page_id}: {e}")
             return None
 
-    async def _load_page_from_directory(self, page_dir: Path) -> CachedPage:
+    async def get_page_location(self, user_id: str, page_id: str) -> Optional[PageLocation]:
+        """
+        Look up where a page is stored in the cache.
+
+        Stale entries whose page directory no longer exists are dropped.
+
+        Args:
+            user_id: User identifier
+            page_id: Page identifier
+
+        Returns:
+            Page location if the page is cached, None otherwise
+        """
+        if not self._get_user_cache_dir(user_id).exists():
+            return None
+
+        if self.uses_pack_store:
+            return self._packed_location(user_id, self._get_page_pack(user_id).get_location(page_id))
+
+        index = self._get_page_index(user_id)
+        location = index.get(page_id)
+        if location and not Path(location.path).exists():
+            logger.debug(f"Dropping stale page index entry: {page_id}")
+            change = index.remove(page_id)
+            if change:
+                await self._record_page_change(user_id, change)
+            return None
+        return location
+
+    async def get_section_page_locations(self, user_id: str, section_id: str) -> List[PageLocation]:
+        """
+        Get the locations of all cached pages of a section.
+
+        Answered from the page index (or pack store) with one keyed query,
+        without reading page files.
+
+        Args:
+            user_id: User identifier
+            section_id: Section identifier
+
+        Returns:
+            Locations of the section's cached pages
+        """
+        if not self._get_user_cache_dir(user_id).exists():
+            return []
+
+        if self.uses_pack_store:
+            rows = self._get_page_pack(user_id).get_section_locations(section_id)
+            return [self._packed_location(user_id, row) for row in rows]
+        return self._get_page_index(user_id).in_section(section_id)
+
+    async def delete_cached_page(self, user_id: str, page_id: str) -> bool:
+        """
+        Delete a page from the local cache.
+
+        Args:
+            user_id: User identifier
+            page_id: Page identifier
+
+        Returns:
+            True if the page was deleted, False if it was not cached
+        """
+        try:
+            location = await self.get_page_location(user_id, page_id)
+            if not location:
+                return False
+
+            # Release attachment links so unshared asset blobs are reclaimed
+            page_dir = Path(location.path)
+            if (page_dir / "attachments").exists():
+                self.get_asset_store(user_id).release_under(page_dir)
+
+            shutil.rmtree(location.path, ignore_errors=True)
+            if self.uses_pack_store:
+                change = self._get_page_pack(user_id).delete(page_id)
+            else:
+                change = self._get_page_index(user_id).remove(page_id)
+            if change:
+                await self._record_page_change(user_id, change)
+            logger.debug(f"Deleted cached page: {page_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to delete cached page {page_id}: {e}")
+            return False
+
+    async def rebuild_page_index(self, user_id: str) -> int:
+        """
+        Rebuild (repair) a user's page location index from the cache tree.
+
+        Args:
+            user_id: User identifier
+
+        Returns:
+            Number of indexed pages
+        """
+        if self.uses_pack_store:
+            # The pack store is its own keyed index
+            count = self._get_page_pack(user_id).counts()["pages"]
+        else:
+            count = self._build_page_index(user_id, self._get_page_index(user_id))
+        await self._reset_cache_counters(user_id)
+        return count
+
+    async def migrate_page_compression(
+        self,
+        user_id: Optional[str] = None,
+        codec: Optional[str] = "settings"
+    ) -> Dict[str, int]:
+        """
+        Rewrite cached page files with the configured compression codec.
+
+        Files already stored with the target codec are left untouched, so the
+        migration can be interrupted and rerun.
+
+        Args:
+            user_id: User identifier, or None for every cached user
+            codec: Target codec ("zstd", "gzip" or None for plain files);
+                defaults to the codec chosen by settings
+
+        Returns:
+            Dictionary with migrated file count and sizes before and after
+        """
+        target_codec = self.compression if codec == "settings" else codec
+        stats = {"files_migrated": 0, "files_skipped": 0, "bytes_before": 0, "bytes_after": 0}
+
+        if self.uses_pack_store:
+            # Pack blobs are compressed on write; the markdown export stays plain
+            return stats
+
+        for page_dir in self._iter_page_dirs(user_id):
+            for name in PAGE_FILES:
+                logical_path = page_dir / name
+                stored = compression.find_stored_file(logical_path)
+                if stored is None:
+                    continue
+                if stored == compression.stored_path(logical_path, target_codec):
+                    stats["files_skipped"] += 1
+                    continue
+
+                try:
+                    size_before = stored.stat().st_size
+                    text = compression.read_text(logical_path)
+                    written = compression.write_text(logical_path, text, target_codec)
+                except Exception as e:
+                    logger.warning(f"Failed to migrate cache file {stored}: {e}")
+                    continue
+
+                stats["files_migrated"] += 1
+                stats["bytes_before"] += size_before
+                stats["bytes_after"] += written.stat().st_size
+
+        logger.info(
+            f"Migrated {stats['files_migrated']} cache files to {target_codec or 'plain'} storage: "
+            f"{stats['bytes_before']} -> {stats['bytes_after']} bytes"
+        )
+        return stats
+
+    def _build_page_index(self, user_id: str, index: PageLocationIndex) -> int:
+        """
+        Scan the cache tree and replace the contents of a page index.
+
+        Args:
+            user_id: User identifier
+            index: Index to rebuild
+
+        Returns:
+            Number of indexed pages
+        """
+        locations = []
+        notebooks_dir = self._get_user_cache_dir(user_id) / "notebooks"
+
+        for page_dir in notebooks_dir.glob("*/sections/*/pages/*"):
+            if not page_dir.is_dir():
+                continue
+
+            modified = None
+            content_hash = None
+            try:
+                metadata_data = compression.read_bytes(page_dir / "metadata.json")
+                if metadata_data:
+                    modified = serialization.loads(metadata_data).get("last_modified_date_time")
+                    if modified:
+                        modified = datetime.fromisoformat(str(modified)).isoformat()
+                content_hash = compute_content_hash(compression.read_text(page_dir / "content.md"))
+            except Exception as e:
+                logger.warning(f"Failed to read page metadata from {page_dir}: {e}")
+
+            section_dir = page_dir.parent.parent
+            locations.append(PageLocation(
+                page_id=page_dir.name,
+                notebook_id=section_dir.parent.parent.name,
+                section_id=section_dir.name,
+                path=str(page_dir),
+                modified=modified,
+                content_hash=content_hash,
+                **self._measure_page_dir(page_dir)
+            ))
+
+        count = index.replace_all(locations)
+        logger.info(f"Built page location index for user {user_id}: {count} pages")
+        return count
+
+    @staticmethod
+    def _measure_assets(page_dir: Path) -> Dict[str, int]:
+        """
+        Measure the downloaded attachments of a page.
+
+        Args:
+            page_dir: Path to page directory
+
+        Returns:
+            Dictionary with image_count, file_count and asset_bytes
+        """
+        footprint = {"image_count": 0, "file_count": 0, "asset_bytes": 0}
+        for kind, counter in (("images", "image_count"), ("files", "file_count")):
+            assets_dir = page_dir / "attachments" / kind
+            if not assets_dir.is_dir():
+                continue
+            for asset_file in assets_dir.iterdir():
+                footprint[counter] += 1
+                if asset_file.is_file():
+                    footprint["asset_bytes"] += asset_file.stat().st_size
+        return footprint
+
+    def _measure_page_dir(self, page_dir: Path) -> Dict[str, int]:
+        """
+        Measure the storage footprint of a page directory.
+
+        Args:
+            page_dir: Path to page directory
+
+        Returns:
+            Footprint keyed by PageLocation footprint fields
+        """
+        footprint = self._measure_assets(page_dir)
+        footprint["markdown_bytes"] = 0
+        footprint["size_bytes"] = footprint["asset_bytes"]
+        for name in PAGE_FILES:
+            stored = compression.find_stored_file(page_dir / name)
+            if stored is None:
+                continue
+            size = stored.stat().st_size
+            footprint["size_bytes"] += size
+            if name == "content.md":
+                footprint["markdown_bytes"] = size
+        return footprint
+
+    def _packed_location(self, user_id: str, row: Optional[Any]) -> Optional[PageLocation]:
+        """Convert a pack store location row to a page location."""
+        if row is None:
+            return None
+        values = dict(row)
+        values["path"] = str(self._get_page_dir(
+            user_id, values["notebook_id"], values["section_id"], values["page_id"]
+        ))
+        return PageLocation(**values)
+
+    async def _record_page_change(self, user_id: str, change: PageChange) -> None:
+        """
+        Update the cache counters for a stored, replaced or deleted page.
+
+        Until the changes are flushed, the counters in the cache metadata are
+        marked unverified, so they are recounted if the process dies first.
+
+        Args:
+            user_id: User identifier
+            change: Change reported by the page index or pack store
+        """
+        previous, current = change.previous, change.current
+        delta = {
+            counter: (getattr(current, field) if current else 0) - (getattr(previous, field) if previous else 0)
+            for counter, field in FOOTPRINT_COUNTERS.items()
+        }
+        delta["pages"] = int(current is not None) - int(previous is not None)
+        delta["sections"] = change.sections
+        delta["notebooks"] = change.notebooks
+
+        pending = self._counter_deltas.get(user_id)
+        if pending is None:
+            pending = self._counter_deltas[user_id] = {}
+            await self._mark_counters_unflushed(user_id)
+        for counter, value in delta.items():
+            pending[counter] = pending.get(counter, 0) + value
+
+        self._counter_changes[user_id] = self._counter_changes.get(user_id, 0) + 1
+        if self._counter_changes[user_id] >= STATISTICS_FLUSH_INTERVAL:
+            await self.flush_cache_statistics(user_id)
+
+    async def _mark_counters_unflushed(self, user_id: str) -> None:
+        """
+        Clear the persisted verification time while counter changes are pending.
+
+        The time is restored when the changes are flushed.
+
+        Args:
+            user_id: User identifier
+        """
+        metadata = await self._load_cache_metadata(user_id)
+        if metadata is None or metadata.counters.verified_at is None:
+            return
+        self._unflushed_verified_at[user_id] = metadata.counters.verified_at
+        metadata.counters.verified_at = None
+        await self._save_cache_metadata(user_id, metadata)
+
+    def _apply_counter_deltas(self, user_id: str, counters: CacheCounters) -> CacheCounters:
+        """Get counters with the user's unflushed changes applied."""
+        pending = self._counter_deltas.get(user_id)
+        if not pending:
+            return counters
+        updated = counters.model_dump()
+        for counter, change in pending.items():
+            updated[counter] = max(0, updated[counter] + change)
+        return CacheCounters(**updated)
+
+    async def flush_cache_statistics(self, user_id: str) -> None:
+        """
+        Write pending counter changes to the cache metadata.
+
+        Args:
+            user_id: User identifier
+        """
+        if not self._counter_deltas.get(user_id):
+            return
+        # update_cache_metadata merges and clears the pending changes
+        await self.update_cache_metadata(user_id)
+
+    async def _reset_cache_counters(self, user_id: str, rescan: bool = False) -> CacheCounters:
+        """
+        Recompute the cache counters from the page index (or pack store).
+
+        Args:
+            user_id: User identifier
+            rescan: Rebuild the page index from the cache tree first
+
+        Returns:
+            Verified counters
+        """
+        if self.uses_pack_store:
+            totals = self._get_page_pack(user_id).totals()
+        else:
+            index = self._get_page_index(user_id)
+            if rescan:
+                self._build_page_index(user_id, index)
+            totals = index.totals()
+
+        counters = CacheCounters(**totals, verified_at=datetime.utcnow())
+        self._counter_deltas.pop(user_id, None)
+        self._counter_changes.pop(user_id, None)
+        self._unflushed_verified_at.pop(user_id, None)
+        await self.update_cache_metadata(user_id, counters=counters)
+        return counters
+
+    async def _load_page_from_directory(self, page_dir: Path, load_content: bool = True) -> CachedPage:
         """
         Load a cached page from its directory.
 
         Args:
             page_dir: Path to page directory
+            load_content: Read content files now; when False only metadata is
+                read and content loads on first access
 
         Returns:
             Loaded cached page
@@ -265,48 +923,276 @@ class OneNoteCacheManager:
             ValueError: If metadata is invalid
         """
         try:
-            # Load metadata
-            metadata_file = page_dir / "metadata.json"
-            if not metadata_file.exists():
-                raise FileNotFoundError(f"Metadata file not found: {metadata_file}")
-
-            with open(metadata_file, 'r', encoding='utf-8') as f:
-                metadata_dict = json.load(f)
-                metadata = CachedPageMetadata(**metadata_dict)
-
-            # Load content files
-            content = None
-            markdown_content = None
-
-            html_file = page_dir / "original.html"
-            if html_file.exists():
-                with open(html_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-            markdown_file = page_dir / "content.md"
-            if markdown_file.exists():
-                with open(markdown_file, 'r', encoding='utf-8') as f:
-                    markdown_content = f.read()
-
-            # Extract text content from markdown if available
-            text_content = None
-            if markdown_content:
-                # Simple text extraction (remove markdown formatting)
-                import re
-                text_content = re.sub(r'[#*_`\[\]()~]', '', markdown_content)
-                text_content = re.sub(r'\n+', ' ', text_content).strip()
-
-            return CachedPage(
-                metadata=metadata,
-                content=content,
-                markdown_content=markdown_content,
-                text_content=text_content
-            )
+            return self._read_page(page_dir, set(PAGE_FIELDS) if load_content else {"metadata"})
 
         except Exception as e:
             logger.error(f"Failed to load page from directory {page_dir}: {e}")
             raise
 
+    def _read_page(self, page_dir: Path, fields: Set[str]) -> CachedPage:
+        """
+        Read the requested parts of a cached page from disk.
+
+        Args:
+            page_dir: Path to page directory
+            fields: Page fields to load now (metadata is always loaded); the
+                remaining content fields load lazily on first access
+
+        Returns:
+            Cached page with the requested content fields loaded
+
+        Raises:
+            FileNotFoundError: If the metadata file is missing
+            ValueError: If metadata is invalid
+        """
+        # Load metadata (stored plain or compressed)
+        metadata_file = page_dir / "metadata.json"
+        metadata_data = compression.read_bytes(metadata_file)
+        if metadata_data is None:
+            raise FileNotFoundError(f"Metadata file not found: {metadata_file}")
+
+        metadata = serialization.load_model(CachedPageMetadata, metadata_data)
+
+        # Load requested content files
+        loaded: Dict[str, Optional[str]] = {}
+
+        if "content" in fields:
+            loaded["content"] = self._read_page_field(page_dir, "content")
+
+        if fields & {"markdown_content", "text_content"}:
+            markdown_content = self._read_page_field(page_dir, "markdown_content")
+            if "markdown_content" in fields:
+                loaded["markdown_content"] = markdown_content
+            if "text_content" in fields:
+                loaded["text_content"] = self._extract_text(markdown_content)
+
+        return CachedPage.with_lazy_content(metadata, _PageContentLoader(self._read_page_field, page_dir), loaded)
+
+    def _read_page_field(self, page_dir: Path, field: str) -> Optional[str]:
+        """
+        Read a single content field of a cached page.
+
+        Args:
+            page_dir: Path to page directory
+            field: Content field name
+
+        Returns:
+            Field value, or None if the page has no such content
+        """
+        if field == "text_content":
+            return self._extract_text(self._read_page_field(page_dir, "markdown_content"))
+
+        return compression.read_text(page_dir / ("original.html" if field == "content" else "content.md"))
+
+    def _read_packed_page(self, user_id: str, page_id: str, fields: Set[str]) -> Optional[CachedPage]:
+        """
+        Read the requested parts of a page from the user's pack store.
+
+        Args:
+            user_id: User identifier
+            page_id: Page identifier
+            fields: Page fields to load now (metadata is always loaded)
+
+        Returns:
+            Cached page, or None if the page is not stored
+        """
+        values = self._get_page_pack(user_id).get_fields(page_id, self._pack_fields(fields))
+        if values is None:
+            return None
+        return self._page_from_pack_values(user_id, page_id, values, fields)
+
+    def _read_packed_page_field(self, user_id: str, page_id: str, field: str) -> Optional[str]:
+        """Read a single content field of a packed page."""
+        if field == "text_content":
+            return self._extract_text(self._read_packed_page_field(user_id, page_id, "markdown_content"))
+        values = self._get_page_pack(user_id).get_fields(page_id, (field,))
+        return values[field] if values else None
+
+    @staticmethod
+    def _pack_fields(fields: Set[str]) -> List[str]:
+        """Map requested page fields to the pack fields that must be read."""
+        pack_fields = ["metadata"]
+        if "content" in fields:
+            pack_fields.append("content")
+        if fields & {"markdown_content", "text_content"}:
+            pack_fields.append("markdown_content")
+        return pack_fields
+
+    def _page_from_pack_values(
+        self,
+        user_id: str,
+        page_id: str,
+        values: Dict[str, Optional[str]],
+        fields: Set[str]
+    ) -> CachedPage:
+        """Build a (partially lazy) cached page from pack store values."""
+        metadata = serialization.load_model(CachedPageMetadata, values["metadata"])
+
+        loaded: Dict[str, Optional[str]] = {}
+        if "content" in fields:
+            loaded["content"] = values["content"]
+        if "markdown_content" in fields:
+            loaded["markdown_content"] = values["markdown_content"]
+        if "text_content" in fields:
+            loaded["text_content"] = self._extract_text(values["markdown_content"])
+
+        loader = _PageContentLoader(self._read_packed_page_field, user_id, page_id)
+        return CachedPage.with_lazy_content(metadata, loader, loaded)
+
+    @staticmethod
+    def _extract_text(markdown_content: Optional[str]) -> Optional[str]:
+        """Extract plain text from markdown content."""
+        if not markdown_content:
+            return None
+        # Simple text extraction (remove markdown formatting)
+        text_content = re.sub(r'[#*_`\[\]()~]', '', markdown_content)
+        return re.sub(r'\n+', ' ', text_content).strip()
+
+    def _iter_page_dirs(self, user_id: Optional[str] = None) -> Iterator[Path]:
+        """
+        Lazily list cached page directories.
+
+        Args:
+            user_id: User identifier, or None for every cached user
+
+        Yields:
+            Page directory paths
+        """
+        if user_id is None:
+            users_dir = self.cache_root / "users"
+            user_dirs = sorted(users_dir.glob("*")) if users_dir.exists() else []
+        else:
+            user_dirs = [self._get_user_cache_dir(user_id)]
+
+        for user_dir in user_dirs:
+            for page_dir in (user_dir / "notebooks").glob("*/sections/*/pages/*"):
+                if page_dir.is_dir():
+                    yield page_dir
+
+    async def iter_cached_pages(
+        self,
+        user_id: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None,
+        max_workers: int = DEFAULT_PAGE_READ_WORKERS
+    ) -> AsyncGenerator[CachedPage, None]:
+        """
+        Stream cached pages, reading them from disk in worker threads.
+
+        At most ``2 * max_workers`` pages are in flight at a time and pages are
+        yielded as soon as they are read, so whole-cache operations run with
+        bounded memory. Pages are yielded in completion order; unreadable
+        pages are logged and skipped. Content fields that were not requested
+        load lazily on first access.
+
+        Args:
+            user_id: User identifier, or None for every cached user
+            fields: Page fields to read up front (see PAGE_FIELDS); all when None
+            max_workers: Number of reader threads
+
+        Yields:
+            Cached pages with the requested fields populated
+
+        Raises:
+            ValueError: If an unknown field is requested
+        """
+        requested = set(fields) if fields is not None else set(PAGE_FIELDS)
+        unknown = requested - set(PAGE_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown page fields: {', '.join(sorted(unknown))}")
+
+        if self.uses_pack_store:
+            async for page in self._iter_packed_pages(user_id, requested):
+                yield page
+            return
+
+        loop = asyncio.get_running_loop()
+        page_dirs = self._iter_page_dirs(user_id)
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cache-read") as executor:
+            pending: Set[asyncio.Future] = set()
+            exhausted = False
+            try:
+                while True:
+                    while not exhausted and len(pending) < max_workers * 2:
+                        page_dir = next(page_dirs, None)
+                        if page_dir is None:
+                            exhausted = True
+                            break
+                        pending.add(loop.run_in_executor(executor, self._read_page, page_dir, requested))
+
+                    if not pending:
+                        break
+
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for future in done:
+                        try:
+                            page = future.result()
+                        except Exception as e:
+                            logger.warning(f"Failed to load cached page: {e}")
+                            continue
+                        yield page
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    async def _iter_packed_pages(
+        self,
+        user_id: Optional[str],
+        fields: Set[str]
+    ) -> AsyncGenerator[CachedPage, None]:
+        """
+        Stream pages from pack stores, reading batches in a worker thread.
+
+        Args:
+            user_id: User identifier, or None for every cached user
+            fields: Page fields to read up front
+
+        Yields:
+            Cached pages with the requested fields populated
+        """
+        if user_id is None:
+            users_dir = self.cache_root / "users"
+            user_ids = [
+                user_dir.name for user_dir in sorted(users_dir.glob("*"))
+                if (user_dir / PAGE_PACK_FILENAME).exists()
+            ] if users_dir.exists() else []
+        elif (self._get_user_cache_dir(user_id) / PAGE_PACK_FILENAME).exists():
+            user_ids = [user_id]
+        else:
+            user_ids = []
+
+        loop = asyncio.get_running_loop()
+        for pack_user_id in user_ids:
+            batches = self._get_page_pack(pack_user_id).iter_pages(self._pack_fields(fields))
+            while True:
+                batch = await loop.run_in_executor(None, next, batches, None)
+                if batch is None:
+                    break
+                for values in batch:
+                    try:
+                        yield self._page_from_pack_values(pack_user_id, values["page_id"], values, fields)
+                    except Exception as e:
+                        logger.warning(f"Failed to load packed page {values['page_id']}: {e}")
+
+    async def get_all_cached_pages(
+        self,
+        user_id: Optional[str] = None,
+        fields: Optional[Iterable[str]] = None
+    ) -> List[CachedPage]:
+        """
+        Load all cached pages into a list.
+
+        Prefer ``iter_cached_pages`` for whole-cache processing.
+
+        Args:
+            user_id: User identifier, or None for every cached user
+            fields: Page fields to read up front (see PAGE_FIELDS); all when None
+
+        Returns:
+            List of cached pages
+        """
+        return [page async for page in self.iter_cached_pages(user_id, fields)]
+
     async def search_cached_pages(self, user_id: str, query: str) -> List[CachedPage]:
         """
         Search cached pages using local full-text search.
@@ -330,31 +1216,15 @@ class OneNoteCacheManager:
 
             query_lower = query.lower()
 
-            # Search through all pages
-            for notebook_dir in (user_cache_dir / "notebooks").glob("*"):
-                if not notebook_dir.is_dir():
-                    continue
-                    
-                for section_dir in (notebook_dir / "sections").glob("*"):
-                    if not section_dir.is_dir():
-                        continue
-                    
-                    for page_dir in (section_dir / "pages").glob("*"):
-                        if not page_dir.is_dir():
-                            continue
-                        
-                        try:
-                            page = await self._load_page_from_directory(page_dir)
-                            
-                            # Check if query matches title or content
-                            if (query_lower in page.metadata.title.lower() or
-                                (page.text_content and query_lower in page.text_content.lower()) or
-                                (page.markdown_content and query_lower in page.markdown_content.lower())):
-                                matches.append(page)
-                                
-                        except Exception as e:
-                            logger.warning(f"Failed to load page from {page_dir}: {e}")
-                            continue
+            # Search through all pages (original HTML is not needed for matching)
+            async for page in self.iter_cached_pages(
+                user_id, fields=("metadata", "markdown_content", "text_content")
+            ):
+                # Check if query matches title or content
+                if (query_lower in page.metadata.title.lower() or
+                    (page.text_content and query_lower in page.text_content.lower()) or
+                    (page.markdown_content and query_lower in page.markdown_content.lower())):
+                    matches.append(page)
 
             # Sort by last modified date (most recent first)
             matches.sort(key=lambda p: p.metadata.last_modified_date_time, reverse=True)
@@ -366,12 +1236,18 @@ class OneNoteCacheManager:
             logger.error(f"Failed to search cached pages: {e}")
             return []
 
-    async def get_cache_statistics(self, user_id: str) -> CacheStatistics:
+    async def get_cache_statistics(self, user_id: str, verify: bool = False) -> CacheStatistics:
         """
         Get cache usage and sync statistics.
 
+        Statistics come from counters maintained as pages are stored and
+        deleted, so no cache tree walk is needed. Caches whose counters were
+        never verified (created before counters existed) or may have lost
+        unflushed changes (the process ended before a flush) are rescanned.
+
         Args:
             user_id: User identifier
+            verify: Rescan the cache and reset the counters from the result
 
         Returns:
             Cache statistics
@@ -384,51 +1260,28 @@ class OneNoteCacheManager:
             if not user_cache_dir.exists():
                 return stats
 
-            # Count notebooks, sections, and pages
-            notebooks_dir = user_cache_dir / "notebooks"
-            if notebooks_dir.exists():
-                for notebook_dir in notebooks_dir.glob("*"):
-                    if not notebook_dir.is_dir():
-                        continue
-                    stats.total_notebooks += 1
-                    
-                    sections_dir = notebook_dir / "sections"
-                    if sections_dir.exists():
-                        for section_dir in sections_dir.glob("*"):
-                            if not section_dir.is_dir():
-                                continue
-                            stats.total_sections += 1
-                            
-                            pages_dir = section_dir / "pages"
-                            if pages_dir.exists():
-                                for page_dir in pages_dir.glob("*"):
-                                    if page_dir.is_dir():
-                                        stats.total_pages += 1
-                                        
-                                        # Count assets
-                                        attachments_dir = page_dir / "attachments"
-                                        if attachments_dir.exists():
-                                            images_dir = attachments_dir / "images"
-                                            if images_dir.exists():
-                                                stats.total_images += len(list(images_dir.glob("*")))
-                                            
-                                            files_dir = attachments_dir / "files"
-                                            if files_dir.exists():
-                                                stats.total_files += len(list(files_dir.glob("*")))
-
-            # Calculate storage size
-            try:
-                stats.total_size_bytes = self._calculate_directory_size(user_cache_dir)
-            except Exception as e:
-                logger.warning(f"Failed to calculate cache size: {e}")
+            cache_metadata = await self._load_cache_metadata(user_id)
+            verified = cache_metadata is not None and (
+                cache_metadata.counters.verified_at is not None
+                or user_id in self._unflushed_verified_at
+            )
+            if verify or not verified:
+                counters = await self._reset_cache_counters(user_id, rescan=True)
+            else:
+                counters = self._apply_counter_deltas(user_id, cache_metadata.counters)
 
-            # Load last sync info from cache metadata
-            try:
-                cache_metadata = await self._load_cache_metadata(user_id)
-                if cache_metadata:
-                    stats.last_sync = cache_metadata.last_incremental_sync or cache_metadata.last_full_sync
-            except Exception as e:
-                logger.warning(f"Failed to load sync info: {e}")
+            stats.total_notebooks = counters.notebooks
+            stats.total_sections = counters.sections
+            stats.total_pages = counters.pages
+            stats.total_images = counters.images
+            stats.total_files = counters.files
+            stats.total_size_bytes = counters.size_bytes
+            stats.markdown_size_bytes = counters.markdown_bytes
+            stats.assets_size_bytes = counters.asset_bytes
+
+            # Last sync info from cache metadata
+            if cache_metadata:
+                stats.last_sync = cache_metadata.last_incremental_sync or cache_metadata.last_full_sync
 
             return stats
 
@@ -436,25 +1289,6 @@ class OneNoteCacheManager:
             logger.error(f"Failed to get cache statistics: {e}")
             return CacheStatistics(user_id=user_id)
 
-    def _calculate_directory_size(self, path: Path) -> int:
-        """
-        Calculate total size of directory and all subdirectories.
-
-        Args:
-            path: Path to calculate size for
-
-        Returns:
-            Total size in bytes
-        """
-        total_size = 0
-        try:
-            for item in path.rglob("*"):
-                if item.is_file():
-                    total_size += item.stat().st_size
-        except (OSError, PermissionError) as e:
-            logger.warning(f"Failed to calculate size for {path}: {e}")
-        return total_size
-
     async def cleanup_orphaned_assets(self, user_id: str) -> CleanupResult:
         """
         Remove assets no longer referenced by any pages.
@@ -478,32 +1312,11 @@ class OneNoteCacheManager:
             # Collect all asset references from pages
             referenced_assets = set()
             
-            for notebook_dir in (user_cache_dir / "notebooks").glob("*"):
-                if not notebook_dir.is_dir():
-                    continue
-                    
-                for section_dir in (notebook_dir / "sections").glob("*"):
-                    if not section_dir.is_dir():
-                        continue
-                    
-                    for page_dir in (section_dir / "pages").glob("*"):
-                        if not page_dir.is_dir():
-                            continue
-                        
-                        try:
-                            metadata_file = page_dir / "metadata.json"
-                            if metadata_file.exists():
-                                with open(metadata_file, 'r', encoding='utf-8') as f:
-                                    metadata = json.load(f)
-                                    
-                                # Collect asset paths from metadata
-                                for attachment in metadata.get('attachments', []):
-                                    if 'local_path' in attachment:
-                                        referenced_assets.add(Path(attachment['local_path']))
-                                        
-                        except Exception as e:
-                            logger.warning(f"Failed to process page {page_dir}: {e}")
-                            continue
+            async for page in self.iter_cached_pages(user_id, fields=("metadata",)):
+                # Collect asset paths from metadata
+                for attachment in page.metadata.attachments:
+                    if attachment.local_path:
+                        referenced_assets.add(Path(attachment.local_path))
 
             # Find and remove orphaned assets
             for notebook_dir in (user_cache_dir / "notebooks").glob("*"):
@@ -535,6 +1348,12 @@ class OneNoteCacheManager:
                                     logger.warning(f"Failed to remove orphaned asset {asset_file}: {e}")
                                     result.errors.append(f"Failed to remove {asset_file}: {e}")
 
+            # Reclaim asset blobs no page links to anymore
+            gc_result = self.get_asset_store(user_id).garbage_collect()
+            if gc_result["blobs_removed"]:
+                logger.info(f"Removed {gc_result['blobs_removed']} unreferenced asset blobs "
+                           f"({gc_result['bytes_freed']} bytes)")
+
             end_time = datetime.utcnow()
             result.cleanup_time_seconds = (end_time - start_time).total_seconds()
             
@@ -560,8 +1379,7 @@ class OneNoteCacheManager:
             user_cache_dir = self._get_user_cache_dir(user_id)
             metadata_file = user_cache_dir / "cache_metadata.json"
             
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata.model_dump(), f, indent=2, default=str)
+            await self.file_io.write_json(metadata_file, metadata)
                 
             logger.debug(f"Saved cache metadata for user: {user_id}")
             
@@ -586,9 +1404,7 @@ class OneNoteCacheManager:
             if not metadata_file.exists():
                 return None
                 
-            with open(metadata_file, 'r', encoding='utf-8') as f:
-                metadata_dict = json.load(f)
-                return CacheMetadata(**metadata_dict)
+            return serialization.load_model(CacheMetadata, metadata_file.read_bytes())
                 
         except Exception as e:
             logger.error(f"Failed to load cache metadata: {e}")
@@ -616,7 +1432,19 @@ class OneNoteCacheManager:
                 if hasattr(metadata, key):
                     setattr(metadata, key, value)
 
+            # Persist pending counter changes along with the update; the
+            # counters are verified again once they include every change
+            metadata.counters = self._apply_counter_deltas(user_id, metadata.counters)
+            verified_at = self._unflushed_verified_at.pop(user_id, None)
+            if verified_at and metadata.counters.verified_at is None:
+                metadata.counters.verified_at = verified_at
+
             await self._save_cache_metadata(user_id, metadata)
+            self._counter_deltas.pop(user_id, None)
+            self._counter_changes.pop(user_id, None)
+
+            # Metadata updates mark sync checkpoints; make prior writes durable
+            await self.file_io.flush()
             
         except Exception as e:
             logger.error(f"Failed to update cache metadata: {e}")
@@ -635,6 +1463,18 @@ class OneNoteCacheManager:
         try:
             user_cache_dir = self._get_user_cache_dir(user_id)
             
+            index = self._page_indexes.pop(str(user_cache_dir), None)
+            if index:
+                index.close()
+            pack = self._page_packs.pop(str(user_cache_dir), None)
+            if pack:
+                pack.close()
+            store = self._asset_stores.pop(str(user_cache_dir), None)
+            if store:
+                store.close()
+            self._counter_deltas.pop(user_id, None)
+            self._counter_changes.pop(user_id, None)
+            
             if user_cache_dir.exists():
                 shutil.rmtree(user_cache_dir)
                 logger.info(f"Deleted cache for user: {user_id}")
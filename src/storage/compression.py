@@ -0,0 +1,189 @@
+"""
+Transparent compression for cached page files.
+
+Page bodies and metadata are stored either as plain files or with a codec
+suffix (``.zst`` for zstd, ``.gz`` for gzip). Writers pick the codec from
+settings; readers locate whichever variant exists and detect the format from
+the file's magic bytes, so caches written with different settings stay
+readable.
+"""
+
+import gzip
+from pathlib import Path
+from typing import Any, Optional
+
+from .async_io import atomic_write_bytes
+
+try:
+    import zstandard
+except ImportError:  # zstd is optional, gzip is always available
+    zstandard = None
+
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+GZIP_MAGIC = b"\x1f\x8b"
+
+CODEC_SUFFIXES = {
+    "zstd": ".zst",
+    "gzip": ".gz",
+}
+
+ZSTD_LEVEL = 3
+GZIP_LEVEL = 6
+
+
+def default_codec() -> str:
+    """Get the preferred available compression codec."""
+    return "zstd" if zstandard is not None else "gzip"
+
+
+def resolve_codec(settings: Any) -> Optional[str]:
+    """
+    Determine the codec to write cache files with.
+
+    Args:
+        settings: Settings instance
+
+    Returns:
+        Codec name, or None when compression is disabled
+    """
+    enabled = getattr(settings, "onenote_enable_compression", False)
+    # Only an explicit boolean enables compression (settings may be mocked)
+    if not isinstance(enabled, bool) or not enabled:
+        return None
+    return default_codec()
+
+
+def compress(data: bytes, codec: Optional[str]) -> bytes:
+    """
+    Compress data with a codec.
+
+    Args:
+        data: Raw data
+        codec: Codec name, or None to store uncompressed
+
+    Returns:
+        Encoded data
+    """
+    if codec is None:
+        return data
+    if codec == "zstd":
+        if zstandard is None:
+            raise ValueError("zstd compression requires the zstandard package")
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    if codec == "gzip":
+        return gzip.compress(data, compresslevel=GZIP_LEVEL)
+    raise ValueError(f"Unknown compression codec: {codec}")
+
+
+def decompress(data: bytes) -> bytes:
+    """
+    Decode data, detecting the codec from its magic bytes.
+
+    Args:
+        data: Stored data
+
+    Returns:
+        Raw data
+    """
+    if data.startswith(ZSTD_MAGIC):
+        if zstandard is None:
+            raise ValueError("Reading zstd-compressed cache files requires the zstandard package")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if data.startswith(GZIP_MAGIC):
+        return gzip.decompress(data)
+    return data
+
+
+def stored_path(path: Path, codec: Optional[str]) -> Path:
+    """Get the on-disk path of a logical cache file for a codec."""
+    if codec is None:
+        return path
+    return path.with_name(path.name + CODEC_SUFFIXES[codec])
+
+
+def find_stored_file(path: Path) -> Optional[Path]:
+    """
+    Find the stored variant of a logical cache file.
+
+    Args:
+        path: Logical (uncompressed) file path
+
+    Returns:
+        Path of the existing variant, or None if the file is not stored
+    """
+    for codec in (*CODEC_SUFFIXES, None):
+        candidate = stored_path(path, codec)
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def write_text(path: Path, text: str, codec: Optional[str]) -> Path:
+    """
+    Write a text file, compressed with the given codec.
+
+    Args:
+        path: Logical (uncompressed) file path
+        text: Text to write
+        codec: Codec name, or None to store uncompressed
+
+    Returns:
+        Path of the written file
+    """
+    return write_bytes(path, text.encode("utf-8"), codec)
+
+
+def write_bytes(path: Path, data: bytes, codec: Optional[str]) -> Path:
+    """
+    Write a file, compressed with the given codec.
+
+    The file is replaced atomically. Variants stored with other codecs are
+    removed so reads stay unambiguous.
+
+    Args:
+        path: Logical (uncompressed) file path
+        data: Raw file content
+        codec: Codec name, or None to store uncompressed
+
+    Returns:
+        Path of the written file
+    """
+    target = stored_path(path, codec)
+    atomic_write_bytes(target, compress(data, codec))
+
+    for other in (*CODEC_SUFFIXES, None):
+        variant = stored_path(path, other)
+        if variant != target and variant.exists():
+            variant.unlink()
+
+    return target
+
+
+def read_text(path: Path) -> Optional[str]:
+    """
+    Read a text file stored with any codec.
+
+    Args:
+        path: Logical (uncompressed) file path
+
+    Returns:
+        File text, or None if the file is not stored
+    """
+    data = read_bytes(path)
+    return data.decode("utf-8") if data is not None else None
+
+
+def read_bytes(path: Path) -> Optional[bytes]:
+    """
+    Read a file stored with any codec.
+
+    Args:
+        path: Logical (uncompressed) file path
+
+    Returns:
+        Raw file content, or None if the file is not stored
+    """
+    stored = find_stored_file(path)
+    if stored is None:
+        return None
+    return decompress(stored.read_bytes())
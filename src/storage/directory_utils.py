@@ -10,6 +10,8 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from .compression import CODEC_SUFFIXES
+
 logger = logging.getLogger(__name__)
 
 
@@ -270,6 +272,12 @@ def get_cache_size_breakdown(user_cache_dir: Path) -> Dict[str, int]:
             size = item.stat().st_size
             filename = item.name.lower()
             
+            # Categorize compressed page files by their logical name
+            for suffix in CODEC_SUFFIXES.values():
+                if filename.endswith(suffix):
+                    filename = filename[:-len(suffix)]
+                    break
+            
             # Categorize by file type
             if filename.endswith('.json'):
                 breakdown['metadata'] += size
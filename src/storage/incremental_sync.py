@@ -3,6 +3,17 @@ Incremental sync manager for OneNote cache system.
 
 Provides intelligent content synchronization with change detection,
 conflict resolution, and efficient update strategies.
+
+Change detection is incremental: sections not modified since the last sync
+are skipped without a page request, changed sections are listed with a
+lightweight page index filtered server side by modification time, and local
+and remote pages are matched through dictionary indexes. Deleted pages can
+only be seen in a complete page list, so they are detected by full scans.
+
+Planned operations are executed grouped by action: deletions are coalesced
+into one removal from the cache, the full-text index and the vector store;
+created and updated pages are fetched with batched Graph requests, stored by
+a pool of workers and handed to the bulk indexer one batch at a time.
 """
 
 import asyncio
@@ -19,9 +30,24 @@ from .onenote_fetcher import OneNoteContentFetcher
 from .bulk_indexer import BulkContentIndexer, IndexingProgress
 from .cache_manager import OneNoteCacheManager
 from .directory_utils import get_content_path_for_page
+from .local_search import LocalOneNoteSearch
+from .page_manifest import parse_modified
+from .vector_store import VectorStore
 
 logger = logging.getLogger(__name__)
 
+# Sync operations executed concurrently
+DEFAULT_MAX_CONCURRENT_OPERATIONS = 5
+
+# Created and updated pages fetched (and then indexed) per batch
+SYNC_BATCH_SIZE = 50
+
+
+def _modified_time(item: Dict) -> Optional[datetime]:
+    """Get the timezone-aware lastModifiedDateTime of a page or section, if present."""
+    value = item.get("lastModifiedDateTime")
+    return parse_modified(value) if value else None
+
 
 class SyncStrategy(Enum):
     """Synchronization strategy options."""
@@ -142,7 +168,10 @@ class IncrementalSyncManager:
                  cache_manager: Optional[OneNoteCacheManager] = None,
                  bulk_indexer: Optional[BulkContentIndexer] = None,
                  default_strategy: SyncStrategy = SyncStrategy.NEWER_WINS,
-                 change_detection_window: timedelta = timedelta(days=30)):
+                 change_detection_window: timedelta = timedelta(days=30),
+                 local_search: Optional[LocalOneNoteSearch] = None,
+                 vector_store: Optional[VectorStore] = None,
+                 max_concurrent_operations: int = DEFAULT_MAX_CONCURRENT_OPERATIONS):
         """
         Initialize incremental sync manager.
 
@@ -153,6 +182,10 @@ class IncrementalSyncManager:
             bulk_indexer: Bulk content indexer (optional)
             default_strategy: Default conflict resolution strategy
             change_detection_window: Time window for change detection
+            local_search: Full-text index deleted pages are removed from
+                (defaults to the bulk indexer's)
+            vector_store: Vector store deleted and changed pages are removed from (optional)
+            max_concurrent_operations: Sync operations executed concurrently
         """
         self.cache_root = Path(cache_root)
         self.content_fetcher = content_fetcher
@@ -160,9 +193,13 @@ class IncrementalSyncManager:
         self.bulk_indexer = bulk_indexer
         self.default_strategy = default_strategy
         self.change_detection_window = change_detection_window
+        self.local_search = local_search or getattr(bulk_indexer, "local_search", None)
+        self.vector_store = vector_store
+        self.max_concurrent_operations = max(1, max_concurrent_operations)
         
         # State tracking
         self.last_sync_time: Optional[datetime] = None
+        self.last_user_id: Optional[str] = None
         self.pending_conflicts: List[ContentChange] = []
         
         logger.info(f"Initialized incremental sync manager with strategy: {default_strategy.value}")
@@ -184,6 +221,7 @@ class IncrementalSyncManager:
         """
         try:
             logger.info("Starting change detection...")
+            self.last_user_id = user_id
             changes = []
             
             # Get notebooks to check
@@ -193,7 +231,7 @@ class IncrementalSyncManager:
             # Set change detection cutoff time
             cutoff_time = None
             if not force_full_scan and self.last_sync_time:
-                cutoff_time = self.last_sync_time - timedelta(hours=1)  # Buffer for clock skew
+                cutoff_time = parse_modified(self.last_sync_time) - timedelta(hours=1)  # Buffer for clock skew
             
             for notebook in notebooks:
                 notebook_changes = await self._detect_notebook_changes(user_id, notebook, cutoff_time)
@@ -241,67 +279,66 @@ class IncrementalSyncManager:
                                     notebook: Dict,
                                     section: Dict, 
                                     cutoff_time: Optional[datetime]) -> List[ContentChange]:
-        """Detect changes within a specific section."""
+        """
+        Detect changes within a specific section.
+
+        With a cutoff time, a section not modified since then costs no page
+        request, and only pages modified since then are listed; deletions
+        are left to full scans (no cutoff), which list every page.
+        """
         changes = []
         
         try:
-            # Get remote pages
-            remote_pages = await self.content_fetcher._get_pages_from_section(section["id"])
-            
-            # Filter by modification time if cutoff specified
-            if cutoff_time:
-                remote_pages = [
-                    page for page in remote_pages 
-                    if datetime.fromisoformat(page["lastModifiedDateTime"].replace('Z', '+00:00')) > cutoff_time
-                ]
+            # Unchanged section: nothing to compare
+            section_modified = _modified_time(section)
+            if cutoff_time and section_modified and section_modified <= cutoff_time:
+                logger.debug(f"Section {section.get('displayName', section['id'])} unchanged since {cutoff_time}")
+                return changes
+
+            # Get remote pages (only the modified ones if a cutoff is given)
+            remote_pages = await self.content_fetcher._list_page_index(
+                section["id"], modified_since=cutoff_time
+            )
+            remote_by_id = {page["id"]: page for page in remote_pages}
             
             # Get local pages
             local_pages = await self._get_local_pages(user_id, notebook, section)
-            local_page_ids = {page["id"] for page in local_pages}
-            remote_page_ids = {page["id"] for page in remote_pages}
+            local_by_id = {page["id"]: page for page in local_pages}
             
             # Detect different types of changes
-            
-            # New pages (added remotely)
-            new_page_ids = remote_page_ids - local_page_ids
-            for page_id in new_page_ids:
-                remote_page = next(p for p in remote_pages if p["id"] == page_id)
-                changes.append(ContentChange(
-                    change_type=ChangeType.ADDED,
-                    page_id=page_id,
-                    page_title=remote_page["title"],
-                    notebook_id=notebook["id"],
-                    section_id=section["id"],
-                    remote_modified=datetime.fromisoformat(
-                        remote_page["lastModifiedDateTime"].replace('Z', '+00:00')
-                    )
-                ))
-            
-            # Deleted pages (removed remotely)
-            deleted_page_ids = local_page_ids - remote_page_ids
-            for page_id in deleted_page_ids:
-                local_page = next(p for p in local_pages if p["id"] == page_id)
-                changes.append(ContentChange(
-                    change_type=ChangeType.DELETED,
-                    page_id=page_id,
-                    page_title=local_page["title"],
-                    notebook_id=notebook["id"],
-                    section_id=section["id"],
-                    local_modified=datetime.fromisoformat(
-                        local_page["lastModifiedDateTime"].replace('Z', '+00:00')
-                    ) if "lastModifiedDateTime" in local_page else None
-                ))
-            
-            # Modified pages
-            common_page_ids = local_page_ids & remote_page_ids
-            for page_id in common_page_ids:
-                local_page = next(p for p in local_pages if p["id"] == page_id)
-                remote_page = next(p for p in remote_pages if p["id"] == page_id)
-                
+            for page_id, remote_page in remote_by_id.items():
+                local_page = local_by_id.get(page_id)
+                if local_page is None:
+                    # New page (added remotely)
+                    changes.append(ContentChange(
+                        change_type=ChangeType.ADDED,
+                        page_id=page_id,
+                        page_title=remote_page.get("title", ""),
+                        notebook_id=notebook["id"],
+                        section_id=section["id"],
+                        remote_modified=_modified_time(remote_page)
+                    ))
+                    continue
+
+                # Modified page
                 change = await self._compare_pages(user_id, notebook, section, local_page, remote_page)
                 if change:
                     changes.append(change)
             
+            # Deleted pages (removed remotely); only a full listing shows them
+            if cutoff_time is None:
+                for page_id, local_page in local_by_id.items():
+                    if page_id in remote_by_id:
+                        continue
+                    changes.append(ContentChange(
+                        change_type=ChangeType.DELETED,
+                        page_id=page_id,
+                        page_title=local_page["title"] or await self._cached_page_title(user_id, page_id),
+                        notebook_id=notebook["id"],
+                        section_id=section["id"],
+                        local_modified=_modified_time(local_page)
+                    ))
+            
         except Exception as e:
             logger.error(f"Failed to detect changes in section {section.get('displayName', section['id'])}: {e}")
         
@@ -311,50 +348,55 @@ class IncrementalSyncManager:
                              user_id: str,
                              notebook: Dict, 
                              section: Dict) -> List[Dict]:
-        """Get pages from local cache for a section."""
+        """
+        Get pages from local cache for a section.
+
+        With a cache manager the section's pages come from its page index in
+        one query; titles are not indexed and are left empty.
+
+        Raises:
+            Exception: If the cache manager lookup fails, so the section is
+                not compared against an empty local set
+        """
         local_pages = []
-        
+
+        if self.cache_manager:
+            locations = await self.cache_manager.get_section_page_locations(user_id, section["id"])
+            return [
+                {"id": location.page_id, "title": "", "lastModifiedDateTime": location.modified}
+                for location in locations
+            ]
+
         try:
-            # Use cache manager to get local pages
-            if self.cache_manager:
-                cached_pages = await self.cache_manager.get_pages_by_section(
-                    user_id=user_id,
-                    section_id=section["id"]
-                )
-                
-                # Convert cached pages to dict format for consistency
-                for cached_page in cached_pages:
-                    local_pages.append({
-                        "id": cached_page.page_id,
-                        "title": cached_page.title,
-                        "lastModifiedDateTime": cached_page.last_modified_date_time.isoformat(),
-                        "createdDateTime": cached_page.created_date_time.isoformat()
-                    })
-            else:
-                # Fallback: Simple file system check
-                section_dir = self.cache_root / "content" / notebook["displayName"] / section["displayName"]
-                
-                if section_dir.exists():
-                    for page_dir in section_dir.iterdir():
-                        if page_dir.is_dir():
-                            metadata_file = page_dir / "metadata.json"
-                            if metadata_file.exists():
-                                local_pages.append({
-                                    "id": page_dir.name,
-                                    "title": page_dir.name,
-                                    "lastModifiedDateTime": datetime.fromtimestamp(
-                                        metadata_file.stat().st_mtime
-                                    ).isoformat(),
-                                    "createdDateTime": datetime.fromtimestamp(
-                                        metadata_file.stat().st_ctime
-                                    ).isoformat()
-                                })
-                            
+            # Fallback: Simple file system check
+            section_dir = self.cache_root / "content" / notebook["displayName"] / section["displayName"]
+
+            if section_dir.exists():
+                for page_dir in section_dir.iterdir():
+                    if page_dir.is_dir():
+                        metadata_file = page_dir / "metadata.json"
+                        if metadata_file.exists():
+                            local_pages.append({
+                                "id": page_dir.name,
+                                "title": page_dir.name,
+                                "lastModifiedDateTime": datetime.fromtimestamp(
+                                    metadata_file.stat().st_mtime
+                                ).isoformat(),
+                                "createdDateTime": datetime.fromtimestamp(
+                                    metadata_file.stat().st_ctime
+                                ).isoformat()
+                            })
+
         except Exception as e:
             logger.debug(f"No local pages found for section {section.get('displayName', section['id'])}: {e}")
         
         return local_pages
 
+    async def _cached_page_title(self, user_id: str, page_id: str) -> str:
+        """Read a cached page's title from its metadata (empty if unavailable)."""
+        cached_page = await self.cache_manager.get_cached_page(user_id, page_id, load_content=False)
+        return cached_page.metadata.title if cached_page else ""
+
     async def _compare_pages(self, 
                            user_id: str,
                            notebook: Dict,
@@ -364,13 +406,8 @@ class IncrementalSyncManager:
         """Compare local and remote page versions."""
         try:
             # Parse timestamps
-            local_modified = datetime.fromisoformat(
-                local_page["lastModifiedDateTime"].replace('Z', '+00:00')
-            ) if "lastModifiedDateTime" in local_page else None
-            
-            remote_modified = datetime.fromisoformat(
-                remote_page["lastModifiedDateTime"].replace('Z', '+00:00')
-            ) if "lastModifiedDateTime" in remote_page else None
+            local_modified = _modified_time(local_page)
+            remote_modified = _modified_time(remote_page)
             
             # Check modification times
             if remote_modified and local_modified and remote_modified <= local_modified:
@@ -380,7 +417,7 @@ class IncrementalSyncManager:
             change = ContentChange(
                 change_type=ChangeType.MODIFIED,
                 page_id=local_page["id"],
-                page_title=local_page["title"],
+                page_title=remote_page.get("title") or local_page["title"],
                 notebook_id=notebook["id"],
                 section_id=section["id"],
                 local_modified=local_modified,
@@ -495,13 +532,20 @@ class IncrementalSyncManager:
 
     async def execute_sync(self, 
                          operations: List[SyncOperation],
-                         dry_run: bool = False) -> SyncReport:
+                         dry_run: bool = False,
+                         user_id: Optional[str] = None) -> SyncReport:
         """
         Execute planned sync operations.
 
+        Operations are grouped by action. Deletions are applied in one
+        batch; created and updated pages are fetched in batches, stored
+        concurrently and indexed batch by batch.
+
         Args:
             operations: List of sync operations to execute
             dry_run: Whether to simulate operations without making changes
+            user_id: User whose cache is updated (defaults to the user of the
+                last change detection)
 
         Returns:
             Comprehensive sync report
@@ -511,17 +555,26 @@ class IncrementalSyncManager:
             sync_strategy=self.default_strategy,
             total_changes=len(operations)
         )
+        user_id = user_id or self.last_user_id
         
         try:
             logger.info(f"Executing {len(operations)} sync operations (dry_run={dry_run})")
             
-            for operation in operations:
-                try:
-                    await self._execute_single_operation(operation, report, dry_run)
-                except Exception as e:
-                    error_msg = f"Failed to execute operation for {operation.change.page_title}: {e}"
-                    logger.error(error_msg)
-                    report.errors.append(error_msg)
+            if dry_run:
+                await self._run_operations(operations, report, dry_run, user_id)
+            else:
+                groups = self._group_operations(operations)
+                await self._execute_deletions(groups["delete"], report, user_id)
+
+                # Created and updated pages, fetched and indexed batch by batch
+                writes = groups["create"] + groups["update"]
+                for start in range(0, len(writes), SYNC_BATCH_SIZE):
+                    batch = writes[start:start + SYNC_BATCH_SIZE]
+                    pages = await self._fetch_pages([operation.change.page_id for operation in batch])
+                    stored_pages = await self._run_operations(batch, report, dry_run, user_id, pages)
+                    await self._index_synced_pages(stored_pages, report)
+
+                await self._run_operations(groups["skip"], report, dry_run, user_id)
             
             # Update sync timestamp
             if not dry_run:
@@ -540,61 +593,234 @@ class IncrementalSyncManager:
             report.end_time = datetime.utcnow()
             raise
 
+    @staticmethod
+    def _group_operations(operations: List[SyncOperation]) -> Dict[str, List[SyncOperation]]:
+        """Group operations by action, keeping their planned order within each group."""
+        groups: Dict[str, List[SyncOperation]] = {"delete": [], "create": [], "update": [], "skip": []}
+        for operation in operations:
+            groups.setdefault(operation.action, []).append(operation)
+        return groups
+
+    async def _run_operations(self,
+                              operations: List[SyncOperation],
+                              report: SyncReport,
+                              dry_run: bool,
+                              user_id: Optional[str],
+                              pages: Optional[Dict[str, Optional[Dict]]] = None) -> List[CachedPage]:
+        """
+        Execute operations with a pool of workers.
+
+        Args:
+            operations: Operations to execute
+            report: Report to record results in
+            dry_run: Whether to simulate operations without making changes
+            user_id: User whose cache is updated
+            pages: Prefetched page dictionaries by page ID
+
+        Returns:
+            Pages stored by the operations, to be indexed
+        """
+        pending = iter(operations)
+        stored_pages: List[CachedPage] = []
+        pages = pages or {}
+
+        async def worker() -> None:
+            """Execute operations from the shared queue until it is empty."""
+            for operation in pending:
+                try:
+                    cached_page = await self._execute_single_operation(
+                        operation, report, dry_run,
+                        user_id=user_id, page_data=pages.get(operation.change.page_id)
+                    )
+                    if cached_page:
+                        stored_pages.append(cached_page)
+                except Exception as e:
+                    error_msg = f"Failed to execute operation for {operation.change.page_title}: {e}"
+                    logger.error(error_msg)
+                    report.errors.append(error_msg)
+
+        workers = min(self.max_concurrent_operations, len(operations))
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        return stored_pages
+
     async def _execute_single_operation(self, 
                                       operation: SyncOperation, 
                                       report: SyncReport,
-                                      dry_run: bool) -> None:
-        """Execute a single sync operation."""
+                                      dry_run: bool,
+                                      user_id: Optional[str] = None,
+                                      page_data: Optional[Dict] = None) -> Optional[CachedPage]:
+        """
+        Execute a single sync operation.
+
+        Args:
+            operation: Operation to execute
+            report: Report to record the result in
+            dry_run: Whether to simulate the operation
+            user_id: User whose cache is updated
+            page_data: Prefetched page dictionary of created or updated pages
+
+        Returns:
+            The stored page if the operation created or updated one
+        """
         change = operation.change
         
         if dry_run:
             logger.info(f"DRY RUN - Would {operation.action} page: {change.page_title}")
-            return
+            return None
         
+        cached_page = None
         if operation.action == "create":
-            # Download and index new page
-            if self.bulk_indexer:
-                # Use bulk indexer for comprehensive processing
-                page_data = await self.content_fetcher._fetch_single_page(change.page_id)
-                if page_data:
-                    # This would typically be handled by bulk indexer
-                    logger.info(f"Would process new page: {change.page_title}")
+            # Download and store new page
+            cached_page = await self._store_remote_page(change, user_id, page_data)
             report.pages_created += 1
             
         elif operation.action == "update":
-            # Update existing page
-            if self.bulk_indexer:
-                # Re-process the page through bulk indexer
-                page_data = await self.content_fetcher._fetch_single_page(change.page_id)
-                if page_data:
-                    # This would typically be handled by bulk indexer
-                    logger.info(f"Would update page: {change.page_title}")
+            # Replace the local copy with the remote page
+            cached_page = await self._store_remote_page(change, user_id, page_data)
             report.pages_updated += 1
             
         elif operation.action == "delete":
             # Remove local page
-            await self._delete_local_page(change)
+            await self._delete_local_pages([change], user_id)
             report.pages_deleted += 1
             
         elif operation.action == "skip":
             report.pages_skipped += 1
         
-        # Track conflicts
-        if change.is_conflict():
+        self._track_conflict(operation, report)
+        return cached_page
+
+    @staticmethod
+    def _track_conflict(operation: SyncOperation, report: SyncReport) -> None:
+        """Count a conflicted change as resolved or pending."""
+        if operation.change.is_conflict():
             if operation.action != "skip":
                 report.conflicts_resolved += 1
             else:
                 report.conflicts_pending += 1
 
-    async def _delete_local_page(self, change: ContentChange) -> None:
-        """Delete a page from local cache."""
+    async def _fetch_pages(self, page_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """Fetch pages with batched requests; pages missing from the result are fetched one by one."""
+        if not page_ids:
+            return {}
+        try:
+            return await self.content_fetcher._fetch_pages(page_ids)
+        except Exception as e:
+            logger.warning(f"Batched fetch of {len(page_ids)} pages failed: {e}")
+            return {}
+
+    async def _store_remote_page(self,
+                                 change: ContentChange,
+                                 user_id: Optional[str],
+                                 page_data: Optional[Dict] = None) -> CachedPage:
+        """
+        Store the remote version of a page in the local cache.
+
+        Args:
+            change: Change of the page
+            user_id: User whose cache is updated
+            page_data: Prefetched page dictionary (fetched here if not given)
+
+        Returns:
+            The stored page
+
+        Raises:
+            ValueError: If the page cannot be fetched or stored
+        """
+        if page_data is None:
+            page_data = await self.content_fetcher._fetch_single_page(change.page_id)
+        if not page_data:
+            raise ValueError(f"Page not found: {change.page_id}")
+
+        cached_page = await self.content_fetcher._convert_to_cached_page(page_data)
+        if self.cache_manager:
+            if not user_id:
+                raise ValueError("No user to store the page for")
+            await self.cache_manager.store_page_content(user_id, cached_page)
+
+        logger.debug(f"Synced page: {change.page_title}")
+        return cached_page
+
+    async def _index_synced_pages(self, cached_pages: List[CachedPage], report: SyncReport) -> None:
+        """
+        Reindex stored pages in one batch.
+
+        The pages go to the bulk indexer's full-text index, and their
+        embeddings are dropped from the vector store so the next content
+        indexing run re-embeds the new content instead of keeping stale chunks.
+
+        Args:
+            cached_pages: Pages stored by the sync
+            report: Sync report warnings are added to
+        """
+        if not cached_pages:
+            return
+        if self.vector_store:
+            page_ids = [cached_page.metadata.id for cached_page in cached_pages]
+            try:
+                await self.vector_store.delete_pages_embeddings(page_ids)
+            except Exception as e:
+                logger.error(f"Failed to drop embeddings of {len(page_ids)} synced pages: {e}")
+                report.warnings.append(f"Failed to drop embeddings of {len(page_ids)} synced pages: {e}")
+        if not self.bulk_indexer:
+            return
+        try:
+            _, failed_count = await self.bulk_indexer.index_cached_pages(cached_pages)
+            if failed_count:
+                report.warnings.append(f"Failed to index {failed_count} synced pages")
+        except Exception as e:
+            logger.error(f"Failed to index {len(cached_pages)} synced pages: {e}")
+            report.warnings.append(f"Failed to index {len(cached_pages)} synced pages: {e}")
+
+    async def _execute_deletions(self,
+                                 operations: List[SyncOperation],
+                                 report: SyncReport,
+                                 user_id: Optional[str]) -> None:
+        """Apply all delete operations as one batch."""
+        if not operations:
+            return
+        try:
+            await self._delete_local_pages([operation.change for operation in operations], user_id)
+        except Exception as e:
+            error_msg = f"Failed to delete {len(operations)} pages: {e}"
+            logger.error(error_msg)
+            report.errors.append(error_msg)
+            return
+
+        for operation in operations:
+            report.pages_deleted += 1
+            self._track_conflict(operation, report)
+
+    async def _delete_local_pages(self, changes: List[ContentChange], user_id: Optional[str]) -> None:
+        """
+        Delete pages from the local cache, the full-text index and the vector store.
+
+        The index and vector store deletions are each a single batched call.
+
+        Args:
+            changes: Changes of the deleted pages
+            user_id: User whose cache is updated
+
+        Raises:
+            ValueError: If there is no user to delete cached pages for
+        """
+        page_ids = [change.page_id for change in changes]
         try:
-            # This would delete the page from local storage
-            # Implementation depends on storage strategy
-            logger.info(f"Deleting local page: {change.page_title}")
+            if self.cache_manager:
+                if not user_id:
+                    raise ValueError("No user to delete cached pages for")
+                for page_id in page_ids:
+                    await self.cache_manager.delete_cached_page(user_id, page_id)
+
+            if self.local_search:
+                await self.local_search.delete_pages(page_ids)
+            if self.vector_store:
+                await self.vector_store.delete_pages_embeddings(page_ids)
+
+            logger.info(f"Deleted {len(page_ids)} local pages")
             
         except Exception as e:
-            logger.error(f"Failed to delete local page {change.page_title}: {e}")
+            logger.error(f"Failed to delete {len(page_ids)} local pages: {e}")
             raise
 
     def get_pending_conflicts(self) -> List[ContentChange]:
@@ -619,7 +845,11 @@ class IncrementalSyncManager:
             operation = await self._plan_single_operation(change, resolution)
             if operation:
                 report = SyncReport(start_time=datetime.utcnow())
-                await self._execute_single_operation(operation, report, dry_run=False)
+                cached_page = await self._execute_single_operation(
+                    operation, report, dry_run=False, user_id=self.last_user_id
+                )
+                if cached_page:
+                    await self._index_synced_pages([cached_page], report)
                 
             logger.info(f"Resolved conflict for page {change.page_title} using {resolution.value}")
             
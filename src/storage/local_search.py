@@ -6,11 +6,18 @@ integrating SQLite FTS for text search with the existing semantic search framewo
 """
 
 import asyncio
+import hashlib
+import heapq
 import logging
+import re
 import sqlite3
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import (Any, AsyncGenerator, AsyncIterable, Dict, List, Optional,
+                    Set, Tuple)
 
 from ..config.logging import log_performance, logged
 from ..config.settings import Settings, get_settings
@@ -25,12 +32,76 @@ from .cache_manager import OneNoteCacheManager
 
 logger = logging.getLogger(__name__)
 
+# Passage index sizing (characters of page markdown per passage)
+MAX_PASSAGE_LENGTH = 800
+MIN_PASSAGE_LENGTH = 200
+
+# Sharded layout: one FTS database per notebook
+SHARD_DIRECTORY = "search_shards"
+UNASSIGNED_SHARD = "_unassigned"
+DEFAULT_SHARD_WORKERS = 4
+
+
+@dataclass
+class _PageRows:
+    """Index rows of one page."""
+    page_id: str
+    fts_row: Tuple[Any, ...]
+    metadata_row: Tuple[Any, ...]
+    passage_rows: List[Tuple[Any, ...]]
+    content_length: int
+
 
 class LocalSearchError(Exception):
     """Exception raised when local search operations fail."""
     pass
 
 
+@dataclass
+class LocalSearchFilter:
+    """
+    Structured filter for local searches, compiled into SQL WHERE clauses.
+
+    Date bounds are start-inclusive and end-exclusive. Content length refers
+    to the indexed searchable text stored in ``page_metadata.content_length``.
+    """
+
+    # Location filters
+    notebook_ids: Optional[List[str]] = None
+    section_ids: Optional[List[str]] = None
+    notebook_names: Optional[List[str]] = None
+    section_names: Optional[List[str]] = None
+
+    # Date filters
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+    modified_after: Optional[datetime] = None
+    modified_before: Optional[datetime] = None
+
+    # Size filters
+    min_content_length: Optional[int] = None
+    max_content_length: Optional[int] = None
+
+    # Asset and link count filters
+    min_asset_count: Optional[int] = None
+    max_asset_count: Optional[int] = None
+    min_link_count: Optional[int] = None
+    max_link_count: Optional[int] = None
+
+    def is_empty(self) -> bool:
+        """Check whether the filter has no active constraints."""
+        return all(value is None for value in vars(self).values())
+
+
+@dataclass(frozen=True)
+class LocalSearchCursor:
+    """Keyset cursor pointing just after the last returned search result."""
+
+    score: float
+    page_id: str
+    offset: int = 0  # Results already returned, keeps rank numbering continuous
+
+
 class LocalOneNoteSearch:
     """
     Local search engine for cached OneNote content.
@@ -42,7 +113,11 @@ class LocalOneNoteSearch:
     def __init__(
         self, 
         settings: Optional[Settings] = None,
-        cache_manager: Optional[OneNoteCacheManager] = None
+        cache_manager: Optional[OneNoteCacheManager] = None,
+        sharded: bool = False,
+        shard_workers: int = DEFAULT_SHARD_WORKERS,
+        in_memory: bool = False,
+        persist_interval: Optional[float] = None
     ):
         """
         Initialize the local search engine.
@@ -50,13 +125,42 @@ class LocalOneNoteSearch:
         Args:
             settings: Optional settings instance
             cache_manager: Optional cache manager instance
+            sharded: Store one FTS database per notebook and fan queries out
+                to the shards in parallel
+            shard_workers: Worker threads used for parallel shard queries
+            in_memory: Load the index into an in-memory hot copy at startup
+                and serve all queries from RAM
+            persist_interval: Seconds between background flushes of the hot
+                copy to disk; None writes every index change through to disk
+
+        Raises:
+            LocalSearchError: If in-memory mode is combined with sharding
         """
+        if in_memory and sharded:
+            raise LocalSearchError("In-memory mode is not supported with a sharded index")
+
         self.settings = settings or get_settings()
         self.cache_manager = cache_manager or OneNoteCacheManager(self.settings)
         
         # Database path for search index
         self.db_path = self.cache_manager.cache_root / "search_index.db"
         self._connection: Optional[sqlite3.Connection] = None
+
+        # Sharded layout state
+        self.sharded = sharded
+        self.shard_dir = self.cache_manager.cache_root / SHARD_DIRECTORY
+        self._shard_workers = shard_workers
+        self._shard_connections: Dict[Path, sqlite3.Connection] = {}
+        self._shard_executor: Optional[ThreadPoolExecutor] = None
+        self._page_shards: Optional[Dict[str, Path]] = None
+
+        # In-memory hot copy state
+        self.in_memory = in_memory
+        self.persist_interval = persist_interval
+        self._disk_connection: Optional[sqlite3.Connection] = None
+        self._hot_copy_dirty = False
+        self._persist_task: Optional[asyncio.Task] = None
+        self.hot_copy_stats: Dict[str, Any] = {}
         
         # Search statistics
         self._search_count = 0
@@ -75,8 +179,13 @@ class LocalOneNoteSearch:
             
             # Initialize database schema
             await self._create_schema()
+            if self.sharded:
+                self.shard_dir.mkdir(parents=True, exist_ok=True)
+            if self.in_memory and self.persist_interval and self._persist_task is None:
+                self._persist_task = asyncio.create_task(self._persist_loop())
             
-            logger.info(f"Local search engine initialized with database: {self.db_path}")
+            location = self.shard_dir if self.sharded else self.db_path
+            logger.info(f"Local search engine initialized with database: {location}")
             
         except Exception as e:
             logger.error(f"Failed to initialize local search engine: {e}")
@@ -86,80 +195,345 @@ class LocalOneNoteSearch:
         """Create the search database schema."""
         try:
             conn = await self._get_connection()
-            
-            # Create FTS5 table for full-text search
-            conn.execute("""
-                CREATE VIRTUAL TABLE IF NOT EXISTS page_content_fts USING fts5(
-                    page_id UNINDEXED,
-                    notebook_id UNINDEXED,
-                    section_id UNINDEXED,
-                    page_title,
-                    content,
-                    tags,
-                    created_time UNINDEXED,
-                    modified_time UNINDEXED
-                );
-            """)
-            
-            # Create metadata table for search optimization
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS page_metadata (
-                    page_id TEXT PRIMARY KEY,
-                    notebook_id TEXT NOT NULL,
-                    section_id TEXT NOT NULL,
-                    notebook_name TEXT,
-                    section_name TEXT,
-                    page_title TEXT NOT NULL,
-                    content_length INTEGER,
-                    asset_count INTEGER,
-                    link_count INTEGER,
-                    created_time TEXT,
-                    modified_time TEXT,
-                    cached_time TEXT,
-                    FOREIGN KEY (page_id) REFERENCES page_content_fts(page_id)
-                );
-            """)
-            
-            # Create index for common queries
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_page_metadata_notebook 
-                ON page_metadata(notebook_id);
-            """)
-            
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_page_metadata_section 
-                ON page_metadata(section_id);
-            """)
-            
-            conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_page_metadata_modified 
-                ON page_metadata(modified_time);
-            """)
-            
-            conn.commit()
+            self._apply_schema(conn)
             
         except Exception as e:
             logger.error(f"Failed to create search schema: {e}")
             raise LocalSearchError(f"Schema creation failed: {e}")
 
+    def _apply_schema(self, conn: sqlite3.Connection) -> None:
+        """
+        Create search tables and indexes on a database connection.
+
+        Args:
+            conn: Connection to the main index or a notebook shard
+        """
+        # Create FTS5 table for full-text search
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS page_content_fts USING fts5(
+                page_id UNINDEXED,
+                notebook_id UNINDEXED,
+                section_id UNINDEXED,
+                page_title,
+                content,
+                tags,
+                created_time UNINDEXED,
+                modified_time UNINDEXED
+            );
+        """)
+        
+        # Create passage-level FTS5 table (headings/paragraphs with offsets)
+        conn.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS page_passage_fts USING fts5(
+                page_id UNINDEXED,
+                passage_index UNINDEXED,
+                heading,
+                content,
+                start_offset UNINDEXED,
+                end_offset UNINDEXED
+            );
+        """)
+        
+        # Create metadata table for search optimization
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS page_metadata (
+                page_id TEXT PRIMARY KEY,
+                notebook_id TEXT NOT NULL,
+                section_id TEXT NOT NULL,
+                notebook_name TEXT,
+                section_name TEXT,
+                page_title TEXT NOT NULL,
+                content_length INTEGER,
+                asset_count INTEGER,
+                link_count INTEGER,
+                created_time TEXT,
+                modified_time TEXT,
+                cached_time TEXT,
+                FOREIGN KEY (page_id) REFERENCES page_content_fts(page_id)
+            );
+        """)
+        
+        # Create index for common queries
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_page_metadata_notebook 
+            ON page_metadata(notebook_id);
+        """)
+        
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_page_metadata_section 
+            ON page_metadata(section_id);
+        """)
+        
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_page_metadata_modified 
+            ON page_metadata(modified_time);
+        """)
+        
+        conn.commit()
+
     async def _get_connection(self) -> sqlite3.Connection:
         """Get database connection with FTS5 enabled."""
         if self._connection is None or self._connection.execute("PRAGMA schema_version").fetchone() is None:
-            self._connection = sqlite3.connect(
-                str(self.db_path),
-                check_same_thread=False,
-                timeout=30.0
-            )
-            self._connection.row_factory = sqlite3.Row
-            
-            # Enable FTS5 and optimize settings
-            self._connection.execute("PRAGMA journal_mode=WAL")
-            self._connection.execute("PRAGMA synchronous=NORMAL") 
-            self._connection.execute("PRAGMA cache_size=10000")
-            self._connection.execute("PRAGMA temp_store=memory")
+            if self.in_memory:
+                self._connection = self._load_hot_copy()
+            else:
+                self._connection = self._open_connection(self.db_path)
             
         return self._connection
 
+    def _load_hot_copy(self) -> sqlite3.Connection:
+        """
+        Load the on-disk index into an in-memory database.
+
+        The disk connection stays open as the persistence target.
+
+        Returns:
+            Connection to the in-memory hot copy
+        """
+        start_time = time.time()
+
+        disk = self._open_connection(self.db_path)
+        self._apply_schema(disk)
+
+        memory = sqlite3.connect(":memory:", check_same_thread=False)
+        memory.row_factory = sqlite3.Row
+        disk.backup(memory)
+        self._disk_connection = disk
+
+        page_size = memory.execute("PRAGMA page_size").fetchone()[0]
+        page_count = memory.execute("PRAGMA page_count").fetchone()[0]
+        load_time = time.time() - start_time
+        self.hot_copy_stats = {
+            "load_seconds": round(load_time, 3),
+            "size_bytes": page_size * page_count,
+            "loaded_at": datetime.now().isoformat()
+        }
+
+        log_performance(
+            "local_search_hot_copy_load",
+            load_time,
+            size_bytes=self.hot_copy_stats["size_bytes"]
+        )
+        logger.info(
+            f"Loaded search index into memory ({self.hot_copy_stats['size_bytes']} bytes) "
+            f"in {load_time:.3f}s"
+        )
+        return memory
+
+    def _mirror(self, connections: List[sqlite3.Connection]) -> List[sqlite3.Connection]:
+        """
+        Get the connections an index write has to be applied to.
+
+        In write-through in-memory mode every write is mirrored to the disk
+        database, which comes first so the hot copy is only committed once
+        the disk commit succeeded; with a persist interval the hot copy is
+        marked dirty and flushed later.
+
+        Args:
+            connections: Connections the write targets
+
+        Returns:
+            Connections to apply the write to
+        """
+        if not self.in_memory or self._disk_connection is None:
+            return connections
+        if self.persist_interval:
+            self._hot_copy_dirty = True
+            return connections
+        return [self._disk_connection] + connections
+
+    def _rollback(self, targets: List[sqlite3.Connection]) -> None:
+        """
+        Roll back a failed index write on every connection it targeted.
+
+        If the disk database already committed the write, the hot copy is
+        marked dirty so the next flush brings the two back in line.
+
+        Args:
+            targets: Connections returned by _mirror for the write
+        """
+        for target in targets:
+            try:
+                target.rollback()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to roll back search index write: {e}")
+        if self.in_memory and self._disk_connection is not None:
+            self._hot_copy_dirty = True
+
+    async def flush_to_disk(self) -> bool:
+        """
+        Persist the in-memory hot copy to the on-disk database.
+
+        Returns:
+            True if a flush was performed, False if there was nothing to flush
+        """
+        if not self.in_memory or self._connection is None or self._disk_connection is None:
+            return False
+        if not self._hot_copy_dirty:
+            return False
+
+        start_time = time.time()
+        self._hot_copy_dirty = False
+        self._connection.backup(self._disk_connection)
+        log_performance("local_search_hot_copy_flush", time.time() - start_time)
+        return True
+
+    async def _persist_loop(self) -> None:
+        """Periodically flush the hot copy to disk."""
+        while True:
+            await asyncio.sleep(self.persist_interval)
+            try:
+                await self.flush_to_disk()
+            except Exception as e:
+                logger.warning(f"Failed to persist in-memory search index: {e}")
+
+    def _open_connection(self, path: Path) -> sqlite3.Connection:
+        """Open a search database connection with FTS5 settings applied."""
+        connection = sqlite3.connect(
+            str(path),
+            check_same_thread=False,
+            timeout=30.0
+        )
+        connection.row_factory = sqlite3.Row
+        
+        # Enable FTS5 and optimize settings
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL") 
+        connection.execute("PRAGMA cache_size=10000")
+        connection.execute("PRAGMA temp_store=memory")
+        return connection
+
+    def _shard_path(self, notebook_id: str) -> Path:
+        """
+        Get the shard database path for a notebook.
+
+        Args:
+            notebook_id: Notebook identifier
+
+        Returns:
+            Path to the notebook's shard database
+        """
+        if not notebook_id:
+            return self.shard_dir / f"{UNASSIGNED_SHARD}.db"
+        safe_id = re.sub(r'[^A-Za-z0-9_-]', '_', notebook_id)[:48]
+        digest = hashlib.sha1(notebook_id.encode("utf-8")).hexdigest()[:8]
+        return self.shard_dir / f"{safe_id}_{digest}.db"
+
+    def _get_shard_connection(self, path: Path) -> sqlite3.Connection:
+        """Get (or open and initialize) the connection for a shard database."""
+        connection = self._shard_connections.get(path)
+        if connection is None:
+            self.shard_dir.mkdir(parents=True, exist_ok=True)
+            connection = self._open_connection(path)
+            self._apply_schema(connection)
+            self._shard_connections[path] = connection
+        return connection
+
+    async def _get_index_connection(self, notebook_id: str) -> sqlite3.Connection:
+        """Get the connection that stores pages of the given notebook."""
+        if not self.sharded:
+            return await self._get_connection()
+        return self._get_shard_connection(self._shard_path(notebook_id))
+
+    async def _get_search_connections(
+        self,
+        notebook_ids: Optional[List[str]] = None
+    ) -> List[sqlite3.Connection]:
+        """
+        Get the connections a search has to query.
+
+        Notebook-scoped searches in sharded mode touch only the matching shards.
+
+        Args:
+            notebook_ids: Optional notebook scope
+
+        Returns:
+            List of database connections
+        """
+        if not self.sharded:
+            return [await self._get_connection()]
+        if notebook_ids:
+            paths = [self._shard_path(notebook_id) for notebook_id in notebook_ids]
+            paths = [path for path in paths if path.exists() or path in self._shard_connections]
+        else:
+            paths = sorted(self.shard_dir.glob("*.db")) if self.shard_dir.exists() else []
+        return [self._get_shard_connection(path) for path in paths]
+
+    async def _get_all_connections(self) -> List[sqlite3.Connection]:
+        """Get connections to every database holding index data."""
+        return await self._get_search_connections()
+
+    def database_paths(self) -> List[Path]:
+        """Get the paths of all database files holding index data."""
+        if not self.sharded:
+            return [self.db_path]
+        return sorted(self.shard_dir.glob("*.db")) if self.shard_dir.exists() else []
+
+    @staticmethod
+    def _notebook_scope(
+        notebook_ids: Optional[List[str]],
+        search_filter: Optional[LocalSearchFilter]
+    ) -> Optional[List[str]]:
+        """Determine which notebooks a search is restricted to, if any."""
+        scopes = [ids for ids in (notebook_ids, search_filter.notebook_ids if search_filter else None) if ids]
+        if not scopes:
+            return None
+        scope = set(scopes[0])
+        for ids in scopes[1:]:
+            scope &= set(ids)
+        return sorted(scope)
+
+    async def _query_rows(
+        self,
+        sql: str,
+        params: List[Any],
+        limit: int,
+        notebook_scope: Optional[List[str]] = None
+    ) -> List[sqlite3.Row]:
+        """
+        Run a search query against the index.
+
+        In sharded mode the query runs on every shard in scope in parallel
+        worker threads and the per-shard results are merged into a global
+        top-k by (BM25 rank, page_id). BM25 statistics are per shard, so
+        cross-shard scores are comparable only approximately.
+
+        Args:
+            sql: Search SQL ending with a LIMIT placeholder
+            params: Query parameters
+            limit: Number of rows to return
+            notebook_scope: Optional notebooks the search is restricted to
+
+        Returns:
+            Result rows ordered by rank
+        """
+        connections = await self._get_search_connections(notebook_scope)
+        if not self.sharded:
+            return connections[0].execute(sql, params).fetchall()
+        if not connections:
+            return []
+
+        if self._shard_executor is None:
+            self._shard_executor = ThreadPoolExecutor(
+                max_workers=self._shard_workers,
+                thread_name_prefix="search-shard"
+            )
+
+        loop = asyncio.get_running_loop()
+        shard_rows = await asyncio.gather(*(
+            loop.run_in_executor(
+                self._shard_executor,
+                lambda connection=connection: connection.execute(sql, params).fetchall()
+            )
+            for connection in connections
+        ))
+
+        return heapq.nsmallest(
+            limit,
+            (row for rows in shard_rows for row in rows),
+            key=lambda row: (row['rank'], row['page_id'])
+        )
+
     @logged("Index cached page for search")
     async def index_page(self, cached_page: CachedPage) -> bool:
         """
@@ -180,75 +554,29 @@ class LocalOneNoteSearch:
         start_time = time.time()
 
         try:
-            conn = await self._get_connection()
-            
-            # Remove existing entries for this page
-            conn.execute(
-                "DELETE FROM page_content_fts WHERE page_id = ?",
-                (cached_page.metadata.id,)
-            )
-            conn.execute(
-                "DELETE FROM page_metadata WHERE page_id = ?", 
-                (cached_page.metadata.id,)
-            )
+            notebook_id = cached_page.metadata.parent_notebook.get("id", "")
+            conn = await self._get_index_connection(notebook_id)
+
+            if self.sharded:
+                self._drop_moved_copy(cached_page.metadata.id, notebook_id)
             
-            # Extract searchable content
-            content_text = self._extract_searchable_content(cached_page)
-            tags_text = ""  # Tags not available in current model
+            rows = self._page_rows(cached_page)
+            targets = self._mirror([conn])
+            try:
+                for target in targets:
+                    self._write_page_rows(target, rows)
+                    target.commit()
+            except Exception:
+                self._rollback(targets)
+                raise
             
-            # Get parent info
-            notebook_id = cached_page.metadata.parent_notebook.get("id", "")
-            notebook_name = cached_page.metadata.parent_notebook.get("name", "")
-            section_id = cached_page.metadata.parent_section.get("id", "")
-            section_name = cached_page.metadata.parent_section.get("name", "")
-            
-            # Insert into FTS table
-            conn.execute("""
-                INSERT INTO page_content_fts (
-                    page_id, notebook_id, section_id, page_title, 
-                    content, tags, created_time, modified_time
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cached_page.metadata.id,
-                notebook_id,
-                section_id,
-                cached_page.metadata.title,
-                content_text,
-                tags_text,
-                cached_page.metadata.created_date_time.isoformat(),
-                cached_page.metadata.last_modified_date_time.isoformat()
-            ))
-            
-            # Insert metadata
-            conn.execute("""
-                INSERT INTO page_metadata (
-                    page_id, notebook_id, section_id, notebook_name, section_name,
-                    page_title, content_length, asset_count, link_count,
-                    created_time, modified_time, cached_time
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cached_page.metadata.id,
-                notebook_id,
-                section_id,
-                notebook_name,
-                section_name,
-                cached_page.metadata.title,
-                len(content_text),
-                len(cached_page.metadata.attachments or []),
-                len(cached_page.metadata.internal_links or []) + len(cached_page.metadata.external_links or []),
-                cached_page.metadata.created_date_time.isoformat(),
-                cached_page.metadata.last_modified_date_time.isoformat(),
-                cached_page.metadata.cached_at.isoformat()
-            ))
-            
-            conn.commit()
             self._index_operations += 1
             
             log_performance(
                 "local_search_index_page",
                 time.time() - start_time,
                 page_id=cached_page.metadata.id,
-                content_length=len(content_text),
+                content_length=rows.content_length,
                 page_title=cached_page.metadata.title
             )
             
@@ -259,6 +587,296 @@ class LocalOneNoteSearch:
             logger.error(f"Failed to index page '{cached_page.metadata.title}': {e}")
             return False
 
+    @logged("Index cached pages for search")
+    async def index_pages(self, cached_pages: List[CachedPage]) -> Tuple[int, int]:
+        """
+        Index several cached pages for full-text search.
+
+        Pages are written in one transaction per database instead of one
+        per page, which makes indexing a batch of synced pages much cheaper.
+
+        Args:
+            cached_pages: Cached pages to index
+
+        Returns:
+            Tuple of (indexed_count, failed_count)
+        """
+        start_time = time.time()
+        batches: Dict[int, Tuple[sqlite3.Connection, List[_PageRows]]] = {}
+        failed_count = 0
+
+        for cached_page in cached_pages:
+            try:
+                if not cached_page.metadata.id:
+                    raise LocalSearchError("Page must have a valid page_id")
+                notebook_id = cached_page.metadata.parent_notebook.get("id", "")
+                conn = await self._get_index_connection(notebook_id)
+                if self.sharded:
+                    self._drop_moved_copy(cached_page.metadata.id, notebook_id)
+                batches.setdefault(id(conn), (conn, []))[1].append(self._page_rows(cached_page))
+            except Exception as e:
+                logger.error(f"Failed to index page '{cached_page.metadata.title}': {e}")
+                failed_count += 1
+
+        indexed_count = 0
+        for conn, batch in batches.values():
+            targets = self._mirror([conn])
+            try:
+                for target in targets:
+                    for rows in batch:
+                        self._write_page_rows(target, rows)
+                    target.commit()
+                indexed_count += len(batch)
+            except Exception as e:
+                self._rollback(targets)
+                logger.error(f"Failed to index {len(batch)} pages: {e}")
+                failed_count += len(batch)
+
+        self._index_operations += indexed_count
+        log_performance(
+            "local_search_index_pages",
+            time.time() - start_time,
+            indexed_count=indexed_count,
+            failed_count=failed_count
+        )
+        return indexed_count, failed_count
+
+    @logged("Delete pages from search index")
+    async def delete_pages(self, page_ids: List[str]) -> int:
+        """
+        Remove pages from the full-text index.
+
+        Args:
+            page_ids: IDs of the pages to remove
+
+        Returns:
+            Number of indexed pages removed
+
+        Raises:
+            LocalSearchError: If the deletion fails
+        """
+        if not page_ids:
+            return 0
+
+        try:
+            deleted_count = 0
+            for conn in await self._get_all_connections():
+                for target in self._mirror([conn]):
+                    deleted = target.executemany(
+                        "DELETE FROM page_metadata WHERE page_id = ?",
+                        [(page_id,) for page_id in page_ids]
+                    ).rowcount
+                    for table in ("page_content_fts", "page_passage_fts"):
+                        target.executemany(
+                            f"DELETE FROM {table} WHERE page_id = ?",
+                            [(page_id,) for page_id in page_ids]
+                        )
+                    target.commit()
+                    if target is conn:
+                        deleted_count += max(deleted, 0)
+
+            if self._page_shards is not None:
+                for page_id in page_ids:
+                    self._page_shards.pop(page_id, None)
+
+            self._index_operations += 1
+            logger.debug(f"Removed {deleted_count} pages from search index")
+            return deleted_count
+
+        except Exception as e:
+            logger.error(f"Failed to delete pages from search index: {e}")
+            raise LocalSearchError(f"Page deletion failed: {e}")
+
+    def _load_page_shards(self) -> Dict[str, Path]:
+        """
+        Get the map of indexed page IDs to the shard holding them.
+
+        The map is read from the shards' page metadata on first use and kept
+        up to date by index writes afterwards.
+
+        Returns:
+            Dictionary mapping page IDs to shard database paths
+        """
+        if self._page_shards is None:
+            page_shards: Dict[str, Path] = {}
+            for path in self.database_paths():
+                connection = self._get_shard_connection(path)
+                for row in connection.execute("SELECT page_id FROM page_metadata"):
+                    page_shards[row["page_id"]] = path
+            self._page_shards = page_shards
+        return self._page_shards
+
+    def _drop_moved_copy(self, page_id: str, notebook_id: str) -> None:
+        """
+        Drop the copy of a page left in its old shard if it moved notebooks.
+
+        Args:
+            page_id: Page being indexed
+            notebook_id: Notebook the page belongs to now
+        """
+        page_shards = self._load_page_shards()
+        path = self._shard_path(notebook_id)
+        previous = page_shards.get(page_id)
+        page_shards[page_id] = path
+        if previous is None or previous == path:
+            return
+
+        other = self._get_shard_connection(previous)
+        self._delete_page_rows(other, page_id)
+        other.commit()
+
+    def _page_rows(self, cached_page: CachedPage) -> "_PageRows":
+        """
+        Build the index rows of a page.
+
+        Args:
+            cached_page: Cached page to index
+
+        Returns:
+            FTS, metadata and passage rows of the page
+        """
+        # Extract searchable content
+        content_text = self._extract_searchable_content(cached_page)
+        tags_text = ""  # Tags not available in current model
+
+        # Get parent info
+        notebook_id = cached_page.metadata.parent_notebook.get("id", "")
+        notebook_name = cached_page.metadata.parent_notebook.get("name", "")
+        section_id = cached_page.metadata.parent_section.get("id", "")
+        section_name = cached_page.metadata.parent_section.get("name", "")
+
+        fts_row = (
+            cached_page.metadata.id,
+            notebook_id,
+            section_id,
+            cached_page.metadata.title,
+            content_text,
+            tags_text,
+            cached_page.metadata.created_date_time.isoformat(),
+            cached_page.metadata.last_modified_date_time.isoformat()
+        )
+        metadata_row = (
+            cached_page.metadata.id,
+            notebook_id,
+            section_id,
+            notebook_name,
+            section_name,
+            cached_page.metadata.title,
+            len(content_text),
+            len(cached_page.metadata.attachments or []),
+            len(cached_page.metadata.internal_links or []) + len(cached_page.metadata.external_links or []),
+            cached_page.metadata.created_date_time.isoformat(),
+            cached_page.metadata.last_modified_date_time.isoformat(),
+            cached_page.metadata.cached_at.isoformat()
+        )
+
+        # Split passages for passage-level retrieval
+        passage_rows = [
+            (cached_page.metadata.id, index, heading, text, start, end)
+            for index, (heading, text, start, end)
+            in enumerate(self._split_passages(cached_page.markdown_content or ""))
+        ]
+
+        return _PageRows(
+            page_id=cached_page.metadata.id,
+            fts_row=fts_row,
+            metadata_row=metadata_row,
+            passage_rows=passage_rows,
+            content_length=len(content_text)
+        )
+
+    def _write_page_rows(self, target: sqlite3.Connection, rows: "_PageRows") -> None:
+        """Replace a page's index rows on one database connection (without committing)."""
+        # Remove existing entries for this page
+        self._delete_page_rows(target, rows.page_id)
+
+        # Insert into FTS table
+        target.execute("""
+            INSERT INTO page_content_fts (
+                page_id, notebook_id, section_id, page_title, 
+                content, tags, created_time, modified_time
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows.fts_row)
+
+        # Insert metadata
+        target.execute("""
+            INSERT INTO page_metadata (
+                page_id, notebook_id, section_id, notebook_name, section_name,
+                page_title, content_length, asset_count, link_count,
+                created_time, modified_time, cached_time
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows.metadata_row)
+
+        # Insert passages
+        target.executemany("""
+            INSERT INTO page_passage_fts (
+                page_id, passage_index, heading, content, start_offset, end_offset
+            ) VALUES (?, ?, ?, ?, ?, ?)
+        """, rows.passage_rows)
+
+    @staticmethod
+    def _delete_page_rows(conn: sqlite3.Connection, page_id: str) -> None:
+        """Delete all index rows for a page on one database connection."""
+        conn.execute("DELETE FROM page_content_fts WHERE page_id = ?", (page_id,))
+        conn.execute("DELETE FROM page_metadata WHERE page_id = ?", (page_id,))
+        conn.execute("DELETE FROM page_passage_fts WHERE page_id = ?", (page_id,))
+
+    def _split_passages(self, markdown: str) -> List[Tuple[str, str, int, int]]:
+        """
+        Split page markdown into passages by heading and paragraph.
+
+        Consecutive short paragraphs under the same heading are merged and
+        long paragraphs are split, keeping passages near MAX_PASSAGE_LENGTH.
+
+        Args:
+            markdown: Page markdown content
+
+        Returns:
+            List of (heading, text, start_offset, end_offset) tuples where the
+            offsets index into the markdown
+        """
+        passages: List[Tuple[str, str, int, int]] = []
+        heading = ""
+        current_start: Optional[int] = None
+        current_end = 0
+
+        def flush() -> None:
+            nonlocal current_start
+            if current_start is not None:
+                text = markdown[current_start:current_end].strip()
+                if text:
+                    passages.append((heading, text, current_start, current_end))
+            current_start = None
+
+        for match in re.finditer(r'[^\n]+(?:\n(?!\s*\n)[^\n]*)*', markdown):
+            block_start, block_end = match.start(), match.end()
+            block = match.group().strip()
+            if not block:
+                continue
+
+            if block.startswith("#"):
+                flush()
+                heading = block.splitlines()[0].lstrip("#").strip()
+
+            # Split oversized blocks into fixed windows
+            while block_end - block_start > MAX_PASSAGE_LENGTH:
+                flush()
+                current_start = block_start
+                current_end = block_start + MAX_PASSAGE_LENGTH
+                flush()
+                block_start += MAX_PASSAGE_LENGTH
+
+            if current_start is not None and block_end - current_start > MAX_PASSAGE_LENGTH:
+                flush()
+            if current_start is None:
+                current_start = block_start
+            current_end = block_end
+            if current_end - current_start >= MIN_PASSAGE_LENGTH:
+                flush()
+
+        flush()
+        return passages
+
     def _extract_searchable_content(self, cached_page: CachedPage) -> str:
         """
         Extract searchable text content from a cached page.
@@ -315,17 +933,25 @@ class LocalOneNoteSearch:
         limit: int = None,
         notebook_ids: Optional[List[str]] = None,
         section_ids: Optional[List[str]] = None,
-        title_only: bool = False
+        title_only: bool = False,
+        search_filter: Optional[LocalSearchFilter] = None,
+        passages_per_page: int = 1
     ) -> List[SemanticSearchResult]:
         """
         Search cached OneNote content.
 
+        Each result's chunk holds the best-matching passage of the page rather
+        than a fixed prefix; further matching passages are listed in
+        ``chunk.metadata["passages"]``.
+
         Args:
             query: Search query
             limit: Maximum number of results (uses setting default if None)
             notebook_ids: Optional list of notebook IDs to search within
             section_ids: Optional list of section IDs to search within  
             title_only: Whether to search only page titles
+            search_filter: Optional structured filter evaluated in SQL
+            passages_per_page: Number of matching passages to return per page
 
         Returns:
             List of semantic search results
@@ -340,63 +966,29 @@ class LocalOneNoteSearch:
         start_time = time.time()
 
         try:
-            conn = await self._get_connection()
-            
             # Build FTS query
             fts_query = self._build_fts_query(query, title_only)
             
             # Build SQL with filters
-            sql = self._build_search_sql(notebook_ids, section_ids)
-            params = [fts_query]
-            
-            # Add filter parameters
-            if notebook_ids:
-                params.extend(notebook_ids)
-            if section_ids:
-                params.extend(section_ids)
+            sql = self._build_search_sql(notebook_ids, section_ids, search_filter)
+            params = self._build_search_params(fts_query, notebook_ids, section_ids, search_filter)
                 
             # Add limit
             params.append(limit)
             
             # Execute search
-            cursor = conn.execute(sql, params)
-            results = cursor.fetchall()
+            results = await self._query_rows(
+                sql, params, limit, self._notebook_scope(notebook_ids, search_filter)
+            )
+            
+            # Look up best-matching passages for the returned pages
+            passages = await self._lookup_passages(fts_query, results, passages_per_page, title_only)
             
             # Convert to semantic search results
-            search_results = []
-            for i, row in enumerate(results):
-                # Create content chunk from search result
-                chunk = ContentChunk(
-                    id=f"{row['page_id']}_local_search",
-                    page_id=row['page_id'],
-                    page_title=row['page_title'],
-                    content=row['content'][:500] + "..." if len(row['content']) > 500 else row['content'],
-                    chunk_index=0,
-                    start_position=0,
-                    end_position=min(500, len(row['content']))
-                )
-                
-                # Create OneNote page representation
-                page = OneNotePage(
-                    id=row['page_id'],
-                    title=row['page_title'],
-                    content="",  # Content is in chunk
-                    createdDateTime=row['created_time'],
-                    lastModifiedDateTime=row['modified_time']
-                )
-                
-                # Calculate relevance score based on FTS rank
-                similarity_score = max(0.1, 1.0 - (i * 0.05))  # Decreasing score
-                
-                result = SemanticSearchResult(
-                    chunk=chunk,
-                    similarity_score=similarity_score,
-                    search_type="local_cache_fts",
-                    rank=i + 1,
-                    page=page
-                )
-                
-                search_results.append(result)
+            search_results = [
+                self._row_to_result(row, i, passages.get(row['page_id']))
+                for i, row in enumerate(results)
+            ]
             
             self._search_count += 1
             
@@ -408,7 +1000,8 @@ class LocalOneNoteSearch:
                 limit=limit,
                 title_only=title_only,
                 filtered_notebooks=len(notebook_ids) if notebook_ids else 0,
-                filtered_sections=len(section_ids) if section_ids else 0
+                filtered_sections=len(section_ids) if section_ids else 0,
+                structured_filter=bool(search_filter and not search_filter.is_empty())
             )
             
             logger.info(f"Local search for '{query}' found {len(search_results)} results")
@@ -418,6 +1011,325 @@ class LocalOneNoteSearch:
             logger.error(f"Local search failed: {e}")
             raise LocalSearchError(f"Search failed: {e}")
 
+    async def search_page(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        cursor: Optional[LocalSearchCursor] = None,
+        notebook_ids: Optional[List[str]] = None,
+        section_ids: Optional[List[str]] = None,
+        title_only: bool = False,
+        search_filter: Optional[LocalSearchFilter] = None,
+        passages_per_page: int = 1
+    ) -> Tuple[List[SemanticSearchResult], Optional[LocalSearchCursor]]:
+        """
+        Fetch one page of search results using keyset pagination.
+
+        Results are ordered by (BM25 score, page_id), so passing the returned
+        cursor back in continues exactly after the last result without
+        re-scanning or re-materializing earlier rows.
+
+        Args:
+            query: Search query
+            limit: Page size (uses setting default if None)
+            cursor: Cursor returned by the previous page, None for the first page
+            notebook_ids: Optional list of notebook IDs to search within
+            section_ids: Optional list of section IDs to search within
+            title_only: Whether to search only page titles
+            search_filter: Optional structured filter evaluated in SQL
+            passages_per_page: Number of matching passages to return per page
+
+        Returns:
+            Tuple of (results, next cursor or None when exhausted)
+
+        Raises:
+            LocalSearchError: If search fails
+        """
+        if not query.strip():
+            raise LocalSearchError("Search query cannot be empty")
+
+        limit = limit or self.settings.semantic_search_limit
+        start_time = time.time()
+
+        try:
+            fts_query = self._build_fts_query(query, title_only)
+            sql = self._build_paged_search_sql(
+                notebook_ids, section_ids, search_filter, has_cursor=cursor is not None
+            )
+            params = self._build_search_params(fts_query, notebook_ids, section_ids, search_filter)
+            if cursor is not None:
+                params.extend([cursor.score, cursor.score, cursor.page_id])
+            params.append(limit)
+
+            rows = await self._query_rows(
+                sql, params, limit, self._notebook_scope(notebook_ids, search_filter)
+            )
+
+            offset = cursor.offset if cursor else 0
+            passages = await self._lookup_passages(fts_query, rows, passages_per_page, title_only)
+            results = [
+                self._row_to_result(row, offset + i, passages.get(row['page_id']))
+                for i, row in enumerate(rows)
+            ]
+
+            next_cursor = None
+            if len(rows) == limit:
+                last_row = rows[-1]
+                next_cursor = LocalSearchCursor(
+                    score=last_row['rank'],
+                    page_id=last_row['page_id'],
+                    offset=offset + len(rows)
+                )
+
+            if cursor is None:
+                self._search_count += 1
+
+            log_performance(
+                "local_search_page",
+                time.time() - start_time,
+                query_length=len(query),
+                results_found=len(results),
+                limit=limit,
+                offset=offset
+            )
+
+            return results, next_cursor
+
+        except Exception as e:
+            logger.error(f"Local paged search failed: {e}")
+            raise LocalSearchError(f"Search failed: {e}")
+
+    async def iter_search(
+        self,
+        query: str,
+        page_size: Optional[int] = None,
+        max_results: Optional[int] = None,
+        cursor: Optional[LocalSearchCursor] = None,
+        notebook_ids: Optional[List[str]] = None,
+        section_ids: Optional[List[str]] = None,
+        title_only: bool = False,
+        search_filter: Optional[LocalSearchFilter] = None,
+        passages_per_page: int = 1
+    ) -> AsyncGenerator[SemanticSearchResult, None]:
+        """
+        Stream search results, fetching further pages only when consumed.
+
+        Callers can display the first results immediately and simply stop
+        iterating once they have enough; no further rows are read or converted.
+
+        Args:
+            query: Search query
+            page_size: Rows fetched per database round trip
+            max_results: Optional cap on the total number of yielded results
+            cursor: Optional cursor to resume a previous iteration
+            notebook_ids: Optional list of notebook IDs to search within
+            section_ids: Optional list of section IDs to search within
+            title_only: Whether to search only page titles
+            search_filter: Optional structured filter evaluated in SQL
+            passages_per_page: Number of matching passages to return per page
+
+        Yields:
+            Semantic search results in relevance order
+
+        Raises:
+            LocalSearchError: If search fails
+        """
+        page_size = page_size or self.settings.semantic_search_limit
+        yielded = 0
+
+        while True:
+            if max_results is not None:
+                page_size = min(page_size, max_results - yielded)
+                if page_size <= 0:
+                    return
+
+            results, cursor = await self.search_page(
+                query,
+                limit=page_size,
+                cursor=cursor,
+                notebook_ids=notebook_ids,
+                section_ids=section_ids,
+                title_only=title_only,
+                search_filter=search_filter,
+                passages_per_page=passages_per_page
+            )
+
+            for result in results:
+                yield result
+                yielded += 1
+
+            if cursor is None:
+                return
+
+    def _row_to_result(
+        self,
+        row: sqlite3.Row,
+        position: int,
+        passages: Optional[List[Dict[str, Any]]] = None
+    ) -> SemanticSearchResult:
+        """
+        Convert a search result row into a semantic search result.
+
+        Args:
+            row: Result row from the search query
+            position: Zero-based position of the row in the overall result order
+            passages: Optional best-matching passages for the page, best first
+
+        Returns:
+            Semantic search result
+        """
+        if passages:
+            # Use the best-matching passage instead of the page prefix
+            best = passages[0]
+            chunk = ContentChunk(
+                id=f"{row['page_id']}_passage_{best['passage_index']}",
+                page_id=row['page_id'],
+                page_title=row['page_title'],
+                content=best['content'],
+                chunk_index=best['passage_index'],
+                start_position=best['start_offset'],
+                end_position=best['end_offset'],
+                metadata={"heading": best['heading'], "passages": passages}
+            )
+        else:
+            snippet = row['content']
+            truncated = row['content_chars'] > len(snippet)
+
+            # Create content chunk from search result
+            chunk = ContentChunk(
+                id=f"{row['page_id']}_local_search",
+                page_id=row['page_id'],
+                page_title=row['page_title'],
+                content=snippet + "..." if truncated else snippet,
+                chunk_index=0,
+                start_position=0,
+                end_position=len(snippet)
+            )
+
+        # Create OneNote page representation
+        page = OneNotePage(
+            id=row['page_id'],
+            title=row['page_title'],
+            content="",  # Content is in chunk
+            createdDateTime=row['created_time'],
+            lastModifiedDateTime=row['modified_time']
+        )
+
+        # Calculate relevance score based on FTS rank
+        similarity_score = max(0.1, 1.0 - (position * 0.05))  # Decreasing score
+
+        return SemanticSearchResult(
+            chunk=chunk,
+            similarity_score=similarity_score,
+            search_type="local_cache_fts",
+            rank=position + 1,
+            page=page
+        )
+
+    async def _lookup_passages(
+        self,
+        fts_query: str,
+        rows: List[sqlite3.Row],
+        per_page: int,
+        title_only: bool = False
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Find best-matching passages for result rows on the databases holding them.
+
+        Args:
+            fts_query: FTS5 query used for the page search
+            rows: Page result rows
+            per_page: Maximum passages to keep per page
+            title_only: Title-only searches have no passage matches
+
+        Returns:
+            Mapping of page_id to passages ordered by BM25 rank
+        """
+        if not rows or per_page <= 0 or title_only:
+            return {}
+
+        if not self.sharded:
+            conn = await self._get_connection()
+            return self._fetch_best_passages(
+                conn, fts_query, [row['page_id'] for row in rows], per_page, title_only
+            )
+
+        pages_by_notebook: Dict[str, List[str]] = {}
+        for row in rows:
+            pages_by_notebook.setdefault(row['notebook_id'], []).append(row['page_id'])
+
+        passages: Dict[str, List[Dict[str, Any]]] = {}
+        for notebook_id, page_ids in pages_by_notebook.items():
+            conn = await self._get_index_connection(notebook_id)
+            passages.update(self._fetch_best_passages(conn, fts_query, page_ids, per_page))
+        return passages
+
+    def _fetch_best_passages(
+        self,
+        conn: sqlite3.Connection,
+        fts_query: str,
+        page_ids: List[str],
+        per_page: int,
+        title_only: bool = False
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Find the best-matching passages for a set of result pages.
+
+        Args:
+            conn: Database connection
+            fts_query: FTS5 query used for the page search
+            page_ids: Pages to look up passages for
+            per_page: Maximum passages to keep per page
+            title_only: Title-only searches have no passage matches
+
+        Returns:
+            Mapping of page_id to passages ordered by BM25 rank
+        """
+        if not page_ids or per_page <= 0 or title_only:
+            return {}
+
+        placeholders = ",".join("?" * len(page_ids))
+        try:
+            rows = conn.execute(f"""
+                SELECT page_id, passage_index, heading, content, start_offset, end_offset
+                FROM page_passage_fts
+                WHERE page_passage_fts MATCH ? AND page_id IN ({placeholders})
+                ORDER BY rank
+            """, [fts_query, *page_ids]).fetchall()
+        except sqlite3.OperationalError as e:
+            logger.debug(f"Passage lookup failed, falling back to page prefixes: {e}")
+            return {}
+
+        passages: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            page_passages = passages.setdefault(row['page_id'], [])
+            if len(page_passages) < per_page:
+                page_passages.append({
+                    "passage_index": row['passage_index'],
+                    "heading": row['heading'],
+                    "content": row['content'],
+                    "start_offset": row['start_offset'],
+                    "end_offset": row['end_offset']
+                })
+        return passages
+
+    def _build_search_params(
+        self,
+        fts_query: str,
+        notebook_ids: Optional[List[str]] = None,
+        section_ids: Optional[List[str]] = None,
+        search_filter: Optional[LocalSearchFilter] = None
+    ) -> List[Any]:
+        """Build positional parameters matching _build_search_sql."""
+        params: List[Any] = [fts_query]
+        if notebook_ids:
+            params.extend(notebook_ids)
+        if section_ids:
+            params.extend(section_ids)
+        if search_filter:
+            params.extend(self._build_filter_conditions(search_filter)[1])
+        return params
+
     def _build_fts_query(self, query: str, title_only: bool = False) -> str:
         """
         Build FTS5 query from user input.
@@ -458,7 +1370,8 @@ class LocalOneNoteSearch:
     def _build_search_sql(
         self, 
         notebook_ids: Optional[List[str]] = None,
-        section_ids: Optional[List[str]] = None
+        section_ids: Optional[List[str]] = None,
+        search_filter: Optional[LocalSearchFilter] = None
     ) -> str:
         """
         Build SQL query with optional filters.
@@ -466,14 +1379,52 @@ class LocalOneNoteSearch:
         Args:
             notebook_ids: Optional notebook ID filters
             section_ids: Optional section ID filters
+            search_filter: Optional structured filter
             
         Returns:
             SQL query string
         """
+        return self._build_search_body(notebook_ids, section_ids, search_filter) + " ORDER BY rank LIMIT ?"
+
+    def _build_paged_search_sql(
+        self,
+        notebook_ids: Optional[List[str]] = None,
+        section_ids: Optional[List[str]] = None,
+        search_filter: Optional[LocalSearchFilter] = None,
+        has_cursor: bool = False
+    ) -> str:
+        """
+        Build keyset-paginated SQL ordered by (rank, page_id).
+
+        FTS5 does not allow ``rank`` in the WHERE clause of the MATCH query
+        itself, so the cursor condition is applied on a subquery.
+
+        Args:
+            notebook_ids: Optional notebook ID filters
+            section_ids: Optional section ID filters
+            search_filter: Optional structured filter
+            has_cursor: Whether to add the (rank, page_id) cursor condition
+
+        Returns:
+            SQL query string
+        """
+        sql = f"SELECT * FROM ({self._build_search_body(notebook_ids, section_ids, search_filter)})"
+        if has_cursor:
+            sql += " WHERE rank > ? OR (rank = ? AND page_id > ?)"
+        return sql + " ORDER BY rank, page_id LIMIT ?"
+
+    def _build_search_body(
+        self,
+        notebook_ids: Optional[List[str]] = None,
+        section_ids: Optional[List[str]] = None,
+        search_filter: Optional[LocalSearchFilter] = None
+    ) -> str:
+        """Build the filtered MATCH query without ordering or limit."""
         base_sql = """
             SELECT 
                 f.page_id, f.notebook_id, f.section_id, f.page_title, 
-                f.content, f.created_time, f.modified_time,
+                substr(f.content, 1, 500) AS content, length(f.content) AS content_chars,
+                f.created_time, f.modified_time,
                 m.notebook_name, m.section_name, m.content_length,
                 rank
             FROM page_content_fts f
@@ -490,14 +1441,78 @@ class LocalOneNoteSearch:
         if section_ids:
             placeholders = ",".join("?" * len(section_ids))
             conditions.append(f"f.section_id IN ({placeholders})")
+
+        if search_filter:
+            conditions.extend(self._build_filter_conditions(search_filter)[0])
         
         if conditions:
             base_sql += " AND " + " AND ".join(conditions)
-            
-        base_sql += " ORDER BY rank LIMIT ?"
-        
+
         return base_sql
 
+    def _build_filter_conditions(
+        self,
+        search_filter: LocalSearchFilter
+    ) -> Tuple[List[str], List[Any]]:
+        """
+        Compile a structured filter into SQL conditions and parameters.
+
+        Conditions reference the ``page_metadata`` alias ``m`` so they can use
+        its notebook, section and modified-time indexes.
+
+        Args:
+            search_filter: Filter to compile
+
+        Returns:
+            Tuple of (conditions, parameters) in matching order
+        """
+        conditions: List[str] = []
+        params: List[Any] = []
+
+        def add_in(column: str, values: Optional[List[str]]) -> None:
+            if values:
+                placeholders = ",".join("?" * len(values))
+                conditions.append(f"{column} IN ({placeholders})")
+                params.extend(values)
+
+        def add_bound(column: str, operator: str, value: Any) -> None:
+            if value is not None:
+                conditions.append(f"{column} {operator} ?")
+                params.append(value)
+
+        add_in("m.notebook_id", search_filter.notebook_ids)
+        add_in("m.section_id", search_filter.section_ids)
+        add_in("m.notebook_name", search_filter.notebook_names)
+        add_in("m.section_name", search_filter.section_names)
+
+        add_bound("m.created_time", ">=", self._format_filter_time(search_filter.created_after))
+        add_bound("m.created_time", "<", self._format_filter_time(search_filter.created_before))
+        add_bound("m.modified_time", ">=", self._format_filter_time(search_filter.modified_after))
+        add_bound("m.modified_time", "<", self._format_filter_time(search_filter.modified_before))
+
+        add_bound("m.content_length", ">=", search_filter.min_content_length)
+        add_bound("m.content_length", "<=", search_filter.max_content_length)
+        add_bound("m.asset_count", ">=", search_filter.min_asset_count)
+        add_bound("m.asset_count", "<=", search_filter.max_asset_count)
+        add_bound("m.link_count", ">=", search_filter.min_link_count)
+        add_bound("m.link_count", "<=", search_filter.max_link_count)
+
+        return conditions, params
+
+    @staticmethod
+    def _format_filter_time(value: Optional[datetime]) -> Optional[str]:
+        """
+        Format a filter bound to match the ISO timestamps stored in the index.
+
+        Timezone-aware values are converted to naive UTC so they compare
+        correctly against stored ``isoformat()`` strings.
+        """
+        if value is None:
+            return None
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value.isoformat()
+
     @logged("Get search statistics") 
     async def get_search_stats(self) -> Dict[str, Any]:
         """
@@ -507,20 +1522,33 @@ class LocalOneNoteSearch:
             Dictionary with search metrics
         """
         try:
-            conn = await self._get_connection()
+            connections = await self._get_all_connections()
             
-            # Get index statistics
-            cursor = conn.execute("SELECT COUNT(*) as page_count FROM page_content_fts")
-            page_count = cursor.fetchone()['page_count']
+            page_count = 0
+            notebook_count = 0
+            section_count = 0
+            passage_count = 0
+            total_content_length = 0
             
-            cursor = conn.execute("SELECT COUNT(DISTINCT notebook_id) as notebook_count FROM page_metadata")
-            notebook_count = cursor.fetchone()['notebook_count']
-            
-            cursor = conn.execute("SELECT COUNT(DISTINCT section_id) as section_count FROM page_metadata") 
-            section_count = cursor.fetchone()['section_count']
+            # Get index statistics (summed across shards in sharded mode)
+            for conn in connections:
+                cursor = conn.execute("SELECT COUNT(*) as page_count FROM page_content_fts")
+                page_count += cursor.fetchone()['page_count']
+                
+                cursor = conn.execute("SELECT COUNT(DISTINCT notebook_id) as notebook_count FROM page_metadata")
+                notebook_count += cursor.fetchone()['notebook_count']
+                
+                cursor = conn.execute("SELECT COUNT(DISTINCT section_id) as section_count FROM page_metadata") 
+                section_count += cursor.fetchone()['section_count']
+                
+                cursor = conn.execute("SELECT SUM(content_length) as total_content_length FROM page_metadata")
+                total_content_length += cursor.fetchone()['total_content_length'] or 0
+                
+                cursor = conn.execute("SELECT COUNT(*) as passage_count FROM page_passage_fts")
+                passage_count += cursor.fetchone()['passage_count']
             
-            cursor = conn.execute("SELECT AVG(content_length) as avg_content_length FROM page_metadata")
-            avg_content_length = cursor.fetchone()['avg_content_length'] or 0
+            avg_content_length = total_content_length / page_count if page_count else 0
+            database_size = sum(path.stat().st_size for path in self.database_paths() if path.exists())
             
             return {
                 "total_searches": self._search_count,
@@ -529,8 +1557,12 @@ class LocalOneNoteSearch:
                 "indexed_notebooks": notebook_count,
                 "indexed_sections": section_count,
                 "average_content_length": round(avg_content_length, 2),
-                "database_path": str(self.db_path),
-                "database_size_mb": round(self.db_path.stat().st_size / (1024 * 1024), 2) if self.db_path.exists() else 0
+                "indexed_passages": passage_count,
+                "database_path": str(self.shard_dir if self.sharded else self.db_path),
+                "database_size_mb": round(database_size / (1024 * 1024), 2),
+                "shard_count": len(connections) if self.sharded else 0,
+                "in_memory": self.in_memory,
+                "hot_copy_load_seconds": self.hot_copy_stats.get("load_seconds")
             }
             
         except Exception as e:
@@ -558,33 +1590,28 @@ class LocalOneNoteSearch:
         
         try:
             # Clear existing index
-            conn = await self._get_connection()
-            conn.execute("DELETE FROM page_content_fts")
-            conn.execute("DELETE FROM page_metadata")
-            conn.commit()
+            for conn in self._mirror(await self._get_all_connections()):
+                conn.execute("DELETE FROM page_content_fts")
+                conn.execute("DELETE FROM page_metadata")
+                conn.execute("DELETE FROM page_passage_fts")
+                conn.commit()
+            if self._page_shards is not None:
+                self._page_shards.clear()
             
-            # Get all cached pages for user
-            all_pages = await self.cache_manager.get_all_cached_pages(user_id)
+            # Stream cached pages for user (HTML is not needed for indexing)
+            all_pages = self.cache_manager.iter_cached_pages(
+                user_id, fields=("metadata", "markdown_content")
+            )
             
             # Index all pages
-            indexed_count = 0
-            failed_count = 0
-            
-            for cached_page in all_pages:
-                try:
-                    if await self.index_page(cached_page):
-                        indexed_count += 1
-                    else:
-                        failed_count += 1
-                except Exception as e:
-                    logger.error(f"Failed to index page during rebuild: {e}")
-                    failed_count += 1
+            indexed_count, failed_count = await self._index_pages(all_pages)
+            total_pages = indexed_count + failed_count
             
             log_performance(
                 "local_search_rebuild_index",
                 time.time() - start_time,
                 user_id=user_id,
-                total_pages=len(all_pages),
+                total_pages=total_pages,
                 indexed_pages=indexed_count,
                 failed_pages=failed_count
             )
@@ -592,20 +1619,133 @@ class LocalOneNoteSearch:
             logger.info(f"Rebuilt search index: {indexed_count} pages indexed, {failed_count} failed")
             
             return {
-                "total_pages": len(all_pages),
+                "total_pages": total_pages,
                 "indexed_pages": indexed_count,
                 "failed_pages": failed_count,
                 "rebuild_time_seconds": round(time.time() - start_time, 2),
-                "success_rate": round(indexed_count / len(all_pages) * 100, 1) if all_pages else 100
+                "success_rate": round(indexed_count / total_pages * 100, 1) if total_pages else 100
             }
             
         except Exception as e:
             logger.error(f"Failed to rebuild search index: {e}")
             raise LocalSearchError(f"Index rebuild failed: {e}")
 
+    async def rebuild_notebook_index(self, user_id: str, notebook_id: str) -> Dict[str, Any]:
+        """
+        Rebuild the search index for a single notebook.
+
+        In sharded mode only the notebook's shard is written, so searches in
+        other notebooks are not blocked while it is rebuilt.
+
+        Args:
+            user_id: User identifier to rebuild index for
+            notebook_id: Notebook whose pages are reindexed
+
+        Returns:
+            Dictionary with rebuild statistics
+
+        Raises:
+            LocalSearchError: If rebuild fails
+        """
+        start_time = time.time()
+
+        try:
+            # Clear existing entries for the notebook
+            conn = await self._get_index_connection(notebook_id)
+            for target in self._mirror([conn]):
+                target.execute("""
+                    DELETE FROM page_passage_fts WHERE page_id IN (
+                        SELECT page_id FROM page_metadata WHERE notebook_id = ?
+                    )
+                """, (notebook_id,))
+                target.execute("DELETE FROM page_content_fts WHERE notebook_id = ?", (notebook_id,))
+                target.execute("DELETE FROM page_metadata WHERE notebook_id = ?", (notebook_id,))
+                target.commit()
+            if self._page_shards is not None:
+                path = self._shard_path(notebook_id)
+                self._page_shards = {
+                    page_id: shard for page_id, shard in self._page_shards.items() if shard != path
+                }
+
+            all_pages = self.cache_manager.iter_cached_pages(
+                user_id, fields=("metadata", "markdown_content")
+            )
+            notebook_pages = (
+                page async for page in all_pages
+                if page.metadata.parent_notebook.get("id", "") == notebook_id
+            )
+
+            indexed_count, failed_count = await self._index_pages(notebook_pages)
+
+            log_performance(
+                "local_search_rebuild_notebook_index",
+                time.time() - start_time,
+                notebook_id=notebook_id,
+                indexed_pages=indexed_count,
+                failed_pages=failed_count
+            )
+
+            return {
+                "notebook_id": notebook_id,
+                "total_pages": indexed_count + failed_count,
+                "indexed_pages": indexed_count,
+                "failed_pages": failed_count,
+                "rebuild_time_seconds": round(time.time() - start_time, 2)
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to rebuild notebook index {notebook_id}: {e}")
+            raise LocalSearchError(f"Notebook index rebuild failed: {e}")
+
+    async def _index_pages(self, pages: AsyncIterable[CachedPage]) -> Tuple[int, int]:
+        """
+        Index a stream of pages, counting successes and failures.
+
+        Args:
+            pages: Pages to index
+
+        Returns:
+            Tuple of (indexed_count, failed_count)
+        """
+        indexed_count = 0
+        failed_count = 0
+
+        async for cached_page in pages:
+            try:
+                if await self.index_page(cached_page):
+                    indexed_count += 1
+                else:
+                    failed_count += 1
+            except Exception as e:
+                logger.error(f"Failed to index page during rebuild: {e}")
+                failed_count += 1
+
+        return indexed_count, failed_count
+
     async def close(self) -> None:
-        """Close the database connection."""
+        """Close the database connections."""
+        if self._persist_task:
+            self._persist_task.cancel()
+            try:
+                await self._persist_task
+            except asyncio.CancelledError:
+                pass
+            self._persist_task = None
+        if self._disk_connection:
+            try:
+                await self.flush_to_disk()
+            except Exception as e:
+                logger.warning(f"Failed to persist in-memory search index on close: {e}")
+            self._disk_connection.close()
+            self._disk_connection = None
         if self._connection:
             self._connection.close()
             self._connection = None
             logger.debug("Local search database connection closed")
+        for connection in self._shard_connections.values():
+            connection.close()
+        self._shard_connections.clear()
+        self._page_shards = None
+        if self._shard_executor:
+            self._shard_executor.shutdown(wait=False)
+            self._shard_executor = None
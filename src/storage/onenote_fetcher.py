@@ -3,23 +3,57 @@ OneNote content fetcher for cache system.
 
 Handles bulk downloading of OneNote content (notebooks, sections, pages)
 with proper API error handling and rate limiting integration.
+
+Content is fetched in two phases. First the pages of all sections are listed
+into a page manifest (metadata only, a bounded number of sections at a time);
+then page content is downloaded, converted and stored with bounded
+concurrency, most recently modified pages first, so the pages users are most
+likely to search for are available early in a long sync. Every Graph request draws
+from one shared request budget, so throughput is limited by how many requests
+Graph accepts at once rather than by the latency of each round trip. Sync
+requests run at background priority, so interactive searches overtake them in
+the Graph request scheduler.
+
+Full fetches are resumable: completed sections, the listing cursor inside
+each unfinished section and the pages already stored are recorded in a sync
+checkpoint, so a fetch that fails or is interrupted continues where it
+stopped on its next run.
 """
 
 import asyncio
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-
-import httpx
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+from urllib.parse import quote, urlencode
 
 from ..config.settings import get_settings
-from ..models.cache import (CachedPage, CachedPageMetadata, SyncResult,
-                            SyncStatus, SyncType)
-from ..tools.onenote_search import OneNoteSearchTool
+from ..models.cache import (CachedPage, CachedPageMetadata, SyncCheckpoint,
+                            SyncResult, SyncStatus, SyncType)
+from ..tools.graph_batch import BatchRequest, execute_batch
+from ..tools.graph_client import (ConditionalResponse, ContentValidators,
+                                  graph_request)
+from ..tools.graph_scheduler import background_priority
+from ..tools.onenote_search import OneNoteSearchTool, page_fields
 from .cache_manager import OneNoteCacheManager
+from .page_manifest import PageManifest
+from .sync_checkpoint import SyncCheckpointStore
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Sections whose page listings and pages are processed at the same time
+DEFAULT_MAX_CONCURRENT_SECTIONS = 4
+# Pages converted and stored at the same time, across all sections
+DEFAULT_MAX_CONCURRENT_PAGES = 16
+# Graph requests in flight at the same time, across the whole fetcher
+DEFAULT_MAX_CONCURRENT_REQUESTS = 8
+
+# Operation name of the fetcher's sync checkpoints
+CHECKPOINT_OPERATION = "fetch"
+# Stored pages between checkpoint saves (and coverage reports)
+CHECKPOINT_SAVE_INTERVAL = 100
+
 
 class OneNoteContentFetcher:
     """
@@ -30,18 +64,41 @@ class OneNoteContentFetcher:
     """
 
     def __init__(self, cache_manager: Optional[OneNoteCacheManager] = None,
-                 onenote_search: Optional[OneNoteSearchTool] = None):
+                 onenote_search: Optional[OneNoteSearchTool] = None,
+                 max_concurrent_sections: int = DEFAULT_MAX_CONCURRENT_SECTIONS,
+                 max_concurrent_pages: int = DEFAULT_MAX_CONCURRENT_PAGES,
+                 max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS):
         """
         Initialize the content fetcher.
 
         Args:
             cache_manager: Optional cache manager instance
             onenote_search: Optional OneNote search tool instance
+            max_concurrent_sections: Maximum number of sections in flight
+            max_concurrent_pages: Maximum number of pages in flight
+            max_concurrent_requests: Request budget, the maximum number of
+                Graph requests in flight
         """
         self.settings = get_settings()
         self.cache_manager = cache_manager or OneNoteCacheManager()
         self.onenote_search = onenote_search  # Will be injected during usage
 
+        self.max_concurrent_sections = max_concurrent_sections
+        self.max_concurrent_pages = max_concurrent_pages
+        self.max_concurrent_requests = max_concurrent_requests
+        self._section_slots = asyncio.Semaphore(max_concurrent_sections)
+        self._page_slots = asyncio.Semaphore(max_concurrent_pages)
+        self._request_budget = asyncio.Semaphore(max_concurrent_requests)
+
+        # Section listing shared by all notebooks of a running fetch
+        self._section_listing: Optional[asyncio.Task] = None
+
+        # Checkpoint of a running fetch and the store it is saved to
+        self._checkpoint: Optional[SyncCheckpoint] = None
+        self._checkpoint_store: Optional[SyncCheckpointStore] = None
+        # Page manifest of a running fetch
+        self._manifest: Optional[PageManifest] = None
+
         logger.debug("Initialized OneNote content fetcher")
 
     async def __aenter__(self):
@@ -127,14 +184,22 @@ class OneNoteContentFetcher:
             return page_data.get('content', '')
         return ''
 
+    @background_priority
     async def fetch_all_content(self, user_id: str,
-                               sync_type: SyncType = SyncType.FULL) -> SyncResult:
+                               sync_type: SyncType = SyncType.FULL,
+                               resume: bool = True) -> SyncResult:
         """
         Fetch all OneNote content for a user.
 
+        If an earlier fetch of the same type failed or was interrupted, it is
+        resumed from its checkpoint: completed sections are skipped and
+        unfinished sections continue from their listing cursor.
+
         Args:
             user_id: User identifier
             sync_type: Type of sync operation
+            resume: Resume from the checkpoint of an interrupted fetch; when
+                False the fetch starts over
 
         Returns:
             Sync result with statistics and status
@@ -154,6 +219,8 @@ class OneNoteContentFetcher:
                 await self.cache_manager.initialize_user_cache(user_id)
                 logger.info(f"Initialized cache for new user: {user_id}")
 
+            await self._open_checkpoint(user_id, sync_type, resume)
+
             # Update sync metadata
             await self.cache_manager.update_cache_metadata(
                 user_id,
@@ -168,23 +235,41 @@ class OneNoteContentFetcher:
             sections_processed = 0
             logger.info(f"Found {len(notebooks)} notebooks")
 
-            # Process each notebook
-            for notebook in notebooks:
-                try:
-                    notebook_result = await self._process_notebook(
-                        user_id, notebook, sync_type
-                    )
-                    sections_processed += notebook_result['sections']
-                    # Use the proper statistics field names
-                    result.statistics.pages_added += notebook_result['cached']
-                    result.errors.extend(notebook_result['errors'])
-
-                except Exception as e:
-                    error_msg = f"Failed to process notebook {notebook.get('displayName', notebook.get('id', 'unknown'))}: {e}"
+            # List the pages of all notebooks together; sections are bounded
+            # by their own limit, so this does not flood the Graph API
+            manifest = self._manifest = PageManifest()
+            try:
+                if notebooks:
+                    self._section_listing = asyncio.create_task(self._request_all_sections())
+                notebook_results = await asyncio.gather(
+                    *(self._list_notebook_pages(notebook, manifest) for notebook in notebooks),
+                    return_exceptions=True
+                )
+            finally:
+                self._reset_section_listing()
+
+            for notebook, notebook_result in zip(notebooks, notebook_results, strict=True):
+                if isinstance(notebook_result, Exception):
+                    error_msg = f"Failed to process notebook {notebook.get('displayName', notebook.get('id', 'unknown'))}: {notebook_result}"
                     logger.error(error_msg)
                     result.errors.append(error_msg)
                     continue
 
+                sections_processed += notebook_result['sections']
+                result.errors.extend(notebook_result['errors'])
+
+            # Store page content, most recently modified first
+            logger.info(f"Listed {manifest.total_pages} pages in {sections_processed} sections, "
+                        f"{manifest.stored_pages} already stored")
+            result.errors.extend(await self._store_manifest_pages(user_id, manifest, sync_type))
+            # Pages stored before an interruption are not listed again, so a
+            # resumed fetch counts them from its checkpoint
+            if self._checkpoint:
+                manifest.update_checkpoint(self._checkpoint)
+                result.statistics.pages_added = self._checkpoint.stored_page_count()
+            else:
+                result.statistics.pages_added = manifest.stored_pages
+
             # Calculate final statistics
             end_time = datetime.utcnow()
             result.completed_at = end_time
@@ -218,8 +303,14 @@ class OneNoteContentFetcher:
             except Exception as cleanup_error:
                 logger.warning(f"Failed to cleanup sync metadata: {cleanup_error}")
 
+        finally:
+            # Also runs on cancellation (Ctrl-C), so the next fetch resumes
+            await self._close_checkpoint(completed=result.status == SyncStatus.COMPLETED)
+            self._manifest = None
+
         return result
 
+    @background_priority
     async def fetch_specific_pages(self, user_id: str, page_ids: List[str]) -> SyncResult:
         """
         Fetch specific pages by their IDs.
@@ -245,23 +336,33 @@ class OneNoteContentFetcher:
             if not self.cache_manager.cache_exists(user_id):
                 await self.cache_manager.initialize_user_cache(user_id)
 
-            # Process each page
-            for page_id in page_ids:
-                try:
-                    page_data = await self._fetch_single_page(page_id)
-                    if page_data:
+            # Fetch metadata and content of all pages with batched requests
+            fetched_pages = await self._fetch_pages(page_ids)
+
+            async def fetch_page(page_id: str) -> Optional[str]:
+                """Cache one fetched page, returning an error message on failure."""
+                async with self._page_slots:
+                    try:
+                        page_data = fetched_pages.get(page_id)
+                        if not page_data:
+                            return f"Page not found: {page_id}"
                         cached_page = await self._convert_to_cached_page(page_data)
                         await self.cache_manager.store_page_content(user_id, cached_page)
-                        result.statistics.pages_added += 1
                         logger.debug(f"Cached page: {page_data.get('title', page_id)}")
-                    else:
-                        result.errors.append(f"Page not found: {page_id}")
+                        return None
 
-                except Exception as e:
-                    error_msg = f"Failed to fetch page {page_id}: {e}"
-                    logger.error(error_msg)
+                    except Exception as e:
+                        error_msg = f"Failed to fetch page {page_id}: {e}"
+                        logger.error(error_msg)
+                        return error_msg
+
+            # Process pages concurrently, bounded by the page limit
+            page_errors = await asyncio.gather(*(fetch_page(page_id) for page_id in page_ids))
+            for error_msg in page_errors:
+                if error_msg:
                     result.errors.append(error_msg)
-                    continue
+                else:
+                    result.statistics.pages_added += 1
 
             # Finalize result
             end_time = datetime.utcnow()
@@ -288,7 +389,7 @@ class OneNoteContentFetcher:
         """
         try:
             if self.onenote_search:
-                notebooks = await self.onenote_search.get_notebooks()
+                notebooks = await self._graph_request(self.onenote_search.get_notebooks)
                 logger.debug(f"Retrieved {len(notebooks)} notebooks via OneNoteSearchTool")
                 return notebooks
             else:
@@ -310,11 +411,8 @@ class OneNoteContentFetcher:
         """
         try:
             if self.onenote_search:
-                # Get authentication token
-                token = await self.onenote_search.authenticator.get_valid_token()
-
                 # Get all sections and filter by notebook_id
-                all_sections = await self.onenote_search._get_all_sections(token)
+                all_sections = await self._list_all_sections()
                 notebook_sections = [
                     section for section in all_sections
                     if section.get('parentNotebook', {}).get('id') == notebook_id
@@ -329,18 +427,111 @@ class OneNoteContentFetcher:
             logger.error(f"Failed to get sections for notebook {notebook_id}: {e}")
             raise
 
-    async def _process_notebook(self, user_id: str, notebook: Dict,
-                              sync_type: SyncType) -> Dict[str, any]:
+    async def _graph_request(self, call: Callable[..., Awaitable[T]], *args: Any) -> T:
+        """
+        Run a Graph API call within the shared request budget.
+
+        Args:
+            call: Coroutine function performing the request
+            *args: Positional arguments for the call
+
+        Returns:
+            The call's result
+        """
+        async with self._request_budget:
+            return await call(*args)
+
+    async def _request_all_sections(self) -> List[Dict]:
+        """Request the sections of all notebooks from the Graph API."""
+        token = await self.onenote_search.authenticator.get_valid_token()
+        return await self._graph_request(self.onenote_search._get_all_sections, token)
+
+    async def _list_all_sections(self) -> List[Dict]:
+        """
+        Get the sections of all notebooks.
+
+        The Graph API lists sections for all notebooks at once. While a fetch
+        is running, one listing is shared by every notebook instead of being
+        requested once per notebook.
+
+        Returns:
+            List of section dictionaries
+        """
+        if self._section_listing is None:
+            return await self._request_all_sections()
+        return await asyncio.shield(self._section_listing)
+
+    def _reset_section_listing(self) -> None:
+        """Drop the shared section listing of a finished fetch."""
+        listing, self._section_listing = self._section_listing, None
+        if listing is None:
+            return
+        if not listing.done():
+            listing.cancel()
+        elif not listing.cancelled():
+            # Mark a failed listing as retrieved; notebooks reported the error
+            listing.exception()
+
+    async def _open_checkpoint(self, user_id: str, sync_type: SyncType, resume: bool) -> None:
         """
-        Process all content in a notebook.
+        Load the checkpoint of an interrupted fetch, or start a new one.
 
         Args:
             user_id: User identifier
-            notebook: Notebook dictionary
             sync_type: Type of sync operation
+            resume: Whether an existing checkpoint may be resumed
+        """
+        store = self.cache_manager.get_sync_checkpoint_store(user_id)
+        checkpoint = await store.load(CHECKPOINT_OPERATION, sync_type) if resume else None
+        if checkpoint:
+            logger.info(f"Resuming content fetch from checkpoint of {checkpoint.updated_at}: "
+                        f"{len(checkpoint.completed_sections)} sections already complete")
+        else:
+            checkpoint = SyncCheckpoint(operation=CHECKPOINT_OPERATION, sync_type=sync_type)
+        self._checkpoint, self._checkpoint_store = checkpoint, store
+
+    async def _save_checkpoint(self) -> None:
+        """Persist the checkpoint of the running fetch."""
+        if self._checkpoint is None:
+            return
+        try:
+            await self._checkpoint_store.save(self._checkpoint)
+        except Exception as e:
+            logger.warning(f"Failed to save sync checkpoint: {e}")
+
+    async def _close_checkpoint(self, completed: bool) -> None:
+        """
+        Finish the checkpoint of a fetch.
+
+        Args:
+            completed: Whether all content was fetched; the checkpoint is then
+                removed, otherwise it is kept for the next fetch to resume
+        """
+        if self._checkpoint is None:
+            return
+        try:
+            if self._manifest:
+                self._manifest.update_checkpoint(self._checkpoint)
+            if completed:
+                await self._checkpoint_store.clear()
+            else:
+                await self._save_checkpoint()
+                logger.info("Content fetch incomplete, the next fetch resumes from its checkpoint")
+        except Exception as e:
+            logger.warning(f"Failed to update sync checkpoint: {e}")
+        finally:
+            self._checkpoint = self._checkpoint_store = None
+
+    async def _list_notebook_pages(self, notebook: Dict, manifest: PageManifest) -> Dict[str, any]:
+        """
+        List the pages of all sections in a notebook into the manifest.
+
+        Args:
+            notebook: Notebook dictionary
+            manifest: Page manifest of the running fetch
 
         Returns:
-            Dictionary with processing statistics
+            Dictionary with listing statistics
         """
         notebook_id = notebook.get('id')
         notebook_name = notebook.get('displayName', 'Unknown')
@@ -348,34 +539,33 @@ class OneNoteContentFetcher:
         result = {
             'sections': 0,
             'pages': 0,
-            'cached': 0,
             'errors': []
         }
 
         try:
-            logger.debug(f"Processing notebook: {notebook_name} ({notebook_id})")
+            logger.debug(f"Listing notebook: {notebook_name} ({notebook_id})")
 
             # Get sections for this notebook
             sections = await self._get_all_sections(notebook_id)
             result['sections'] = len(sections)
 
-            # Process each section
-            for section in sections:
-                try:
-                    section_result = await self._process_section(
-                        user_id, section, sync_type
-                    )
-                    result['pages'] += section_result['pages']
-                    result['cached'] += section_result['cached']
-                    result['errors'].extend(section_result['errors'])
-
-                except Exception as e:
-                    error_msg = f"Failed to process section {section.get('displayName', section.get('id', 'unknown'))}: {e}"
+            # List sections concurrently, bounded by the section limit
+            section_results = await asyncio.gather(
+                *(self._list_section_pages_bounded(section, manifest) for section in sections),
+                return_exceptions=True
+            )
+
+            for section, section_result in zip(sections, section_results, strict=True):
+                if isinstance(section_result, Exception):
+                    error_msg = f"Failed to process section {section.get('displayName', section.get('id', 'unknown'))}: {section_result}"
                     logger.error(error_msg)
                     result['errors'].append(error_msg)
                     continue
 
-            logger.debug(f"Notebook {notebook_name}: {result['cached']}/{result['pages']} pages cached")
+                result['pages'] += section_result['pages']
+                result['errors'].extend(section_result['errors'])
+
+            logger.debug(f"Notebook {notebook_name}: {result['pages']} pages listed")
 
         except Exception as e:
             error_msg = f"Failed to process notebook {notebook_name}: {e}"
@@ -384,62 +574,56 @@ class OneNoteContentFetcher:
 
         return result
 
-    async def _process_section(self, user_id: str, section: Dict,
-                             sync_type: SyncType) -> Dict[str, any]:
+    async def _list_section_pages_bounded(self, section: Dict, manifest: PageManifest) -> Dict[str, any]:
+        """List a section's pages once one of the section slots is free."""
+        async with self._section_slots:
+            return await self._list_section(section, manifest)
+
+    async def _list_section(self, section: Dict, manifest: PageManifest) -> Dict[str, any]:
         """
-        Process all pages in a section.
+        List all pages in a section into the manifest.
+
+        When an interrupted fetch resumes, completed sections are skipped, the
+        listing continues from the section's checkpoint cursor, and pages
+        stored before the interruption are marked as stored in the manifest.
 
         Args:
-            user_id: User identifier
             section: Section dictionary
-            sync_type: Type of sync operation
+            manifest: Page manifest of the running fetch
 
         Returns:
-            Dictionary with processing statistics
+            Dictionary with listing statistics
         """
         section_id = section.get('id')
         section_name = section.get('displayName', 'Unknown')
 
         result = {
             'pages': 0,
-            'cached': 0,
             'errors': []
         }
 
         try:
-            logger.debug(f"Processing section: {section_name} ({section_id})")
+            checkpoint = self._checkpoint
+            if checkpoint and section_id in checkpoint.completed_sections:
+                logger.debug(f"Section {section_name} completed by an earlier fetch, skipping")
+                return result
 
-            # Get pages for this section using the section-by-section approach
-            pages = await self._get_pages_from_section(section_id)
-            result['pages'] = len(pages)
-
-            # Process each page
-            for page_data in pages:
-                try:
-                    page_id = page_data.get('id')
+            logger.debug(f"Listing section: {section_name} ({section_id})")
 
-                    # Check if we should skip this page (for incremental sync)
-                    if sync_type == SyncType.INCREMENTAL:
-                        existing_page = await self.cache_manager.get_cached_page(user_id, page_id)
-                        if existing_page and self._is_page_up_to_date(existing_page, page_data):
-                            logger.debug(f"Skipping up-to-date page: {page_data.get('title', page_id)}")
-                            result['cached'] += 1  # Count as cached since it's current
-                            continue
+            cursor = checkpoint.section_cursors.get(section_id) if checkpoint else None
+            while True:
+                pages, next_url = await self._list_section_pages(section_id, cursor)
+                manifest.add_listing(section_id, pages, next_url)
+                result['pages'] += len(pages)
 
-                    # Convert and cache the page
-                    cached_page = await self._convert_to_cached_page(page_data)
-                    await self.cache_manager.store_page_content(user_id, cached_page)
-                    result['cached'] += 1
+                if checkpoint:
+                    for page_data in pages:
+                        if checkpoint.is_page_stored(section_id, page_data.get('id')):
+                            manifest.mark_stored(page_data.get('id'))
 
-                    logger.debug(f"Cached page: {page_data.get('title', page_id)}")
-
-                except Exception as e:
-                    error_msg = f"Failed to cache page {page_data.get('title', page_data.get('id', 'unknown'))}: {e}"
-                    logger.error(error_msg)
-                    result['errors'].append(error_msg)
-                    continue
-
-            logger.debug(f"Section {section_name}: {result['cached']}/{result['pages']} pages cached")
+                if not next_url:
+                    break
+                cursor = next_url
 
         except Exception as e:
             error_msg = f"Failed to process section {section_name}: {e}"
@@ -448,6 +632,131 @@ class OneNoteContentFetcher:
 
         return result
 
+    async def _store_manifest_pages(self, user_id: str, manifest: PageManifest,
+                                    sync_type: SyncType) -> List[str]:
+        """
+        Download and store the manifest's pages, most recently modified first.
+
+        Args:
+            user_id: User identifier
+            manifest: Page manifest of the running fetch
+            sync_type: Type of sync operation
+
+        Returns:
+            Error messages of pages that could not be stored
+        """
+        pending = iter(manifest.pending_by_recency())
+        checkpoint = self._checkpoint
+        errors: List[str] = []
+        # Pages stored since the checkpoint was last saved, across all workers
+        unsaved_pages = 0
+
+        async def worker() -> None:
+            """Store pages from the shared queue until it is empty."""
+            nonlocal unsaved_pages
+            for entry in pending:
+                error_msg = await self._process_page(user_id, entry.page, sync_type)
+                if error_msg:
+                    errors.append(error_msg)
+                    continue
+
+                manifest.mark_stored(entry.page_id)
+                if checkpoint:
+                    checkpoint.mark_page_stored(entry.section_id, entry.page_id)
+                unsaved_pages += 1
+                if unsaved_pages >= CHECKPOINT_SAVE_INTERVAL:
+                    unsaved_pages = 0
+                    logger.info(f"Sync coverage {manifest.coverage:.1f}% "
+                                f"({manifest.stored_pages}/{manifest.total_pages} pages)")
+                    if checkpoint:
+                        manifest.update_checkpoint(checkpoint)
+                        await self._save_checkpoint()
+
+        # Workers take pages in recency order; each page holds a page slot
+        await asyncio.gather(*(worker() for _ in range(self.max_concurrent_pages)))
+        return errors
+
+    async def _process_page(self, user_id: str, page_data: Dict,
+                            sync_type: SyncType) -> Optional[str]:
+        """
+        Convert and cache one page once one of the page slots is free.
+
+        Args:
+            user_id: User identifier
+            page_data: Page dictionary from the section listing
+            sync_type: Type of sync operation
+
+        Returns:
+            Error message, or None if the page is cached (or already current)
+        """
+        async with self._page_slots:
+            try:
+                page_id = page_data.get('id')
+                existing_page = await self.cache_manager.get_cached_page(
+                    user_id, page_id, load_content=False
+                )
+
+                # Check if we should skip this page (for incremental sync)
+                if sync_type == SyncType.INCREMENTAL:
+                    if existing_page and self._is_page_up_to_date(existing_page, page_data):
+                        logger.debug(f"Skipping up-to-date page: {page_data.get('title', page_id)}")
+                        return None  # Count as cached since it's current
+
+                # Listings carry no content; download it unless it is unchanged
+                validators = None
+                if 'content' not in page_data:
+                    response = await self._fetch_page_content_if_modified(page_id, existing_page)
+                    if response.not_modified:
+                        # Cached content is current: skip conversion and reindexing
+                        logger.debug(f"Content unchanged, keeping cached page: {page_data.get('title', page_id)}")
+                        return None
+                    if not response.ok:
+                        raise ValueError(f"content request failed with HTTP {response.status_code}")
+                    page_data = {**page_data, 'content': response.text}
+                    validators = response.validators
+
+                # Convert and cache the page
+                cached_page = await self._convert_to_cached_page(page_data)
+                if validators:
+                    cached_page.metadata.content_etag = validators.etag
+                    cached_page.metadata.content_last_modified = validators.last_modified
+                await self.cache_manager.store_page_content(user_id, cached_page)
+
+                logger.debug(f"Cached page: {page_data.get('title', page_id)}")
+                return None
+
+            except Exception as e:
+                error_msg = f"Failed to cache page {page_data.get('title', page_data.get('id', 'unknown'))}: {e}"
+                logger.error(error_msg)
+                return error_msg
+
+    async def _fetch_page_content_if_modified(self, page_id: str,
+                                              cached_page: Optional[CachedPage]) -> ConditionalResponse:
+        """
+        Download page content unless the cached copy is current.
+
+        Args:
+            page_id: Page ID
+            cached_page: Cached copy of the page, if any
+
+        Returns:
+            Conditional response (HTTP 304 if the cached content is current)
+        """
+        if not self.onenote_search:
+            raise ValueError("OneNoteSearchTool instance not provided")
+
+        validators = None
+        if cached_page:
+            validators = ContentValidators(
+                etag=cached_page.metadata.content_etag,
+                last_modified=cached_page.metadata.content_last_modified
+            )
+
+        token = await self.onenote_search.authenticator.get_valid_token()
+        return await self._graph_request(
+            self.onenote_search._fetch_page_content_if_modified, page_id, token, validators
+        )
+
     async def _get_pages_from_section(self, section_id: str) -> List[Dict]:
         """
         Get all pages from a specific section using OneNoteSearchTool.
@@ -464,7 +773,9 @@ class OneNoteContentFetcher:
                 token = await self.onenote_search.authenticator.get_valid_token()
 
                 # Get pages from section
-                pages = await self.onenote_search._get_pages_from_section(section_id, token)
+                pages = await self._graph_request(
+                    self.onenote_search._get_pages_from_section, section_id, token
+                )
 
                 logger.debug(f"Retrieved {len(pages)} pages from section {section_id}")
                 return pages
@@ -475,9 +786,114 @@ class OneNoteContentFetcher:
             logger.error(f"Failed to get pages from section {section_id}: {e}")
             raise
 
+    async def _list_section_pages(self, section_id: str,
+                                  next_url: Optional[str] = None) -> Tuple[List[Dict], Optional[str]]:
+        """
+        Get one listing page of a section's pages using OneNoteSearchTool.
+
+        Args:
+            section_id: Section ID
+            next_url: Listing cursor; the first listing page if not given
+
+        Returns:
+            Tuple of (page dictionaries, cursor of the next listing page or None)
+        """
+        if not self.onenote_search:
+            raise ValueError("OneNoteSearchTool instance not provided")
+
+        token = await self.onenote_search.authenticator.get_valid_token()
+        pages, next_url = await self._graph_request(
+            self.onenote_search._list_section_pages, section_id, token, next_url
+        )
+        logger.debug(f"Retrieved {len(pages)} pages from section {section_id}")
+        return pages, next_url
+
+    async def _list_page_index(self, section_id: str,
+                               modified_since: Optional[datetime] = None) -> List[Dict]:
+        """
+        Get the lightweight page index of a section for change detection.
+
+        Args:
+            section_id: Section ID
+            modified_since: Only list pages modified after this time (filtered
+                server side where Graph supports it)
+
+        Returns:
+            Page dictionaries with id, title and lastModifiedDateTime
+        """
+        if not self.onenote_search:
+            raise ValueError("OneNoteSearchTool instance not provided")
+
+        token = await self.onenote_search.authenticator.get_valid_token()
+        return await self._graph_request(
+            self.onenote_search._list_section_page_index, section_id, token, modified_since
+        )
+
+    async def _fetch_pages(self, page_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Fetch several pages (metadata and HTML content) by ID.
+
+        Metadata and content requests are sent through Graph JSON batching,
+        so 10 pages take one round trip. If batching fails, pages are fetched
+        one by one.
+
+        Args:
+            page_ids: Page IDs
+
+        Returns:
+            Dictionary mapping page ID to page dictionary (None if not found)
+        """
+        if not page_ids:
+            return {}
+
+        try:
+            if not self.onenote_search:
+                raise ValueError("OneNoteSearchTool instance not provided")
+
+            token = await self.onenote_search.authenticator.get_valid_token()
+            fields = urlencode(page_fields(), safe="$,", quote_via=quote)
+            requests = []
+            for i, page_id in enumerate(page_ids):
+                requests.append(BatchRequest(id=f"{i}.metadata", url=f"/me/onenote/pages/{page_id}?{fields}"))
+                requests.append(BatchRequest(
+                    id=f"{i}.content",
+                    url=f"/me/onenote/pages/{page_id}/content",
+                    headers={"Accept": "text/html"}
+                ))
+
+            async with self._request_budget:
+                responses, api_calls = await execute_batch(requests, token, self.onenote_search.base_url)
+            logger.debug(f"Fetched {len(page_ids)} pages in {api_calls} batch requests")
+
+        except Exception as e:
+            logger.warning(f"Batched page fetch failed, fetching pages individually: {e}")
+            pages = await asyncio.gather(*(self._fetch_single_page(page_id) for page_id in page_ids))
+            return dict(zip(page_ids, pages, strict=True))
+
+        fetched: Dict[str, Optional[Dict]] = {}
+        for i, page_id in enumerate(page_ids):
+            metadata = responses.get(f"{i}.metadata")
+            if metadata is None or not metadata.ok:
+                status = metadata.status if metadata else "no response"
+                logger.warning(f"Failed to get page metadata for {page_id}: {status}")
+                fetched[page_id] = None
+                continue
+
+            page_data = metadata.json()
+            content = responses.get(f"{i}.content")
+            if content is not None and content.ok:
+                page_data['content'] = content.text()
+            else:
+                status = content.status if content else "no response"
+                logger.warning(f"Failed to get page content for {page_id}: {status}")
+                page_data['content'] = ''
+            fetched[page_id] = page_data
+
+        return fetched
+
     async def _fetch_single_page(self, page_id: str) -> Optional[Dict]:
         """
-        Fetch a single page by ID using direct HTTP calls.
+        Fetch a single page (metadata and HTML content) by ID.
 
         Args:
             page_id: Page ID
@@ -486,41 +902,36 @@ class OneNoteContentFetcher:
             Page dictionary or None if not found
         """
         try:
-            import aiohttp
+            if not self.onenote_search:
+                raise ValueError("OneNoteSearchTool instance not provided")
 
-            # Get access token (assuming we have one)
+            token = await self.onenote_search.authenticator.get_valid_token()
             headers = {
-                "Authorization": "Bearer mock_access_token",  # In real use, get from auth
+                "Authorization": f"Bearer {token}",
                 "Accept": "application/json"
             }
+            page_url = f"{self.onenote_search.base_url}/me/onenote/pages/{page_id}"
 
-            async with aiohttp.ClientSession() as session:
+            async with self._request_budget:
                 # Get page metadata
-                async with session.get(
-                    f"https://graph.microsoft.com/v1.0/me/onenote/pages/{page_id}",
-                    headers=headers
-                ) as response:
-                    if response.status == 200:
-                        page_data = await response.json()
-
-                        # Get page content
-                        content_headers = headers.copy()
-                        content_headers["Accept"] = "text/html"
-
-                        async with session.get(
-                            f"https://graph.microsoft.com/v1.0/me/onenote/pages/{page_id}/content",
-                            headers=content_headers
-                        ) as content_response:
-                            if content_response.status == 200:
-                                page_data['content'] = await content_response.text()
-                            else:
-                                logger.warning(f"Failed to get page content for {page_id}: {content_response.status}")
-                                page_data['content'] = ''
-
-                        return page_data
-                    else:
-                        logger.warning(f"Failed to get page metadata for {page_id}: {response.status}")
-                        return None
+                response = await graph_request("GET", page_url, headers=headers, params=page_fields())
+                if response.status_code != 200:
+                    logger.warning(f"Failed to get page metadata for {page_id}: {response.status_code}")
+                    return None
+                page_data = response.json()
+
+                # Get page content
+                content_headers = headers.copy()
+                content_headers["Accept"] = "text/html"
+
+                content_response = await graph_request("GET", f"{page_url}/content", headers=content_headers)
+                if content_response.status_code == 200:
+                    page_data['content'] = content_response.text
+                else:
+                    logger.warning(f"Failed to get page content for {page_id}: {content_response.status_code}")
+                    page_data['content'] = ''
+
+                return page_data
 
         except Exception as e:
             logger.error(f"Failed to fetch single page {page_id}: {e}")
@@ -644,13 +1055,24 @@ class OneNoteContentFetcher:
             if not metadata or not metadata.sync_in_progress:
                 return None
 
-            return {
+            progress = {
                 'sync_in_progress': True,
                 'sync_started': metadata.last_sync_attempt,
                 'estimated_completion': None,  # Could be calculated based on progress
                 'pages_processed': metadata.total_pages_cached or 0
             }
 
+            # Coverage of the running fetch: listed pages that are stored
+            manifest = self._manifest
+            if manifest is not None:
+                progress.update({
+                    'pages_listed': manifest.total_pages,
+                    'pages_stored': manifest.stored_pages,
+                    'coverage_percent': round(manifest.coverage, 1)
+                })
+
+            return progress
+
         except Exception as e:
             logger.error(f"Failed to get sync progress: {e}")
             return None
@@ -0,0 +1,372 @@
+"""
+Persistent page location index for the local OneNote cache.
+
+Maps page ids to their location in the cache tree so that cached pages can be
+found with a single keyed read instead of scanning every notebook and section
+directory.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Name of the index database inside each user's cache directory
+PAGE_INDEX_FILENAME = "page_index.db"
+
+# Per-page storage footprint columns used for incremental cache statistics
+FOOTPRINT_COLUMNS = {
+    "size_bytes": "INTEGER NOT NULL DEFAULT 0",
+    "markdown_bytes": "INTEGER NOT NULL DEFAULT 0",
+    "asset_bytes": "INTEGER NOT NULL DEFAULT 0",
+    "image_count": "INTEGER NOT NULL DEFAULT 0",
+    "file_count": "INTEGER NOT NULL DEFAULT 0",
+}
+
+
+@dataclass
+class PageLocation:
+    """Location of a cached page in the cache tree."""
+    page_id: str
+    notebook_id: str
+    section_id: str
+    path: str
+    modified: Optional[str] = None
+    content_hash: Optional[str] = None
+
+    # Storage footprint
+    size_bytes: int = 0
+    markdown_bytes: int = 0
+    asset_bytes: int = 0
+    image_count: int = 0
+    file_count: int = 0
+
+
+@dataclass
+class PageChange:
+    """
+    A page stored, replaced or deleted in a page store.
+
+    Section and notebook count changes are determined in the transaction of
+    the write, so concurrent writes cannot skew them.
+    """
+    previous: Optional[PageLocation]  # None if the page is new
+    current: Optional[PageLocation]  # None if the page was deleted
+    sections: int = 0
+    notebooks: int = 0
+
+
+def parent_count_changes(
+    connection: sqlite3.Connection,
+    table: str,
+    old_parent: Optional[Tuple[str, str]],
+    new_parent: Optional[Tuple[str, str]]
+) -> Tuple[int, int]:
+    """
+    Get the section and notebook count changes of moving a page between parents.
+
+    Must run after the write, before it is committed.
+
+    Args:
+        connection: Database connection holding the write
+        table: Page table with notebook_id and section_id columns
+        old_parent: (notebook_id, section_id) before the write (None if new)
+        new_parent: (notebook_id, section_id) after the write (None if deleted)
+
+    Returns:
+        Tuple of (section change, notebook change)
+    """
+    def count(notebook_id: str, section_id: Optional[str] = None) -> int:
+        if section_id is None:
+            sql, params = f"SELECT COUNT(*) FROM {table} WHERE notebook_id = ?", (notebook_id,)
+        else:
+            sql = f"SELECT COUNT(*) FROM {table} WHERE notebook_id = ? AND section_id = ?"
+            params = (notebook_id, section_id)
+        return connection.execute(sql, params).fetchone()[0]
+
+    sections = notebooks = 0
+    if old_parent == new_parent:
+        return sections, notebooks
+    if new_parent:
+        if count(*new_parent) == 1:
+            sections += 1
+        if (not old_parent or old_parent[0] != new_parent[0]) and count(new_parent[0]) == 1:
+            notebooks += 1
+    if old_parent:
+        if count(*old_parent) == 0:
+            sections -= 1
+        if (not new_parent or new_parent[0] != old_parent[0]) and count(old_parent[0]) == 0:
+            notebooks -= 1
+    return sections, notebooks
+
+
+def ensure_columns(connection: sqlite3.Connection, table: str, columns: Dict[str, str]) -> None:
+    """
+    Add columns missing from a table created by an older version.
+
+    Args:
+        connection: Database connection
+        table: Table name
+        columns: Mapping of column name to column definition
+    """
+    existing = {row[1] for row in connection.execute(f"PRAGMA table_info({table})")}
+    for name, definition in columns.items():
+        if name not in existing:
+            connection.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+
+
+def footprint_totals(connection: sqlite3.Connection, table: str) -> Dict[str, int]:
+    """
+    Aggregate page counts and storage footprints of a page table.
+
+    Args:
+        connection: Database connection
+        table: Table with notebook_id, section_id and footprint columns
+
+    Returns:
+        Totals keyed like CacheCounters fields
+    """
+    row = connection.execute(f"""
+        SELECT COUNT(DISTINCT notebook_id) AS notebooks,
+               COUNT(DISTINCT notebook_id || '/' || section_id) AS sections,
+               COUNT(*) AS pages,
+               COALESCE(SUM(image_count), 0) AS images,
+               COALESCE(SUM(file_count), 0) AS files,
+               COALESCE(SUM(size_bytes), 0) AS size_bytes,
+               COALESCE(SUM(markdown_bytes), 0) AS markdown_bytes,
+               COALESCE(SUM(asset_bytes), 0) AS asset_bytes
+        FROM {table}
+    """).fetchone()
+    return dict(zip(row.keys(), row, strict=True))
+
+
+def compute_content_hash(content: Optional[str]) -> Optional[str]:
+    """
+    Compute the content hash stored for a page.
+
+    Args:
+        content: Page markdown content
+
+    Returns:
+        SHA-256 hex digest, or None if there is no content
+    """
+    if content is None:
+        return None
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class PageLocationIndex:
+    """
+    SQLite-backed page_id -> location index for one user's cache.
+
+    The index records whether it has been fully built from the cache tree, so
+    a lookup miss on a built index means the page is not cached.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize the page location index.
+
+        Args:
+            db_path: Path to the index database file
+        """
+        self.db_path = db_path
+        self._connection: Optional[sqlite3.Connection] = None
+        # Writes come from several file I/O threads sharing the connection
+        self._lock = threading.RLock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get (or open and initialize) the index database connection."""
+        with self._lock:
+            if self._connection is None:
+                self._connection = self._open_connection()
+            return self._connection
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open and initialize the database connection."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30.0)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS page_locations (
+                page_id TEXT PRIMARY KEY,
+                notebook_id TEXT NOT NULL,
+                section_id TEXT NOT NULL,
+                path TEXT NOT NULL,
+                modified TEXT,
+                content_hash TEXT
+            )
+        """)
+        ensure_columns(connection, "page_locations", FOOTPRINT_COLUMNS)
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_page_locations_section ON page_locations(notebook_id, section_id)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_page_locations_section_id ON page_locations(section_id)"
+        )
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS index_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            )
+        """)
+        connection.commit()
+        return connection
+
+    @property
+    def is_built(self) -> bool:
+        """Whether the index has been fully built from the cache tree."""
+        row = self._get_connection().execute(
+            "SELECT value FROM index_meta WHERE key = 'built'"
+        ).fetchone()
+        return row is not None and row["value"] == "1"
+
+    _UPSERT_SQL = """
+        INSERT OR REPLACE INTO page_locations (
+            page_id, notebook_id, section_id, path, modified, content_hash,
+            size_bytes, markdown_bytes, asset_bytes, image_count, file_count
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def _row(location: PageLocation) -> tuple:
+        """Convert a page location to an upsert parameter tuple."""
+        return (
+            location.page_id,
+            location.notebook_id,
+            location.section_id,
+            location.path,
+            location.modified,
+            location.content_hash,
+            location.size_bytes,
+            location.markdown_bytes,
+            location.asset_bytes,
+            location.image_count,
+            location.file_count
+        )
+
+    def get(self, page_id: str) -> Optional[PageLocation]:
+        """
+        Look up the location of a page.
+
+        Args:
+            page_id: Page identifier
+
+        Returns:
+            Page location if indexed, None otherwise
+        """
+        row = self._get_connection().execute(
+            "SELECT * FROM page_locations WHERE page_id = ?", (page_id,)
+        ).fetchone()
+        return PageLocation(**dict(row)) if row else None
+
+    def in_section(self, section_id: str) -> List[PageLocation]:
+        """
+        Get the locations of all indexed pages of a section.
+
+        Args:
+            section_id: Section identifier
+
+        Returns:
+            Page locations in the section
+        """
+        rows = self._get_connection().execute(
+            "SELECT * FROM page_locations WHERE section_id = ?", (section_id,)
+        ).fetchall()
+        return [PageLocation(**dict(row)) for row in rows]
+
+    def upsert(self, location: PageLocation) -> PageChange:
+        """
+        Add or update a page location.
+
+        Args:
+            location: Page location to store
+
+        Returns:
+            The change, with the page's previous location
+        """
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                row = connection.execute(
+                    "SELECT * FROM page_locations WHERE page_id = ?", (location.page_id,)
+                ).fetchone()
+                previous = PageLocation(**dict(row)) if row else None
+                connection.execute(self._UPSERT_SQL, self._row(location))
+                sections, notebooks = parent_count_changes(
+                    connection, "page_locations",
+                    (previous.notebook_id, previous.section_id) if previous else None,
+                    (location.notebook_id, location.section_id)
+                )
+        return PageChange(previous=previous, current=location, sections=sections, notebooks=notebooks)
+
+    def remove(self, page_id: str) -> Optional[PageChange]:
+        """
+        Remove a page from the index.
+
+        Args:
+            page_id: Page identifier
+
+        Returns:
+            The change, or None if the page was not indexed
+        """
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                row = connection.execute(
+                    "SELECT * FROM page_locations WHERE page_id = ?", (page_id,)
+                ).fetchone()
+                if row is None:
+                    return None
+                previous = PageLocation(**dict(row))
+                connection.execute("DELETE FROM page_locations WHERE page_id = ?", (page_id,))
+                sections, notebooks = parent_count_changes(
+                    connection, "page_locations", (previous.notebook_id, previous.section_id), None
+                )
+        return PageChange(previous=previous, current=None, sections=sections, notebooks=notebooks)
+
+    def replace_all(self, locations: Iterable[PageLocation]) -> int:
+        """
+        Replace the index contents and mark it as built.
+
+        Args:
+            locations: Every page location in the cache
+
+        Returns:
+            Number of indexed pages
+        """
+        rows = [self._row(location) for location in locations]
+        with self._lock, self._get_connection() as connection:
+            connection.execute("DELETE FROM page_locations")
+            connection.executemany(self._UPSERT_SQL, rows)
+            connection.execute("INSERT OR REPLACE INTO index_meta (key, value) VALUES ('built', '1')")
+        return len(rows)
+
+    def all_locations(self) -> List[PageLocation]:
+        """Get every indexed page location."""
+        rows = self._get_connection().execute(
+            "SELECT * FROM page_locations ORDER BY notebook_id, section_id, page_id"
+        ).fetchall()
+        return [PageLocation(**dict(row)) for row in rows]
+
+    def totals(self) -> Dict[str, int]:
+        """Aggregate page counts and storage footprints."""
+        return footprint_totals(self._get_connection(), "page_locations")
+
+    def count(self) -> int:
+        """Get the number of indexed pages."""
+        return self._get_connection().execute("SELECT COUNT(*) FROM page_locations").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the index database connection."""
+        with self._lock:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
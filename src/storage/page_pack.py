@@ -0,0 +1,305 @@
+"""
+Single-file pack store for cached OneNote pages.
+
+Stores page metadata, markdown and HTML as (optionally compressed) blobs in
+one SQLite database per user, instead of a directory with several small
+files per page. Used by ``OneNoteCacheManager`` when the ``pack`` storage
+backend is selected.
+"""
+
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from . import compression
+from .page_index import (FOOTPRINT_COLUMNS, PageChange, PageLocation,
+                         ensure_columns, footprint_totals,
+                         parent_count_changes)
+
+logger = logging.getLogger(__name__)
+
+# Name of the pack database inside each user's cache directory
+PAGE_PACK_FILENAME = "page_pack.db"
+
+# Page fields and the pack columns holding them
+PACK_COLUMNS = {
+    "metadata": "metadata",
+    "markdown_content": "markdown",
+    "content": "html",
+}
+
+
+class PagePackStore:
+    """SQLite blob store holding every cached page of one user."""
+
+    def __init__(self, db_path: Path, codec: Optional[str] = None):
+        """
+        Initialize the pack store.
+
+        Args:
+            db_path: Path to the pack database file
+            codec: Compression codec for page blobs (None stores them plain)
+        """
+        self.db_path = db_path
+        self.codec = codec
+        self._connection: Optional[sqlite3.Connection] = None
+        # Writes come from several file I/O threads sharing the connection
+        self._lock = threading.RLock()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get (or open and initialize) the pack database connection."""
+        with self._lock:
+            if self._connection is None:
+                self._connection = self._open_connection()
+            return self._connection
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open and initialize the database connection."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30.0)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                page_id TEXT PRIMARY KEY,
+                notebook_id TEXT NOT NULL,
+                section_id TEXT NOT NULL,
+                modified TEXT,
+                metadata BLOB NOT NULL,
+                markdown BLOB,
+                html BLOB
+            )
+        """)
+        ensure_columns(connection, "pages", FOOTPRINT_COLUMNS)
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_pages_notebook ON pages(notebook_id)")
+        connection.execute("CREATE INDEX IF NOT EXISTS idx_pages_section ON pages(section_id)")
+        connection.commit()
+        return connection
+
+    def _encode(self, text: Optional[str]) -> Optional[bytes]:
+        """Encode a text value as a (compressed) blob."""
+        if text is None:
+            return None
+        return compression.compress(text.encode("utf-8"), self.codec)
+
+    @staticmethod
+    def _decode(blob: Optional[bytes]) -> Optional[str]:
+        """Decode a blob written with any codec."""
+        if blob is None:
+            return None
+        return compression.decompress(bytes(blob)).decode("utf-8")
+
+    def put(
+        self,
+        page_id: str,
+        notebook_id: str,
+        section_id: str,
+        modified: Optional[str],
+        metadata_json: str,
+        markdown: Optional[str],
+        html: Optional[str],
+        footprint: Optional[Dict[str, int]] = None
+    ) -> PageChange:
+        """
+        Store (or replace) a page.
+
+        Args:
+            page_id: Page identifier
+            notebook_id: Parent notebook identifier
+            section_id: Parent section identifier
+            modified: Last modified timestamp (ISO format)
+            metadata_json: Serialized page metadata
+            markdown: Markdown content
+            html: Original HTML content
+            footprint: Asset counts and sizes (image_count, file_count, asset_bytes)
+
+        Returns:
+            The change; page locations carry the recorded storage footprint
+            and an empty path
+        """
+        metadata_blob = self._encode(metadata_json)
+        markdown_blob = self._encode(markdown)
+        html_blob = self._encode(html)
+
+        recorded = {column: 0 for column in FOOTPRINT_COLUMNS}
+        recorded.update(footprint or {})
+        recorded["markdown_bytes"] = len(markdown_blob) if markdown_blob is not None else 0
+        recorded["size_bytes"] = (
+            len(metadata_blob)
+            + recorded["markdown_bytes"]
+            + (len(html_blob) if html_blob is not None else 0)
+            + recorded["asset_bytes"]
+        )
+
+        current = PageLocation(
+            page_id=page_id,
+            notebook_id=notebook_id,
+            section_id=section_id,
+            path="",
+            modified=modified,
+            **recorded
+        )
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                previous = self._location(connection, page_id)
+                connection.execute("""
+                    INSERT OR REPLACE INTO pages (
+                        page_id, notebook_id, section_id, modified, metadata, markdown, html,
+                        size_bytes, markdown_bytes, asset_bytes, image_count, file_count
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    page_id,
+                    notebook_id,
+                    section_id,
+                    modified,
+                    metadata_blob,
+                    markdown_blob,
+                    html_blob,
+                    recorded["size_bytes"],
+                    recorded["markdown_bytes"],
+                    recorded["asset_bytes"],
+                    recorded["image_count"],
+                    recorded["file_count"]
+                ))
+                sections, notebooks = parent_count_changes(
+                    connection, "pages",
+                    (previous.notebook_id, previous.section_id) if previous else None,
+                    (notebook_id, section_id)
+                )
+        return PageChange(previous=previous, current=current, sections=sections, notebooks=notebooks)
+
+    @staticmethod
+    def _location(connection: sqlite3.Connection, page_id: str) -> Optional[PageLocation]:
+        """Read a page's location (with an empty path) within the current transaction."""
+        footprint = ", ".join(FOOTPRINT_COLUMNS)
+        row = connection.execute(
+            f"SELECT page_id, notebook_id, section_id, modified, {footprint} FROM pages WHERE page_id = ?",
+            (page_id,)
+        ).fetchone()
+        return PageLocation(path="", **dict(row)) if row else None
+
+    def get_location(self, page_id: str) -> Optional[sqlite3.Row]:
+        """
+        Look up a page's parents, modification time and footprint without reading blobs.
+
+        Args:
+            page_id: Page identifier
+
+        Returns:
+            Row with page_id, notebook_id, section_id, modified and footprint columns, or None
+        """
+        footprint = ", ".join(FOOTPRINT_COLUMNS)
+        return self._get_connection().execute(
+            f"SELECT page_id, notebook_id, section_id, modified, {footprint} FROM pages WHERE page_id = ?",
+            (page_id,)
+        ).fetchone()
+
+    def get_section_locations(self, section_id: str) -> List[sqlite3.Row]:
+        """
+        Look up the locations of all pages of a section without reading blobs.
+
+        Args:
+            section_id: Section identifier
+
+        Returns:
+            Rows with page_id, notebook_id, section_id, modified and footprint columns
+        """
+        footprint = ", ".join(FOOTPRINT_COLUMNS)
+        return self._get_connection().execute(
+            f"SELECT page_id, notebook_id, section_id, modified, {footprint} FROM pages WHERE section_id = ?",
+            (section_id,)
+        ).fetchall()
+
+    def get_fields(self, page_id: str, fields: Sequence[str]) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Read page fields.
+
+        Args:
+            page_id: Page identifier
+            fields: Page fields to read (keys of PACK_COLUMNS)
+
+        Returns:
+            Mapping of field name to value, or None if the page is not stored
+        """
+        columns = ", ".join(PACK_COLUMNS[field] for field in fields)
+        row = self._get_connection().execute(
+            f"SELECT {columns} FROM pages WHERE page_id = ?", (page_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {field: self._decode(row[PACK_COLUMNS[field]]) for field in fields}
+
+    def iter_pages(
+        self,
+        fields: Sequence[str],
+        batch_size: int = 100
+    ) -> Iterator[List[Dict[str, Optional[str]]]]:
+        """
+        Read pages in batches.
+
+        Args:
+            fields: Page fields to read (keys of PACK_COLUMNS)
+            batch_size: Number of pages per batch
+
+        Yields:
+            Batches of mappings of field name to value (plus page_id)
+        """
+        columns = ", ".join(PACK_COLUMNS[field] for field in fields)
+        cursor = self._get_connection().execute(f"SELECT page_id, {columns} FROM pages")
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield [
+                {"page_id": row["page_id"], **{
+                    field: self._decode(row[PACK_COLUMNS[field]]) for field in fields
+                }}
+                for row in rows
+            ]
+
+    def delete(self, page_id: str) -> Optional[PageChange]:
+        """
+        Delete a page.
+
+        Args:
+            page_id: Page identifier
+
+        Returns:
+            The change, or None if the page was not stored
+        """
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                previous = self._location(connection, page_id)
+                if previous is None:
+                    return None
+                connection.execute("DELETE FROM pages WHERE page_id = ?", (page_id,))
+                sections, notebooks = parent_count_changes(
+                    connection, "pages", (previous.notebook_id, previous.section_id), None
+                )
+        return PageChange(previous=previous, current=None, sections=sections, notebooks=notebooks)
+
+    def totals(self) -> Dict[str, int]:
+        """Aggregate page counts and storage footprints."""
+        return footprint_totals(self._get_connection(), "pages")
+
+    def counts(self) -> Dict[str, int]:
+        """Get page, section and notebook counts."""
+        row = self._get_connection().execute("""
+            SELECT COUNT(*) AS pages,
+                   COUNT(DISTINCT section_id) AS sections,
+                   COUNT(DISTINCT notebook_id) AS notebooks
+            FROM pages
+        """).fetchone()
+        return dict(row)
+
+    def close(self) -> None:
+        """Close the pack database connection."""
+        with self._lock:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,322 @@
+"""
+Maintenance for the local full-text search index.
+
+Every ``index_page`` commit adds a small FTS5 segment, so over time the index
+fragments and query latency creeps up. This module tracks index health
+(segment count, database and WAL size, free-page fragmentation) and runs
+segment merges, ``PRAGMA optimize``, WAL checkpoints and ``VACUUM`` when
+thresholds are crossed, either on demand or from an idle-time background task.
+"""
+
+import asyncio
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+from ..config.logging import log_performance
+from .local_search import LocalOneNoteSearch
+
+logger = logging.getLogger(__name__)
+
+# Default maintenance thresholds
+DEFAULT_SEGMENT_THRESHOLD = 16
+DEFAULT_WAL_THRESHOLD_MB = 64.0
+DEFAULT_FRAGMENTATION_THRESHOLD = 0.25
+DEFAULT_AUTOMERGE = 8
+DEFAULT_IDLE_SECONDS = 300.0
+DEFAULT_PROBE_QUERIES = ["meeting", "project notes", "todo"]
+
+# FTS5 tables merged and tuned during maintenance
+FTS_TABLES = ("page_content_fts", "page_passage_fts")
+
+
+@dataclass
+class IndexHealth:
+    """Snapshot of search index health metrics."""
+    segment_count: int
+    indexed_pages: int
+    database_size_bytes: int
+    wal_size_bytes: int
+    page_count: int
+    freelist_count: int
+
+    @property
+    def fragmentation(self) -> float:
+        """Fraction of database pages that are free."""
+        if self.page_count == 0:
+            return 0.0
+        return self.freelist_count / self.page_count
+
+
+@dataclass
+class MaintenanceReport:
+    """Results of a maintenance run."""
+    timestamp: datetime
+    before: IndexHealth
+    after: IndexHealth
+    actions: List[str] = field(default_factory=list)
+    latency_before_ms: float = 0.0
+    latency_after_ms: float = 0.0
+    duration_seconds: float = 0.0
+
+    @property
+    def latency_improvement_ms(self) -> float:
+        """Reduction in average probe query latency."""
+        return self.latency_before_ms - self.latency_after_ms
+
+
+class SearchIndexMaintainer:
+    """
+    Keeps the local search index compact and fast.
+
+    Maintenance can be triggered explicitly (``run_maintenance``) or by a
+    background task that runs it once the search engine has been idle.
+    """
+
+    def __init__(
+        self,
+        local_search: LocalOneNoteSearch,
+        segment_threshold: int = DEFAULT_SEGMENT_THRESHOLD,
+        wal_threshold_mb: float = DEFAULT_WAL_THRESHOLD_MB,
+        fragmentation_threshold: float = DEFAULT_FRAGMENTATION_THRESHOLD,
+        automerge: int = DEFAULT_AUTOMERGE,
+        probe_queries: Optional[List[str]] = None
+    ):
+        """
+        Initialize the maintainer.
+
+        Args:
+            local_search: Local search engine whose index is maintained
+            segment_threshold: Segment count that triggers a full FTS optimize
+            wal_threshold_mb: WAL size that triggers a truncating checkpoint
+            fragmentation_threshold: Free-page ratio that triggers VACUUM
+            automerge: FTS5 automerge level applied during maintenance
+            probe_queries: Queries used to measure latency before and after
+        """
+        self.local_search = local_search
+        self.segment_threshold = segment_threshold
+        self.wal_threshold_bytes = int(wal_threshold_mb * 1024 * 1024)
+        self.fragmentation_threshold = fragmentation_threshold
+        self.automerge = automerge
+        self.probe_queries = probe_queries or DEFAULT_PROBE_QUERIES
+
+        self._background_task: Optional[asyncio.Task] = None
+        self._last_activity_marker: Optional[tuple] = None
+        self._last_report: Optional[MaintenanceReport] = None
+
+    @property
+    def last_report(self) -> Optional[MaintenanceReport]:
+        """Report from the most recent maintenance run."""
+        return self._last_report
+
+    async def collect_health(self) -> IndexHealth:
+        """
+        Collect current index health metrics.
+
+        With a sharded index the segment count is that of the most fragmented
+        shard and the remaining metrics are summed across shards.
+
+        Returns:
+            Index health snapshot
+        """
+        health = IndexHealth(0, 0, 0, 0, 0, 0)
+
+        for conn in await self.local_search._get_all_connections():
+            health.segment_count = max(
+                health.segment_count,
+                conn.execute("SELECT COUNT(DISTINCT segid) FROM page_content_fts_idx").fetchone()[0]
+            )
+            health.indexed_pages += conn.execute("SELECT COUNT(*) FROM page_metadata").fetchone()[0]
+            health.page_count += conn.execute("PRAGMA page_count").fetchone()[0]
+            health.freelist_count += conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+        for path in self.local_search.database_paths():
+            health.database_size_bytes += self._file_size(path)
+            health.wal_size_bytes += self._file_size(Path(f"{path}-wal"))
+
+        return health
+
+    async def measure_query_latency(self) -> float:
+        """
+        Measure average latency of the probe queries.
+
+        Returns:
+            Average query latency in milliseconds
+        """
+        timings = []
+
+        for query in self.probe_queries:
+            fts_query = self.local_search._build_fts_query(query)
+            sql = self.local_search._build_search_sql()
+            start_time = time.perf_counter()
+            try:
+                await self.local_search._query_rows(sql, [fts_query, 10], 10)
+            except Exception as e:
+                logger.debug(f"Probe query '{query}' failed: {e}")
+                continue
+            timings.append((time.perf_counter() - start_time) * 1000)
+
+        return sum(timings) / len(timings) if timings else 0.0
+
+    def needs_maintenance(self, health: IndexHealth) -> bool:
+        """Check whether any maintenance threshold is crossed."""
+        return bool(self._plan_actions(health))
+
+    def _plan_actions(self, health: IndexHealth, force: bool = False) -> List[str]:
+        """Decide which maintenance actions to run."""
+        actions = []
+        if force or health.segment_count > self.segment_threshold:
+            actions.append("fts_optimize")
+        if force or health.fragmentation > self.fragmentation_threshold:
+            actions.append("vacuum")
+        if force or health.wal_size_bytes > self.wal_threshold_bytes or actions:
+            actions.append("wal_checkpoint")
+        if actions:
+            actions.insert(0, "automerge")
+            actions.append("pragma_optimize")
+        return actions
+
+    async def run_maintenance(self, force: bool = False) -> MaintenanceReport:
+        """
+        Run maintenance actions whose thresholds are crossed.
+
+        Args:
+            force: Run every action regardless of thresholds
+
+        Returns:
+            Maintenance report with before/after health and query latency
+        """
+        start_time = time.time()
+        connections = await self.local_search._get_all_connections()
+
+        before = await self.collect_health()
+        actions = self._plan_actions(before, force)
+        latency_before = await self.measure_query_latency() if actions else 0.0
+
+        for action in actions:
+            for conn in connections:
+                try:
+                    self._run_action(conn, action)
+                except Exception as e:
+                    logger.warning(f"Search index maintenance action '{action}' failed: {e}")
+
+        after = await self.collect_health() if actions else before
+        latency_after = await self.measure_query_latency() if actions else 0.0
+
+        report = MaintenanceReport(
+            timestamp=datetime.now(),
+            before=before,
+            after=after,
+            actions=actions,
+            latency_before_ms=round(latency_before, 3),
+            latency_after_ms=round(latency_after, 3),
+            duration_seconds=round(time.time() - start_time, 3)
+        )
+        self._last_report = report
+
+        if actions:
+            log_performance(
+                "local_search_maintenance",
+                report.duration_seconds,
+                actions=",".join(actions),
+                segments_before=before.segment_count,
+                segments_after=after.segment_count,
+                latency_before_ms=report.latency_before_ms,
+                latency_after_ms=report.latency_after_ms
+            )
+            logger.info(
+                f"Search index maintenance ran {', '.join(actions)}: "
+                f"segments {before.segment_count} -> {after.segment_count}, "
+                f"latency {report.latency_before_ms:.2f}ms -> {report.latency_after_ms:.2f}ms"
+            )
+
+        return report
+
+    def _run_action(self, conn: sqlite3.Connection, action: str) -> None:
+        """Run a single maintenance action on one database."""
+        if action == "automerge":
+            for table in FTS_TABLES:
+                conn.execute(
+                    f"INSERT INTO {table}({table}, rank) VALUES('automerge', ?)",
+                    (self.automerge,)
+                )
+            conn.commit()
+        elif action == "fts_optimize":
+            for table in FTS_TABLES:
+                conn.execute(f"INSERT INTO {table}({table}) VALUES('optimize')")
+            conn.commit()
+        elif action == "vacuum":
+            conn.commit()
+            conn.execute("VACUUM")
+        elif action == "wal_checkpoint":
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchall()
+        elif action == "pragma_optimize":
+            conn.execute("PRAGMA optimize")
+
+    def start_background(
+        self,
+        idle_seconds: float = DEFAULT_IDLE_SECONDS,
+        check_interval: Optional[float] = None
+    ) -> None:
+        """
+        Start an idle-time background maintenance task.
+
+        The search engine counts as idle when no searches or index operations
+        happened since the previous check.
+
+        Args:
+            idle_seconds: Required idle time before maintenance runs
+            check_interval: Polling interval (defaults to idle_seconds)
+        """
+        if self._background_task and not self._background_task.done():
+            return
+        self._background_task = asyncio.create_task(
+            self._background_loop(idle_seconds, check_interval or idle_seconds)
+        )
+        logger.debug("Started background search index maintenance")
+
+    async def stop_background(self) -> None:
+        """Stop the background maintenance task."""
+        if self._background_task:
+            self._background_task.cancel()
+            try:
+                await self._background_task
+            except asyncio.CancelledError:
+                pass
+            self._background_task = None
+            logger.debug("Stopped background search index maintenance")
+
+    async def _background_loop(self, idle_seconds: float, check_interval: float) -> None:
+        """Periodically run maintenance when the search engine is idle."""
+        idle_since = time.monotonic()
+        while True:
+            await asyncio.sleep(check_interval)
+
+            marker = (self.local_search._search_count, self.local_search._index_operations)
+            if marker != self._last_activity_marker:
+                self._last_activity_marker = marker
+                idle_since = time.monotonic()
+                continue
+
+            if time.monotonic() - idle_since < idle_seconds:
+                continue
+
+            try:
+                health = await self.collect_health()
+                if self.needs_maintenance(health):
+                    await self.run_maintenance()
+            except Exception as e:
+                logger.warning(f"Background search index maintenance failed: {e}")
+            idle_since = time.monotonic()
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        """Get file size, returning 0 if the file does not exist."""
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
@@ -0,0 +1,112 @@
+"""
+JSON serialization for cache metadata and local JSON stores.
+
+One place decides how cache JSON is encoded and decoded:
+
+- Compact encoding (no indentation) to keep files small and writes cheap.
+- orjson when it is installed, the standard library ``json`` otherwise. Both
+  produce and accept the same documents.
+- Model loads straight from the raw JSON bytes (``model_validate_json``),
+  skipping the intermediate dict.
+"""
+
+import json
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Optional, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, stdlib json is always available
+    orjson = None
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _default(value: Any) -> Any:
+    """Encode values the JSON encoders do not handle natively."""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def dumps(data: Any, pretty: bool = False) -> bytes:
+    """
+    Encode data as JSON.
+
+    Args:
+        data: Data to encode (pydantic models, datetimes, sets and enums
+            are converted)
+        pretty: Indent the output for human readers
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if isinstance(data, BaseModel):
+        data = data.model_dump()
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(data, default=_default, option=option)
+    separators = None if pretty else (",", ":")
+    return json.dumps(
+        data, default=_default, indent=2 if pretty else None, separators=separators, ensure_ascii=False
+    ).encode("utf-8")
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode JSON.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Decoded data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path: Path) -> Optional[Any]:
+    """
+    Read a JSON file.
+
+    Args:
+        path: File path
+
+    Returns:
+        Decoded data, or None if the file does not exist
+    """
+    if not path.exists():
+        return None
+    return loads(path.read_bytes())
+
+
+def load_model(model_cls: Type[ModelT], data: Union[bytes, str, Dict[str, Any]]) -> ModelT:
+    """
+    Load a model from JSON.
+
+    JSON documents are validated directly from their raw bytes, so no
+    intermediate Python objects are built; in pydantic v2 this is faster than
+    decoding first and calling ``model_construct`` on the result.
+
+    Args:
+        model_cls: Model class
+        data: JSON document or already decoded object
+
+    Returns:
+        Model instance
+    """
+    if isinstance(data, dict):
+        return model_cls.model_validate(data)
+    return model_cls.model_validate_json(data)
@@ -0,0 +1,92 @@
+"""
+Durable checkpoints for resumable syncs.
+
+Long syncs record their progress in a small JSON checkpoint: sections that
+are complete, the listing cursor inside sections that are not, and pages
+already stored. A sync that fails or is interrupted (crash, Ctrl-C) resumes
+from the checkpoint on its next run instead of starting over; a sync that
+completes removes it.
+
+Checkpoints are written atomically and fsynced, so a crash leaves either
+the previous or the new checkpoint on disk, never a partial one.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+
+from ..models.cache import SyncCheckpoint, SyncType
+from . import serialization
+from .async_io import AsyncFileIO, get_file_io
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILE = "sync_checkpoint.json"
+
+# Older checkpoints are discarded; the content has likely moved on since
+CHECKPOINT_MAX_AGE = timedelta(days=3)
+
+
+class SyncCheckpointStore:
+    """Storage of the checkpoint file of one sync operation."""
+
+    def __init__(self, path: Path, file_io: Optional[AsyncFileIO] = None):
+        """
+        Initialize the checkpoint store.
+
+        Args:
+            path: Checkpoint file path
+            file_io: File I/O layer (the shared one if not given)
+        """
+        self.path = Path(path)
+        self.file_io = file_io or get_file_io()
+        self._lock = asyncio.Lock()
+
+    async def load(self, operation: str, sync_type: Optional[SyncType] = None) -> Optional[SyncCheckpoint]:
+        """
+        Load the checkpoint of an interrupted sync.
+
+        Args:
+            operation: Operation that is about to run
+            sync_type: Type of the sync that is about to run
+
+        Returns:
+            The checkpoint, or None if there is nothing to resume
+        """
+        try:
+            data = await self.file_io.run(serialization.read_json, self.path)
+            if data is None:
+                return None
+            checkpoint = serialization.load_model(SyncCheckpoint, data)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable sync checkpoint {self.path}: {e}")
+            return None
+
+        if checkpoint.operation != operation or checkpoint.sync_type != sync_type:
+            return None
+        if datetime.utcnow() - checkpoint.updated_at > CHECKPOINT_MAX_AGE:
+            logger.info(f"Discarding sync checkpoint from {checkpoint.updated_at}")
+            await self.clear()
+            return None
+        return checkpoint
+
+    async def save(self, checkpoint: SyncCheckpoint) -> None:
+        """
+        Durably write a checkpoint.
+
+        Args:
+            checkpoint: Checkpoint to write
+        """
+        async with self._lock:
+            checkpoint.updated_at = datetime.utcnow()
+            # Encode on the event loop, so concurrent updates cannot race the write
+            data = serialization.dumps(checkpoint)
+            await self.file_io.write_bytes(self.path, data)
+            await self.file_io.flush()
+
+    async def clear(self) -> None:
+        """Remove the checkpoint once its sync has completed."""
+        async with self._lock:
+            await self.file_io.run(self.path.unlink, True)
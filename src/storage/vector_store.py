@@ -174,6 +174,25 @@ class VectorStore:
             logger.error(f"Error storing embeddings: {e}")
             raise VectorStoreError(f"Failed to store embeddings: {e}")
 
+    async def get_page_chunk_metadata(self, page_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the stored metadata of one chunk of a page.
+
+        Args:
+            page_id: OneNote page ID
+
+        Returns:
+            Chunk metadata, or None if the page has no stored embeddings
+        """
+        try:
+            result = self.collection.get(where={"page_id": page_id}, limit=1, include=["metadatas"])
+        except Exception as e:
+            logger.warning(f"Failed to get chunk metadata for page {page_id}: {e}")
+            return None
+
+        metadatas = result.get("metadatas") or []
+        return metadatas[0] if metadatas else None
+
     @logged("Search similar embeddings")
     async def search_similar(
         self,
@@ -314,6 +333,43 @@ class VectorStore:
             logger.error(f"Error deleting page embeddings: {e}")
             raise VectorStoreError(f"Failed to delete page embeddings: {e}")
 
+    @logged("Delete embeddings of several pages")
+    async def delete_pages_embeddings(self, page_ids: List[str]) -> int:
+        """
+        Delete all embeddings of several pages in one operation.
+
+        Args:
+            page_ids: OneNote page IDs
+
+        Returns:
+            Number of embeddings deleted
+
+        Raises:
+            VectorStoreError: If deletion fails
+        """
+        if not page_ids:
+            return 0
+
+        try:
+            results = self.collection.get(
+                where={"page_id": {"$in": list(page_ids)}}
+            )
+
+            if not results["ids"]:
+                return 0
+
+            self.collection.delete(ids=results["ids"])
+
+            deleted_count = len(results["ids"])
+            self._operation_count += 1
+
+            logger.info(f"Deleted {deleted_count} embeddings for {len(page_ids)} pages")
+            return deleted_count
+
+        except Exception as e:
+            logger.error(f"Error deleting page embeddings: {e}")
+            raise VectorStoreError(f"Failed to delete page embeddings: {e}")
+
     @logged("Get vector storage statistics")
     async def get_storage_stats(self) -> StorageStats:
         """
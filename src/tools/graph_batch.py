@@ -0,0 +1,195 @@
+"""
+Microsoft Graph JSON batching.
+
+Graph's ``/$batch`` endpoint accepts up to 20 sub-requests per call and runs
+them server side, so bulk operations (page contents, page metadata, section
+page listings) need one round trip per 20 requests instead of one each.
+
+Batch calls go through the Graph request scheduler. Each sub-request has its
+own status: throttled sub-requests (429, 503, 504) are reported to the
+scheduler, which pauses all requests for their ``Retry-After``, and are
+retried together in a later batch; other statuses are returned to the caller
+as they are.
+"""
+
+import base64
+import binascii
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..config.settings import get_settings
+from .graph_client import get_graph_client
+from .graph_scheduler import (THROTTLE_STATUSES, get_graph_scheduler,
+                              retry_after_seconds)
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of sub-requests Graph accepts in one batch
+GRAPH_BATCH_LIMIT = 20
+
+# Times throttled sub-requests are retried in a later batch
+BATCH_MAX_RETRIES = 3
+
+
+class GraphBatchError(Exception):
+    """Exception raised when a batch call itself fails."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@dataclass
+class BatchRequest:
+    """A sub-request of a Graph batch."""
+    id: str
+    url: str  # Relative to the API version root, e.g. "/me/onenote/pages/{id}"
+    method: str = "GET"
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Get the JSON representation used in the batch body."""
+        payload: Dict[str, Any] = {"id": self.id, "method": self.method, "url": self.url}
+        if self.headers:
+            payload["headers"] = self.headers
+        return payload
+
+
+@dataclass
+class BatchResponse:
+    """The response to a sub-request of a Graph batch."""
+    id: str
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: Any = None
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "BatchResponse":
+        """Create a response from its JSON representation in the batch result."""
+        return cls(
+            id=str(payload.get("id")),
+            status=int(payload.get("status", 0)),
+            headers=payload.get("headers") or {},
+            body=payload.get("body")
+        )
+
+    @property
+    def ok(self) -> bool:
+        """Check whether the sub-request succeeded."""
+        return 200 <= self.status < 300
+
+    def json(self) -> Any:
+        """Get the decoded JSON body."""
+        if isinstance(self.body, str):
+            return json.loads(self.text())
+        return self.body
+
+    def text(self) -> str:
+        """
+        Get the body as text.
+
+        Graph base64 encodes non-JSON bodies (such as page HTML) in batch
+        responses; they are decoded here.
+        """
+        if self.body is None:
+            return ""
+        if not isinstance(self.body, str):
+            return json.dumps(self.body)
+        try:
+            return base64.b64decode(self.body, validate=True).decode("utf-8")
+        except (binascii.Error, UnicodeDecodeError):
+            return self.body
+
+
+def relative_url(url: str, base_url: str) -> str:
+    """
+    Make a Graph URL (such as an ``@odata.nextLink``) relative for batching.
+
+    Args:
+        url: Absolute or relative Graph URL
+        base_url: API version root, e.g. "https://graph.microsoft.com/v1.0"
+
+    Returns:
+        URL relative to the version root
+    """
+    base_url = base_url.rstrip("/")
+    if url.startswith(base_url):
+        url = url[len(base_url):]
+    return url if url.startswith("/") else f"/{url}"
+
+
+async def execute_batch(
+    requests: List[BatchRequest],
+    token: str,
+    base_url: Optional[str] = None,
+    max_retries: int = BATCH_MAX_RETRIES
+) -> Tuple[Dict[str, BatchResponse], int]:
+    """
+    Run requests through Graph's ``/$batch`` endpoint.
+
+    Args:
+        requests: Sub-requests (IDs must be unique)
+        token: Authentication token
+        base_url: API version root; the configured Graph base URL if not given
+        max_retries: Number of times throttled sub-requests are retried
+
+    Returns:
+        Tuple of (responses by request ID, batch calls made). Sub-requests that
+        are still throttled after the last retry are returned with their last
+        status.
+
+    Raises:
+        GraphBatchError: If a batch call fails as a whole
+    """
+    base_url = (base_url or get_settings().graph_api_base_url).rstrip("/")
+    endpoint = f"{base_url}/$batch"
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json"
+    }
+
+    client = await get_graph_client()
+    scheduler = get_graph_scheduler()
+    results: Dict[str, BatchResponse] = {}
+    api_calls = 0
+    pending = list(requests)
+
+    for attempt in range(max_retries + 1):
+        throttled: List[BatchRequest] = []
+
+        for start in range(0, len(pending), GRAPH_BATCH_LIMIT):
+            chunk = pending[start:start + GRAPH_BATCH_LIMIT]
+            payload = {"requests": [r.to_payload() for r in chunk]}
+            # The scheduler retries the batch call itself if it is throttled
+            response = await scheduler.run(lambda payload=payload: client.post(endpoint, headers=headers, json=payload))
+            api_calls += 1
+
+            if response.status_code in THROTTLE_STATUSES:
+                for request in chunk:
+                    results[request.id] = BatchResponse(id=request.id, status=response.status_code)
+                continue
+            if response.status_code != 200:
+                raise GraphBatchError(
+                    f"Batch request failed: HTTP {response.status_code}", response.status_code
+                )
+
+            by_id = {request.id: request for request in chunk}
+            for item in response.json().get("responses", []):
+                item_response = BatchResponse.from_payload(item)
+                results[item_response.id] = item_response
+                if item_response.status in THROTTLE_STATUSES and item_response.id in by_id:
+                    throttled.append(by_id[item_response.id])
+                    scheduler.on_throttled(retry_after_seconds(item_response.headers, attempt))
+
+        if not throttled or attempt == max_retries:
+            if throttled:
+                logger.warning(f"{len(throttled)} batched requests still throttled after {max_retries} retries")
+            break
+
+        # The next batch waits for the scheduler's Retry-After pause
+        logger.info(f"{len(throttled)} batched requests throttled, retrying")
+        pending = throttled
+
+    return results, api_calls
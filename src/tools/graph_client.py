@@ -0,0 +1,236 @@
+"""
+Shared HTTP client for Microsoft Graph API calls.
+
+Opening an ``httpx.AsyncClient`` per request pays TCP and TLS setup on every
+call. Every Graph caller (search tool, authenticator, content fetcher, asset
+downloader) instead shares one long-lived pooled client with keep-alive
+connections, HTTP/2 when the optional ``h2`` package is installed, and the
+connection limits and timeouts defined in this module.
+
+httpx connection pools are bound to the event loop that uses them, so one
+client is kept per running event loop. Requests are sent through
+``graph_request``, which paces them with the loop's ``GraphScheduler``.
+"""
+
+import asyncio
+import logging
+import weakref
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional
+
+import httpx
+
+from ..config.settings import get_settings
+from .graph_scheduler import RequestPriority, get_graph_scheduler
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx)
+except ImportError:  # h2 is optional, HTTP/1.1 keep-alive is used without it
+    h2 = None
+
+logger = logging.getLogger(__name__)
+
+# Connection pool limits shared by all Graph requests
+GRAPH_MAX_CONNECTIONS = 20
+GRAPH_MAX_KEEPALIVE_CONNECTIONS = 10
+GRAPH_KEEPALIVE_EXPIRY = 60.0
+
+# Timeouts (seconds); read/write/pool use the configured request timeout
+GRAPH_CONNECT_TIMEOUT = 10.0
+DEFAULT_REQUEST_TIMEOUT = 30.0
+
+USER_AGENT = "OneNote-Copilot/1.0"
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_client_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+
+def http2_enabled() -> bool:
+    """Check whether requests are made over HTTP/2."""
+    return h2 is not None
+
+
+def _request_timeout() -> float:
+    """Get the configured request timeout."""
+    try:
+        return float(get_settings().request_timeout)
+    except Exception:
+        return DEFAULT_REQUEST_TIMEOUT
+
+
+def build_timeout(request_timeout: Optional[float] = None) -> httpx.Timeout:
+    """
+    Build the timeout configuration for Graph requests.
+
+    Args:
+        request_timeout: Read, write and pool timeout; the configured request
+            timeout if not given
+
+    Returns:
+        httpx timeout configuration
+    """
+    request_timeout = request_timeout or _request_timeout()
+    return httpx.Timeout(request_timeout, connect=min(GRAPH_CONNECT_TIMEOUT, request_timeout))
+
+
+def build_limits() -> httpx.Limits:
+    """Build the connection pool limits for Graph requests."""
+    return httpx.Limits(
+        max_connections=GRAPH_MAX_CONNECTIONS,
+        max_keepalive_connections=GRAPH_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=GRAPH_KEEPALIVE_EXPIRY
+    )
+
+
+async def get_graph_client() -> httpx.AsyncClient:
+    """
+    Get the shared Graph HTTP client for the running event loop.
+
+    The client is opened on first use and kept open until
+    ``close_graph_client`` is called (or its event loop goes away).
+
+    Returns:
+        Pooled HTTP client
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is not None:
+        return client
+
+    lock = _client_locks.setdefault(loop, asyncio.Lock())
+    async with lock:
+        client = _clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(
+                timeout=build_timeout(),
+                limits=build_limits(),
+                http2=http2_enabled(),
+                headers={"User-Agent": USER_AGENT},
+                follow_redirects=True
+            )
+            # Open the connection pool for the lifetime of the loop
+            client = await client.__aenter__()
+            _clients[loop] = client
+            logger.debug(f"Opened shared Graph HTTP client (HTTP/2: {http2_enabled()})")
+    return client
+
+
+async def close_graph_client() -> None:
+    """Close the shared Graph HTTP client of the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _clients.pop(loop, None)
+    if client is not None:
+        await client.__aexit__(None, None, None)
+        logger.debug("Closed shared Graph HTTP client")
+
+
+async def graph_request(
+    method: str,
+    url: str,
+    priority: Optional[RequestPriority] = None,
+    **kwargs: Any
+) -> httpx.Response:
+    """
+    Send a Graph request with the shared client, under the request scheduler.
+
+    Throttled responses (429, 503, 504) are retried after their Retry-After
+    delay; see ``GraphScheduler.run``.
+
+    Args:
+        method: HTTP method, e.g. "GET"
+        url: Request URL
+        priority: Request priority; the ``graph_priority`` context if not given
+        **kwargs: Arguments for the client method (headers, params, json, ...)
+
+    Returns:
+        The response
+    """
+    client = await get_graph_client()
+    send = getattr(client, method.lower())
+    return await get_graph_scheduler().run(lambda: send(url, **kwargs), priority)
+
+
+@dataclass
+class ContentValidators:
+    """HTTP cache validators (ETag and Last-Modified) of a downloaded resource."""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @classmethod
+    def from_headers(cls, headers: Mapping[str, str]) -> "ContentValidators":
+        """
+        Get the validators a server sent with a response.
+
+        Args:
+            headers: Response headers
+
+        Returns:
+            Validators (empty if the server sent none)
+        """
+        normalized = {name.lower(): value for name, value in (headers or {}).items()}
+        return cls(etag=normalized.get("etag"), last_modified=normalized.get("last-modified"))
+
+    def __bool__(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    def request_headers(self) -> Dict[str, str]:
+        """Get the headers that make a request conditional on these validators."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class ConditionalResponse:
+    """Result of a conditional GET request."""
+    status_code: int
+    text: str = ""
+    validators: Optional[ContentValidators] = None
+
+    @property
+    def not_modified(self) -> bool:
+        """Check whether the resource is unchanged (HTTP 304)."""
+        return self.status_code == 304
+
+    @property
+    def ok(self) -> bool:
+        """Check whether new content was downloaded."""
+        return self.status_code == 200
+
+
+async def get_if_modified(
+    url: str,
+    headers: Dict[str, str],
+    validators: Optional[ContentValidators] = None
+) -> ConditionalResponse:
+    """
+    GET a resource unless it is unchanged since it was last downloaded.
+
+    Args:
+        url: Resource URL
+        headers: Request headers
+        validators: Validators of the copy the caller already has
+
+    Returns:
+        Conditional response; on HTTP 304 the body is empty and the caller's
+        copy is current
+    """
+    if validators:
+        headers = {**headers, **validators.request_headers()}
+
+    response = await graph_request("GET", url, headers=headers)
+
+    if response.status_code == 304:
+        # Servers may refresh validators on 304; keep ours when they do not
+        fresh = ContentValidators.from_headers(response.headers)
+        return ConditionalResponse(status_code=304, validators=fresh or validators)
+    if response.status_code != 200:
+        return ConditionalResponse(status_code=response.status_code)
+    return ConditionalResponse(
+        status_code=200,
+        text=response.text,
+        validators=ContentValidators.from_headers(response.headers)
+    )
@@ -0,0 +1,349 @@
+"""
+Throttling-aware scheduler for Microsoft Graph requests.
+
+Every Graph request goes through one scheduler per event loop, which
+combines three controls:
+
+- A token bucket caps the sustained request rate while allowing short bursts.
+- An additive-increase/multiplicative-decrease (AIMD) limit on concurrent
+  requests grows by about one slot per window of successful requests and is
+  halved when Graph throttles (429, 503, 504).
+- ``Retry-After`` is honored globally: a throttled response pauses all
+  requests, not just the one that was throttled.
+
+Waiting requests are admitted by priority, so interactive requests (chat
+searches) overtake queued background sync traffic. The priority of a
+request comes from the ``graph_priority`` context, which asyncio tasks
+inherit from the code that creates them.
+"""
+
+import asyncio
+import contextvars
+import functools
+import heapq
+import itertools
+import logging
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from enum import IntEnum
+from typing import (Any, AsyncIterator, Awaitable, Callable, Iterator, List,
+                    Mapping, Optional, Tuple, TypeVar)
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Sustained request rate (requests per second) and burst size
+DEFAULT_RATE = 10.0
+DEFAULT_BURST = 20
+
+# AIMD concurrency bounds
+DEFAULT_INITIAL_CONCURRENCY = 4
+DEFAULT_MIN_CONCURRENCY = 1
+DEFAULT_MAX_CONCURRENCY = 16
+CONCURRENCY_DECREASE_FACTOR = 0.5
+
+# Statuses that mean Graph is throttling us
+THROTTLE_STATUSES = {429, 503, 504}
+DEFAULT_MAX_RETRIES = 3
+
+# Backoff (seconds) when Graph sends no Retry-After, doubled per attempt
+DEFAULT_RETRY_AFTER_SECONDS = 1.0
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+class RequestPriority(IntEnum):
+    """Priority of a Graph request; lower values are admitted first."""
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+_priority: contextvars.ContextVar[RequestPriority] = contextvars.ContextVar(
+    "graph_request_priority", default=RequestPriority.INTERACTIVE
+)
+
+
+def current_priority() -> RequestPriority:
+    """Get the priority of Graph requests made in the current context."""
+    return _priority.get()
+
+
+@contextmanager
+def graph_priority(priority: RequestPriority) -> Iterator[None]:
+    """
+    Set the priority of Graph requests made within the block.
+
+    Tasks created within the block inherit the priority.
+
+    Usage::
+
+        with graph_priority(RequestPriority.BACKGROUND):
+            await fetcher.fetch_all_content(user_id)
+    """
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def background_priority(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Decorator running an async function's Graph requests at background priority."""
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        with graph_priority(RequestPriority.BACKGROUND):
+            return await func(*args, **kwargs)
+    return wrapper
+
+
+def retry_after_seconds(headers: Optional[Mapping[str, str]], attempt: int = 0) -> float:
+    """
+    Get the delay requested by a throttled response.
+
+    Args:
+        headers: Response headers
+        attempt: Number of earlier attempts, used for the backoff when the
+            response has no Retry-After header
+
+    Returns:
+        Delay in seconds
+    """
+    try:
+        for name, value in (headers or {}).items():
+            if name.lower() == "retry-after":
+                return min(max(float(value), 0.0), MAX_RETRY_AFTER_SECONDS)
+    except (AttributeError, TypeError, ValueError):
+        pass
+    return min(DEFAULT_RETRY_AFTER_SECONDS * 2 ** attempt, MAX_RETRY_AFTER_SECONDS)
+
+
+class GraphScheduler:
+    """
+    Admission control for Graph requests of one event loop.
+
+    Requests either run through ``run`` (which also retries throttled and
+    failed requests) or hold a ``slot`` while the caller reports the outcome
+    with ``on_success`` / ``on_throttled``.
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        initial_concurrency: int = DEFAULT_INITIAL_CONCURRENCY,
+        min_concurrency: int = DEFAULT_MIN_CONCURRENCY,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Requests that may be sent at once after an idle period
+            initial_concurrency: Concurrent requests allowed at start
+            min_concurrency: Lower bound of the concurrency limit
+            max_concurrency: Upper bound of the concurrency limit
+            max_retries: Times ``run`` retries a throttled or failed request
+            clock: Monotonic clock in seconds
+        """
+        self.rate = rate
+        self.burst = burst
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self._clock = clock
+
+        self._limit = float(min(max(initial_concurrency, min_concurrency), max_concurrency))
+        self._active = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+        self._tokens = float(burst)
+        self._refilled_at = clock()
+        self._paused_until = 0.0
+
+        self.throttled_responses = 0
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return max(self.min_concurrency, int(self._limit))
+
+    @property
+    def active_requests(self) -> int:
+        """Number of requests currently in flight."""
+        return self._active
+
+    @property
+    def paused_for(self) -> float:
+        """Seconds until the current Retry-After pause ends (0 if none)."""
+        return max(0.0, self._paused_until - self._clock())
+
+    async def acquire(self, priority: Optional[RequestPriority] = None) -> None:
+        """
+        Wait for permission to send a request.
+
+        Each successful call must be paired with ``release``.
+
+        Args:
+            priority: Request priority; the context priority if not given
+        """
+        priority = current_priority() if priority is None else priority
+
+        if self._active < self.concurrency_limit and not self._waiters:
+            self._active += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (int(priority), next(self._sequence), waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # The slot was granted as we were cancelled
+                    self.release()
+                raise
+
+        try:
+            await self._wait_for_capacity()
+        except BaseException:
+            self.release()
+            raise
+
+    def release(self) -> None:
+        """Give back a slot taken by ``acquire``."""
+        self._active -= 1
+        self._wake_waiters()
+
+    @asynccontextmanager
+    async def slot(self, priority: Optional[RequestPriority] = None) -> AsyncIterator[None]:
+        """Hold a request slot for the duration of the block."""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def on_success(self) -> None:
+        """Record a request that was not throttled (additive increase)."""
+        if self._limit < self.max_concurrency:
+            self._limit = min(float(self.max_concurrency), self._limit + 1.0 / self._limit)
+            self._wake_waiters()
+
+    def on_throttled(self, delay: float) -> None:
+        """
+        Record a throttled request.
+
+        The concurrency limit is cut once per throttling episode and every
+        request waits until the Retry-After delay has passed.
+
+        Args:
+            delay: Retry-After delay in seconds
+        """
+        self.throttled_responses += 1
+        now = self._clock()
+        if now >= self._paused_until:
+            self._limit = max(float(self.min_concurrency), self._limit * CONCURRENCY_DECREASE_FACTOR)
+            logger.info(f"Graph throttled requests, concurrency limit now {self.concurrency_limit}")
+        self._paused_until = max(self._paused_until, now + delay)
+
+    async def run(
+        self,
+        send: Callable[[], Awaitable[T]],
+        priority: Optional[RequestPriority] = None
+    ) -> T:
+        """
+        Send a request under the scheduler's control.
+
+        Throttled responses are retried after their Retry-After delay, and
+        transport errors after an exponential backoff.
+
+        Args:
+            send: Callable that sends the request and returns the response
+            priority: Request priority; the context priority if not given
+
+        Returns:
+            The response (the last throttled response once retries run out)
+
+        Raises:
+            httpx.TransportError: If the request still fails after the last retry
+        """
+        priority = current_priority() if priority is None else priority
+
+        attempt = 0
+        while True:
+            backoff = 0.0
+            async with self.slot(priority):
+                try:
+                    response = await send()
+                except httpx.TransportError as e:
+                    if attempt == self.max_retries:
+                        raise
+                    backoff = retry_after_seconds(None, attempt)
+                    logger.warning(f"Graph request failed, retrying in {backoff:.1f}s: {e}")
+                else:
+                    if getattr(response, "status_code", None) not in THROTTLE_STATUSES:
+                        self.on_success()
+                        return response
+
+                    delay = retry_after_seconds(getattr(response, "headers", None), attempt)
+                    self.on_throttled(delay)
+                    if attempt == self.max_retries:
+                        logger.warning(f"Graph request still throttled after {self.max_retries} retries")
+                        return response
+                    logger.info(f"Graph request throttled ({response.status_code}), retrying in {delay:.1f}s")
+
+            if backoff:
+                await asyncio.sleep(backoff)
+            attempt += 1
+
+    async def _wait_for_capacity(self) -> None:
+        """Wait out the Retry-After pause and the token bucket."""
+        pause = self._paused_until - self._clock()
+        if pause > 0:
+            await asyncio.sleep(pause)
+
+        wait = self._reserve_token()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def _reserve_token(self) -> float:
+        """
+        Take a token from the bucket.
+
+        The bucket may go into debt; the caller then waits until the token
+        it reserved has been refilled.
+
+        Returns:
+            Seconds to wait before sending
+        """
+        now = self._clock()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+        self._tokens -= 1
+        return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def _wake_waiters(self) -> None:
+        """Admit waiting requests, highest priority first, while slots are free."""
+        while self._waiters and self._active < self.concurrency_limit:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if waiter.done():
+                continue  # Cancelled while waiting
+            self._active += 1
+            waiter.set_result(None)
+
+
+_schedulers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, GraphScheduler]" = weakref.WeakKeyDictionary()
+
+
+def get_graph_scheduler() -> GraphScheduler:
+    """Get the Graph request scheduler of the running event loop."""
+    loop = asyncio.get_running_loop()
+    scheduler = _schedulers.get(loop)
+    if scheduler is None:
+        scheduler = _schedulers[loop] = GraphScheduler()
+    return scheduler
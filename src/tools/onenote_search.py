@@ -9,18 +9,61 @@ import asyncio
 import logging
 import re
 import time
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote, urlencode
 
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 from ..auth.microsoft_auth import AuthenticationError, MicrosoftAuthenticator
 from ..config.logging import log_api_call, log_performance, logged
 from ..config.settings import get_settings
 from ..models.onenote import OneNotePage, SearchResult
+from .graph_batch import BatchRequest, execute_batch, relative_url
+from .graph_client import (ConditionalResponse, ContentValidators,
+                           get_if_modified, graph_request)
 
 logger = logging.getLogger(__name__)
 
+# Server-side field selection: listings return only the fields that are
+# persisted (ids, titles, timestamps, parents and URLs), and parents are
+# expanded inline with just their id and name
+PARENT_SELECT = "$select=id,displayName"
+PAGE_SELECT = "id,title,createdDateTime,lastModifiedDateTime,contentUrl,links"
+PAGE_EXPAND = f"parentSection({PARENT_SELECT}),parentNotebook({PARENT_SELECT})"
+SECTION_SELECT = "id,displayName,lastModifiedDateTime"
+SECTION_EXPAND = f"parentNotebook({PARENT_SELECT})"
+NOTEBOOK_SELECT = "id,displayName,createdDateTime,lastModifiedDateTime,isDefault,links"
+# Page index for change detection: just enough to compare with the cache
+PAGE_INDEX_SELECT = "id,title,lastModifiedDateTime"
+
+# Items per listing response (Graph returns 20 unless asked for more)
+LISTING_PAGE_SIZE = 100
+
+
+def page_fields() -> Dict[str, str]:
+    """Get the $select/$expand query parameters for page requests."""
+    return {"$select": PAGE_SELECT, "$expand": PAGE_EXPAND}
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Make a datetime timezone-aware; naive datetimes are taken as UTC."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def modified_since_filter(since: datetime) -> str:
+    """
+    Build the OData filter for pages modified after a point in time.
+
+    Args:
+        since: Point in time (naive datetimes are taken as UTC)
+
+    Returns:
+        ``$filter`` expression
+    """
+    since = _as_utc(since).astimezone(timezone.utc)
+    return f"lastModifiedDateTime gt {since.strftime('%Y-%m-%dT%H:%M:%SZ')}"
+
 
 class OneNoteSearchError(Exception):
     """Exception raised when OneNote search operations fail."""
@@ -72,11 +115,6 @@ class OneNoteSearchTool:
         self.timeout = self.settings.request_timeout
         self.max_results = self.settings.max_search_results
 
-        # Rate limiting state
-        self._last_request_time = 0.0
-        self._request_count = 0
-        self._rate_limit_window_start = time.time()
-
     def _prepare_search_query(self, natural_query: str) -> str:
         """
         Prepare a natural language query for OneNote search API.
@@ -236,10 +274,6 @@ class OneNoteSearchTool:
             logger.error(f"Search failed: {e}")
             raise OneNoteSearchError(f"Search operation failed: {e}")
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10)
-    )
     async def _search_pages_api(self, query: str, token: str, max_results: int) -> tuple[List[Dict[str, Any]], int]:
         """
         Make API call to search OneNote pages.
@@ -252,8 +286,6 @@ class OneNoteSearchTool:
         Returns:
             Tuple of (pages data, api calls made)
         """
-        await self._enforce_rate_limit()
-
         headers = {
             "Authorization": f"Bearer {token}",
             "Content-Type": "application/json"
@@ -268,40 +300,35 @@ class OneNoteSearchTool:
         params = {
             "$filter": filter_query,
             "$top": min(max_results, 50),  # API limit is 50 per request
-            "$select": "id,title,createdDateTime,lastModifiedDateTime,contentUrl,parentSection,parentNotebook",
-            "$expand": "parentSection,parentNotebook",
+            **page_fields(),
             "$orderby": "lastModifiedDateTime desc"
         }
 
         endpoint = f"{self.base_url}/me/onenote/pages"
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(endpoint, headers=headers, params=params)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    pages = data.get("value", [])
-                    logger.debug(f"API returned {len(pages)} pages")
-                    return pages, 1
-                elif response.status_code == 401:
-                    raise AuthenticationError("Token expired or invalid")
-                elif response.status_code == 403:
-                    raise OneNoteSearchError("Access denied - check OneNote permissions")
-                elif response.status_code == 400:
-                    # Handle "too many sections" error - fallback to section-by-section search
-                    logger.warning(f"Search pages endpoint returned 400, falling back to section-based search for query: {query}")
-                    return await self._search_pages_by_sections(query, token, max_results)
-                elif response.status_code == 429:
-                    # Rate limit exceeded
-                    retry_after = int(response.headers.get("Retry-After", 60))
-                    logger.warning(f"Rate limit exceeded, waiting {retry_after} seconds")
-                    await asyncio.sleep(retry_after)
-                    raise OneNoteSearchError("Rate limit exceeded")
-                else:
-                    error_msg = f"API request failed with status {response.status_code}"
-                    logger.error(f"{error_msg}: {response.text}")
-                    raise OneNoteSearchError(error_msg)
+            response = await graph_request("GET", endpoint, headers=headers, params=params)
+
+            if response.status_code == 200:
+                data = response.json()
+                pages = data.get("value", [])
+                logger.debug(f"API returned {len(pages)} pages")
+                return pages, 1
+            elif response.status_code == 401:
+                raise AuthenticationError("Token expired or invalid")
+            elif response.status_code == 403:
+                raise OneNoteSearchError("Access denied - check OneNote permissions")
+            elif response.status_code == 400:
+                # Handle "too many sections" error - fallback to section-by-section search
+                logger.warning(f"Search pages endpoint returned 400, falling back to section-based search for query: {query}")
+                return await self._search_pages_by_sections(query, token, max_results)
+            elif response.status_code == 429:
+                # Still throttled after the scheduler's retries
+                raise OneNoteSearchError("Rate limit exceeded", status_code=429)
+            else:
+                error_msg = f"API request failed with status {response.status_code}"
+                logger.error(f"{error_msg}: {response.text}")
+                raise OneNoteSearchError(error_msg)
 
         except httpx.TimeoutException:
             raise OneNoteSearchError("Search request timed out")
@@ -313,6 +340,9 @@ class OneNoteSearchTool:
         """
         Fetch content for a list of pages.
 
+        Contents are requested through Graph JSON batching, 20 pages per
+        round trip. If batching fails, pages are fetched one by one.
+
         Args:
             pages: List of pages to fetch content for
             token: Authentication token
@@ -324,33 +354,68 @@ class OneNoteSearchTool:
             return 0
 
         logger.debug(f"Fetching content for {len(pages)} pages")
-        api_calls = 0
 
-        # Fetch content in parallel (with limited concurrency)
-        semaphore = asyncio.Semaphore(3)  # Limit to 3 concurrent requests
+        requests = [
+            BatchRequest(
+                id=str(i),
+                url=f"/me/onenote/pages/{page.id}/content",
+                headers={"Accept": "application/xhtml+xml"}
+            )
+            for i, page in enumerate(pages)
+        ]
+
+        try:
+            responses, api_calls = await execute_batch(requests, token, self.base_url)
+        except Exception as e:
+            logger.warning(f"Batched content fetch failed, fetching pages individually: {e}")
+            return await self._fetch_page_contents_individually(pages, token)
+
+        for i, page in enumerate(pages):
+            response = responses.get(str(i))
+            if response is None or not response.ok:
+                status = response.status if response else "no response"
+                logger.warning(f"Failed to fetch content for page {page.id}: {status}")
+                continue
+
+            content = response.text()
+            if content:
+                page.content = content
+                page.text_content = self._extract_text_from_html(content)
+                page.processed_content = page.text_content  # Use processed text for chunking
+
+        return api_calls
 
+    async def _fetch_page_contents_individually(self, pages: List[OneNotePage], token: str) -> int:
+        """
+        Fetch content for a list of pages with one request per page.
+
+        Args:
+            pages: List of pages to fetch content for
+            token: Authentication token
+
+        Returns:
+            Number of API calls made
+        """
+        api_calls = 0
+
+        # Fetch content in parallel; the Graph request scheduler bounds concurrency
         async def fetch_single_content(page: OneNotePage) -> None:
             nonlocal api_calls
-            async with semaphore:
-                try:
-                    content, calls = await self._fetch_page_content(page.id, token)
-                    if content:
-                        page.content = content
-                        page.text_content = self._extract_text_from_html(content)
-                        page.processed_content = page.text_content  # Use processed text for chunking
-                    api_calls += calls
-                except Exception as e:
-                    logger.warning(f"Failed to fetch content for page {page.id}: {e}")
+            try:
+                content, calls = await self._fetch_page_content(page.id, token)
+                if content:
+                    page.content = content
+                    page.text_content = self._extract_text_from_html(content)
+                    page.processed_content = page.text_content  # Use processed text for chunking
+                api_calls += calls
+            except Exception as e:
+                logger.warning(f"Failed to fetch content for page {page.id}: {e}")
 
         # Execute all content fetches
         await asyncio.gather(*[fetch_single_content(page) for page in pages], return_exceptions=True)
 
         return api_calls
 
-    @retry(
-        stop=stop_after_attempt(2),
-        wait=wait_exponential(multiplier=1, min=2, max=5)
-    )
     async def _fetch_page_content(self, page_id: str, token: str) -> tuple[Optional[str], int]:
         """
         Fetch content for a specific page.
@@ -362,8 +427,6 @@ class OneNoteSearchTool:
         Returns:
             Tuple of (page content HTML, api calls made)
         """
-        await self._enforce_rate_limit()
-
         headers = {
             "Authorization": f"Bearer {token}",
             "Accept": "application/xhtml+xml"
@@ -372,19 +435,18 @@ class OneNoteSearchTool:
         endpoint = f"{self.base_url}/me/onenote/pages/{page_id}/content"
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(endpoint, headers=headers)
-
-                if response.status_code == 200:
-                    return response.text, 1
-                elif response.status_code == 401:
-                    raise AuthenticationError("Token expired or invalid")
-                elif response.status_code == 404:
-                    logger.warning(f"Page {page_id} not found")
-                    return None, 1
-                else:
-                    logger.warning(f"Failed to fetch content for page {page_id}: {response.status_code}")
-                    return None, 1
+            response = await graph_request("GET", endpoint, headers=headers)
+
+            if response.status_code == 200:
+                return response.text, 1
+            elif response.status_code == 401:
+                raise AuthenticationError("Token expired or invalid")
+            elif response.status_code == 404:
+                logger.warning(f"Page {page_id} not found")
+                return None, 1
+            else:
+                logger.warning(f"Failed to fetch content for page {page_id}: {response.status_code}")
+                return None, 1
 
         except httpx.TimeoutException:
             logger.warning(f"Timeout fetching content for page {page_id}")
@@ -393,6 +455,44 @@ class OneNoteSearchTool:
             logger.warning(f"Error fetching content for page {page_id}: {e}")
             return None, 1
 
+    async def _fetch_page_content_if_modified(
+        self,
+        page_id: str,
+        token: str,
+        validators: Optional[ContentValidators] = None
+    ) -> ConditionalResponse:
+        """
+        Fetch content for a page unless it is unchanged.
+
+        Sends If-None-Match / If-Modified-Since built from the validators of
+        the caller's copy; an HTTP 304 response carries no body.
+
+        Args:
+            page_id: OneNote page ID
+            token: Authentication token
+            validators: Validators stored with the caller's copy of the content
+
+        Returns:
+            Conditional response with the content and its new validators
+
+        Raises:
+            AuthenticationError: If the token is expired or invalid
+        """
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/xhtml+xml"
+        }
+        endpoint = f"{self.base_url}/me/onenote/pages/{page_id}/content"
+
+        response = await get_if_modified(endpoint, headers, validators)
+        if response.status_code == 401:
+            raise AuthenticationError("Token expired or invalid")
+        if response.not_modified:
+            logger.debug(f"Content of page {page_id} not modified")
+        elif not response.ok:
+            logger.warning(f"Failed to fetch content for page {page_id}: {response.status_code}")
+        return response
+
     def _extract_text_from_html(self, html_content: str) -> str:
         """
         Extract text content from OneNote HTML.
@@ -446,25 +546,6 @@ class OneNoteSearchTool:
             logger.warning(f"Failed to extract text from HTML: {e}")
             return ""
 
-    async def _enforce_rate_limit(self) -> None:
-        """
-        Simple rate limiting to respect Microsoft Graph API limits.
-
-        Note: With local cache as primary search, API usage should be minimal.
-        This is a simplified version for the remaining API fallback calls.
-        """
-        current_time = time.time()
-
-        # Simple delay between API calls
-        time_since_last = current_time - self._last_request_time
-        min_delay = 0.1  # 100ms delay between API calls
-
-        if time_since_last < min_delay:
-            await asyncio.sleep(min_delay - time_since_last)
-
-        self._request_count += 1
-        self._last_request_time = time.time()
-
     async def get_recent_pages(self, limit: int = 10) -> List[OneNotePage]:
         """
         Get recently modified OneNote pages with content.
@@ -488,42 +569,40 @@ class OneNoteSearchTool:
 
             params = {
                 "$top": min(limit, 50),
-                "$select": "id,title,createdDateTime,lastModifiedDateTime,contentUrl,parentSection,parentNotebook",
-                "$expand": "parentSection,parentNotebook",
+                **page_fields(),
                 "$orderby": "lastModifiedDateTime desc"
             }
 
             endpoint = f"{self.base_url}/me/onenote/pages"
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(endpoint, headers=headers, params=params)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    pages_data = data.get("value", [])
-
-                    pages = []
-                    for page_data in pages_data:
-                        try:
-                            page = OneNotePage(**page_data)
-                            pages.append(page)
-                        except Exception as e:
-                            logger.warning(f"Failed to parse page data: {e}")
-                            continue
-
-                    # Fetch content for all pages
-                    if pages:
-                        logger.debug(f"Fetching content for {len(pages)} recent pages")
-                        await self._fetch_page_contents(pages, token)
-
-                    return pages
-                elif response.status_code == 400:
-                    # Fallback for tenants with too many sections: use section-by-section retrieval
-                    logger.warning(f"Recent pages endpoint returned 400, falling back to section-based retrieval")
-                    # Use optimized fallback that respects the original limit
-                    return await self._get_recent_pages_fallback(limit)
-                else:
-                    raise OneNoteSearchError(f"Failed to get recent pages: {response.status_code}")
+            response = await graph_request("GET", endpoint, headers=headers, params=params)
+
+            if response.status_code == 200:
+                data = response.json()
+                pages_data = data.get("value", [])
+
+                pages = []
+                for page_data in pages_data:
+                    try:
+                        page = OneNotePage(**page_data)
+                        pages.append(page)
+                    except Exception as e:
+                        logger.warning(f"Failed to parse page data: {e}")
+                        continue
+
+                # Fetch content for all pages
+                if pages:
+                    logger.debug(f"Fetching content for {len(pages)} recent pages")
+                    await self._fetch_page_contents(pages, token)
+
+                return pages
+            elif response.status_code == 400:
+                # Fallback for tenants with too many sections: use section-by-section retrieval
+                logger.warning(f"Recent pages endpoint returned 400, falling back to section-based retrieval")
+                # Use optimized fallback that respects the original limit
+                return await self._get_recent_pages_fallback(limit)
+            else:
+                raise OneNoteSearchError(f"Failed to get recent pages: {response.status_code}")
 
         except AuthenticationError:
             raise OneNoteSearchError("Authentication failed - please log in again")
@@ -537,7 +616,8 @@ class OneNoteSearchTool:
 
         This method uses section-by-section retrieval but with several optimizations:
         1. Fetches only metadata initially (no content)
-        2. Limits total pages processed to avoid rate limiting
+        2. Lists only the newest pages of each section, batched 20 sections
+           per request
         3. Only fetches content for the final limited set
 
         Args:
@@ -558,39 +638,12 @@ class OneNoteSearchTool:
             if not sections:
                 return []
 
-            all_pages = []
-            pages_processed = 0
-            # Process sections but limit total pages to avoid rate limits
-            max_pages_to_process = min(50, limit * 3)  # Process up to 3x the requested limit
-
-            for i, section in enumerate(sections):
-                section_id = section.get("id")
-                section_name = section.get("displayName", "Unknown")
-
-                try:
-                    logger.debug(f"Getting pages from section: {section_name} ({i+1}/{len(sections)})")
-
-                    # Get pages metadata only (no content yet)
-                    section_pages = await self._get_pages_from_section(
-                        section_id, token, max_pages_to_process - pages_processed
-                    )
-
-                    if section_pages:
-                        all_pages.extend(section_pages)
-                        pages_processed += len(section_pages)
-                        logger.debug(f"Retrieved {len(section_pages)} pages from section '{section_name}'")
-
-                    # Stop if we have enough pages to choose from
-                    if pages_processed >= max_pages_to_process:
-                        logger.debug(f"Reached processing limit of {max_pages_to_process} pages")
-                        break
-
-                    # Small delay between sections to respect API limits
-                    await asyncio.sleep(0.1)  # Reduced delay for fallback
-
-                except Exception as e:
-                    logger.warning(f"Failed to get pages from section '{section_name}': {e}")
-                    continue
+            # Listings are ordered newest first, so the newest pages overall
+            # are among the first `limit` pages of each section
+            pages_by_section = await self._get_pages_from_sections(
+                [section.get("id") for section in sections], token, limit, follow_next_links=False
+            )
+            all_pages = [page for section_pages in pages_by_section.values() for page in section_pages]
 
             # Sort by last modified date (newest first) and limit
             all_pages.sort(key=lambda p: p.last_modified_date_time, reverse=True)
@@ -610,7 +663,7 @@ class OneNoteSearchTool:
             # Return empty list rather than failing completely
             return []
 
-    async def get_all_pages(self, limit: Optional[int] = None) -> List[OneNotePage]:
+    async def get_all_pages(self, limit: Optional[int] = None, include_content: bool = True) -> List[OneNotePage]:
         """
         Get all OneNote pages from all notebooks using section-by-section approach.
 
@@ -619,9 +672,11 @@ class OneNoteSearchTool:
 
         Args:
             limit: Optional maximum number of pages to return
+            include_content: Also fetch page content; callers that fetch
+                content conditionally themselves pass False
 
         Returns:
-            List of all pages from all notebooks with content loaded
+            List of all pages from all notebooks (with content loaded if requested)
 
         Raises:
             OneNoteSearchError: If operation fails
@@ -638,60 +693,27 @@ class OneNoteSearchTool:
                 logger.warning("No sections found in any notebooks")
                 return []
 
-            all_pages = []
-            pages_fetched = 0
-
-            # Get pages from each section
-            for i, section in enumerate(sections):
-                section_id = section.get("id")
-                section_name = section.get("displayName", "Unknown")
-
-                try:
-                    logger.debug(f"Getting pages from section: {section_name} ({i+1}/{len(sections)})")
-
-                    # Get pages for this specific section
-                    section_pages = await self._get_pages_from_section(section_id, token, limit)
-
-                    if section_pages:
-                        all_pages.extend(section_pages)
-                        pages_fetched += len(section_pages)
-                        logger.debug(f"Retrieved {len(section_pages)} pages from section '{section_name}'")
-
-                    # Stop if we've reached the limit
-                    if limit and pages_fetched >= limit:
-                        all_pages = all_pages[:limit]  # Trim to exact limit
-                        break
+            # Get pages from all sections with batched listing requests
+            pages_by_section = await self._get_pages_from_sections(
+                [section.get("id") for section in sections], token, limit
+            )
 
-                    # Small delay between sections to respect API limits
-                    await asyncio.sleep(0.2)
+            all_pages = []
+            for section in sections:
+                all_pages.extend(pages_by_section.get(section.get("id"), []))
 
-                except Exception as e:
-                    logger.warning(f"Failed to get pages from section '{section_name}': {e}")
-                    continue
+            # Sort by last modified date (newest first); each section listed
+            # its newest pages, so a limit keeps the newest pages overall
+            all_pages.sort(key=lambda p: p.last_modified_date_time, reverse=True)
+            if limit:
+                all_pages = all_pages[:limit]  # Trim to exact limit
 
             logger.info(f"Retrieved {len(all_pages)} pages from {len(sections)} sections")
 
-            # Sort by last modified date (newest first)
-            all_pages.sort(key=lambda p: p.last_modified_date_time, reverse=True)
-
-            # Fetch content for pages in batches to avoid overwhelming the API
-            if all_pages:
+            # Fetch content for all pages; requests are batched 20 per round trip
+            if all_pages and include_content:
                 logger.info(f"Fetching content for {len(all_pages)} pages...")
-
-                # Process in smaller batches to manage memory and API limits
-                batch_size = 10
-                for i in range(0, len(all_pages), batch_size):
-                    batch = all_pages[i:i + batch_size]
-                    await self._fetch_page_contents(batch, token)
-
-                    # Progress logging for large operations
-                    if len(all_pages) > 20:
-                        progress = min(i + batch_size, len(all_pages))
-                        logger.info(f"Content fetched for {progress}/{len(all_pages)} pages")
-
-                    # Small delay between batches to respect API limits
-                    if i + batch_size < len(all_pages):
-                        await asyncio.sleep(0.5)
+                await self._fetch_page_contents(all_pages, token)
 
             return all_pages
 
@@ -721,8 +743,9 @@ class OneNoteSearchTool:
             }
 
             params = {
-                "$select": "id,displayName,parentNotebook",
-                "$expand": "parentNotebook"
+                "$select": SECTION_SELECT,
+                "$expand": SECTION_EXPAND,
+                "$top": LISTING_PAGE_SIZE
             }
 
             endpoint = f"{self.base_url}/me/onenote/sections"
@@ -731,24 +754,23 @@ class OneNoteSearchTool:
 
             # Handle pagination
             while True:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    if next_url:
-                        response = await client.get(next_url, headers=headers)
-                    else:
-                        response = await client.get(endpoint, headers=headers, params=params)
-
-                    if response.status_code == 200:
-                        data = response.json()
-                        sections_data = data.get("value", [])
-                        all_sections.extend(sections_data)
-
-                        # Check for more sections (pagination)
-                        next_url = data.get("@odata.nextLink")
-                        if not next_url:
-                            break
-                    else:
-                        logger.error(f"Failed to get sections: HTTP {response.status_code}")
-                        raise OneNoteSearchError(f"Failed to get sections: {response.status_code}")
+                if next_url:
+                    response = await graph_request("GET", next_url, headers=headers)
+                else:
+                    response = await graph_request("GET", endpoint, headers=headers, params=params)
+
+                if response.status_code == 200:
+                    data = response.json()
+                    sections_data = data.get("value", [])
+                    all_sections.extend(sections_data)
+
+                    # Check for more sections (pagination)
+                    next_url = data.get("@odata.nextLink")
+                    if not next_url:
+                        break
+                else:
+                    logger.error(f"Failed to get sections: HTTP {response.status_code}")
+                    raise OneNoteSearchError(f"Failed to get sections: {response.status_code}")
 
             return all_sections
 
@@ -778,51 +800,46 @@ class OneNoteSearchTool:
             }
 
             params = {
-                "$select": "id,title,createdDateTime,lastModifiedDateTime,contentUrl,parentSection,parentNotebook",
-                "$expand": "parentSection,parentNotebook",
-                "$orderby": "lastModifiedDateTime desc"
+                **page_fields(),
+                "$orderby": "lastModifiedDateTime desc",
+                "$top": min(remaining_limit or LISTING_PAGE_SIZE, LISTING_PAGE_SIZE)
             }
 
-            # Add limit if specified
-            if remaining_limit:
-                params["$top"] = min(remaining_limit, 50)  # API limit per request
-
             endpoint = f"{self.base_url}/me/onenote/sections/{section_id}/pages"
             section_pages = []
             next_url = None
 
             # Handle pagination within the section
             while True:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    if next_url:
-                        response = await client.get(next_url, headers=headers)
-                    else:
-                        response = await client.get(endpoint, headers=headers, params=params)
-
-                    if response.status_code == 200:
-                        data = response.json()
-                        pages_data = data.get("value", [])
-
-                        # Convert to OneNotePage models
-                        for page_data in pages_data:
-                            try:
-                                page = OneNotePage(**page_data)
-                                section_pages.append(page)
-
-                                # Stop if we've reached the limit
-                                if remaining_limit and len(section_pages) >= remaining_limit:
-                                    break
-                            except Exception as e:
-                                logger.warning(f"Failed to parse page data: {e}")
-                                continue
-
-                        # Check for more pages in this section
-                        next_url = data.get("@odata.nextLink")
-                        if not next_url or (remaining_limit and len(section_pages) >= remaining_limit):
-                            break
-                    else:
-                        logger.warning(f"Failed to get pages from section {section_id}: HTTP {response.status_code}")
-                        break  # Continue with next section instead of failing completely
+                if next_url:
+                    response = await graph_request("GET", next_url, headers=headers)
+                else:
+                    response = await graph_request("GET", endpoint, headers=headers, params=params)
+
+                if response.status_code == 200:
+                    data = response.json()
+                    pages_data = data.get("value", [])
+
+                    # Convert to OneNotePage models
+                    for page_data in pages_data:
+                        try:
+                            page = OneNotePage(**page_data)
+                            section_pages.append(page)
+
+                            # Stop if we've reached the limit
+                            if remaining_limit and len(section_pages) >= remaining_limit:
+                                break
+                        except Exception as e:
+                            logger.warning(f"Failed to parse page data: {e}")
+                            continue
+
+                    # Check for more pages in this section
+                    next_url = data.get("@odata.nextLink")
+                    if not next_url or (remaining_limit and len(section_pages) >= remaining_limit):
+                        break
+                else:
+                    logger.warning(f"Failed to get pages from section {section_id}: HTTP {response.status_code}")
+                    break  # Continue with next section instead of failing completely
 
             return section_pages
 
@@ -830,6 +847,203 @@ class OneNoteSearchTool:
             logger.warning(f"Failed to get pages from section {section_id}: {e}")
             return []  # Return empty list to continue with other sections
 
+    async def _list_section_pages(
+        self,
+        section_id: str,
+        token: str,
+        next_url: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Get one listing page of a section's pages.
+
+        Unlike ``_get_pages_from_section``, the listing cursor is returned to
+        the caller, so a sync can record it and resume from it later.
+
+        Args:
+            section_id: Section ID to get pages from
+            token: Authentication token
+            next_url: Cursor (``@odata.nextLink``) of the listing page to get;
+                the first listing page if not given
+
+        Returns:
+            Tuple of (page dictionaries, cursor of the next listing page or
+            None if this was the last)
+
+        Raises:
+            OneNoteSearchError: If the listing request fails
+        """
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json"
+        }
+
+        if next_url:
+            response = await graph_request("GET", next_url, headers=headers)
+        else:
+            params = {
+                **page_fields(),
+                "$orderby": "lastModifiedDateTime desc",
+                "$top": LISTING_PAGE_SIZE
+            }
+            endpoint = f"{self.base_url}/me/onenote/sections/{section_id}/pages"
+            response = await graph_request("GET", endpoint, headers=headers, params=params)
+
+        if response.status_code != 200:
+            raise OneNoteSearchError(
+                f"Failed to get pages from section {section_id}: HTTP {response.status_code}",
+                status_code=response.status_code
+            )
+
+        data = response.json()
+        return data.get("value", []), data.get("@odata.nextLink")
+
+    async def _list_section_page_index(
+        self,
+        section_id: str,
+        token: str,
+        modified_since: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List the IDs, titles and modification times of a section's pages.
+
+        This is the lightweight listing used for change detection: no
+        parents are expanded, and with ``modified_since`` Graph filters the
+        pages server side. If the filter is rejected, all pages are listed
+        and filtered here.
+
+        Args:
+            section_id: Section ID to list pages of
+            token: Authentication token
+            modified_since: Only list pages modified after this time
+
+        Returns:
+            Page dictionaries with id, title and lastModifiedDateTime
+
+        Raises:
+            OneNoteSearchError: If the listing fails
+        """
+        endpoint = f"{self.base_url}/me/onenote/sections/{section_id}/pages"
+        params: Dict[str, Any] = {"$select": PAGE_INDEX_SELECT, "$top": LISTING_PAGE_SIZE}
+        if modified_since is None:
+            return await self._list_all_values(endpoint, token, params)
+
+        try:
+            return await self._list_all_values(
+                endpoint, token, {**params, "$filter": modified_since_filter(modified_since)}
+            )
+        except OneNoteSearchError as e:
+            if e.status_code != 400:
+                raise
+            logger.info(f"Modification filter not supported for section {section_id}, filtering locally")
+
+        since = _as_utc(modified_since)
+        pages = await self._list_all_values(endpoint, token, params)
+        return [
+            page for page in pages
+            if page.get("lastModifiedDateTime") and _as_utc(
+                datetime.fromisoformat(page["lastModifiedDateTime"].replace("Z", "+00:00"))
+            ) > since
+        ]
+
+    async def _list_all_values(self, endpoint: str, token: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Get all items of a listing, following its next links.
+
+        Args:
+            endpoint: Listing URL
+            token: Authentication token
+            params: Query parameters of the first request
+
+        Returns:
+            Items of all listing pages
+
+        Raises:
+            OneNoteSearchError: If a listing request fails
+        """
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json"
+        }
+
+        values: List[Dict[str, Any]] = []
+        response = await graph_request("GET", endpoint, headers=headers, params=params)
+        while True:
+            if response.status_code != 200:
+                raise OneNoteSearchError(
+                    f"Listing request failed: HTTP {response.status_code}",
+                    status_code=response.status_code
+                )
+            data = response.json()
+            values.extend(data.get("value", []))
+
+            next_url = data.get("@odata.nextLink")
+            if not next_url:
+                return values
+            response = await graph_request("GET", next_url, headers=headers)
+
+    async def _get_pages_from_sections(
+        self,
+        section_ids: List[str],
+        token: str,
+        remaining_limit: Optional[int] = None,
+        follow_next_links: bool = True
+    ) -> Dict[str, List[OneNotePage]]:
+        """
+        Get the pages of several sections with batched listing requests.
+
+        Section listings (and their follow-up pages) are requested through
+        Graph JSON batching, 20 listings per round trip.
+
+        Args:
+            section_ids: Section IDs to get pages from
+            token: Authentication token
+            remaining_limit: Optional maximum number of pages per section
+            follow_next_links: Also request further listing pages; when False
+                only the first (newest) pages of each section are returned
+
+        Returns:
+            Dictionary mapping section ID to its pages (empty if the listing failed)
+        """
+        params = {
+            **page_fields(),
+            "$orderby": "lastModifiedDateTime desc",
+            "$top": min(remaining_limit or LISTING_PAGE_SIZE, LISTING_PAGE_SIZE)
+        }
+        query = urlencode(params, safe="$,", quote_via=quote)
+
+        pages_by_section: Dict[str, List[OneNotePage]] = {section_id: [] for section_id in section_ids}
+        pending = {
+            section_id: f"/me/onenote/sections/{section_id}/pages?{query}"
+            for section_id in section_ids
+        }
+
+        while pending:
+            requests = [BatchRequest(id=section_id, url=url) for section_id, url in pending.items()]
+            responses, _ = await execute_batch(requests, token, self.base_url)
+            pending = {}
+
+            for section_id, response in responses.items():
+                if not response.ok:
+                    logger.warning(f"Failed to get pages from section {section_id}: HTTP {response.status}")
+                    continue
+
+                data = response.json() or {}
+                section_pages = pages_by_section[section_id]
+                for page_data in data.get("value", []):
+                    try:
+                        section_pages.append(OneNotePage(**page_data))
+                    except Exception as e:
+                        logger.warning(f"Failed to parse page data: {e}")
+
+                if remaining_limit and len(section_pages) >= remaining_limit:
+                    del section_pages[remaining_limit:]
+                    continue
+                next_url = data.get("@odata.nextLink")
+                if next_url and follow_next_links:
+                    pending[section_id] = relative_url(next_url, self.base_url)
+
+        return pages_by_section
+
     async def get_notebooks(self) -> List[Dict[str, Any]]:
         """
         Get list of OneNote notebooks.
@@ -849,19 +1063,19 @@ class OneNoteSearchTool:
             }
 
             params = {
-                "$select": "id,displayName,createdDateTime,lastModifiedDateTime,isDefault"
+                "$select": NOTEBOOK_SELECT,
+                "$top": LISTING_PAGE_SIZE
             }
 
             endpoint = f"{self.base_url}/me/onenote/notebooks"
 
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(endpoint, headers=headers, params=params)
+            response = await graph_request("GET", endpoint, headers=headers, params=params)
 
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get("value", [])
-                else:
-                    raise OneNoteSearchError(f"Failed to get notebooks: {response.status_code}")
+            if response.status_code == 200:
+                data = response.json()
+                return data.get("value", [])
+            else:
+                raise OneNoteSearchError(f"Failed to get notebooks: {response.status_code}")
 
         except AuthenticationError:
             raise OneNoteSearchError("Authentication failed - please log in again")
@@ -0,0 +1,115 @@
+"""
+Benchmark for cache JSON serialization.
+
+Compares the previous approach (stdlib ``json`` with ``indent=2`` and
+``default=str``, then ``Model(**data)``) against ``src.storage.serialization``
+for the documents the cache reads and writes most often.
+
+Run with::
+
+    python -m tests.benchmarks.bench_serialization [iterations]
+"""
+
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict
+
+from src.models.cache import AssetInfo, CachedPageMetadata, CacheMetadata
+from src.storage import serialization
+from src.storage.async_io import atomic_write_bytes
+
+
+def _page_metadata() -> CachedPageMetadata:
+    """Build representative page metadata with a few attachments."""
+    now = datetime.utcnow()
+    return CachedPageMetadata(
+        id="1-abcdef0123456789!42",
+        title="Quarterly planning notes",
+        created_date_time=now,
+        last_modified_date_time=now,
+        parent_section={"id": "section-1", "name": "Planning"},
+        parent_notebook={"id": "notebook-1", "name": "Work"},
+        content_url="https://graph.microsoft.com/v1.0/me/onenote/pages/1-abcdef/content",
+        local_content_path="/cache/users/u/notebooks/n/sections/s/pages/p/content.md",
+        local_html_path="/cache/users/u/notebooks/n/sections/s/pages/p/original.html",
+        attachments=[
+            AssetInfo(
+                type="image",
+                original_url=f"https://graph.microsoft.com/v1.0/me/onenote/resources/{i}/$value",
+                local_path=f"/cache/users/u/notebooks/n/sections/s/pages/p/attachments/images/{i}.png",
+                filename=f"{i}.png",
+                size_bytes=20480,
+                mime_type="image/png"
+            )
+            for i in range(5)
+        ]
+    )
+
+
+def _time(label: str, func: Callable[[], object], iterations: int) -> float:
+    """Run a function repeatedly and report operations per second."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed = time.perf_counter() - start
+    rate = iterations / elapsed
+    print(f"  {label:<28} {rate:>12,.0f} ops/s")
+    return rate
+
+
+def _compare(name: str, model, iterations: int, directory: Path) -> Dict[str, float]:
+    """Benchmark storing and loading one model both ways."""
+    model_cls = type(model)
+    legacy_path = directory / f"{name}.legacy.json"
+    new_path = directory / f"{name}.json"
+
+    def legacy_store():
+        with open(legacy_path, "w", encoding="utf-8") as f:
+            json.dump(model.model_dump(), f, indent=2, default=str)
+
+    def legacy_load():
+        with open(legacy_path, "r", encoding="utf-8") as f:
+            return model_cls(**json.load(f))
+
+    def new_store():
+        atomic_write_bytes(new_path, serialization.dumps(model))
+
+    def new_load():
+        return serialization.load_model(model_cls, new_path.read_bytes())
+
+    print(f"{name}:")
+    results = {
+        "legacy_store": _time("store (json, indent=2)", legacy_store, iterations),
+        "new_store": _time("store (serialization)", new_store, iterations),
+        "legacy_load": _time("load (json + Model(**))", legacy_load, iterations),
+        "new_load": _time("load (serialization)", new_load, iterations),
+    }
+    print(f"  size: {legacy_path.stat().st_size} -> {new_path.stat().st_size} bytes")
+    print(f"  store speedup x{results['new_store'] / results['legacy_store']:.1f}, "
+          f"load speedup x{results['new_load'] / results['legacy_load']:.1f}")
+    return results
+
+
+def main(iterations: int = 2000) -> None:
+    """Run the serialization benchmark."""
+    encoder = "orjson" if serialization.orjson is not None else "json (orjson not installed)"
+    print(f"Encoder: {encoder}, iterations: {iterations}\n")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        directory = Path(temp_dir)
+        _compare("page metadata.json", _page_metadata(), iterations, directory)
+        print()
+        _compare(
+            "cache_metadata.json",
+            CacheMetadata(user_id="user@example.com", cache_root_path="/cache"),
+            iterations,
+            directory
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
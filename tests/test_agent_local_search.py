@@ -101,6 +101,25 @@ class TestOneNoteAgentLocalSearch:
             # Always cleanup to prevent database file locking
             await agent.cleanup()
 
+    async def test_agent_runs_background_index_maintenance(self, agent_with_mocks):
+        """Test that index maintenance runs for the agent's lifetime."""
+        agent = agent_with_mocks
+
+        try:
+            agent.cache_manager.cache_root.mkdir(parents=True, exist_ok=True)
+            await agent.initialize()
+
+            maintainer = agent._search_maintainer
+            assert maintainer is not None
+            assert maintainer.local_search is agent.local_search
+            task = maintainer._background_task
+            assert task is not None and not task.done()
+        finally:
+            await agent.cleanup()
+
+        assert task.cancelled()
+        assert agent._search_maintainer is None
+
     async def test_agent_initialization_without_cache(self, mock_settings):
         """Test agent initialization when no cache is available."""
         agent = OneNoteAgent(mock_settings)
@@ -155,7 +174,7 @@ class TestOneNoteAgentLocalSearch:
                 )
             )
 
-            agent.local_search.search = AsyncMock(return_value=[mock_local_result])
+            agent.local_search.search_page = AsyncMock(return_value=([mock_local_result], None))
 
             # Perform search
             response = await agent.search_pages("test query", 5)
@@ -169,11 +188,37 @@ class TestOneNoteAgentLocalSearch:
             assert response.metadata["api_calls"] == 0
 
             # Verify local search was called
-            agent.local_search.search.assert_called_once_with("test query", limit=5)
+            agent.local_search.search_page.assert_called_once()
+            assert agent.local_search.search_page.call_args.kwargs["limit"] == 5
         finally:
             # Always cleanup
             await agent.cleanup()
 
+    async def test_search_stops_after_first_result_page(self, agent_with_mocks, sample_cached_page):
+        """Test the agent only reads as many local results as it returns."""
+        agent = agent_with_mocks
+
+        try:
+            agent.cache_manager.cache_root.mkdir(parents=True, exist_ok=True)
+            await agent.initialize()
+
+            for i in range(6):
+                page = sample_cached_page.model_copy(deep=True)
+                page.metadata.id = f"test-page-{i:03d}"
+                await agent.local_search.index_page(page)
+
+            with patch.object(
+                agent.local_search, "search_page", wraps=agent.local_search.search_page
+            ) as search_page:
+                response = await agent.search_pages("test", 2)
+
+            assert response.metadata["search_method"] == "local_cache"
+            assert len(response.sources) == 2
+            search_page.assert_awaited_once()
+            assert search_page.call_args.kwargs["limit"] == 2
+        finally:
+            await agent.cleanup()
+
     async def test_search_fallback_to_api(self, agent_with_mocks):
         """Test search fallback to API when local search fails or returns no results."""
         agent = agent_with_mocks
@@ -184,7 +229,7 @@ class TestOneNoteAgentLocalSearch:
             await agent.initialize()
 
             # Mock local search to return no results
-            agent.local_search.search = AsyncMock(return_value=[])
+            agent.local_search.search_page = AsyncMock(return_value=([], None))
 
             # Mock API search tool
             from src.models.onenote import SearchResult
@@ -215,7 +260,8 @@ class TestOneNoteAgentLocalSearch:
             assert response.metadata["api_calls"] == 1
 
             # Verify both searches were called
-            agent.local_search.search.assert_called_once_with("test query", limit=5)
+            agent.local_search.search_page.assert_called_once()
+            assert agent.local_search.search_page.call_args.kwargs["limit"] == 5
             agent.search_tool.search_pages.assert_called_once_with("test query", 5)
         finally:
             # Always cleanup
@@ -329,7 +375,7 @@ class TestOneNoteAgentLocalSearch:
 
         # Mock local search to raise error
         from src.storage.local_search import LocalSearchError
-        agent.local_search.search = AsyncMock(side_effect=LocalSearchError("Database error"))
+        agent.local_search.search_page = AsyncMock(side_effect=LocalSearchError("Database error"))
 
         # Mock API search tool
         from src.models.onenote import SearchResult
@@ -359,5 +405,5 @@ class TestOneNoteAgentLocalSearch:
         assert response.metadata["search_method"] == "api"
 
         # Verify both searches were attempted
-        agent.local_search.search.assert_called_once()
+        agent.local_search.search_page.assert_called_once()
         agent.search_tool.search_pages.assert_called_once()
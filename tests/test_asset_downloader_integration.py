@@ -11,6 +11,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from src.storage.asset_downloader import AssetDownloadManager, extract_assets_from_html
+from src.storage.asset_store import AssetBlobStore
 from src.models.cache import AssetInfo, DownloadStatus
 
 
@@ -80,7 +81,7 @@ class TestAssetDownloadManagerIntegration:
         """Test async context manager functionality."""
         async with AssetDownloadManager() as manager:
             assert manager.session is not None
-            # Session should be an aiohttp ClientSession
+            # Session is the shared Graph HTTP client
             assert hasattr(manager.session, 'get')
 
     @pytest.mark.asyncio
@@ -101,7 +102,7 @@ class TestAssetDownloadManagerIntegration:
         
         # Mock successful HTTP response with proper async iterator
         mock_response = MagicMock()
-        mock_response.status = 200
+        mock_response.status_code = 200
         mock_response.headers = {
             'content-type': 'image/jpeg',
             'content-length': '1024'
@@ -113,10 +114,10 @@ class TestAssetDownloadManagerIntegration:
             for chunk in chunks:
                 yield chunk
         
-        mock_response.content.iter_chunked = mock_chunk_iterator
+        mock_response.aiter_bytes = mock_chunk_iterator
         
         async with AssetDownloadManager() as manager:
-            with patch.object(manager.session, 'get') as mock_get:
+            with patch.object(manager.session, 'stream') as mock_get:
                 mock_get.return_value.__aenter__.return_value = mock_response
                 
                 result = await manager.download_single_asset(asset, temp_dir / "attachments")
@@ -130,6 +131,56 @@ class TestAssetDownloadManagerIntegration:
                 assert local_path.exists()
                 assert local_path.stat().st_size > 0
 
+    @pytest.mark.asyncio
+    async def test_download_deduplicates_into_asset_store(self, temp_dir, sample_assets):
+        """Test identical assets are stored once and known URLs are not fetched again."""
+        store = AssetBlobStore(temp_dir / "assets")
+        image, other_image, document = sample_assets[0], sample_assets[1], sample_assets[2]
+        bodies = {document.original_url: b'pdf-bytes'}
+
+        def make_response(url):
+            response = MagicMock()
+            response.status_code = 200
+            # Servers may send the same opaque ETag for unrelated resources
+            response.headers = {'content-type': 'image/png', 'etag': 'W/"1"'}
+
+            async def chunks(chunk_size):
+                yield bodies.get(url, b'logo-bytes')
+
+            response.aiter_bytes = chunks
+            return response
+
+        async with AssetDownloadManager(asset_store=store) as manager:
+            with patch.object(manager.session, 'stream') as mock_get:
+                mock_get.side_effect = lambda method, url, **kwargs: MagicMock(
+                    __aenter__=AsyncMock(return_value=make_response(url)),
+                    __aexit__=AsyncMock(return_value=False)
+                )
+
+                first = await manager.download_single_asset(image, temp_dir / "page1" / "attachments")
+                # Same URL on another page: linked without an HTTP request
+                second = await manager.download_single_asset(
+                    image.model_copy(), temp_dir / "page2" / "attachments"
+                )
+                assert mock_get.call_count == 1
+
+                # Different URL, same content: downloaded, but stored once
+                third = await manager.download_single_asset(
+                    other_image, temp_dir / "page3" / "attachments"
+                )
+                # Different URL, same ETag, different content: stored separately
+                fourth = await manager.download_single_asset(
+                    document, temp_dir / "page4" / "attachments"
+                )
+                assert mock_get.call_count == 3
+
+        assert first['sha256'] == second['sha256'] == third['sha256']
+        assert second['cached']
+        assert Path(second['local_path']).read_bytes() == b'logo-bytes'
+        assert Path(fourth['local_path']).read_bytes() == b'pdf-bytes'
+        assert store.stats()['blobs'] == 2
+        assert store.reference_count(first['sha256']) == 3
+
     @pytest.mark.asyncio
     async def test_download_assets_mixed_success(self, temp_dir, sample_assets):
         """Test batch download with mixed success/failure."""
@@ -139,7 +190,7 @@ class TestAssetDownloadManagerIntegration:
         # Successful responses
         for i in range(2):
             mock_response = MagicMock()
-            mock_response.status = 200
+            mock_response.status_code = 200
             mock_response.headers = {
                 'content-type': 'image/jpeg' if i == 0 else 'image/png',
                 'content-length': str(1024 * (i + 1))
@@ -151,17 +202,17 @@ class TestAssetDownloadManagerIntegration:
                 for chunk in chunks:
                     yield chunk
             
-            mock_response.content.iter_chunked = mock_chunk_iterator
+            mock_response.aiter_bytes = mock_chunk_iterator
             responses.append(mock_response)
         
         # Failed response
         mock_failed_response = MagicMock()
-        mock_failed_response.status = 404
-        mock_failed_response.reason = "Not Found"
+        mock_failed_response.status_code = 404
+        mock_failed_response.reason_phrase = "Not Found"
         responses.append(mock_failed_response)
         
         async with AssetDownloadManager() as manager:
-            with patch.object(manager.session, 'get') as mock_get:
+            with patch.object(manager.session, 'stream') as mock_get:
                 # Configure mock to return different responses
                 mock_get.return_value.__aenter__.side_effect = responses
                 
@@ -181,12 +232,12 @@ class TestAssetDownloadManagerIntegration:
         
         # Mock failed response that will trigger retry
         mock_failed_response = MagicMock()
-        mock_failed_response.status = 503  # Service unavailable
-        mock_failed_response.reason = "Service Unavailable"
+        mock_failed_response.status_code = 503  # Service unavailable
+        mock_failed_response.reason_phrase = "Service Unavailable"
         
         # Mock successful response after retry
         mock_success_response = MagicMock()
-        mock_success_response.status = 200
+        mock_success_response.status_code = 200
         mock_success_response.headers = {
             'content-type': 'image/jpeg',
             'content-length': '1024'
@@ -198,10 +249,10 @@ class TestAssetDownloadManagerIntegration:
             for chunk in chunks:
                 yield chunk
         
-        mock_success_response.content.iter_chunked = mock_success_chunks
+        mock_success_response.aiter_bytes = mock_success_chunks
         
         async with AssetDownloadManager(max_retries=2) as manager:
-            with patch.object(manager.session, 'get') as mock_get:
+            with patch.object(manager.session, 'stream') as mock_get:
                 # First call fails, second succeeds
                 mock_get.return_value.__aenter__.side_effect = [
                     mock_failed_response, mock_success_response
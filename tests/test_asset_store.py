@@ -0,0 +1,92 @@
+"""
+Unit tests for the content-addressed asset store.
+"""
+
+import os
+import time
+
+import pytest
+
+from src.storage.asset_store import TEMP_FILE_MAX_AGE_SECONDS, AssetBlobStore, hash_file
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create an asset store for testing."""
+    asset_store = AssetBlobStore(tmp_path / "assets")
+    yield asset_store
+    asset_store.close()
+
+
+def _add(store, tmp_path, data, url=None):
+    """Add a blob with the given content to the store."""
+    source = store.temp_path()
+    source.write_bytes(data)
+    return store.add_file(source, url=url)
+
+
+class TestAssetBlobStore:
+    """Test cases for AssetBlobStore."""
+
+    def test_add_deduplicates_content(self, store, tmp_path):
+        """Test identical content is stored once."""
+        first = _add(store, tmp_path, b"same", url="https://example.com/a.png")
+        second = _add(store, tmp_path, b"same")
+
+        assert first.sha256 == second.sha256 == hash_file(first.path)
+        assert store.stats()["blobs"] == 1
+        assert store.find_source("https://example.com/a.png").sha256 == first.sha256
+        assert store.find_source("https://example.com/unknown.png") is None
+
+    def test_links_are_reference_counted(self, store, tmp_path):
+        """Test blobs are deleted when their last link is released."""
+        blob = _add(store, tmp_path, b"logo")
+        page1 = store.link(blob.sha256, tmp_path / "page1" / "attachments" / "images" / "logo.png")
+        page2 = store.link(blob.sha256, tmp_path / "page2" / "attachments" / "images" / "logo.png")
+
+        assert page1.read_bytes() == page2.read_bytes() == b"logo"
+        assert store.reference_count(blob.sha256) == 2
+        assert store.stats()["bytes_saved"] == 4
+
+        assert store.release_under(tmp_path / "page1") == 1
+        assert not page1.exists()
+        assert blob.path.exists()
+
+        store.release(page2)
+        assert not blob.path.exists()
+        assert store.get_blob(blob.sha256) is None
+
+    def test_garbage_collect_stale_links(self, store, tmp_path):
+        """Test links whose attachment file was removed are reclaimed."""
+        blob = _add(store, tmp_path, b"orphan")
+        link = store.link(blob.sha256, tmp_path / "page" / "orphan.bin")
+        link.unlink()
+
+        result = store.garbage_collect()
+
+        assert result == {"stale_links": 1, "blobs_removed": 1, "bytes_freed": 6}
+        assert store.stats()["blobs"] == 0
+
+    def test_etags_only_match_their_url(self, store, tmp_path):
+        """Test an ETag never matches a blob stored for another URL."""
+        source = store.temp_path()
+        source.write_bytes(b"first")
+        blob = store.add_file(source, url="https://example.com/a.png", etag='W/"1"')
+
+        assert store.find_source("https://example.com/a.png", 'W/"1"').sha256 == blob.sha256
+        assert store.find_source("https://example.com/a.png", 'W/"2"') is None
+        assert store.find_source("https://example.com/b.png", 'W/"1"') is None
+
+    def test_garbage_collect_keeps_fresh_temp_files(self, store):
+        """Test only old temporary files are treated as interrupted downloads."""
+        in_flight = store.temp_path()
+        in_flight.write_bytes(b"partial")
+        leftover = store.temp_path()
+        leftover.write_bytes(b"stale")
+        old = time.time() - 2 * TEMP_FILE_MAX_AGE_SECONDS
+        os.utime(leftover, (old, old))
+
+        store.garbage_collect()
+
+        assert in_flight.exists()
+        assert not leftover.exists()
@@ -0,0 +1,85 @@
+"""
+Unit tests for the asynchronous cache file I/O layer.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.storage.async_io import AsyncFileIO, atomic_write_bytes, get_file_io
+
+
+@pytest.fixture
+def file_io():
+    """Create a file I/O layer for testing."""
+    io = AsyncFileIO(max_workers=2, fsync_batch_size=3)
+    yield io
+    io.shutdown()
+
+
+class TestAsyncFileIO:
+    """Test cases for AsyncFileIO."""
+
+    def test_atomic_write_replaces_file(self, tmp_path):
+        """Test atomic writes create parents and leave no temporary files."""
+        target = tmp_path / "nested" / "file.txt"
+        atomic_write_bytes(target, b"first")
+        atomic_write_bytes(target, b"second", fsync=True)
+
+        assert target.read_bytes() == b"second"
+        assert [p.name for p in target.parent.iterdir()] == ["file.txt"]
+
+    @pytest.mark.asyncio
+    async def test_write_json_and_text(self, file_io, tmp_path):
+        """Test JSON and text writes on the thread pool."""
+        await file_io.write_json(tmp_path / "data.json", {"count": 2})
+        await file_io.write_text(tmp_path / "note.md", "# Note")
+
+        assert json.loads((tmp_path / "data.json").read_text()) == {"count": 2}
+        assert (tmp_path / "note.md").read_text() == "# Note"
+
+    @pytest.mark.asyncio
+    async def test_stream_commits_on_success(self, file_io, tmp_path):
+        """Test streamed writes replace the target once complete."""
+        target = tmp_path / "asset.bin"
+        async with file_io.open_stream(target) as stream:
+            await stream.write(b"abc")
+            await stream.write(b"def")
+            assert not target.exists()
+
+        assert target.read_bytes() == b"abcdef"
+        assert stream.bytes_written == 6
+
+    @pytest.mark.asyncio
+    async def test_stream_discards_partial_write(self, file_io, tmp_path):
+        """Test a failed stream keeps the previous file and removes its temp file."""
+        target = tmp_path / "asset.bin"
+        target.write_bytes(b"previous")
+
+        with pytest.raises(RuntimeError):
+            async with file_io.open_stream(target) as stream:
+                await stream.write(b"partial")
+                raise RuntimeError("connection reset")
+
+        assert target.read_bytes() == b"previous"
+        assert [p.name for p in tmp_path.iterdir()] == ["asset.bin"]
+
+    @pytest.mark.asyncio
+    async def test_batched_fsync(self, file_io, tmp_path):
+        """Test written files are fsynced once per batch."""
+        with patch("src.storage.async_io._fsync_path") as mock_fsync:
+            await file_io.write_bytes(tmp_path / "a", b"a")
+            await file_io.write_bytes(tmp_path / "b", b"b")
+            assert mock_fsync.call_count == 0
+
+            # Third write completes the batch: three files plus their directory
+            await file_io.write_bytes(tmp_path / "c", b"c")
+            assert mock_fsync.call_count == 4
+
+            await file_io.write_bytes(tmp_path / "d", b"d")
+            assert await file_io.flush() == 1
+
+    def test_shared_instance(self):
+        """Test all writers share one file I/O layer."""
+        assert get_file_io() is get_file_io()
@@ -5,6 +5,7 @@ Tests the core caching functionality including directory structure creation,
 page storage/retrieval, search, and cleanup operations.
 """
 
+import asyncio
 import json
 import tempfile
 from datetime import datetime, timezone
@@ -23,6 +24,7 @@ from src.models.cache import (
     InternalLink,
     ExternalLink,
     CleanupResult,
+    PageMatch,
 )
 from src.storage.cache_manager import OneNoteCacheManager
 
@@ -199,6 +201,210 @@ class TestOneNoteCacheManager:
         retrieved_page = await cache_manager.get_cached_page(user_id, "nonexistent-page")
         assert retrieved_page is None
 
+    @pytest.mark.asyncio
+    async def test_get_cached_page_lazy_content(self, cache_manager, sample_cached_page):
+        """Test that content loads on first access when load_content=False."""
+        user_id = "test-user-123"
+
+        await cache_manager.initialize_user_cache(user_id)
+        await cache_manager.store_page_content(user_id, sample_cached_page)
+
+        page = await cache_manager.get_cached_page(user_id, "page-123", load_content=False)
+        assert page.metadata.title == "Test Page"
+        assert not page.is_content_loaded
+        assert "markdown_content" in page._pending_fields
+
+        assert page.markdown_content == "# Test Page\n\nThis is test content.\n"
+        assert page._pending_fields == {"content", "text_content"}
+        assert "<h1>Test Page</h1>" in page.model_dump()["content"]
+        assert page.is_content_loaded
+
+        # Lazy pages nested in result models are serialized with their content
+        lazy = await cache_manager.get_cached_page(user_id, "page-123", load_content=False)
+        match = PageMatch(page=lazy, match_score=1.0, match_reason="title")
+        dumped = json.loads(match.model_dump_json())["page"]
+        assert dumped["markdown_content"] == "# Test Page\n\nThis is test content.\n"
+        assert dumped["text_content"] == "Test Page This is test content."
+        assert dict(await cache_manager.get_cached_page(user_id, "page-123", load_content=False))["content"]
+        assert lazy == await cache_manager.get_cached_page(user_id, "page-123", load_content=False)
+
+    @pytest.mark.asyncio
+    async def test_compressed_page_storage(self, temp_cache_dir, sample_cached_page):
+        """Test that pages are stored compressed when compression is enabled."""
+        user_id = "test-user-123"
+        settings = Mock()
+        settings.onenote_preserve_html = True
+        settings.onenote_enable_compression = True
+        manager = OneNoteCacheManager(settings=settings, cache_root=temp_cache_dir)
+
+        await manager.initialize_user_cache(user_id)
+        await manager.store_page_content(user_id, sample_cached_page)
+
+        page_dir = manager._get_page_dir(user_id, "notebook-456", "section-789", "page-123")
+        suffix = ".zst" if manager.compression == "zstd" else ".gz"
+        assert (page_dir / f"metadata.json{suffix}").exists()
+        assert (page_dir / f"original.html{suffix}").exists()
+        assert not (page_dir / "content.md").exists()
+
+        page = await manager.get_cached_page(user_id, "page-123")
+        assert page.markdown_content == sample_cached_page.markdown_content
+        assert page.content == sample_cached_page.content
+
+    @pytest.mark.asyncio
+    async def test_migrate_page_compression(self, cache_manager, sample_cached_page):
+        """Test migrating plain cache files to compressed storage and back."""
+        user_id = "test-user-123"
+
+        await cache_manager.initialize_user_cache(user_id)
+        await cache_manager.store_page_content(user_id, sample_cached_page)
+        page_dir = cache_manager._get_page_dir(user_id, "notebook-456", "section-789", "page-123")
+
+        stats = await cache_manager.migrate_page_compression(user_id, codec="gzip")
+        assert stats["files_migrated"] == 3
+        assert (page_dir / "content.md.gz").exists()
+        assert not (page_dir / "content.md").exists()
+
+        # Rerunning is a no-op
+        stats = await cache_manager.migrate_page_compression(user_id, codec="gzip")
+        assert stats["files_migrated"] == 0
+        assert stats["files_skipped"] == 3
+
+        page = await cache_manager.get_cached_page(user_id, "page-123")
+        assert page.markdown_content == sample_cached_page.markdown_content
+
+        # Settings disable compression for this manager, so files go back to plain
+        stats = await cache_manager.migrate_page_compression(user_id)
+        assert stats["files_migrated"] == 3
+        assert (page_dir / "content.md").exists()
+
+    @pytest.mark.asyncio
+    async def test_pack_storage_backend(self, temp_cache_dir, sample_cached_page):
+        """Test storing, reading and deleting pages with the pack backend."""
+        user_id = "test-user-123"
+        manager = OneNoteCacheManager(
+            settings=Mock(onenote_preserve_html=True),
+            cache_root=temp_cache_dir,
+            storage_backend="pack",
+            export_markdown=True
+        )
+
+        await manager.initialize_user_cache(user_id)
+        await manager.store_page_content(user_id, sample_cached_page)
+
+        page_dir = manager._get_page_dir(user_id, "notebook-456", "section-789", "page-123")
+        assert (temp_cache_dir / "users" / user_id / "page_pack.db").exists()
+        assert not (page_dir / "metadata.json").exists()
+        assert (page_dir / "content.md").read_text() == sample_cached_page.markdown_content
+
+        page = await manager.get_cached_page(user_id, "page-123", load_content=False)
+        assert not page.is_content_loaded
+        assert page.content == sample_cached_page.content
+        assert page.text_content == "Test Page This is test content."
+
+        pages = await manager.get_all_cached_pages(user_id, fields=("metadata", "markdown_content"))
+        assert [p.metadata.id for p in pages] == ["page-123"]
+
+        stats = await manager.get_cache_statistics(user_id)
+        assert (stats.total_notebooks, stats.total_sections, stats.total_pages) == (1, 1, 1)
+
+        assert await manager.delete_cached_page(user_id, "page-123")
+        assert await manager.get_cached_page(user_id, "page-123") is None
+        assert not page_dir.exists()
+
+    @pytest.mark.asyncio
+    async def test_import_directory_pages_into_pack(self, cache_manager, temp_cache_dir, sample_cached_page):
+        """Test moving an existing directory cache into the pack store."""
+        user_id = "test-user-123"
+        await cache_manager.initialize_user_cache(user_id)
+        await cache_manager.store_page_content(user_id, sample_cached_page)
+
+        manager = OneNoteCacheManager(
+            settings=cache_manager.settings, cache_root=temp_cache_dir, storage_backend="pack"
+        )
+        assert await manager.import_directory_pages(user_id, remove_directories=True) == 1
+
+        page = await manager.get_cached_page(user_id, "page-123")
+        assert page.markdown_content == sample_cached_page.markdown_content
+        assert not manager._get_page_dir(user_id, "notebook-456", "section-789", "page-123").exists()
+
+        assert await manager.export_markdown_tree(user_id) == 1
+
+    def test_unknown_storage_backend(self, temp_cache_dir):
+        """Test that an unknown storage backend is rejected."""
+        with pytest.raises(ValueError):
+            OneNoteCacheManager(settings=Mock(), cache_root=temp_cache_dir, storage_backend="tarball")
+
+    @pytest.mark.asyncio
+    async def test_page_location_index(self, cache_manager, sample_cached_page):
+        """Test that stored pages are recorded in the page location index."""
+        user_id = "test-user-123"
+
+        await cache_manager.initialize_user_cache(user_id)
+        await cache_manager.store_page_content(user_id, sample_cached_page)
+
+        location = await cache_manager.get_page_location(user_id, "page-123")
+        assert location is not None
+        assert location.notebook_id == "notebook-456"
+        assert location.section_id == "section-789"
+        assert location.modified == "2024-01-15T14:30:00+00:00"
+        assert location.content_hash is not None
+
+        assert await cache_manager.delete_cached_page(user_id, "page-123")
+        assert await cache_manager.get_page_location(user_id, "page-123") is None
+        assert await cache_manager.get_cached_page(user_id, "page-123") is None
+        assert not await cache_manager.delete_cached_page(user_id, "page-123")
+
+    @pytest.mark.asyncio
+    async def test_rebuild_page_index(self, cache_manager, sample_cached_page, temp_cache_dir):
+        """Test repairing the page location index from the cache tree."""
+        user_id = "test-user-123"
+
+        await cache_manager.initialize_user_cache(user_id)
+        await cache_manager.store_page_content(user_id, sample_cached_page)
+
+        # A fresh manager builds the index from existing cache directories
+        rebuilt_manager = OneNoteCacheManager(settings=cache_manager.settings, cache_root=temp_cache_dir)
+        location = await rebuilt_manager.get_page_location(user_id, "page-123")
+        assert location is not None
+        assert location.modified == "2024-01-15T14:30:00+00:00"
+
+        # Pages copied into the tree behind the index's back need a repair
+        page_dir = Path(location.path)
+        copied_dir = page_dir.parent / "page-copied"
+        copied_dir.mkdir()
+        (copied_dir / "metadata.json").write_text((page_dir / "metadata.json").read_text())
+        assert await rebuilt_manager.get_page_location(user_id, "page-copied") is None
+
+        assert await rebuilt_manager.rebuild_page_index(user_id) == 2
+        assert await rebuilt_manager.get_page_location(user_id, "page-copied") is not None
+
+    @pytest.mark.asyncio
+    async def test_iter_cached_pages(self, cache_manager, sample_cached_page):
+        """Test streaming cached pages with selected fields."""
+        user_id = "test-user-123"
+
+        await cache_manager.initialize_user_cache(user_id)
+        for i in range(5):
+            page = sample_cached_page.model_copy(deep=True)
+            page.metadata.id = f"page-{i}"
+            await cache_manager.store_page_content(user_id, page)
+
+        pages = [page async for page in cache_manager.iter_cached_pages(user_id, max_workers=2)]
+        assert sorted(page.metadata.id for page in pages) == [f"page-{i}" for i in range(5)]
+        assert all(page.content and page.markdown_content and page.text_content for page in pages)
+
+        metadata_only = await cache_manager.get_all_cached_pages(user_id, fields=("metadata",))
+        assert len(metadata_only) == 5
+        assert not any(page.is_content_loaded for page in metadata_only)
+
+        text_only = await cache_manager.get_all_cached_pages(fields=("metadata", "text_content"))
+        assert len(text_only) == 5
+        assert all(page._pending_fields == {"content", "markdown_content"} for page in text_only)
+        assert all(page.text_content == "Test Page This is test content." for page in text_only)
+
+        with pytest.raises(ValueError):
+            await cache_manager.get_all_cached_pages(user_id, fields=("attachments",))
+
     @pytest.mark.asyncio
     async def test_search_cached_pages(self, cache_manager, sample_cached_page):
         """Test searching cached pages."""
@@ -244,6 +450,96 @@ class TestOneNoteCacheManager:
         assert stats.total_pages == 1
         assert stats.total_size_bytes > 0
 
+    @pytest.mark.asyncio
+    async def test_cache_statistics_counters(self, cache_manager, sample_cached_page):
+        """Test that statistics are maintained incrementally and can be verified."""
+        user_id = "test-user-123"
+        await cache_manager.initialize_user_cache(user_id)
+        await cache_manager.store_page_content(user_id, sample_cached_page)
+
+        page2 = sample_cached_page.model_copy(deep=True)
+        page2.metadata.id = "page-456"
+        page2.metadata.parent_section = {"id": "section-999", "name": "Other Section"}
+        await cache_manager.store_page_content(user_id, page2)
+
+        # Re-storing a page does not count it twice
+        await cache_manager.store_page_content(user_id, sample_cached_page)
+
+        stats = await cache_manager.get_cache_statistics(user_id)
+        assert (stats.total_notebooks, stats.total_sections, stats.total_pages) == (1, 2, 2)
+        assert stats.markdown_size_bytes > 0
+
+        # Counters are persisted with the cache metadata
+        await cache_manager.flush_cache_statistics(user_id)
+        metadata = await cache_manager._load_cache_metadata(user_id)
+        assert metadata.counters.pages == 2
+        assert metadata.counters.size_bytes == stats.total_size_bytes
+
+        assert await cache_manager.delete_cached_page(user_id, "page-456")
+        stats = await cache_manager.get_cache_statistics(user_id)
+        assert (stats.total_notebooks, stats.total_sections, stats.total_pages) == (1, 1, 1)
+
+        # Verify mode rescans the cache tree and picks up external changes
+        page_dir = cache_manager._get_page_dir(user_id, "notebook-456", "section-789", "page-123")
+        (page_dir / "attachments" / "images" / "image.png").write_bytes(b"png" * 10)
+        stats = await cache_manager.get_cache_statistics(user_id)
+        assert stats.total_images == 0
+        stats = await cache_manager.get_cache_statistics(user_id, verify=True)
+        assert stats.total_images == 1
+        assert stats.assets_size_bytes == 30
+
+    @pytest.mark.asyncio
+    async def test_cache_statistics_counters_concurrent_pack_stores(self, temp_cache_dir, sample_cached_page):
+        """Test counters stay exact when pages are stored concurrently in the pack store."""
+        user_id = "test-user-123"
+        manager = OneNoteCacheManager(
+            settings=Mock(onenote_preserve_html=True),
+            cache_root=temp_cache_dir,
+            storage_backend="pack"
+        )
+        await manager.initialize_user_cache(user_id)
+        await manager.get_cache_statistics(user_id, verify=True)
+
+        pages = []
+        for i in range(40):
+            page = sample_cached_page.model_copy(deep=True)
+            page.metadata.id = f"page-{i}"
+            page.metadata.parent_notebook = {"id": f"notebook-{i % 2}", "name": "Notebook"}
+            page.metadata.parent_section = {"id": f"section-{i % 4}", "name": "Section"}
+            pages.append(page)
+        await asyncio.gather(*(manager.store_page_content(user_id, page) for page in pages))
+
+        stats = await manager.get_cache_statistics(user_id)
+        verified = await manager.get_cache_statistics(user_id, verify=True)
+        assert (stats.total_pages, stats.total_sections, stats.total_notebooks) == (40, 4, 2)
+        assert stats == verified
+
+    @pytest.mark.asyncio
+    async def test_unflushed_counters_are_recounted_after_restart(self, cache_manager, sample_cached_page):
+        """Test counters with unflushed changes are not trusted by a new process."""
+        user_id = "test-user-123"
+        await cache_manager.initialize_user_cache(user_id)
+        await cache_manager.get_cache_statistics(user_id, verify=True)
+        await cache_manager.store_page_content(user_id, sample_cached_page)
+
+        # The change is pending: persisted counters are marked unverified
+        metadata = await cache_manager._load_cache_metadata(user_id)
+        assert metadata.counters.verified_at is None
+        assert (await cache_manager.get_cache_statistics(user_id)).total_pages == 1
+
+        # Flushing persists the change and marks the counters verified again
+        await cache_manager.flush_cache_statistics(user_id)
+        metadata = await cache_manager._load_cache_metadata(user_id)
+        assert metadata.counters.verified_at is not None
+        assert metadata.counters.pages == 1
+
+        # A process ending with a pending change leaves the counters to be recounted
+        page2 = sample_cached_page.model_copy(deep=True)
+        page2.metadata.id = "page-456"
+        await cache_manager.store_page_content(user_id, page2)
+        restarted = OneNoteCacheManager(settings=cache_manager.settings, cache_root=cache_manager.cache_root)
+        assert (await restarted.get_cache_statistics(user_id)).total_pages == 2
+
     @pytest.mark.asyncio
     async def test_cleanup_orphaned_assets(self, cache_manager, sample_cached_page, temp_cache_dir):
         """Test cleanup of orphaned assets."""
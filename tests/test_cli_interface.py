@@ -140,6 +140,28 @@ class TestOneNoteCLI:
                 mock_list.assert_called_once()
                 mock_print.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_local_search_command_streams_results(self):
+        """Test /local prints results as the agent streams them."""
+        cli = OneNoteCLI()
+        results = [Mock(similarity_score=0.9), Mock(similarity_score=0.5)]
+        for i, result in enumerate(results):
+            result.chunk.page_title = f"Page {i}"
+            result.chunk.content = "content"
+
+        async def iter_local_search(query, max_results):
+            for result in results:
+                yield result
+
+        cli.agent.iter_local_search = Mock(side_effect=iter_local_search)
+
+        with patch('rich.console.Console.print') as mock_print:
+            assert await cli._handle_command("/local meeting notes") is True
+
+        cli.agent.iter_local_search.assert_called_once_with("meeting notes", max_results=10)
+        printed = " ".join(str(call.args[0]) for call in mock_print.call_args_list)
+        assert "1. Page 0" in printed and "2. Page 1" in printed
+
     @pytest.mark.asyncio
     async def test_show_recent_pages_command(self):
         """Test /recent command."""
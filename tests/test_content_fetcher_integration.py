@@ -4,13 +4,16 @@ Integration tests for OneNoteContentFetcher.
 Tests the real implementation with proper initialization and basic functionality.
 """
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.models.cache import SyncStatus, SyncType
+from src.models.cache import SyncCheckpoint, SyncStatus, SyncType
 from src.storage.cache_manager import OneNoteCacheManager
 from src.storage.onenote_fetcher import OneNoteContentFetcher
+from src.storage.sync_checkpoint import SyncCheckpointStore
+from src.tools.graph_client import ConditionalResponse, ContentValidators
 from src.tools.onenote_search import OneNoteSearchTool
 
 
@@ -18,9 +21,15 @@ class TestOneNoteContentFetcherIntegration:
     """Test real OneNoteContentFetcher integration."""
 
     @pytest.fixture
-    def mock_cache_manager(self):
+    def checkpoint_store(self, tmp_path):
+        """Create a sync checkpoint store in a temporary directory."""
+        return SyncCheckpointStore(tmp_path / "sync_checkpoint.json")
+
+    @pytest.fixture
+    def mock_cache_manager(self, checkpoint_store):
         """Create a mock cache manager."""
         cache_manager = MagicMock(spec=OneNoteCacheManager)
+        cache_manager.get_sync_checkpoint_store = MagicMock(return_value=checkpoint_store)
         cache_manager.cache_exists = MagicMock(return_value=False)  # Sync method, not async
         cache_manager.initialize_user_cache = AsyncMock()
         cache_manager.update_cache_metadata = AsyncMock()
@@ -50,6 +59,10 @@ class TestOneNoteContentFetcherIntegration:
         ])
 
         search_tool._get_pages_from_section = AsyncMock(return_value=[])
+        search_tool._list_section_pages = AsyncMock(return_value=([], None))
+        search_tool._fetch_page_content_if_modified = AsyncMock(return_value=ConditionalResponse(
+            status_code=200, text="<p>Body</p>", validators=ContentValidators(etag='"v2"')
+        ))
 
         # Mock properties
         search_tool.base_url = "https://graph.microsoft.com/v1.0"
@@ -136,6 +149,249 @@ class TestOneNoteContentFetcherIntegration:
         mock_cache_manager.initialize_user_cache.assert_called_once_with("test_user")
         assert mock_cache_manager.update_cache_metadata.call_count >= 2  # Start and end
 
+    @pytest.mark.asyncio
+    async def test_fetch_all_content_bounded_concurrency(self, mock_cache_manager, mock_onenote_search):
+        """Test sections and Graph requests run concurrently within their limits."""
+        in_flight = {"requests": 0, "peak_requests": 0}
+
+        async def list_pages(section_id, token, next_url=None):
+            in_flight["requests"] += 1
+            in_flight["peak_requests"] = max(in_flight["peak_requests"], in_flight["requests"])
+            await asyncio.sleep(0.01)
+            in_flight["requests"] -= 1
+            return [{
+                "id": f"{section_id}-page{i}",
+                "title": f"Page {i}",
+                "createdDateTime": "2024-01-01T00:00:00Z",
+                "lastModifiedDateTime": "2024-01-02T00:00:00Z"
+            } for i in range(3)], None
+
+        mock_onenote_search._get_all_sections = AsyncMock(return_value=[
+            {"id": f"sec{i}", "displayName": f"Section {i}", "parentNotebook": {"id": f"nb{i % 2 + 1}"}}
+            for i in range(8)
+        ])
+        mock_onenote_search._list_section_pages = AsyncMock(side_effect=list_pages)
+
+        fetcher = OneNoteContentFetcher(
+            cache_manager=mock_cache_manager,
+            onenote_search=mock_onenote_search,
+            max_concurrent_sections=4,
+            max_concurrent_pages=5,
+            max_concurrent_requests=3
+        )
+
+        result = await fetcher.fetch_all_content("test_user")
+
+        assert result.status == SyncStatus.COMPLETED
+        assert result.statistics.pages_added == 24
+        assert mock_cache_manager.store_page_content.call_count == 24
+        # Page listings overlap, but never exceed the request budget
+        assert 1 < in_flight["peak_requests"] <= 3
+        # Both notebooks share one section listing
+        mock_onenote_search._get_all_sections.assert_called_once_with("fake_token")
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_content_collects_section_errors(self, mock_cache_manager, mock_onenote_search):
+        """Test a failing section is reported without stopping the others."""
+        async def list_pages(section_id, token, next_url=None):
+            if section_id == "sec1":
+                raise RuntimeError("section unavailable")
+            return [{
+                "id": "page1",
+                "title": "Page 1",
+                "createdDateTime": "2024-01-01T00:00:00Z",
+                "lastModifiedDateTime": "2024-01-02T00:00:00Z"
+            }], None
+
+        mock_onenote_search._list_section_pages = AsyncMock(side_effect=list_pages)
+
+        fetcher = OneNoteContentFetcher(
+            cache_manager=mock_cache_manager,
+            onenote_search=mock_onenote_search
+        )
+
+        result = await fetcher.fetch_all_content("test_user")
+
+        assert result.status == SyncStatus.PARTIAL
+        assert result.statistics.pages_added == 1
+        assert len(result.errors) == 1
+        assert "section unavailable" in result.errors[0]
+
+    @pytest.mark.asyncio
+    async def test_unchanged_content_is_not_stored_again(self, mock_cache_manager, mock_onenote_search):
+        """Test conditional content requests skip pages whose content is unchanged."""
+        mock_onenote_search._get_all_sections = AsyncMock(return_value=[
+            {"id": "sec1", "displayName": "Section 1", "parentNotebook": {"id": "nb1"}}
+        ])
+        mock_onenote_search._list_section_pages = AsyncMock(return_value=([{
+            "id": page_id,
+            "title": page_id,
+            "createdDateTime": "2024-01-01T00:00:00Z",
+            "lastModifiedDateTime": "2024-01-02T00:00:00Z"
+        } for page_id in ("unchanged", "changed")], None))
+
+        cached = MagicMock()
+        cached.metadata.content_etag = '"v1"'
+        cached.metadata.content_last_modified = "Mon, 01 Jan 2024 00:00:00 GMT"
+        mock_cache_manager.get_cached_page = AsyncMock(return_value=cached)
+
+        async def fetch_content(page_id, token, validators):
+            if page_id == "unchanged":
+                return ConditionalResponse(status_code=304, validators=validators)
+            return ConditionalResponse(
+                status_code=200, text="<p>New</p>", validators=ContentValidators(etag='"v2"')
+            )
+
+        mock_onenote_search._fetch_page_content_if_modified = AsyncMock(side_effect=fetch_content)
+
+        fetcher = OneNoteContentFetcher(
+            cache_manager=mock_cache_manager,
+            onenote_search=mock_onenote_search
+        )
+
+        result = await fetcher.fetch_all_content("test_user")
+
+        assert result.status == SyncStatus.COMPLETED
+        assert result.statistics.pages_added == 2
+        # The cached page's validators make the request conditional
+        validators = mock_onenote_search._fetch_page_content_if_modified.call_args_list[0].args[2]
+        assert validators.request_headers() == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"
+        }
+        # Only the changed page is converted and stored, with its new ETag
+        mock_cache_manager.store_page_content.assert_called_once()
+        stored_page = mock_cache_manager.store_page_content.call_args.args[1]
+        assert stored_page.metadata.id == "changed"
+        assert stored_page.content == "<p>New</p>"
+        assert stored_page.metadata.content_etag == '"v2"'
+
+    @pytest.mark.asyncio
+    async def test_interrupted_fetch_resumes_from_checkpoint(
+        self, mock_cache_manager, mock_onenote_search, checkpoint_store
+    ):
+        """Test a failed fetch resumes from its section cursors and skips stored pages."""
+        def page(page_id):
+            return {
+                "id": page_id,
+                "title": page_id,
+                "createdDateTime": "2024-01-01T00:00:00Z",
+                "lastModifiedDateTime": "2024-01-02T00:00:00Z"
+            }
+
+        listings = {
+            ("sec1", None): ([page("p1")], None),
+            ("sec2", None): ([page("p2"), page("p3")], "cursor-2"),
+            ("sec2", "cursor-2"): ([page("p4")], None)
+        }
+        failing = {"p4"}
+
+        async def list_pages(section_id, token, next_url=None):
+            return listings[(section_id, next_url)]
+
+        async def store_page(user_id, cached_page):
+            if cached_page.metadata.id in failing:
+                raise RuntimeError("disk full")
+
+        mock_onenote_search._list_section_pages = AsyncMock(side_effect=list_pages)
+        mock_cache_manager.store_page_content = AsyncMock(side_effect=store_page)
+        fetcher = OneNoteContentFetcher(
+            cache_manager=mock_cache_manager,
+            onenote_search=mock_onenote_search
+        )
+
+        result = await fetcher.fetch_all_content("test_user")
+
+        assert result.status == SyncStatus.PARTIAL
+        checkpoint = await checkpoint_store.load("fetch", SyncType.FULL)
+        assert checkpoint.completed_sections == {"sec1"}
+        assert checkpoint.section_cursors == {"sec2": "cursor-2"}
+        assert checkpoint.stored_pages == {"sec2": {"p2", "p3"}}
+
+        # The next fetch only lists and stores what is left
+        failing.clear()
+        mock_onenote_search._list_section_pages.reset_mock()
+        mock_cache_manager.store_page_content.reset_mock()
+
+        result = await fetcher.fetch_all_content("test_user")
+
+        assert result.status == SyncStatus.COMPLETED
+        mock_onenote_search._list_section_pages.assert_called_once_with("sec2", "fake_token", "cursor-2")
+        stored = [call.args[1].metadata.id for call in mock_cache_manager.store_page_content.call_args_list]
+        assert stored == ["p4"]
+        assert not checkpoint_store.path.exists()
+
+        # Totals cover the pages stored before the interruption too
+        assert result.statistics.pages_added == 4
+        final_update = mock_cache_manager.update_cache_metadata.call_args_list[-1]
+        assert final_update.kwargs["total_pages"] == 4
+
+    @pytest.mark.asyncio
+    async def test_checkpoint_saved_per_interval_of_new_pages(
+        self, mock_cache_manager, mock_onenote_search, checkpoint_store
+    ):
+        """Test checkpoint saves count pages stored by this run, not pre-marked ones."""
+        page_ids = [f"p{i}" for i in range(7)]
+        mock_onenote_search._list_section_pages = AsyncMock(return_value=([{
+            "id": page_id,
+            "title": page_id,
+            "createdDateTime": "2024-01-01T00:00:00Z",
+            "lastModifiedDateTime": "2024-01-02T00:00:00Z"
+        } for page_id in page_ids], None))
+        # Resume a fetch that stored one of the section's pages
+        await checkpoint_store.save(SyncCheckpoint(
+            operation="fetch", sync_type=SyncType.FULL, stored_pages={"sec1": {"p0"}}
+        ))
+        fetcher = OneNoteContentFetcher(
+            cache_manager=mock_cache_manager,
+            onenote_search=mock_onenote_search,
+            max_concurrent_pages=2
+        )
+        stored_at_save = []
+
+        async def save_checkpoint():
+            stored_at_save.append(mock_cache_manager.store_page_content.await_count)
+
+        with patch("src.storage.onenote_fetcher.CHECKPOINT_SAVE_INTERVAL", 2), \
+                patch.object(fetcher, "_save_checkpoint", side_effect=save_checkpoint):
+            result = await fetcher.fetch_all_content("test_user")
+
+        assert result.status == SyncStatus.COMPLETED
+        assert result.statistics.pages_added == 7
+        assert stored_at_save == [2, 4, 6]
+
+    @pytest.mark.asyncio
+    async def test_pages_stored_most_recent_first(self, mock_cache_manager, mock_onenote_search):
+        """Test all sections are listed first and pages are stored newest first."""
+        modified = {"a1": "2023-01-01", "a2": "2024-03-01", "b1": "2024-02-01", "b2": "2022-01-01"}
+
+        async def list_pages(section_id, token, next_url=None):
+            return [{
+                "id": page_id,
+                "title": page_id,
+                "createdDateTime": "2021-01-01T00:00:00Z",
+                "lastModifiedDateTime": f"{modified[page_id]}T00:00:00Z"
+            } for page_id in modified if page_id.startswith(section_id)], None
+
+        mock_onenote_search._get_all_sections = AsyncMock(return_value=[
+            {"id": "a", "displayName": "A", "parentNotebook": {"id": "nb1"}},
+            {"id": "b", "displayName": "B", "parentNotebook": {"id": "nb2"}}
+        ])
+        mock_onenote_search._list_section_pages = AsyncMock(side_effect=list_pages)
+
+        fetcher = OneNoteContentFetcher(
+            cache_manager=mock_cache_manager,
+            onenote_search=mock_onenote_search,
+            max_concurrent_pages=1
+        )
+
+        result = await fetcher.fetch_all_content("test_user")
+
+        assert result.status == SyncStatus.COMPLETED
+        assert result.statistics.pages_added == 4
+        stored = [call.args[1].metadata.id for call in mock_cache_manager.store_page_content.call_args_list]
+        assert stored == ["a2", "b1", "a1", "b2"]
+
     @pytest.mark.asyncio
     async def test_error_handling_no_search(self, mock_cache_manager):
         """Test error handling when no OneNoteSearch is provided."""
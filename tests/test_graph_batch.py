@@ -0,0 +1,241 @@
+"""
+Unit tests for Microsoft Graph JSON batching.
+"""
+
+import base64
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from src.models.onenote import OneNotePage
+from src.tools.graph_batch import (BatchRequest, BatchResponse,
+                                   GraphBatchError, execute_batch,
+                                   relative_url)
+from src.tools.graph_scheduler import GraphScheduler
+from src.tools.onenote_search import OneNoteSearchTool
+
+BASE_URL = "https://graph.microsoft.com/v1.0"
+
+
+def batch_response(items, status_code=200, headers=None):
+    """Create a mocked /$batch HTTP response."""
+    response = Mock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = {"responses": items}
+    return response
+
+
+def echo_client(status_for=None):
+    """Create a mocked client answering every sub-request (200 unless overridden)."""
+    status_for = status_for or (lambda request_id: 200)
+    client = MagicMock()
+
+    async def post(endpoint, headers=None, json=None):
+        return batch_response([
+            {"id": r["id"], "status": status_for(r["id"]), "body": {"url": r["url"]}}
+            for r in json["requests"]
+        ])
+
+    client.post = AsyncMock(side_effect=post)
+    return client
+
+
+@pytest.fixture
+def scheduler():
+    """Use a request scheduler with a frozen clock."""
+    scheduler = GraphScheduler(clock=lambda: 0.0)
+    with patch("src.tools.graph_batch.get_graph_scheduler", return_value=scheduler):
+        yield scheduler
+
+
+class TestGraphBatch:
+    """Test cases for execute_batch."""
+
+    @pytest.mark.asyncio
+    async def test_requests_split_into_batches_of_20(self, scheduler):
+        """Test sub-requests are sent 20 per batch call."""
+        client = echo_client()
+        requests = [BatchRequest(id=str(i), url=f"/me/onenote/pages/{i}") for i in range(45)]
+
+        with patch("src.tools.graph_batch.get_graph_client", AsyncMock(return_value=client)):
+            responses, api_calls = await execute_batch(requests, "token", BASE_URL)
+
+        assert api_calls == 3
+        assert len(responses) == 45
+        assert responses["44"].json() == {"url": "/me/onenote/pages/44"}
+        endpoint = client.post.call_args.args[0]
+        assert endpoint == f"{BASE_URL}/$batch"
+
+    @pytest.mark.asyncio
+    async def test_throttled_items_retried_after_retry_after(self, scheduler):
+        """Test throttled sub-requests pause the scheduler and are retried alone."""
+        attempts = {}
+
+        def status_for(request_id):
+            attempts[request_id] = attempts.get(request_id, 0) + 1
+            if request_id == "b" and attempts[request_id] == 1:
+                return 429
+            return 404 if request_id == "c" else 200
+
+        client = echo_client(status_for)
+        original_post = client.post.side_effect
+
+        async def post(endpoint, headers=None, json=None):
+            response = await original_post(endpoint, headers=headers, json=json)
+            for item in response.json.return_value["responses"]:
+                if item["status"] == 429:
+                    item["headers"] = {"Retry-After": "7"}
+            return response
+
+        client.post.side_effect = post
+        requests = [BatchRequest(id=request_id, url=f"/{request_id}") for request_id in "abc"]
+
+        with patch("src.tools.graph_batch.get_graph_client", AsyncMock(return_value=client)), \
+             patch("src.tools.graph_scheduler.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            responses, api_calls = await execute_batch(requests, "token", BASE_URL)
+
+        assert api_calls == 2
+        assert scheduler.throttled_responses == 1
+        mock_sleep.assert_awaited_once_with(7.0)
+        assert attempts == {"a": 1, "b": 2, "c": 1}
+        assert responses["b"].ok
+        # Non-retryable statuses are returned as they are
+        assert responses["c"].status == 404 and not responses["c"].ok
+
+    @pytest.mark.asyncio
+    async def test_still_throttled_after_retries(self, scheduler):
+        """Test sub-requests keep their last status once retries run out."""
+        client = echo_client(lambda request_id: 429)
+
+        with patch("src.tools.graph_batch.get_graph_client", AsyncMock(return_value=client)), \
+             patch("src.tools.graph_scheduler.asyncio.sleep", new_callable=AsyncMock):
+            responses, api_calls = await execute_batch(
+                [BatchRequest(id="a", url="/a")], "token", BASE_URL, max_retries=2
+            )
+
+        assert api_calls == 3
+        assert responses["a"].status == 429
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_raises(self, scheduler):
+        """Test a failed batch call raises GraphBatchError."""
+        client = MagicMock()
+        client.post = AsyncMock(return_value=batch_response([], status_code=400))
+
+        with patch("src.tools.graph_batch.get_graph_client", AsyncMock(return_value=client)):
+            with pytest.raises(GraphBatchError) as exc_info:
+                await execute_batch([BatchRequest(id="a", url="/a")], "token", BASE_URL)
+
+        assert exc_info.value.status_code == 400
+
+    def test_response_bodies(self):
+        """Test base64 encoded (non-JSON) and JSON bodies are decoded."""
+        html = "<html><body>Notes</body></html>"
+        encoded = BatchResponse(id="1", status=200, body=base64.b64encode(html.encode()).decode())
+        assert encoded.text() == html
+
+        assert BatchResponse(id="2", status=200, body={"id": "x"}).json() == {"id": "x"}
+        assert BatchResponse(id="3", status=204).text() == ""
+
+    def test_relative_url(self):
+        """Test next links are made relative to the version root."""
+        assert relative_url(f"{BASE_URL}/me/onenote/pages?$skip=20", BASE_URL) == "/me/onenote/pages?$skip=20"
+        assert relative_url("me/onenote/sections", BASE_URL) == "/me/onenote/sections"
+
+
+class TestSearchToolBatching:
+    """Test batched requests in OneNoteSearchTool."""
+
+    @pytest.fixture
+    def search_tool(self):
+        """Create a search tool with mocked settings."""
+        settings = MagicMock()
+        settings.graph_api_base_url = BASE_URL
+        return OneNoteSearchTool(authenticator=MagicMock(), settings=settings)
+
+    @pytest.mark.asyncio
+    async def test_fetch_page_contents_batched(self, search_tool):
+        """Test page contents are fetched in one batch."""
+        pages = [
+            OneNotePage(id=f"page{i}", title=f"Page {i}",
+                        createdDateTime="2024-01-01T00:00:00Z",
+                        lastModifiedDateTime="2024-01-02T00:00:00Z")
+            for i in range(3)
+        ]
+        responses = {
+            str(i): BatchResponse(id=str(i), status=200,
+                                  body=base64.b64encode(f"<p>Body {i}</p>".encode()).decode())
+            for i in range(3)
+        }
+
+        with patch("src.tools.onenote_search.execute_batch",
+                   AsyncMock(return_value=(responses, 1))) as mock_batch:
+            api_calls = await search_tool._fetch_page_contents(pages, "token")
+
+        assert api_calls == 1
+        assert [page.text_content for page in pages] == ["Body 0", "Body 1", "Body 2"]
+        requests = mock_batch.call_args.args[0]
+        assert requests[2].url == "/me/onenote/pages/page2/content"
+
+    @pytest.mark.asyncio
+    async def test_get_pages_from_sections_follows_next_links(self, search_tool):
+        """Test section listings are batched and their next links followed."""
+        def page(page_id):
+            return {"id": page_id, "title": page_id,
+                    "createdDateTime": "2024-01-01T00:00:00Z",
+                    "lastModifiedDateTime": "2024-01-02T00:00:00Z"}
+
+        rounds = [
+            {
+                "s1": BatchResponse(id="s1", status=200, body={
+                    "value": [page("p1")],
+                    "@odata.nextLink": f"{BASE_URL}/me/onenote/sections/s1/pages?$skip=1"
+                }),
+                "s2": BatchResponse(id="s2", status=200, body={"value": [page("p2")]}),
+                "s3": BatchResponse(id="s3", status=403)
+            },
+            {"s1": BatchResponse(id="s1", status=200, body={"value": [page("p3")]})}
+        ]
+
+        with patch("src.tools.onenote_search.execute_batch",
+                   AsyncMock(side_effect=[(r, 1) for r in rounds])) as mock_batch:
+            pages = await search_tool._get_pages_from_sections(["s1", "s2", "s3"], "token")
+
+        assert [p.id for p in pages["s1"]] == ["p1", "p3"]
+        assert [p.id for p in pages["s2"]] == ["p2"]
+        assert pages["s3"] == []
+        second_round = mock_batch.call_args_list[1].args[0]
+        assert [(r.id, r.url) for r in second_round] == [("s1", "/me/onenote/sections/s1/pages?$skip=1")]
+
+        # Listings select only persisted fields and use large response pages
+        first_url = mock_batch.call_args_list[0].args[0][0].url
+        assert "$select=id,title,createdDateTime,lastModifiedDateTime,contentUrl,links" in first_url
+        assert "$expand=parentSection%28$select%3Did,displayName%29" in first_url
+        assert "$top=100" in first_url
+
+    @pytest.mark.asyncio
+    async def test_page_index_filter_falls_back_to_local_filtering(self, search_tool):
+        """Test a rejected modification filter is applied to the full listing."""
+        def response(status_code, values=None):
+            result = Mock()
+            result.status_code = status_code
+            result.json.return_value = {"value": values or []}
+            return result
+
+        pages = [
+            {"id": "old", "lastModifiedDateTime": "2024-01-01T00:00:00Z"},
+            {"id": "new", "lastModifiedDateTime": "2024-03-01T00:00:00Z"}
+        ]
+        since = datetime(2024, 2, 1)
+
+        with patch("src.tools.onenote_search.graph_request",
+                   AsyncMock(side_effect=[response(400), response(200, pages)])) as mock_request:
+            index = await search_tool._list_section_page_index("s1", "token", modified_since=since)
+
+        assert [page["id"] for page in index] == ["new"]
+        filtered, unfiltered = [call.kwargs["params"] for call in mock_request.call_args_list]
+        assert filtered["$filter"] == "lastModifiedDateTime gt 2024-02-01T00:00:00Z"
+        assert filtered["$select"] == "id,title,lastModifiedDateTime"
+        assert "$filter" not in unfiltered
@@ -0,0 +1,108 @@
+"""
+Unit tests for the shared Graph HTTP client.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import httpx
+import pytest
+
+from src.tools import graph_client
+from src.tools.graph_client import (ContentValidators, build_limits,
+                                    build_timeout, close_graph_client,
+                                    get_graph_client, get_if_modified)
+
+
+class TestGraphClient:
+    """Test cases for the shared Graph HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_client_is_shared(self):
+        """Test concurrent callers on one event loop share a single client."""
+        clients = await asyncio.gather(*(get_graph_client() for _ in range(5)))
+
+        assert all(client is clients[0] for client in clients)
+        assert isinstance(clients[0], httpx.AsyncClient)
+        assert not clients[0].is_closed
+
+        await close_graph_client()
+        assert clients[0].is_closed
+        assert await get_graph_client() is not clients[0]
+        await close_graph_client()
+
+    def test_client_per_event_loop(self):
+        """Test each event loop gets its own connection pool."""
+        async def open_and_close():
+            client = await get_graph_client()
+            await close_graph_client()
+            return client
+
+        first = asyncio.run(open_and_close())
+        second = asyncio.run(open_and_close())
+
+        assert first is not second
+
+    def test_pool_configuration(self):
+        """Test limits and timeouts come from this module."""
+        limits = build_limits()
+        assert limits.max_connections == graph_client.GRAPH_MAX_CONNECTIONS
+        assert limits.max_keepalive_connections == graph_client.GRAPH_MAX_KEEPALIVE_CONNECTIONS
+
+        timeout = build_timeout(60)
+        assert timeout.read == 60
+        assert timeout.connect == graph_client.GRAPH_CONNECT_TIMEOUT
+
+        assert build_timeout(5).connect == 5
+
+
+class TestConditionalRequests:
+    """Test cases for conditional GET requests."""
+
+    @staticmethod
+    def client_returning(status_code, headers=None, text=""):
+        """Create a mocked client answering every GET with one response."""
+        response = Mock()
+        response.status_code = status_code
+        response.headers = headers or {}
+        response.text = text
+        client = MagicMock()
+        client.get = AsyncMock(return_value=response)
+        return client
+
+    def test_validators_from_headers(self):
+        """Test validators are read case-insensitively and become request headers."""
+        validators = ContentValidators.from_headers({"ETag": '"v1"', "last-modified": "Mon, 01 Jan 2024"})
+
+        assert validators.request_headers() == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024"
+        }
+        assert not ContentValidators.from_headers({})
+
+    @pytest.mark.asyncio
+    async def test_not_modified_keeps_validators(self):
+        """Test a 304 response returns no body and the caller's validators."""
+        client = self.client_returning(304)
+        validators = ContentValidators(etag='"v1"')
+
+        with patch("src.tools.graph_client.get_graph_client", AsyncMock(return_value=client)):
+            response = await get_if_modified("https://example/page", {"Accept": "text/html"}, validators)
+
+        assert response.not_modified
+        assert response.text == ""
+        assert response.validators == validators
+        sent = client.get.call_args.kwargs["headers"]
+        assert sent == {"Accept": "text/html", "If-None-Match": '"v1"'}
+
+    @pytest.mark.asyncio
+    async def test_modified_returns_content_and_new_validators(self):
+        """Test a 200 response returns the body and the server's validators."""
+        client = self.client_returning(200, headers={"ETag": '"v2"'}, text="<p>New</p>")
+
+        with patch("src.tools.graph_client.get_graph_client", AsyncMock(return_value=client)):
+            response = await get_if_modified("https://example/page", {}, ContentValidators(etag='"v1"'))
+
+        assert response.ok
+        assert response.text == "<p>New</p>"
+        assert response.validators.etag == '"v2"'
@@ -0,0 +1,134 @@
+"""
+Unit tests for the Graph request scheduler.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from src.tools.graph_scheduler import (GraphScheduler, RequestPriority,
+                                       current_priority, graph_priority,
+                                       retry_after_seconds)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestGraphScheduler:
+    """Test cases for GraphScheduler."""
+
+    @pytest.mark.asyncio
+    async def test_interactive_requests_admitted_first(self):
+        """Test queued interactive requests overtake queued background requests."""
+        scheduler = GraphScheduler(initial_concurrency=1, max_concurrency=1)
+        order = []
+
+        async def request(name, priority):
+            async with scheduler.slot(priority):
+                order.append(name)
+                await asyncio.sleep(0)
+
+        await scheduler.acquire()
+        tasks = [asyncio.create_task(request(f"sync{i}", RequestPriority.BACKGROUND)) for i in range(3)]
+        tasks.append(asyncio.create_task(request("chat", RequestPriority.INTERACTIVE)))
+        await asyncio.sleep(0)
+
+        scheduler.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["chat", "sync0", "sync1", "sync2"]
+
+    @pytest.mark.asyncio
+    async def test_priority_inherited_by_tasks(self):
+        """Test tasks created within graph_priority inherit the priority."""
+        async def priority():
+            return current_priority()
+
+        assert current_priority() == RequestPriority.INTERACTIVE
+        with graph_priority(RequestPriority.BACKGROUND):
+            assert await asyncio.create_task(priority()) == RequestPriority.BACKGROUND
+        assert current_priority() == RequestPriority.INTERACTIVE
+
+    def test_aimd_concurrency(self):
+        """Test the limit grows additively and is halved once per throttling episode."""
+        clock = FakeClock()
+        scheduler = GraphScheduler(initial_concurrency=4, max_concurrency=8, clock=clock)
+
+        for _ in range(4):
+            scheduler.on_success()
+        assert scheduler.concurrency_limit == 4  # About +1 per window of 4 successes
+        scheduler.on_success()
+        assert scheduler.concurrency_limit == 5
+
+        scheduler.on_throttled(10.0)
+        assert scheduler.concurrency_limit == 2
+        assert scheduler.paused_for == 10.0
+
+        # Further throttled responses in the same pause do not cut the limit again
+        scheduler.on_throttled(4.0)
+        assert scheduler.concurrency_limit == 2
+        assert scheduler.paused_for == 10.0
+
+        clock.now = 11.0
+        scheduler.on_throttled(1.0)
+        assert scheduler.concurrency_limit == 1
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_paces_requests(self):
+        """Test requests beyond the burst wait for tokens."""
+        scheduler = GraphScheduler(rate=2.0, burst=2, clock=FakeClock())
+
+        with patch("src.tools.graph_scheduler.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            for _ in range(4):
+                async with scheduler.slot():
+                    pass
+
+        assert [call.args[0] for call in mock_sleep.await_args_list] == [0.5, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_retry_after_pauses_all_requests(self):
+        """Test a throttled response delays other requests too."""
+        scheduler = GraphScheduler(clock=FakeClock())
+        throttled = Mock(status_code=429, headers={"Retry-After": "5"})
+        ok = Mock(status_code=200)
+        send = AsyncMock(side_effect=[throttled, ok])
+
+        with patch("src.tools.graph_scheduler.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            response = await scheduler.run(send)
+            async with scheduler.slot():
+                pass
+
+        assert response is ok
+        assert send.await_count == 2
+        # Both the retry and the unrelated request waited for the pause
+        assert [call.args[0] for call in mock_sleep.await_args_list] == [5.0, 5.0]
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_retried(self):
+        """Test transport errors are retried and raised after the last retry."""
+        scheduler = GraphScheduler(max_retries=2, clock=FakeClock())
+        send = AsyncMock(side_effect=httpx.ConnectError("connection refused"))
+
+        with patch("src.tools.graph_scheduler.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            with pytest.raises(httpx.ConnectError):
+                await scheduler.run(send)
+
+        assert send.await_count == 3
+        assert [call.args[0] for call in mock_sleep.await_args_list] == [1.0, 2.0]
+        assert scheduler.active_requests == 0
+
+    def test_retry_after_seconds(self):
+        """Test Retry-After parsing and the backoff without it."""
+        assert retry_after_seconds({"retry-after": "3"}) == 3.0
+        assert retry_after_seconds({"Retry-After": "3600"}) == 60.0
+        assert retry_after_seconds({}, attempt=2) == 4.0
+        assert retry_after_seconds(Mock()) == 1.0
@@ -4,7 +4,7 @@ Tests for incremental sync manager.
 
 import asyncio
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 from tempfile import TemporaryDirectory
@@ -13,8 +13,11 @@ from src.storage.incremental_sync import (
     IncrementalSyncManager, ContentChange, SyncOperation, SyncReport,
     SyncStrategy, ChangeType
 )
+from src.models.cache import CachedPage, CachedPageMetadata
 from src.models.onenote import OneNoteNotebook, OneNoteSection, OneNotePage
+from src.storage.cache_manager import OneNoteCacheManager
 from src.storage.onenote_fetcher import OneNoteContentFetcher
+from src.storage.page_manifest import parse_modified
 
 
 class TestIncrementalSyncManager:
@@ -105,7 +108,7 @@ class TestIncrementalSyncManager:
         # Setup mock data
         mock_content_fetcher._get_all_notebooks.return_value = [sample_notebook]
         mock_content_fetcher._get_all_sections.return_value = [sample_section]
-        mock_content_fetcher._get_pages_from_section.return_value = [sample_page]
+        mock_content_fetcher._list_page_index.return_value = [sample_page]
         
         # Mock local pages (empty)
         with patch.object(sync_manager, '_get_local_pages', return_value=[]):
@@ -138,7 +141,7 @@ class TestIncrementalSyncManager:
         # Setup mock data
         mock_content_fetcher._get_all_notebooks.return_value = [sample_notebook]
         mock_content_fetcher._get_all_sections.return_value = [sample_section]
-        mock_content_fetcher._get_pages_from_section.return_value = [remote_page]
+        mock_content_fetcher._list_page_index.return_value = [remote_page]
         
         # Mock local pages
         with patch.object(sync_manager, '_get_local_pages', return_value=[local_page]):
@@ -163,7 +166,7 @@ class TestIncrementalSyncManager:
         # Setup mock data (empty remote pages)
         mock_content_fetcher._get_all_notebooks.return_value = [sample_notebook]
         mock_content_fetcher._get_all_sections.return_value = [sample_section]
-        mock_content_fetcher._get_pages_from_section.return_value = []
+        mock_content_fetcher._list_page_index.return_value = []
         
         # Mock local pages
         with patch.object(sync_manager, '_get_local_pages', return_value=[local_page]):
@@ -197,7 +200,7 @@ class TestIncrementalSyncManager:
         # Setup mock data
         mock_content_fetcher._get_all_notebooks.return_value = [sample_notebook]
         mock_content_fetcher._get_all_sections.return_value = [sample_section]
-        mock_content_fetcher._get_pages_from_section.return_value = [remote_page]
+        mock_content_fetcher._list_page_index.return_value = [remote_page]
         
         # Mock local pages
         with patch.object(sync_manager, '_get_local_pages', return_value=[local_page]):
@@ -276,10 +279,11 @@ class TestIncrementalSyncManager:
         assert report.get_duration() is not None
 
     @pytest.mark.asyncio
-    async def test_execute_sync_real_operations(self, sync_manager, mock_content_fetcher):
+    async def test_execute_sync_real_operations(self, sync_manager, mock_content_fetcher, mock_bulk_indexer):
         """Test actual sync execution."""
         # Mock page content fetching
-        mock_content_fetcher._fetch_single_page.return_value = {"id": "page-1", "title": "Test"}
+        mock_content_fetcher._fetch_pages.return_value = {"page-1": {"id": "page-1", "title": "Test"}}
+        mock_bulk_indexer.index_cached_pages.return_value = (1, 0)
         
         operations = [
             SyncOperation(
@@ -295,10 +299,90 @@ class TestIncrementalSyncManager:
             )
         ]
         
-        report = await sync_manager.execute_sync(operations, dry_run=False)
+        report = await sync_manager.execute_sync(operations, dry_run=False, user_id="user-1")
         
         assert report.pages_created == 1
         assert len(report.errors) == 0
+        cached_page = mock_content_fetcher._convert_to_cached_page.return_value
+        sync_manager.cache_manager.store_page_content.assert_awaited_once_with("user-1", cached_page)
+        mock_bulk_indexer.index_cached_pages.assert_awaited_once_with([cached_page])
+
+    @pytest.mark.asyncio
+    async def test_execute_sync_drops_stale_embeddings(self, sync_manager, mock_content_fetcher,
+                                                       mock_bulk_indexer):
+        """Test updated pages lose their old embeddings so they are re-embedded."""
+        sync_manager.vector_store = AsyncMock()
+        mock_content_fetcher._fetch_pages.return_value = {"page-1": {"id": "page-1", "title": "Test"}}
+        cached_page = mock_content_fetcher._convert_to_cached_page.return_value
+        cached_page.metadata.id = "page-1"
+        mock_bulk_indexer.index_cached_pages.return_value = (1, 0)
+
+        operations = [
+            SyncOperation(
+                change=ContentChange(
+                    change_type=ChangeType.MODIFIED,
+                    page_id="page-1",
+                    page_title="Changed Page",
+                    notebook_id="notebook-1",
+                    section_id="section-1"
+                ),
+                action="update",
+                strategy_used=SyncStrategy.NEWER_WINS
+            )
+        ]
+
+        report = await sync_manager.execute_sync(operations, user_id="user-1")
+
+        assert report.pages_updated == 1
+        assert report.errors == []
+        sync_manager.vector_store.delete_pages_embeddings.assert_awaited_once_with(["page-1"])
+        mock_bulk_indexer.index_cached_pages.assert_awaited_once_with([cached_page])
+
+    @pytest.mark.asyncio
+    async def test_execute_sync_groups_operations(self, sync_manager, mock_content_fetcher, mock_bulk_indexer):
+        """Test deletions are coalesced and page writes fetched and indexed in batches."""
+        def operation(action, page_id):
+            change_type = {"create": ChangeType.ADDED, "update": ChangeType.MODIFIED,
+                           "delete": ChangeType.DELETED}[action]
+            return SyncOperation(
+                change=ContentChange(
+                    change_type=change_type,
+                    page_id=page_id,
+                    page_title=page_id,
+                    notebook_id="notebook-1",
+                    section_id="section-1"
+                ),
+                action=action,
+                strategy_used=SyncStrategy.NEWER_WINS
+            )
+
+        operations = (
+            [operation("delete", f"deleted-{i}") for i in range(3)]
+            + [operation("create", f"new-{i}") for i in range(40)]
+            + [operation("update", f"changed-{i}") for i in range(20)]
+        )
+        mock_content_fetcher._fetch_pages.side_effect = lambda page_ids: {
+            page_id: {"id": page_id} for page_id in page_ids
+        }
+        mock_content_fetcher._convert_to_cached_page.side_effect = lambda page_data: page_data["id"]
+        mock_bulk_indexer.index_cached_pages.side_effect = lambda pages: (len(pages), 0)
+
+        report = await sync_manager.execute_sync(operations, user_id="user-1")
+
+        assert report.errors == []
+        assert (report.pages_deleted, report.pages_created, report.pages_updated) == (3, 40, 20)
+
+        # One batched removal from the search index
+        deleted_ids = [f"deleted-{i}" for i in range(3)]
+        mock_bulk_indexer.local_search.delete_pages.assert_awaited_once_with(deleted_ids)
+        assert sync_manager.cache_manager.delete_cached_page.await_count == 3
+
+        # Page writes are fetched and indexed in batches, not page by page
+        assert [len(call.args[0]) for call in mock_content_fetcher._fetch_pages.call_args_list] == [50, 10]
+        mock_content_fetcher._fetch_single_page.assert_not_awaited()
+        indexed = [page for call in mock_bulk_indexer.index_cached_pages.call_args_list for page in call.args[0]]
+        assert sorted(indexed) == sorted(op.change.page_id for op in operations[3:])
+        assert mock_bulk_indexer.index_cached_pages.await_count == 2
 
     def test_content_change_is_conflict(self):
         """Test conflict detection in ContentChange."""
@@ -432,7 +516,7 @@ class TestIncrementalSyncManager:
         # Setup mock data
         mock_content_fetcher._get_all_notebooks.return_value = [sample_notebook]
         mock_content_fetcher._get_all_sections.return_value = [sample_section]
-        mock_content_fetcher._get_pages_from_section.return_value = [old_page]
+        mock_content_fetcher._list_page_index.return_value = [old_page]
         
         # Mock local pages (empty)
         with patch.object(sync_manager, '_get_local_pages', return_value=[]):
@@ -445,6 +529,113 @@ class TestIncrementalSyncManager:
         # With force_full_scan=True, should detect the old page
         assert len(changes_full) >= len(changes_normal)
 
+    @pytest.mark.asyncio
+    async def test_incremental_scan_uses_section_and_server_filters(self, sync_manager, mock_content_fetcher,
+                                                                    sample_notebook):
+        """Test unchanged sections are skipped and changed ones list only modified pages."""
+        now = datetime.utcnow()
+        sync_manager.last_sync_time = now - timedelta(days=1)
+        unchanged = {"id": "section-old", "displayName": "Old",
+                     "lastModifiedDateTime": (now - timedelta(days=7)).isoformat() + "Z"}
+        changed = {"id": "section-new", "displayName": "New",
+                   "lastModifiedDateTime": now.isoformat() + "Z"}
+        remote_page = {"id": "page-2", "title": "Edited", "lastModifiedDateTime": now.isoformat() + "Z"}
+        local_pages = [
+            {"id": "page-1", "title": "Untouched", "lastModifiedDateTime": (now - timedelta(days=7)).isoformat()},
+            {"id": "page-2", "title": "Edited", "lastModifiedDateTime": (now - timedelta(days=7)).isoformat()}
+        ]
+
+        mock_content_fetcher._get_all_notebooks.return_value = [sample_notebook]
+        mock_content_fetcher._get_all_sections.return_value = [unchanged, changed]
+        mock_content_fetcher._list_page_index.return_value = [remote_page]
+
+        with patch.object(sync_manager, '_get_local_pages', return_value=local_pages):
+            changes = await sync_manager.detect_changes(user_id="test-user")
+
+        # One filtered listing, for the changed section only
+        mock_content_fetcher._list_page_index.assert_called_once()
+        call = mock_content_fetcher._list_page_index.call_args
+        assert call.args == ("section-new",)
+        assert call.kwargs["modified_since"] == parse_modified(sync_manager.last_sync_time) - timedelta(hours=1)
+        # page-1 is missing from the filtered listing, but is not deleted
+        assert [(c.change_type, c.page_id) for c in changes] == [(ChangeType.MODIFIED, "page-2")]
+
+    @pytest.mark.asyncio
+    async def test_large_section_compared_by_index(self, sync_manager, mock_content_fetcher,
+                                                   sample_notebook, sample_section):
+        """Test a full scan of a large section finds every kind of change."""
+        old = (datetime.utcnow() - timedelta(days=2)).isoformat()
+        new = datetime.utcnow().isoformat()
+        local_pages = [{"id": f"page-{i}", "title": f"Page {i}", "lastModifiedDateTime": old}
+                       for i in range(5000)]
+        remote_pages = [{"id": f"page-{i}", "title": f"Page {i}", "lastModifiedDateTime": new if i % 1000 == 0 else old}
+                        for i in range(1, 5001)]
+
+        mock_content_fetcher._get_all_notebooks.return_value = [sample_notebook]
+        mock_content_fetcher._get_all_sections.return_value = [sample_section]
+        mock_content_fetcher._list_page_index.return_value = remote_pages
+
+        with patch.object(sync_manager, '_get_local_pages', return_value=local_pages):
+            changes = await sync_manager.detect_changes(user_id="test-user", force_full_scan=True)
+
+        by_type = {}
+        for change in changes:
+            by_type.setdefault(change.change_type, []).append(change.page_id)
+        assert by_type[ChangeType.ADDED] == ["page-5000"]
+        assert by_type[ChangeType.DELETED] == ["page-0"]
+        assert sorted(by_type[ChangeType.MODIFIED]) == ["page-1000", "page-2000", "page-3000", "page-4000"]
+        assert mock_content_fetcher._list_page_index.call_args.kwargs["modified_since"] is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("storage_backend", ["directory", "pack"])
+    async def test_detect_changes_against_cache_manager(self, temp_cache_root, mock_content_fetcher,
+                                                        sample_notebook, sample_section, storage_backend):
+        """Test a full scan compares the listing against the pages in a real cache."""
+        settings = MagicMock()
+        settings.onenote_preserve_html = False
+        settings.onenote_cache_compression = None
+        cache_manager = OneNoteCacheManager(
+            settings=settings, cache_root=temp_cache_root, storage_backend=storage_backend
+        )
+        old = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        new = datetime(2024, 2, 1, tzinfo=timezone.utc)
+        for page_id in ("page-1", "page-2", "page-3"):
+            await cache_manager.store_page_content("test-user", CachedPage(
+                metadata=CachedPageMetadata(
+                    id=page_id,
+                    title=f"Cached {page_id}",
+                    created_date_time=old,
+                    last_modified_date_time=old,
+                    parent_section={"id": "section-1"},
+                    parent_notebook={"id": "notebook-1"},
+                    content_url=f"https://graph.microsoft.com/v1.0/me/onenote/pages/{page_id}/content",
+                    local_content_path="",
+                    local_html_path=""
+                ),
+                markdown_content=f"# {page_id}"
+            ))
+
+        mock_content_fetcher._get_all_notebooks.return_value = [sample_notebook]
+        mock_content_fetcher._get_all_sections.return_value = [sample_section]
+        mock_content_fetcher._list_page_index.return_value = [
+            {"id": "page-1", "title": "Untouched", "lastModifiedDateTime": old.isoformat()},
+            {"id": "page-2", "title": "Edited", "lastModifiedDateTime": new.isoformat()},
+            {"id": "page-4", "title": "Added", "lastModifiedDateTime": new.isoformat()}
+        ]
+        sync_manager = IncrementalSyncManager(
+            cache_root=temp_cache_root,
+            content_fetcher=mock_content_fetcher,
+            cache_manager=cache_manager
+        )
+
+        changes = await sync_manager.detect_changes(user_id="test-user", force_full_scan=True)
+
+        assert {(c.change_type, c.page_id, c.page_title) for c in changes} == {
+            (ChangeType.MODIFIED, "page-2", "Edited"),
+            (ChangeType.ADDED, "page-4", "Added"),
+            (ChangeType.DELETED, "page-3", "Cached page-3")
+        }
+
     @pytest.mark.asyncio
     async def test_error_handling_in_detection(self, sync_manager, mock_content_fetcher):
         """Test error handling during change detection."""
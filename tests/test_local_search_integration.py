@@ -11,14 +11,21 @@ import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import List
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from src.models.cache import AssetInfo, CachedPage, CachedPageMetadata, LinkInfo
 from src.models.onenote import OneNotePage, SemanticSearchResult
 from src.storage.cache_manager import OneNoteCacheManager
-from src.storage.local_search import LocalOneNoteSearch, LocalSearchError
+from src.storage.local_search import (LocalOneNoteSearch, LocalSearchError,
+                                      LocalSearchFilter)
+
+
+async def _iter_pages(pages: List[CachedPage]):
+    """Stream pages the way OneNoteCacheManager.iter_cached_pages does."""
+    for page in pages:
+        yield page
 
 
 class TestLocalOneNoteSearchIntegration:
@@ -51,6 +58,14 @@ class TestLocalOneNoteSearchIntegration:
         yield engine
         await engine.close()
 
+    @pytest.fixture
+    async def sharded_engine(self, mock_settings, cache_manager):
+        """Create local search engine with one shard per notebook."""
+        engine = LocalOneNoteSearch(mock_settings, cache_manager, sharded=True)
+        await engine.initialize()
+        yield engine
+        await engine.close()
+
     @pytest.fixture
     def sample_cached_page(self):
         """Create sample cached page for testing."""
@@ -178,6 +193,23 @@ class TestLocalOneNoteSearchIntegration:
         
         assert count == len(sample_cached_pages)
 
+    async def test_index_and_delete_pages_in_batches(self, search_engine, sample_cached_pages):
+        """Test pages are indexed and removed with batched calls."""
+        indexed_count, failed_count = await search_engine.index_pages(sample_cached_pages)
+
+        assert (indexed_count, failed_count) == (len(sample_cached_pages), 0)
+        conn = await search_engine._get_connection()
+        assert conn.execute("SELECT COUNT(*) FROM page_metadata").fetchone()[0] == len(sample_cached_pages)
+
+        removed_ids = [page.metadata.id for page in sample_cached_pages[:2]]
+        assert await search_engine.delete_pages(removed_ids + ["unknown-page"]) == 2
+
+        remaining = {row[0] for row in conn.execute("SELECT page_id FROM page_content_fts")}
+        assert remaining == {page.metadata.id for page in sample_cached_pages[2:]}
+        assert conn.execute(
+            "SELECT COUNT(*) FROM page_passage_fts WHERE page_id IN (?, ?)", removed_ids
+        ).fetchone()[0] == 0
+
     async def test_search_by_title(self, search_engine, sample_cached_pages):
         """Test searching by page title."""
         # Index all pages
@@ -312,8 +344,8 @@ class TestLocalOneNoteSearchIntegration:
 
     async def test_rebuild_index(self, search_engine, cache_manager, sample_cached_pages):
         """Test rebuilding the search index."""
-        # Mock cache_manager.get_all_cached_pages
-        cache_manager.get_all_cached_pages = AsyncMock(return_value=sample_cached_pages)
+        # Mock cache_manager.iter_cached_pages
+        cache_manager.iter_cached_pages = MagicMock(side_effect=lambda *args, **kwargs: _iter_pages(sample_cached_pages))
         
         # Rebuild index
         result = await search_engine.rebuild_index("test-user-001")
@@ -394,6 +426,263 @@ class TestLocalOneNoteSearchIntegration:
         assert "f.section_id IN (?)" in sql
         assert sql.count(" AND ") == 2  # Two filter conditions
 
+    async def test_build_search_sql_with_structured_filter(self, search_engine):
+        """Test SQL building with a structured filter."""
+        search_filter = LocalSearchFilter(
+            notebook_names=["Work Notebook"],
+            modified_after=datetime(2024, 1, 1),
+            max_content_length=1000
+        )
+        sql = search_engine._build_search_sql(search_filter=search_filter)
+        conditions, params = search_engine._build_filter_conditions(search_filter)
+
+        assert "m.notebook_name IN (?)" in sql
+        assert "m.modified_time >= ?" in sql
+        assert "m.content_length <= ?" in sql
+        assert params == ["Work Notebook", "2024-01-01T00:00:00", 1000]
+        assert len(conditions) == 3
+
+    async def test_search_with_structured_filter(self, search_engine, sample_cached_pages):
+        """Test that date and location filters are applied by the search query."""
+        for page in sample_cached_pages:
+            await search_engine.index_page(page)
+
+        # Only the API documentation page was modified after Jan 16
+        results = await search_engine.search(
+            "documentation meeting weekend",
+            search_filter=LocalSearchFilter(modified_after=datetime(2024, 1, 16))
+        )
+        assert [r.page.id for r in results] == ["page-project-001"]
+
+        results = await search_engine.search(
+            "documentation meeting weekend",
+            search_filter=LocalSearchFilter(section_names=["Daily Journal"])
+        )
+        assert [r.page.id for r in results] == ["page-personal-001"]
+
+        results = await search_engine.search(
+            "meeting",
+            search_filter=LocalSearchFilter(max_content_length=10)
+        )
+        assert results == []
+
+    async def test_search_page_keyset_pagination(self, search_engine, sample_cached_pages):
+        """Test that cursor pagination walks all results without duplicates."""
+        for page in sample_cached_pages:
+            await search_engine.index_page(page)
+
+        query = "documentation meeting weekend"
+        first_page, cursor = await search_engine.search_page(query, limit=2)
+        assert len(first_page) == 2
+        assert cursor is not None
+        assert cursor.offset == 2
+
+        second_page, cursor = await search_engine.search_page(query, limit=2, cursor=cursor)
+        assert len(second_page) == 1
+        assert cursor is None
+        assert second_page[0].rank == 3
+
+        page_ids = [r.page.id for r in first_page + second_page]
+        assert sorted(page_ids) == sorted(p.metadata.id for p in sample_cached_pages)
+
+    async def test_iter_search_streams_results(self, search_engine, sample_cached_pages):
+        """Test streaming search results with a result cap."""
+        for page in sample_cached_pages:
+            await search_engine.index_page(page)
+
+        query = "documentation meeting weekend"
+        streamed = [r async for r in search_engine.iter_search(query, page_size=1)]
+        assert [r.rank for r in streamed] == [1, 2, 3]
+
+        capped = [r async for r in search_engine.iter_search(query, page_size=2, max_results=2)]
+        assert [r.page.id for r in capped] == [r.page.id for r in streamed[:2]]
+
+    async def test_split_passages_by_heading(self, search_engine):
+        """Test passage splitting by heading and paragraph with offsets."""
+        markdown = (
+            "# Overview\n\nShort intro.\n\n"
+            "## Budget\n\n" + "Costs rise every quarter. " * 40 + "\n\n"
+            "## Staffing\n\nHire two engineers."
+        )
+        passages = search_engine._split_passages(markdown)
+
+        assert len(passages) >= 3
+        for heading, text, start, end in passages:
+            assert markdown[start:end].strip() == text
+        assert passages[0][0] == "Overview"
+        assert passages[-1][0] == "Staffing"
+        assert "Hire two engineers." in passages[-1][1]
+
+    async def test_search_returns_best_matching_passage(self, search_engine, sample_cached_page):
+        """Test that results carry the matching passage rather than the page prefix."""
+        sample_cached_page.markdown_content = (
+            "# Notes\n\n" + "Filler paragraph about nothing in particular. " * 30 + "\n\n"
+            "## Deployment\n\nThe kubernetes rollout happens on Friday."
+        )
+        await search_engine.index_page(sample_cached_page)
+
+        results = await search_engine.search("kubernetes", passages_per_page=2)
+
+        assert len(results) == 1
+        chunk = results[0].chunk
+        assert "kubernetes rollout" in chunk.content
+        assert chunk.metadata["heading"] == "Deployment"
+        assert chunk.start_position > 500
+        assert sample_cached_page.markdown_content[chunk.start_position:chunk.end_position].strip() == chunk.content
+
+        stats = await search_engine.get_search_stats()
+        assert stats["indexed_passages"] >= 2
+
+    async def test_sharded_search_fans_out_across_notebooks(self, sharded_engine, sample_cached_pages):
+        """Test that sharded mode stores one database per notebook and merges results."""
+        for page in sample_cached_pages:
+            assert await sharded_engine.index_page(page) is True
+
+        assert len(sharded_engine.database_paths()) == 2
+
+        results = await sharded_engine.search("documentation meeting weekend")
+        assert sorted(r.page.id for r in results) == sorted(p.metadata.id for p in sample_cached_pages)
+        assert [r.rank for r in results] == [1, 2, 3]
+
+        stats = await sharded_engine.get_search_stats()
+        assert stats["indexed_pages"] == 3
+        assert stats["indexed_notebooks"] == 2
+        assert stats["shard_count"] == 2
+
+    async def test_sharded_notebook_scope_touches_one_shard(self, sharded_engine, sample_cached_pages):
+        """Test that notebook-scoped searches only query the matching shard."""
+        for page in sample_cached_pages:
+            await sharded_engine.index_page(page)
+
+        connections = await sharded_engine._get_search_connections(["notebook-personal"])
+        assert len(connections) == 1
+
+        results = await sharded_engine.search(
+            "documentation meeting weekend",
+            notebook_ids=["notebook-personal"]
+        )
+        assert [r.page.id for r in results] == ["page-personal-001"]
+
+        results = await sharded_engine.search("weekend", notebook_ids=["notebook-missing"])
+        assert results == []
+
+    async def test_sharded_page_moved_between_notebooks(self, sharded_engine, sample_cached_pages):
+        """Test that reindexing a moved page removes it from its old shard."""
+        page = sample_cached_pages[2]
+        await sharded_engine.index_page(page)
+
+        page.metadata.parent_notebook = {"id": "notebook-work", "name": "Work Notebook"}
+        await sharded_engine.index_page(page)
+
+        results = await sharded_engine.search("weekend")
+        assert [r.page.id for r in results] == [page.metadata.id]
+        personal = await sharded_engine.search("weekend", notebook_ids=["notebook-personal"])
+        assert personal == []
+
+    async def test_sharded_batch_reindex_only_touches_old_shard_on_move(
+        self, sharded_engine, sample_cached_pages
+    ):
+        """Test that batch reindexing drops old copies only for moved pages."""
+        await sharded_engine.index_pages(sample_cached_pages)
+
+        work_pages = sample_cached_pages[:2]
+        with patch.object(
+            sharded_engine, "_get_shard_connection", wraps=sharded_engine._get_shard_connection
+        ) as get_shard:
+            assert await sharded_engine.index_pages(work_pages) == (2, 0)
+        work_shard = sharded_engine._shard_path("notebook-work")
+        assert {call.args[0] for call in get_shard.call_args_list} == {work_shard}
+
+        moved = sample_cached_pages[2]
+        moved.metadata.parent_notebook = {"id": "notebook-work", "name": "Work Notebook"}
+        assert await sharded_engine.index_pages(sample_cached_pages) == (3, 0)
+
+        personal = await sharded_engine.search("weekend", notebook_ids=["notebook-personal"])
+        assert personal == []
+        work = await sharded_engine.search("weekend", notebook_ids=["notebook-work"])
+        assert [r.page.id for r in work] == [moved.metadata.id]
+
+    async def test_rebuild_notebook_index(self, sharded_engine, cache_manager, sample_cached_pages):
+        """Test rebuilding a single notebook's shard."""
+        for page in sample_cached_pages:
+            await sharded_engine.index_page(page)
+        cache_manager.iter_cached_pages = MagicMock(side_effect=lambda *args, **kwargs: _iter_pages(sample_cached_pages))
+
+        result = await sharded_engine.rebuild_notebook_index("test-user-001", "notebook-work")
+
+        assert result["total_pages"] == 2
+        assert result["indexed_pages"] == 2
+        stats = await sharded_engine.get_search_stats()
+        assert stats["indexed_pages"] == 3
+
+    async def test_in_memory_write_through(self, search_engine, mock_settings, cache_manager, sample_cached_pages):
+        """Test that the hot copy loads from disk and writes through to it."""
+        await search_engine.index_page(sample_cached_pages[0])
+        await search_engine.close()
+
+        engine = LocalOneNoteSearch(mock_settings, cache_manager, in_memory=True)
+        await engine.initialize()
+        try:
+            stats = await engine.get_search_stats()
+            assert stats["in_memory"] is True
+            assert stats["indexed_pages"] == 1
+            assert stats["hot_copy_load_seconds"] is not None
+
+            await engine.index_page(sample_cached_pages[1])
+            disk = sqlite3.connect(str(engine.db_path))
+            assert disk.execute("SELECT COUNT(*) FROM page_metadata").fetchone()[0] == 2
+            disk.close()
+        finally:
+            await engine.close()
+
+    async def test_in_memory_disk_failure_keeps_hot_copy_consistent(
+        self, mock_settings, cache_manager, sample_cached_pages
+    ):
+        """Test that a failed disk write is not committed to the hot copy."""
+        engine = LocalOneNoteSearch(mock_settings, cache_manager, in_memory=True)
+        await engine.initialize()
+        try:
+            write_page_rows = engine._write_page_rows
+
+            def failing_disk_write(target, rows):
+                if target is engine._disk_connection:
+                    raise sqlite3.OperationalError("disk I/O error")
+                write_page_rows(target, rows)
+
+            with patch.object(engine, "_write_page_rows", side_effect=failing_disk_write):
+                assert await engine.index_page(sample_cached_pages[0]) is False
+                assert await engine.index_pages(sample_cached_pages[1:]) == (0, 2)
+
+            stats = await engine.get_search_stats()
+            assert stats["indexed_pages"] == 0
+            disk = sqlite3.connect(str(engine.db_path))
+            assert disk.execute("SELECT COUNT(*) FROM page_metadata").fetchone()[0] == 0
+            disk.close()
+        finally:
+            await engine.close()
+
+    async def test_in_memory_periodic_flush(self, mock_settings, cache_manager, sample_cached_pages):
+        """Test that periodic persistence defers disk writes until a flush."""
+        engine = LocalOneNoteSearch(mock_settings, cache_manager, in_memory=True, persist_interval=3600)
+        await engine.initialize()
+        for page in sample_cached_pages:
+            await engine.index_page(page)
+
+        disk = sqlite3.connect(str(engine.db_path))
+        assert disk.execute("SELECT COUNT(*) FROM page_metadata").fetchone()[0] == 0
+        assert len(await engine.search("weekend")) == 1
+
+        assert await engine.flush_to_disk() is True
+        assert await engine.flush_to_disk() is False
+        assert disk.execute("SELECT COUNT(*) FROM page_metadata").fetchone()[0] == 3
+        disk.close()
+        await engine.close()
+
+    def test_in_memory_rejects_sharding(self, mock_settings, cache_manager):
+        """Test that in-memory mode cannot be combined with sharding."""
+        with pytest.raises(LocalSearchError):
+            LocalOneNoteSearch(mock_settings, cache_manager, sharded=True, in_memory=True)
+
     async def test_database_connection_persistence(self, search_engine):
         """Test that database connection is persistent and reusable."""
         conn1 = await search_engine._get_connection()
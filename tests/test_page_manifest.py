@@ -0,0 +1,66 @@
+"""
+Unit tests for the recency-ordered page manifest.
+"""
+
+from src.models.cache import SyncCheckpoint
+from src.storage.page_manifest import PageManifest, parse_modified
+
+
+def page(page_id, modified="2024-01-01T00:00:00Z"):
+    """Create a page dictionary as returned by a section listing."""
+    return {"id": page_id, "title": page_id, "lastModifiedDateTime": modified}
+
+
+class TestPageManifest:
+    """Test cases for PageManifest."""
+
+    def test_pending_pages_newest_first(self):
+        """Test pages of all sections are ordered by modification time."""
+        manifest = PageManifest()
+        manifest.add_listing("s1", [page("old", "2023-05-01T00:00:00Z"), page("undated", None)], None)
+        manifest.add_listing("s2", [page("new", "2024-06-01T12:30:00.123Z"),
+                                    page("mid", "2024-01-01T00:00:00Z")], None)
+
+        assert [entry.page_id for entry in manifest.pending_by_recency()] == ["new", "mid", "old", "undated"]
+
+        manifest.mark_stored("mid")
+        assert [entry.page_id for entry in manifest.pending_by_recency()] == ["new", "old", "undated"]
+
+    def test_coverage(self):
+        """Test coverage is the share of listed pages that are stored."""
+        manifest = PageManifest()
+        assert manifest.coverage == 100.0
+
+        manifest.add_listing("s1", [page(f"p{i}") for i in range(4)], None)
+        manifest.mark_stored("p0")
+        manifest.mark_stored("unlisted")
+
+        assert manifest.stored_pages == 1
+        assert manifest.coverage == 25.0
+
+    def test_checkpoint_cursors_only_pass_stored_listing_pages(self):
+        """Test section cursors move past a listing page once all its pages are stored."""
+        manifest = PageManifest()
+        manifest.add_listing("s1", [page("p1"), page("p2")], "cursor-2")
+        manifest.add_listing("s1", [page("p3")], None)
+        manifest.add_listing("s2", [page("p4")], None)
+        checkpoint = SyncCheckpoint(operation="fetch")
+
+        # p3 is stored, but the first listing page is not complete yet
+        manifest.mark_stored("p1")
+        manifest.mark_stored("p3")
+        manifest.mark_stored("p4")
+        manifest.update_checkpoint(checkpoint)
+
+        assert checkpoint.section_cursors == {}
+        assert checkpoint.completed_sections == {"s2"}
+
+        manifest.mark_stored("p2")
+        manifest.update_checkpoint(checkpoint)
+
+        assert checkpoint.completed_sections == {"s1", "s2"}
+
+    def test_parse_modified(self):
+        """Test naive and aware modification times compare with each other."""
+        assert parse_modified("2024-01-01T00:00:00Z") == parse_modified(parse_modified("2024-01-01T00:00:00Z"))
+        assert parse_modified("not a date") < parse_modified("2000-01-01T00:00:00Z")
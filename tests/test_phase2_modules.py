@@ -164,18 +164,18 @@ class TestOneNoteContentFetcher:
             "lastModifiedDateTime": "2024-01-01T00:00:00Z"
         }
 
-        with patch('aiohttp.ClientSession.get') as mock_get:
+        with patch('httpx.AsyncClient.get', new_callable=AsyncMock) as mock_get:
             # Create two different mock responses
-            mock_resp_metadata = AsyncMock()
-            mock_resp_metadata.status = 200
-            mock_resp_metadata.json = AsyncMock(return_value=mock_metadata)
+            mock_resp_metadata = MagicMock()
+            mock_resp_metadata.status_code = 200
+            mock_resp_metadata.json.return_value = mock_metadata
 
-            mock_resp_content = AsyncMock()
-            mock_resp_content.status = 200
-            mock_resp_content.text = AsyncMock(return_value=mock_content)
+            mock_resp_content = MagicMock()
+            mock_resp_content.status_code = 200
+            mock_resp_content.text = mock_content
 
             # First call returns metadata, second call returns content
-            mock_get.return_value.__aenter__.side_effect = [mock_resp_metadata, mock_resp_content]
+            mock_get.side_effect = [mock_resp_metadata, mock_resp_content]
 
             content = await content_fetcher.fetch_page_content(page)
 
@@ -225,14 +225,14 @@ class TestAssetDownloadManager:
         async def mock_iter_chunked(chunk_size):
             yield mock_content
 
-        with patch('aiohttp.ClientSession.get') as mock_get:
+        with patch('httpx.AsyncClient.stream') as mock_get:
             mock_resp = AsyncMock()
-            mock_resp.status = 200
+            mock_resp.status_code = 200
             mock_resp.headers = {
                 'content-type': 'image/png',
                 'content-length': str(len(mock_content))
             }
-            mock_resp.content.iter_chunked = mock_iter_chunked
+            mock_resp.aiter_bytes = mock_iter_chunked
             mock_get.return_value.__aenter__.return_value = mock_resp
 
             result = await asset_manager.download_assets(sample_assets, temp_dir)
@@ -244,10 +244,10 @@ class TestAssetDownloadManager:
     @pytest.mark.asyncio
     async def test_download_assets_http_error(self, asset_manager, sample_assets, temp_dir):
         """Test asset downloading with HTTP error."""
-        with patch('aiohttp.ClientSession.get') as mock_get:
+        with patch('httpx.AsyncClient.stream') as mock_get:
             mock_resp = AsyncMock()
-            mock_resp.status = 404
-            mock_resp.reason = "Not Found"
+            mock_resp.status_code = 404
+            mock_resp.reason_phrase = "Not Found"
             mock_get.return_value.__aenter__.return_value = mock_resp
 
             result = await asset_manager.download_assets(sample_assets, temp_dir)
@@ -265,14 +265,14 @@ class TestAssetDownloadManager:
         async def mock_iter_chunked(chunk_size):
             yield mock_content
 
-        with patch('aiohttp.ClientSession.get') as mock_get:
+        with patch('httpx.AsyncClient.stream') as mock_get:
             mock_resp = AsyncMock()
-            mock_resp.status = 200
+            mock_resp.status_code = 200
             mock_resp.headers = {
                 'content-type': 'image/png',
                 'content-length': str(len(mock_content))
             }
-            mock_resp.content.iter_chunked = mock_iter_chunked
+            mock_resp.aiter_bytes = mock_iter_chunked
             mock_get.return_value.__aenter__.return_value = mock_resp
 
             result = await asset_manager.download_single_asset(asset, temp_dir)
@@ -0,0 +1,125 @@
+"""
+Tests for local search index maintenance.
+
+Covers health collection, threshold-based planning, FTS segment merging
+and the idle-time background task.
+"""
+
+import asyncio
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.models.cache import CachedPage, CachedPageMetadata
+from src.storage.cache_manager import OneNoteCacheManager
+from src.storage.local_search import LocalOneNoteSearch
+from src.storage.search_maintenance import (IndexHealth, MaintenanceReport,
+                                            SearchIndexMaintainer)
+
+
+def _make_page(index: int) -> CachedPage:
+    """Create a small cached page for indexing."""
+    return CachedPage(
+        metadata=CachedPageMetadata(
+            id=f"page-{index:03d}",
+            title=f"Meeting notes {index}",
+            created_date_time=datetime(2024, 1, 1, 12, 0, 0),
+            last_modified_date_time=datetime(2024, 1, 2, 12, 0, 0),
+            parent_section={"id": "section-001", "name": "Notes"},
+            parent_notebook={"id": "notebook-001", "name": "Work"},
+            content_url=f"https://example.com/pages/{index}/content",
+            local_content_path=f"cache/page-{index}.md",
+            local_html_path=f"cache/page-{index}.html"
+        ),
+        markdown_content=f"Project meeting {index} discussed todo items and notes"
+    )
+
+
+class TestSearchIndexMaintainer:
+    """Tests for SearchIndexMaintainer."""
+
+    @pytest.fixture
+    async def search_engine(self):
+        """Create a local search engine in a temporary directory."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            settings = MagicMock()
+            settings.onenote_cache_full_path = Path(temp_dir)
+            settings.semantic_search_limit = 10
+            engine = LocalOneNoteSearch(settings, OneNoteCacheManager(settings))
+            await engine.initialize()
+            yield engine
+            await engine.close()
+
+    @pytest.fixture
+    async def fragmented_engine(self, search_engine):
+        """Search engine with one FTS segment per indexed page."""
+        for i in range(12):
+            await search_engine.index_page(_make_page(i))
+        return search_engine
+
+    async def test_collect_health(self, fragmented_engine):
+        """Test that health metrics reflect the index contents."""
+        maintainer = SearchIndexMaintainer(fragmented_engine)
+        health = await maintainer.collect_health()
+
+        assert health.indexed_pages == 12
+        assert health.segment_count > 1
+        assert health.database_size_bytes >= 0
+        assert 0.0 <= health.fragmentation <= 1.0
+
+    def test_plan_actions_thresholds(self):
+        """Test that actions are only planned when thresholds are crossed."""
+        maintainer = SearchIndexMaintainer(MagicMock(), segment_threshold=4)
+        healthy = IndexHealth(2, 10, 1000, 0, 100, 0)
+        fragmented = IndexHealth(8, 10, 1000, 0, 100, 0)
+
+        assert maintainer._plan_actions(healthy) == []
+        assert maintainer.needs_maintenance(fragmented)
+        actions = maintainer._plan_actions(fragmented)
+        assert actions[0] == "automerge"
+        assert "fts_optimize" in actions
+        assert "wal_checkpoint" in actions
+        assert "vacuum" not in actions
+
+    async def test_run_maintenance_merges_segments(self, fragmented_engine):
+        """Test that maintenance merges FTS segments into one."""
+        maintainer = SearchIndexMaintainer(fragmented_engine, segment_threshold=2)
+        report = await maintainer.run_maintenance()
+
+        assert isinstance(report, MaintenanceReport)
+        assert report.before.segment_count > 2
+        assert report.after.segment_count == 1
+        assert "fts_optimize" in report.actions
+        assert report.latency_before_ms >= 0
+        assert maintainer.last_report is report
+
+        # Search still works after maintenance
+        results = await fragmented_engine.search("meeting")
+        assert len(results) >= 1
+
+    async def test_run_maintenance_noop_when_healthy(self, search_engine):
+        """Test that a healthy index is left untouched."""
+        await search_engine.index_page(_make_page(1))
+        maintainer = SearchIndexMaintainer(search_engine)
+        report = await maintainer.run_maintenance()
+
+        assert report.actions == []
+        assert report.after == report.before
+
+    async def test_background_task_runs_when_idle(self, fragmented_engine):
+        """Test that the idle-time background task performs maintenance."""
+        maintainer = SearchIndexMaintainer(fragmented_engine, segment_threshold=2)
+        maintainer.start_background(idle_seconds=0.01, check_interval=0.01)
+        try:
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if maintainer.last_report:
+                    break
+        finally:
+            await maintainer.stop_background()
+
+        assert maintainer.last_report is not None
+        assert maintainer.last_report.after.segment_count == 1
@@ -0,0 +1,57 @@
+"""
+Unit tests for cache JSON serialization.
+"""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from src.models.cache import CacheMetadata
+from src.storage import serialization
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request):
+    """Run a test with orjson and with the stdlib fallback."""
+    if request.param == "json":
+        with patch.object(serialization, "orjson", None):
+            yield request.param
+    else:
+        if serialization.orjson is None:
+            pytest.skip("orjson not installed")
+        yield request.param
+
+
+class TestSerialization:
+    """Test cases for the serialization module."""
+
+    def test_dumps_is_compact_and_converts_values(self, encoder):
+        """Test compact output with datetimes, sets and models converted."""
+        data = {"when": datetime(2024, 5, 1, 12, 30), "tags": {"a"}, "n": 1}
+
+        encoded = serialization.dumps(data)
+
+        assert b"\n" not in encoded and b", " not in encoded
+        assert serialization.loads(encoded) == {"when": "2024-05-01T12:30:00", "tags": ["a"], "n": 1}
+
+    def test_model_round_trip(self, encoder):
+        """Test models load back from their encoded form."""
+        metadata = CacheMetadata(user_id="user", cache_root_path="/cache", total_pages=5)
+        metadata.counters.verified_at = datetime(2024, 5, 1, 12, 30)
+
+        loaded = serialization.load_model(CacheMetadata, serialization.dumps(metadata))
+
+        assert loaded == metadata
+
+    def test_load_model_accepts_legacy_documents(self):
+        """Test files written with json.dump(default=str) still load."""
+        legacy = '{"user_id": "user", "cache_root_path": "/cache", "cache_created": "2024-05-01 12:30:00"}'
+
+        loaded = serialization.load_model(CacheMetadata, legacy)
+
+        assert loaded.cache_created == datetime(2024, 5, 1, 12, 30)
+
+    def test_read_json_missing_file(self, tmp_path):
+        """Test reading a missing file returns None."""
+        assert serialization.read_json(tmp_path / "missing.json") is None
@@ -0,0 +1,84 @@
+"""
+Unit tests for durable sync checkpoints.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.models.cache import SyncCheckpoint, SyncType
+from src.storage.sync_checkpoint import CHECKPOINT_MAX_AGE, SyncCheckpointStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a checkpoint store for testing."""
+    return SyncCheckpointStore(tmp_path / "sync_checkpoint.json")
+
+
+class TestSyncCheckpoint:
+    """Test cases for SyncCheckpoint."""
+
+    def test_section_progress(self):
+        """Test stored pages are tracked until their section completes."""
+        checkpoint = SyncCheckpoint(operation="fetch")
+        checkpoint.mark_page_stored("s1", "p1")
+        checkpoint.advance_section("s1", "cursor-1")
+
+        assert checkpoint.is_page_stored("s1", "p1")
+        assert not checkpoint.is_page_stored("s1", "p2")
+        assert checkpoint.section_cursors == {"s1": "cursor-1"}
+
+        checkpoint.advance_section("s1", None)
+
+        assert checkpoint.completed_sections == {"s1"}
+        assert checkpoint.section_cursors == {}
+        assert checkpoint.stored_pages == {}
+        assert checkpoint.completed_section_pages == {"s1": 1}
+        assert checkpoint.is_page_stored("s1", "p2")
+
+        checkpoint.mark_page_stored("s2", "p3")
+        assert checkpoint.stored_page_count() == 2
+
+
+class TestSyncCheckpointStore:
+    """Test cases for SyncCheckpointStore."""
+
+    @pytest.mark.asyncio
+    async def test_save_load_and_clear(self, store):
+        """Test a saved checkpoint is loaded back until it is cleared."""
+        checkpoint = SyncCheckpoint(operation="fetch", sync_type=SyncType.FULL)
+        checkpoint.mark_page_stored("s1", "p1")
+        checkpoint.advance_section("s2", None)
+        await store.save(checkpoint)
+
+        loaded = await store.load("fetch", SyncType.FULL)
+        assert loaded.stored_pages == {"s1": {"p1"}}
+        assert loaded.completed_sections == {"s2"}
+
+        await store.clear()
+        assert await store.load("fetch", SyncType.FULL) is None
+        await store.clear()  # Clearing twice is harmless
+
+    @pytest.mark.asyncio
+    async def test_other_operations_are_not_resumed(self, store):
+        """Test checkpoints only resume the operation and sync type that wrote them."""
+        await store.save(SyncCheckpoint(operation="fetch", sync_type=SyncType.FULL))
+
+        assert await store.load("index") is None
+        assert await store.load("fetch", SyncType.INCREMENTAL) is None
+        assert await store.load("fetch", SyncType.FULL) is not None
+
+    @pytest.mark.asyncio
+    async def test_stale_or_corrupt_checkpoints_are_ignored(self, store):
+        """Test old and unreadable checkpoints are not resumed."""
+        checkpoint = SyncCheckpoint(operation="fetch")
+        await store.save(checkpoint)
+        stale = checkpoint.model_copy(update={"updated_at": datetime.utcnow() - 2 * CHECKPOINT_MAX_AGE})
+        store.path.write_text(stale.model_dump_json())
+
+        assert await store.load("fetch") is None
+        assert not store.path.exists()
+
+        store.path.write_text("{not json")
+        assert await store.load("fetch") is None
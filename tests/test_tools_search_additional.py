@@ -417,6 +417,25 @@ class TestOneNoteSearchToolAdditional:
             assert result[0]["id"] == "nb1"
             assert result[1]["id"] == "nb2"
 
+    @pytest.mark.asyncio
+    async def test_get_notebooks_selects_links(self, search_tool):
+        """Test get_notebooks requests links so notebook web URLs are kept."""
+        search_tool.authenticator.get_valid_token = AsyncMock(return_value="test_token")
+
+        with patch('httpx.AsyncClient') as mock_client_class:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {"value": []}
+
+            mock_client = Mock()
+            mock_client.get = AsyncMock(return_value=mock_response)
+            mock_client_class.return_value.__aenter__.return_value = mock_client
+
+            await search_tool.get_notebooks()
+
+            params = mock_client.get.call_args[1]['params']
+            assert "links" in params["$select"].split(",")
+
     @pytest.mark.asyncio
     async def test_get_notebooks_authentication_error(self, search_tool):
         """Test get_notebooks handles authentication errors."""